@@ -0,0 +1,98 @@
+"""
+Balance update path benchmark: numeric(12, 2) vs BIGINT minor units.
+
+Measures two things:
+
+* Python-side arithmetic of the repository hot path (add + funds check)
+  with Decimal vs int.
+* Postgres-side update throughput of the same conditional
+  `UPDATE ... SET balance = balance + $1` workload against a numeric and a
+  bigint scratch table, driven by concurrent connections.
+
+Usage:
+    python -m benchmarks.balance_update_benchmark --wallets 10000 --updates 200000 --concurrency 32
+"""
+import argparse
+import asyncio
+import random
+import time
+import timeit
+from decimal import Decimal
+import asyncpg
+from src.application.domain.uuid7 import uuid7
+from src.settings import settings
+
+
+def python_arithmetic(iterations: int) -> dict:
+    decimal_balance, decimal_amount = Decimal('1000.00'), Decimal('12.34')
+    int_balance, int_amount = 100_000, 1_234
+
+    decimal_seconds = timeit.timeit(
+        lambda: decimal_balance >= decimal_amount and decimal_balance + decimal_amount, number=iterations
+    )
+    int_seconds = timeit.timeit(
+        lambda: int_balance >= int_amount and int_balance + int_amount, number=iterations
+    )
+    return {'numeric': iterations / decimal_seconds, 'minor_units': iterations / int_seconds}
+
+
+async def database_updates(dsn: str, column_type: str, amount, wallets: int, updates: int, concurrency: int) -> float:
+    table = f'bench_balance_{column_type.split("(")[0]}'
+    pool = await asyncpg.create_pool(dsn, min_size=concurrency, max_size=concurrency)
+    try:
+        await pool.execute(f'DROP TABLE IF EXISTS {table}')
+        await pool.execute(f'CREATE UNLOGGED TABLE {table} (id uuid PRIMARY KEY, balance {column_type} NOT NULL)')
+        ids = [uuid7() for _ in range(wallets)]
+        await pool.copy_records_to_table(table, records=[(wallet_id, amount * 1000) for wallet_id in ids])
+
+        statement = (
+            f'UPDATE {table} SET balance = balance + $1 '
+            f'WHERE id = $2 AND balance + $1 >= 0 RETURNING balance'
+        )
+        per_worker = updates // concurrency
+
+        async def worker():
+            async with pool.acquire() as connection:
+                prepared = await connection.prepare(statement)
+                for _ in range(per_worker):
+                    delta = amount if random.random() < 0.5 else -amount
+                    await prepared.fetchval(delta, random.choice(ids))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        await pool.execute(f'DROP TABLE {table}')
+        return per_worker * concurrency / elapsed
+    finally:
+        await pool.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--wallets', type=int, default=10_000)
+    parser.add_argument('--updates', type=int, default=100_000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--iterations', type=int, default=2_000_000)
+    parser.add_argument('--dsn', default=settings.DATABASE_DSN)
+    parser.add_argument('--skip-db', action='store_true', help='Only run the Python arithmetic benchmark')
+    args = parser.parse_args()
+
+    arithmetic = python_arithmetic(args.iterations)
+    print(f'{"python hot path":<24} {"numeric ops/s":>16} {"minor units ops/s":>18}')
+    print(f'{"add + funds check":<24} {arithmetic["numeric"]:>16,.0f} {arithmetic["minor_units"]:>18,.0f}')
+
+    if args.skip_db:
+        return
+
+    numeric = await database_updates(
+        args.dsn, 'numeric(12, 2)', Decimal('12.34'), args.wallets, args.updates, args.concurrency
+    )
+    minor_units = await database_updates(
+        args.dsn, 'bigint', 1_234, args.wallets, args.updates, args.concurrency
+    )
+    print(f'{"postgres update path":<24} {numeric:>16,.0f} {minor_units:>18,.0f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
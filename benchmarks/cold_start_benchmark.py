@@ -0,0 +1,91 @@
+"""
+Cold-start-to-first-request benchmark.
+
+Starts the application in a fresh server process and measures:
+
+* import time of `src.main` (python -X importtime equivalent, total only)
+* time from process spawn until `/ping` answers
+* time from process spawn until `/ready` answers 200 (warm-up finished)
+* latency of the first and of subsequent `GET /api/v1/wallets/{id}` requests
+
+Usage:
+    python -m benchmarks.cold_start_benchmark --server granian --runs 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+import httpx
+
+
+SERVER_COMMANDS = {
+    'granian': ['granian', '--interface', 'asgi', '--host', '127.0.0.1', '--port', '{port}', '--workers', '1', 'src.main:app'],
+    'uvicorn': [sys.executable, '-m', 'uvicorn', '--host', '127.0.0.1', '--port', '{port}', 'src.main:app'],
+}
+
+
+def import_time() -> float:
+    output = subprocess.run(
+        [sys.executable, '-c', 'import time; t = time.perf_counter(); import src.main; print(time.perf_counter() - t)'],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def wait_for(client: httpx.Client, path: str, started: float, timeout: float) -> float:
+    while time.perf_counter() - started < timeout:
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter() - started
+        except httpx.TransportError:
+            pass
+        time.sleep(0.005)
+    raise TimeoutError(f'{path} did not answer within {timeout}s')
+
+
+def run_once(server: str, port: int, timeout: float) -> dict:
+    command = [part.format(port=port) for part in SERVER_COMMANDS[server]]
+    started = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        with httpx.Client(base_url=f'http://127.0.0.1:{port}', timeout=timeout) as client:
+            to_ping = wait_for(client, '/ping', started, timeout)
+            to_ready = wait_for(client, '/ready', started, timeout)
+
+            wallet_path = f'/api/v1/wallets/{uuid.uuid4()}'
+            latencies = []
+            for _ in range(20):
+                request_started = time.perf_counter()
+                client.get(wallet_path)
+                latencies.append(time.perf_counter() - request_started)
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {
+        'to_ping': to_ping,
+        'to_ready': to_ready,
+        'first_request': latencies[0],
+        'steady_request': statistics.median(latencies[1:]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', choices=SERVER_COMMANDS, default='granian')
+    parser.add_argument('--port', type=int, default=9100)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    args = parser.parse_args()
+
+    print(f'import src.main: {import_time() * 1000:.0f} ms')
+    runs = [run_once(args.server, args.port, args.timeout) for _ in range(args.runs)]
+    for key in ('to_ping', 'to_ready', 'first_request', 'steady_request'):
+        values = [run[key] * 1000 for run in runs]
+        print(f'{key:<16} median {statistics.median(values):8.1f} ms   max {max(values):8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Bulk insert benchmark: uuid4 vs UUIDv7 primary keys.
+
+Creates two scratch tables shaped like `wallets`, loads the same number of
+rows into each in batches and reports insert rate and primary key index
+size. Random uuid4 keys spread inserts over the whole B-tree, while UUIDv7
+keys append to its right edge.
+
+Usage:
+    python -m benchmarks.uuid_insert_benchmark --rows 5000000 --batch 10000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, UTC
+from decimal import Decimal
+from typing import Callable
+import asyncpg
+from src.application.domain.uuid7 import uuid7
+from src.settings import settings
+
+
+TABLE_DDL = '''
+    CREATE UNLOGGED TABLE {table} (
+        id uuid PRIMARY KEY,
+        balance numeric(12, 2) NOT NULL DEFAULT 0,
+        created_at timestamptz NOT NULL
+    )
+'''
+
+
+async def run_case(connection: asyncpg.Connection, table: str, generator: Callable[[], uuid.UUID], rows: int, batch: int) -> dict:
+    await connection.execute(f'DROP TABLE IF EXISTS {table}')
+    await connection.execute(TABLE_DDL.format(table=table))
+
+    started = time.perf_counter()
+    inserted = 0
+    while inserted < rows:
+        size = min(batch, rows - inserted)
+        now = datetime.now(UTC)
+        records = [(generator(), Decimal('0.00'), now) for _ in range(size)]
+        # Row-by-row INSERT through the PK index, like the application does
+        await connection.executemany(
+            f'INSERT INTO {table} (id, balance, created_at) VALUES ($1, $2, $3)',
+            records
+        )
+        inserted += size
+    elapsed = time.perf_counter() - started
+
+    index_size = await connection.fetchval(f"SELECT pg_relation_size('{table}_pkey')")
+    leaf_density = None
+    if await connection.fetchval("SELECT count(*) FROM pg_extension WHERE extname = 'pgstattuple'"):
+        leaf_density = await connection.fetchval('SELECT avg_leaf_density FROM pgstatindex($1)', f'{table}_pkey')
+
+    await connection.execute(f'DROP TABLE {table}')
+    return {
+        'rows_per_second': rows / elapsed,
+        'seconds': elapsed,
+        'index_mb': index_size / 1024 / 1024,
+        'leaf_density': leaf_density
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--batch', type=int, default=10_000)
+    parser.add_argument('--dsn', default=settings.DATABASE_DSN)
+    args = parser.parse_args()
+
+    connection = await asyncpg.connect(args.dsn)
+    try:
+        results = {
+            'uuid4': await run_case(connection, 'bench_wallets_uuid4', uuid.uuid4, args.rows, args.batch),
+            'uuid7': await run_case(connection, 'bench_wallets_uuid7', uuid7, args.rows, args.batch),
+        }
+    finally:
+        await connection.close()
+
+    print(f'{"generator":<10} {"rows/s":>12} {"seconds":>10} {"pk index MB":>12} {"leaf density":>13}')
+    for name, result in results.items():
+        density = '-' if result['leaf_density'] is None else f'{result["leaf_density"]:.1f}%'
+        print(
+            f'{name:<10} {result["rows_per_second"]:>12,.0f} {result["seconds"]:>10.2f} '
+            f'{result["index_mb"]:>12.1f} {density:>13}'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,369 @@
+"""
+Concurrent deposit/withdraw stress test of the wallet repositories.
+
+Runs thousands of concurrent deposits and withdrawals through the real
+repositories against a local Postgres (or the in-memory store), once on a
+single hot wallet and once spread over many wallets, for every requested
+combination of repository and row lock mode. After each run it checks:
+
+* no wallet balance and no returned balance is negative
+* every final balance equals its initial balance plus the sum of the
+  acknowledged changes
+* no lost updates: every acknowledged change started from the balance
+  left by exactly one other change (or the initial balance), i.e. the
+  changes form a serial history
+* the wallet_stats aggregates moved by exactly the created wallets and
+  their balances (skipped with --skip-stats when other writers are active)
+
+and reports throughput, latency and lock wait percentiles side by side.
+Lock wait is the time a balance change waits for its wallet lock, as
+recorded by the repository; group commit waits inside its batch runner
+and reports none.
+
+Wallets are created in the wallets table of the target database and
+deleted again afterwards; run it against a scratch database.
+
+Usage:
+    python -m benchmarks.wallet_stress_benchmark --operations 20000 --concurrency 2000
+    python -m benchmarks.wallet_stress_benchmark --repositories postgres,group_commit,memory \\
+        --lock-modes for_update,for_no_key_update --scenarios hot,spread --wallets 1000
+"""
+import argparse
+import asyncio
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from src.application.abstractions import IWalletRepository
+from src.application.domain.wallet_totals import WalletTotals
+from src.application.exceptions import InsufficientFundsError
+from src.infrastructure.database.balance import WALLET_LOCK_MODES
+from src.infrastructure.database.group_commit import GroupCommitExecutor
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.repositories.wallet_repostiory import WalletRepository
+from src.infrastructure.database.stats import apply_stats_delta, read_totals
+from src.infrastructure.memory import InMemoryWalletRepository
+from src.settings import settings
+
+
+REPOSITORIES = ('postgres', 'group_commit', 'memory')
+SCENARIOS = ('hot', 'spread')
+
+
+class EventRecorder:
+    """Stand-in for the logger collecting the timings repositories report per request."""
+
+    def __init__(self):
+        self.timings: Dict[str, List[float]] = {}
+
+    def add_event_timing(self, name: str, seconds: float):
+        self.timings.setdefault(name, []).append(seconds * 1000)
+
+    def add_event_fields(self, **fields):
+        pass
+
+    def debug(self, *args, **fields):
+        pass
+
+    info = warning = error = debug
+
+
+@dataclass
+class Change:
+    wallet: int
+    delta: Decimal
+    balance_after: Decimal
+
+
+@dataclass
+class RunResult:
+    repository: str
+    lock_mode: str
+    scenario: str
+    wallets: int
+    operations: int
+    seconds: float
+    applied: int
+    rejected: int
+    errors: Dict[str, int]
+    latency_ms: Dict[str, float]
+    lock_wait_ms: Dict[str, float]
+    violations: List[str] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    values = sorted(values)
+    pick = lambda q: round(values[min(len(values) - 1, int(q * len(values)))], 3)
+    return {'p50': pick(0.50), 'p90': pick(0.90), 'p99': pick(0.99), 'max': round(values[-1], 3)}
+
+
+def plan_operations(count: int, wallets: int, seed: int) -> List[Tuple[int, bool, Decimal]]:
+    """(wallet index, is deposit, amount); balances random-walk so withdrawals are sometimes refused."""
+    rng = random.Random(seed)
+    return [
+        (rng.randrange(wallets), rng.random() < 0.5, Decimal(rng.randint(1, 1000)) / 100)
+        for _ in range(count)
+    ]
+
+
+def check_history(initial: Decimal, final: Decimal, changes: List[Change]) -> List[str]:
+    """
+    Check the acknowledged changes of one wallet form a serial history.
+
+    In any serial order every change starts from the initial balance or the
+    result of exactly one other change, and the last result is the final
+    balance. Two changes starting from the same state (a lost update) or a
+    result nobody continued from break the multiset equality.
+    """
+    violations = []
+    expected = initial + sum((change.delta for change in changes), Decimal('0.00'))
+    if final != expected:
+        violations.append(f'final balance {final} != expected {expected}')
+    if final < 0 or any(change.balance_after < 0 for change in changes):
+        violations.append('negative balance')
+    starts = Counter(change.balance_after - change.delta for change in changes)
+    ends = Counter(change.balance_after for change in changes)
+    ends[initial] += 1
+    ends[final] -= 1
+    if starts != +ends:
+        violations.append('changes do not form a serial history (lost update)')
+    return violations
+
+
+class Target:
+    """A repository under test with setup and teardown around each run."""
+
+    def __init__(self, name: str, lock_mode: str, args: argparse.Namespace, recorder: EventRecorder):
+        self.name = name
+        self.lock_mode = lock_mode
+        self._args = args
+        self._recorder = recorder
+        self._engine: Optional[AsyncEngine] = None
+        self._session_maker = None
+        self._directory: Optional[str] = None
+        self.repository: Optional[IWalletRepository] = None
+
+    async def open(self):
+        if self.name == 'memory':
+            self._directory = tempfile.mkdtemp(prefix='wallet-stress-')
+            self.repository = InMemoryWalletRepository(self._directory, self._recorder, fsync=not self._args.no_fsync)
+            await self.repository.start()
+            return
+
+        self._engine = create_async_engine(
+            self._args.database_url,
+            pool_size=self._args.pool_size,
+            max_overflow=0,
+            pool_timeout=self._args.pool_timeout
+        )
+        self._session_maker = async_sessionmaker(self._engine, expire_on_commit=False)
+        group_commit = None
+        if self.name == 'group_commit':
+            group_commit = GroupCommitExecutor(
+                self._session_maker,
+                self._recorder,
+                window=settings.GROUP_COMMIT_WINDOW_MS / 1000,
+                max_batch=settings.GROUP_COMMIT_MAX_BATCH,
+                lock_mode=self.lock_mode
+            )
+        self.repository = WalletRepository(
+            self._session_maker,
+            self._recorder,
+            group_commit=group_commit,
+            lock_mode=self.lock_mode
+        )
+
+    async def totals(self) -> Optional[WalletTotals]:
+        if self.name == 'memory':
+            return self.repository.totals()
+        if not settings.WALLET_STATS_ENABLED:
+            return None
+        async with self._session_maker() as session:
+            return await read_totals(session)
+
+    async def remove(self, wallets: List[Wallet]):
+        """Delete the wallets created by a run together with their share of the aggregates."""
+        if self.name == 'memory':
+            return
+        async with self._session_maker() as session:
+            for wallet in wallets:
+                await apply_stats_delta(session, wallet.id, -1, -wallet.balance)
+            await session.execute(delete(Wallet).where(Wallet.id.in_([wallet.id for wallet in wallets])))
+            await session.commit()
+
+    async def close(self):
+        if self.name == 'memory':
+            await self.repository.close()
+            shutil.rmtree(self._directory, ignore_errors=True)
+        else:
+            await self._engine.dispose()
+
+
+async def run_scenario(target: Target, recorder: EventRecorder, scenario: str, args: argparse.Namespace) -> RunResult:
+    repository = target.repository
+    wallet_count = 1 if scenario == 'hot' else args.wallets
+    initial = Decimal(args.initial_balance).quantize(Decimal('0.01'))
+
+    totals_before = None if args.skip_stats else await target.totals()
+    wallets = [await repository.create() for _ in range(wallet_count)]
+    ids = [str(wallet.id) for wallet in wallets]
+    if initial > 0:
+        for wallet_id in ids:
+            await repository.deposit(wallet_id, initial)
+
+    plan = plan_operations(args.operations, wallet_count, args.seed)
+    changes: Dict[int, List[Change]] = {index: [] for index in range(wallet_count)}
+    latencies: List[float] = []
+    rejected = 0
+    errors: Counter = Counter()
+    recorder.timings.clear()
+    position = 0
+
+    async def client():
+        nonlocal position, rejected
+        while position < len(plan):
+            wallet, deposit, amount = plan[position]
+            position += 1
+            started = time.perf_counter()
+            try:
+                if deposit:
+                    result = await repository.deposit(ids[wallet], amount)
+                else:
+                    result = await repository.withdraw(ids[wallet], amount)
+            except InsufficientFundsError:
+                rejected += 1
+                continue
+            except Exception as e:
+                errors[type(e).__name__] += 1
+                continue
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+            changes[wallet].append(Change(wallet, amount if deposit else -amount, result.balance))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    seconds = time.perf_counter() - started
+
+    violations = []
+    final_wallets = [await repository.get_wallet(wallet_id) for wallet_id in ids]
+    for index, wallet in enumerate(final_wallets):
+        violations.extend(f'wallet {index}: {problem}' for problem in check_history(initial, wallet.balance, changes[index]))
+
+    totals_after = None if args.skip_stats else await target.totals()
+    if totals_before is not None and totals_after is not None:
+        created = WalletTotals(
+            wallet_count=totals_after.wallet_count - totals_before.wallet_count,
+            total_balance=totals_after.total_balance - totals_before.total_balance
+        )
+        expected = WalletTotals(wallet_count, sum((wallet.balance for wallet in final_wallets), Decimal('0.00')))
+        if created != expected:
+            violations.append(f'stats moved by {created}, expected {expected}')
+
+    if not args.keep:
+        await target.remove(final_wallets)
+
+    return RunResult(
+        repository=target.name,
+        lock_mode=target.lock_mode,
+        scenario=scenario,
+        wallets=wallet_count,
+        operations=len(plan),
+        seconds=round(seconds, 3),
+        applied=sum(len(wallet_changes) for wallet_changes in changes.values()),
+        rejected=rejected,
+        errors=dict(errors),
+        latency_ms=percentiles(latencies),
+        lock_wait_ms=percentiles(recorder.timings.get('lock_wait_ms', [])),
+        violations=violations
+    )
+
+
+def print_results(results: List[RunResult]):
+    header = (
+        f'{"repository":<13} {"lock mode":<18} {"scenario":<8} {"ops/s":>9} {"applied":>8} {"refused":>8} '
+        f'{"errors":>7} {"lat p50":>8} {"lat p99":>8} {"lock p50":>9} {"lock p99":>9} {"lock max":>9}  invariants'
+    )
+    print(header)
+    print('-' * len(header))
+    for result in results:
+        lock = result.lock_wait_ms
+        print(
+            f'{result.repository:<13} {result.lock_mode:<18} {result.scenario:<8} {result.throughput:>9,.0f} '
+            f'{result.applied:>8} {result.rejected:>8} {sum(result.errors.values()):>7} '
+            f'{result.latency_ms.get("p50", 0):>8.2f} {result.latency_ms.get("p99", 0):>8.2f} '
+            f'{lock.get("p50", float("nan")):>9.2f} {lock.get("p99", float("nan")):>9.2f} '
+            f'{lock.get("max", float("nan")):>9.2f}  {"ok" if not result.violations else "FAILED"}'
+        )
+    for result in results:
+        if result.errors:
+            print(f'{result.repository}/{result.lock_mode}/{result.scenario} errors: {result.errors}')
+        for violation in result.violations[:20]:
+            print(f'{result.repository}/{result.lock_mode}/{result.scenario}: {violation}')
+
+
+def parse_list(value: str, allowed: Tuple[str, ...]) -> List[str]:
+    items = [item.strip() for item in value.split(',') if item.strip()]
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise argparse.ArgumentTypeError(f'unknown values {unknown}, expected some of {allowed}')
+    return items
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repositories', type=lambda v: parse_list(v, REPOSITORIES), default=['postgres'])
+    parser.add_argument('--lock-modes', type=lambda v: parse_list(v, WALLET_LOCK_MODES), default=list(WALLET_LOCK_MODES))
+    parser.add_argument('--scenarios', type=lambda v: parse_list(v, SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--operations', type=int, default=20_000, help='Balance changes per run')
+    parser.add_argument('--concurrency', type=int, default=2_000, help='Concurrent clients')
+    parser.add_argument('--wallets', type=int, default=1_000, help='Wallets of the spread scenario')
+    parser.add_argument('--initial-balance', default='50.00')
+    parser.add_argument('--pool-size', type=int, default=settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW)
+    parser.add_argument('--pool-timeout', type=float, default=120.0)
+    parser.add_argument('--database-url', default=settings.DATABASE_URL)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--no-fsync', action='store_true', help='Disable fsync of the in-memory store log')
+    parser.add_argument('--skip-stats', action='store_true', help='Skip the aggregates check (other writers active)')
+    parser.add_argument('--keep', action='store_true', help='Keep the created wallets')
+    parser.add_argument('--output', help='Write results as JSON lines to this file')
+    args = parser.parse_args()
+
+    results: List[RunResult] = []
+    for name in args.repositories:
+        # The in-memory store has no row locks
+        for lock_mode in (['-'] if name == 'memory' else args.lock_modes):
+            recorder = EventRecorder()
+            target = Target(name, lock_mode if lock_mode != '-' else None, args, recorder)
+            await target.open()
+            try:
+                for scenario in args.scenarios:
+                    result = await run_scenario(target, recorder, scenario, args)
+                    result.lock_mode = lock_mode
+                    results.append(result)
+            finally:
+                await target.close()
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as output:
+            for result in results:
+                output.write(json.dumps({**asdict(result), 'throughput': result.throughput}, default=str) + '\n')
+    return 1 if any(result.violations for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
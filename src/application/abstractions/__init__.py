@@ -1 +1,3 @@
 from src.application.abstractions.i_wallet_repository import IWalletRepository
+from src.application.abstractions.i_operation_repository import IOperationRepository
+from src.application.abstractions.i_stats_repository import IStatsRepository
@@ -0,0 +1,23 @@
+from abc import abstractmethod
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.contracts.i_operation_service import IOperationService
+from src.application.domain.operation_type import Operation
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.infrastructure.logger import Logger
+
+
+class IOperationRepository(IOperationService):
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], logger: Logger):
+        self._session_maker = session_maker
+        self._logger = logger
+
+
+    @abstractmethod
+    async def enqueue(self, wallet_id: str, operation_type: Operation, amount: Decimal) -> WalletOperation:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_operation(self, operation_id: str) -> WalletOperation:
+        raise NotImplementedError
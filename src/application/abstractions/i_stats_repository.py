@@ -0,0 +1,17 @@
+from abc import abstractmethod
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.contracts.i_stats_service import IStatsService
+from src.application.domain.wallet_totals import WalletTotals
+from src.infrastructure.logger import Logger
+
+
+class IStatsRepository(IStatsService):
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], logger: Logger):
+        self._session_maker = session_maker
+        self._logger = logger
+
+
+    @abstractmethod
+    async def get_totals(self) -> WalletTotals:
+        raise NotImplementedError
@@ -1,15 +1,16 @@
 from abc import abstractmethod
 from decimal import Decimal
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from src.application.contracts.i_wallet_service import IWalletService
+from src.application.domain.wallet_page import WalletListQuery, WalletPage
 from src.infrastructure.database.models.wallet import Wallet
 from src.infrastructure.logger import Logger
 
 
 class IWalletRepository(IWalletService):
 
-    def __init__(self, session: AsyncSession, logger: Logger):
-        self._session = session
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], logger: Logger):
+        self._session_maker = session_maker
         self._logger = logger
 
 
@@ -28,3 +29,7 @@ class IWalletRepository(IWalletService):
     @abstractmethod
     async def get_wallet(self, wallet_id: str) -> Wallet:
         raise NotImplementedError
+
+    @abstractmethod
+    async def list_wallets(self, query: WalletListQuery) -> WalletPage:
+        raise NotImplementedError
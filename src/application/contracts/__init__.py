@@ -1 +1,3 @@
 from src.application.contracts.i_wallet_service import IWalletService
+from src.application.contracts.i_operation_service import IOperationService
+from src.application.contracts.i_stats_service import IStatsService
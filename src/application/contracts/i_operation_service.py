@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from src.application.domain.operation_type import Operation
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+
+
+class IOperationService(ABC):
+
+    @abstractmethod
+    async def enqueue(self, wallet_id: str, operation_type: Operation, amount: Decimal) -> WalletOperation:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_operation(self, operation_id: str) -> WalletOperation:
+        raise NotImplementedError
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from src.application.domain.wallet_totals import WalletTotals
+
+
+class IStatsService(ABC):
+
+    @abstractmethod
+    async def get_totals(self) -> WalletTotals:
+        raise NotImplementedError
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from src.application.domain.wallet_page import WalletListQuery, WalletPage
 from src.infrastructure.database.models.wallet import Wallet
 
 
@@ -21,3 +22,6 @@ class IWalletService(ABC):
     async def get_wallet(self, wallet_id: str) -> Wallet:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_wallets(self, query: WalletListQuery) -> WalletPage:
+        raise NotImplementedError
@@ -0,0 +1,34 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+
+MINOR_UNITS_PER_UNIT = 100
+_CENT = Decimal('0.01')
+
+
+def to_minor_units(amount: Decimal) -> int:
+    """
+    Convert a decimal amount to integer minor units (cents).
+
+    Rounds half away from zero to two decimal places, which matches how
+    Postgres stores values into a numeric(12, 2) column.
+
+    Args:
+        amount: Decimal amount
+
+    Returns:
+        int: Amount in minor units
+    """
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP) * MINOR_UNITS_PER_UNIT)
+
+
+def from_minor_units(minor_units: int) -> Decimal:
+    """
+    Convert integer minor units (cents) to a decimal amount with two places.
+
+    Args:
+        minor_units: Amount in minor units
+
+    Returns:
+        Decimal: Amount with exactly two decimal places (e.g. Decimal('150.00'))
+    """
+    return Decimal(minor_units).scaleb(-2)
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class OperationStatus(str, Enum):
+    """
+    Enumeration of queued wallet operation states.
+
+    Attributes:
+        PENDING: Accepted and waiting for the worker
+        APPLIED: Applied to the wallet balance
+        FAILED: Rejected by the worker (see error_code)
+    """
+    PENDING = 'pending'
+    APPLIED = 'applied'
+    FAILED = 'failed'
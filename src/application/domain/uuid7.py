@@ -0,0 +1,49 @@
+import os
+import threading
+import time
+import uuid
+
+
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_sequence = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The 48 most significant bits hold the Unix timestamp in milliseconds and
+    the 12-bit rand_a field is used as a sequence counter, so IDs generated
+    by one process are strictly increasing even within the same millisecond.
+    The remaining 62 bits are random.
+
+    Returns:
+        uuid.UUID: New UUIDv7
+    """
+    global _last_timestamp_ms, _last_sequence
+
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _last_timestamp_ms:
+            # Start each millisecond at a random point in the lower half of the
+            # counter range to leave room for increments
+            sequence = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            timestamp_ms = _last_timestamp_ms
+            sequence = _last_sequence + 1
+            if sequence > 0xFFF:
+                timestamp_ms += 1
+                sequence = 0
+        _last_timestamp_ms = timestamp_ms
+        _last_sequence = sequence
+
+    rand_b = int.from_bytes(os.urandom(8)) & 0x3FFFFFFFFFFFFFFF
+    value = (
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | sequence << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
@@ -0,0 +1,114 @@
+import base64
+import binascii
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+from src.application.exceptions import InvalidCursorError
+from src.infrastructure.database.models.wallet import Wallet
+
+
+class SortOrder(str, Enum):
+    """
+    Direction of a wallet listing by creation date.
+
+    Attributes:
+        ASC: Oldest wallets first
+        DESC: Newest wallets first
+    """
+    ASC = 'asc'
+    DESC = 'desc'
+
+
+@dataclass(frozen=True)
+class WalletCursor:
+    """
+    Position in a wallet listing: the (created_at, id) key of the last wallet returned.
+
+    Attributes:
+        created_at: Creation date of the last wallet on the page
+        wallet_id: ID of the last wallet on the page, breaking ties on created_at
+    """
+    created_at: datetime
+    wallet_id: uuid.UUID
+
+    def encode(self) -> str:
+        """Opaque URL-safe token handed to clients."""
+        raw = f'{self.created_at.isoformat()}|{self.wallet_id}'.encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'WalletCursor':
+        """
+        Parse a token produced by encode().
+
+        Raises:
+            InvalidCursorError: If the token is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+            created_at, wallet_id = raw.split('|')
+            cursor = cls(created_at=datetime.fromisoformat(created_at), wallet_id=uuid.UUID(wallet_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidCursorError(f'Invalid cursor: {token}')
+        if cursor.created_at.tzinfo is None:
+            raise InvalidCursorError(f'Invalid cursor: {token}')
+        return cursor
+
+
+@dataclass(frozen=True)
+class WalletListQuery:
+    """
+    Page request of a wallet listing.
+
+    Attributes:
+        limit: Maximum number of wallets on the page
+        cursor: Position after which the page starts, None for the first page
+        order: Direction by (created_at, id)
+        min_balance: Lowest balance included
+        max_balance: Highest balance included
+        created_from: Earliest creation date included
+        created_to: Creation date before which wallets are included
+        nonzero: Only wallets with a non-zero balance
+    """
+    limit: int = 50
+    cursor: Optional[WalletCursor] = None
+    order: SortOrder = SortOrder.ASC
+    min_balance: Optional[Decimal] = None
+    max_balance: Optional[Decimal] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    nonzero: bool = False
+
+    @property
+    def excludes_zero(self) -> bool:
+        """Whether the filters rule out zero balances, so the non-zero index applies."""
+        return (
+            self.nonzero
+            or (self.min_balance is not None and self.min_balance > 0)
+            or (self.max_balance is not None and self.max_balance < 0)
+        )
+
+
+@dataclass(frozen=True)
+class WalletPage:
+    """
+    One page of a wallet listing.
+
+    Attributes:
+        items: Wallets in listing order
+        next_cursor: Cursor of the following page, None on the last page
+    """
+    items: List[Wallet] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_rows(cls, rows: List[Wallet], limit: int) -> 'WalletPage':
+        """Build a page from up to limit + 1 rows; the extra row only signals that more follow."""
+        items = list(rows[:limit])
+        if len(rows) <= limit or not items:
+            return cls(items=items)
+        last = items[-1]
+        return cls(items=items, next_cursor=WalletCursor(last.created_at, last.id).encode())
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(frozen=True)
+class WalletTotals:
+    """
+    Aggregates over all wallets.
+
+    Attributes:
+        wallet_count: Number of wallets
+        total_balance: Sum of all wallet balances
+    """
+    wallet_count: int
+    total_balance: Decimal
@@ -1,3 +1,6 @@
+import math
+
+
 class WalletError(Exception):
     """Base exception for all wallet-related errors."""
     pass
@@ -26,3 +29,32 @@ class InvalidWalletIdError(WalletError):
 class DatabaseError(WalletError):
     """Raised when a database operation fails."""
     pass
+
+
+class CircuitOpenError(DatabaseError):
+    """Raised without touching the database while its circuit breaker is open."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        # Whole seconds, as sent in the Retry-After header
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class OperationNotFoundError(WalletError):
+    """Raised when a queued operation with the specified ID is not found."""
+    pass
+
+
+class InvalidOperationIdError(WalletError):
+    """Raised when the operation ID format is invalid."""
+    pass
+
+
+class OperationQueueUnavailableError(WalletError):
+    """Raised when the operation queue cannot be used with the configured wallet storage."""
+    pass
+
+
+class InvalidCursorError(WalletError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
@@ -1,10 +1,23 @@
-from fastapi import Depends
-from src.application.abstractions import IWalletRepository
-from src.application.contracts import IWalletService
+from src.application.contracts import IWalletService, IOperationService, IStatsService
 from src.application.services.wallet_service import WalletService
-from src.infrastructure.database.repositories import get_wallet_repository
-from src.infrastructure.logger import get_logger, Logger
+from src.application.services.operation_service import OperationService
+from src.application.services.stats_service import StatsService
+from src.infrastructure.database.repositories import wallet_repository, operation_repository, stats_repository
+from src.infrastructure.logger import logger
 
 
-async def get_wallet_service(wallet_repository: IWalletRepository = Depends(get_wallet_repository), logger: Logger = Depends(get_logger)) -> IWalletService:
-    yield WalletService(wallet_repository=wallet_repository, logger=logger)
+wallet_service = WalletService(wallet_repository=wallet_repository, logger=logger)
+operation_service = OperationService(operation_repository=operation_repository, logger=logger)
+stats_service = StatsService(stats_repository=stats_repository, logger=logger)
+
+
+async def get_wallet_service() -> IWalletService:
+    return wallet_service
+
+
+async def get_operation_service() -> IOperationService:
+    return operation_service
+
+
+async def get_stats_service() -> IStatsService:
+    return stats_service
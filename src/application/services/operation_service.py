@@ -0,0 +1,85 @@
+from decimal import Decimal
+from src.application.abstractions.i_operation_repository import IOperationRepository
+from src.application.contracts.i_operation_service import IOperationService
+from src.application.domain.operation_type import Operation
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.infrastructure.logger import Logger
+from src.application.exceptions import (
+    InvalidAmountError,
+    InvalidWalletIdError,
+    InvalidOperationIdError,
+    OperationNotFoundError,
+    OperationQueueUnavailableError,
+    DatabaseError
+)
+from src.infrastructure.tracing import tracer
+
+
+class OperationService(IOperationService):
+    """
+    Service layer for asynchronously applied wallet operations.
+
+    Accepts operations into the durable queue and reports their status.
+    """
+
+    def __init__(self, operation_repository: IOperationRepository, logger: Logger):
+        """
+        Initialize the operation service.
+
+        Args:
+            operation_repository: Repository for the operation queue
+            logger: Logger instance for operation logging
+        """
+        self._operation_repository = operation_repository
+        self._logger = logger
+
+    @tracer.traced('OperationService.enqueue')
+    async def enqueue(self, wallet_id: str, operation_type: Operation, amount: Decimal) -> WalletOperation:
+        """
+        Accept an operation for asynchronous processing.
+
+        Args:
+            wallet_id: The target wallet ID
+            operation_type: The operation type
+            amount: The operation amount
+
+        Returns:
+            WalletOperation: The accepted operation
+
+        Raises:
+            InvalidAmountError: If amount is not positive
+            InvalidWalletIdError: If wallet ID format is invalid
+            OperationQueueUnavailableError: If the wallet storage does not support the queue
+            DatabaseError: If the operation could not be accepted
+        """
+        try:
+            return await self._operation_repository.enqueue(wallet_id, operation_type, amount)
+        except (InvalidAmountError, InvalidWalletIdError, OperationQueueUnavailableError, DatabaseError):
+            raise
+        except Exception as e:
+            self._logger.add_event_fields(error=f'Unexpected error during operation enqueue: {e}')
+            raise DatabaseError(f'Operation enqueue failed: {e}')
+
+    @tracer.traced('OperationService.get_operation')
+    async def get_operation(self, operation_id: str) -> WalletOperation:
+        """
+        Retrieve a queued operation by its ID.
+
+        Args:
+            operation_id: The operation ID
+
+        Returns:
+            WalletOperation: The operation with its current status
+
+        Raises:
+            InvalidOperationIdError: If operation ID format is invalid
+            OperationNotFoundError: If operation is not found
+            DatabaseError: If retrieval fails
+        """
+        try:
+            return await self._operation_repository.get_operation(operation_id=operation_id)
+        except (InvalidOperationIdError, OperationNotFoundError, DatabaseError):
+            raise
+        except Exception as e:
+            self._logger.add_event_fields(error=f'Unexpected error during operation retrieval: {e}')
+            raise DatabaseError(f'Operation retrieval failed: {e}')
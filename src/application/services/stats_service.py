@@ -0,0 +1,42 @@
+from src.application.abstractions.i_stats_repository import IStatsRepository
+from src.application.contracts.i_stats_service import IStatsService
+from src.application.domain.wallet_totals import WalletTotals
+from src.infrastructure.logger import Logger
+from src.application.exceptions import DatabaseError
+from src.infrastructure.tracing import tracer
+
+
+class StatsService(IStatsService):
+    """
+    Service layer for wallet aggregates.
+    """
+
+    def __init__(self, stats_repository: IStatsRepository, logger: Logger):
+        """
+        Initialize the stats service.
+
+        Args:
+            stats_repository: Repository for wallet aggregates
+            logger: Logger instance for stats logging
+        """
+        self._stats_repository = stats_repository
+        self._logger = logger
+
+    @tracer.traced('StatsService.get_totals')
+    async def get_totals(self) -> WalletTotals:
+        """
+        Retrieve the wallet count and total balance.
+
+        Returns:
+            WalletTotals: Aggregates over all wallets
+
+        Raises:
+            DatabaseError: If retrieval fails
+        """
+        try:
+            return await self._stats_repository.get_totals()
+        except DatabaseError:
+            raise
+        except Exception as e:
+            self._logger.add_event_fields(error=f'Unexpected error during stats retrieval: {e}')
+            raise DatabaseError(f'Stats retrieval failed: {e}')
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from src.application.abstractions.i_wallet_repository import IWalletRepository
 from src.application.contracts.i_wallet_service import IWalletService
+from src.application.domain.wallet_page import WalletListQuery, WalletPage
 from src.infrastructure.database.models.wallet import Wallet
 from src.infrastructure.logger import Logger
 from src.application.exceptions import (
@@ -10,6 +11,7 @@ from src.application.exceptions import (
     InvalidWalletIdError,
     DatabaseError
 )
+from src.infrastructure.tracing import tracer
 
 
 class WalletService(IWalletService):
@@ -17,7 +19,7 @@ class WalletService(IWalletService):
     Service layer for wallet operations.
 
     Provides business logic for wallet creation, deposits, withdrawals,
-    and retrieval operations with proper logging.
+    and retrieval operations. Details are attached to the request's wide log event.
     """
 
     def __init__(self, wallet_repository: IWalletRepository, logger: Logger):
@@ -31,6 +33,7 @@ class WalletService(IWalletService):
         self._wallet_repository = wallet_repository
         self._logger = logger
 
+    @tracer.traced('WalletService.create')
     async def create(self) -> Wallet:
         """
         Create a new wallet with zero balance.
@@ -42,17 +45,14 @@ class WalletService(IWalletService):
             DatabaseError: If wallet creation fails
         """
         try:
-            self._logger.info('Creating new wallet')
-            wallet = await self._wallet_repository.create()
-            self._logger.info(f'Wallet created successfully: {wallet.id}')
-            return wallet
+            return await self._wallet_repository.create()
         except DatabaseError:
-            self._logger.error('Database error during wallet creation')
             raise
         except Exception as e:
-            self._logger.error(f'Unexpected error during wallet creation: {e}')
+            self._logger.add_event_fields(error=f'Unexpected error during wallet creation: {e}')
             raise DatabaseError(f'Wallet creation failed: {e}')
 
+    @tracer.traced('WalletService.deposit')
     async def deposit(self, wallet_id: str, amount: Decimal) -> Wallet:
         """
         Deposit money into a wallet.
@@ -71,17 +71,15 @@ class WalletService(IWalletService):
             DatabaseError: If deposit operation fails
         """
         try:
-            self._logger.info(f'Depositing {amount} to wallet {wallet_id}')
-            wallet = await self._wallet_repository.deposit(wallet_id, amount)
-            self._logger.info(f'Deposit successful: wallet {wallet.id}, new balance: {wallet.balance}')
-            return wallet
-        except (InvalidAmountError, InvalidWalletIdError, WalletNotFoundError):
+            return await self._wallet_repository.deposit(wallet_id, amount)
+        except (InvalidAmountError, InvalidWalletIdError, WalletNotFoundError, DatabaseError):
             # Re-raise domain exceptions without wrapping
             raise
         except Exception as e:
-            self._logger.error(f'Unexpected error during deposit: {e}')
+            self._logger.add_event_fields(error=f'Unexpected error during deposit: {e}')
             raise DatabaseError(f'Deposit operation failed: {e}')
 
+    @tracer.traced('WalletService.withdraw')
     async def withdraw(self, wallet_id: str, amount: Decimal) -> Wallet:
         """
         Withdraw money from a wallet.
@@ -101,17 +99,15 @@ class WalletService(IWalletService):
             DatabaseError: If withdraw operation fails
         """
         try:
-            self._logger.info(f'Withdrawing {amount} from wallet {wallet_id}')
-            wallet = await self._wallet_repository.withdraw(wallet_id, amount)
-            self._logger.info(f'Withdraw successful: wallet {wallet.id}, new balance: {wallet.balance}')
-            return wallet
-        except (InvalidAmountError, InvalidWalletIdError, WalletNotFoundError, InsufficientFundsError):
+            return await self._wallet_repository.withdraw(wallet_id, amount)
+        except (InvalidAmountError, InvalidWalletIdError, WalletNotFoundError, InsufficientFundsError, DatabaseError):
             # Re-raise domain exceptions without wrapping
             raise
         except Exception as e:
-            self._logger.error(f'Unexpected error during withdraw: {e}')
+            self._logger.add_event_fields(error=f'Unexpected error during withdraw: {e}')
             raise DatabaseError(f'Withdraw operation failed: {e}')
 
+    @tracer.traced('WalletService.get_wallet')
     async def get_wallet(self, wallet_id: str) -> Wallet:
         """
         Retrieve a wallet by its ID.
@@ -128,13 +124,32 @@ class WalletService(IWalletService):
             DatabaseError: If retrieval operation fails
         """
         try:
-            self._logger.info(f'Getting wallet with ID: {wallet_id}')
-            wallet = await self._wallet_repository.get_wallet(wallet_id=wallet_id)
-            self._logger.info(f'Wallet retrieved successfully: {wallet.id}')
-            return wallet
-        except (InvalidWalletIdError, WalletNotFoundError):
+            return await self._wallet_repository.get_wallet(wallet_id=wallet_id)
+        except (InvalidWalletIdError, WalletNotFoundError, DatabaseError):
             # Re-raise domain exceptions without wrapping
             raise
         except Exception as e:
-            self._logger.error(f'Unexpected error during wallet retrieval: {e}')
+            self._logger.add_event_fields(error=f'Unexpected error during wallet retrieval: {e}')
             raise DatabaseError(f'Wallet retrieval failed: {e}')
+
+    @tracer.traced('WalletService.list_wallets')
+    async def list_wallets(self, query: WalletListQuery) -> WalletPage:
+        """
+        List wallets page by page.
+
+        Args:
+            query: Page size, cursor, sort order and filters
+
+        Returns:
+            WalletPage: The wallets and the cursor of the next page
+
+        Raises:
+            DatabaseError: If the listing query fails
+        """
+        try:
+            return await self._wallet_repository.list_wallets(query)
+        except DatabaseError:
+            raise
+        except Exception as e:
+            self._logger.add_event_fields(error=f'Unexpected error during wallet listing: {e}')
+            raise DatabaseError(f'Wallet listing failed: {e}')
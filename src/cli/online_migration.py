@@ -0,0 +1,122 @@
+"""
+Run the data phase of an online column migration.
+
+A column change goes through these steps without locking the table:
+1. a migration adds the new column as nullable; the application writes it
+   for every row it changes (dual-write);
+2. `backfill` fills the remaining rows in short chunks while traffic runs;
+   an interrupted backfill resumes from its last chunk;
+3. `verify` checks every row has the new column and agrees with the old
+   ones, and exits non-zero otherwise;
+4. reads switch to the new column (for balance_minor: BALANCE_MINOR_UNITS);
+5. a later migration makes the column NOT NULL with set_not_null_online.
+
+Usage:
+    python -m src.cli.online_migration status
+    python -m src.cli.online_migration backfill balance_minor [--restart]
+    python -m src.cli.online_migration verify balance_minor
+"""
+import argparse
+import asyncio
+import sys
+import asyncpg
+from src.infrastructure.logger import logger
+from src.infrastructure.online_migration import COLUMN_MIGRATIONS, ColumnBackfill, DualWriteVerifier
+from src.settings import settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Online column migrations')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('status', help='Show backfill progress of every column migration')
+    for command in ('backfill', 'verify'):
+        subparser = commands.add_parser(command)
+        subparser.add_argument('migration', choices=sorted(COLUMN_MIGRATIONS))
+        subparser.add_argument('--batch-size', type=int, default=settings.ONLINE_MIGRATION_BATCH_SIZE)
+        subparser.add_argument('--duty-cycle', type=float, default=settings.ONLINE_MIGRATION_DUTY_CYCLE,
+                               help='Fraction of time the connection may spend querying')
+    backfill = commands.choices['backfill']
+    backfill.add_argument('--lock-timeout-ms', type=int, default=settings.ONLINE_MIGRATION_LOCK_TIMEOUT_MS,
+                          help='Longest wait for a row lock held by the application')
+    backfill.add_argument('--restart', action='store_true', help='Ignore the progress and start from the beginning')
+    return parser.parse_args()
+
+
+async def status(connection: asyncpg.Connection) -> int:
+    for migration in COLUMN_MIGRATIONS.values():
+        progress = await ColumnBackfill(connection, migration, logger).progress()
+        if progress is None:
+            logger.info('Backfill not started', migration=migration.name)
+            continue
+        logger.info(
+            'Backfill status',
+            migration=migration.name,
+            finished=progress.finished,
+            rows_scanned=progress.rows_scanned,
+            rows_updated=progress.rows_updated,
+            last_id=str(progress.last_id) if progress.last_id else None,
+            updated_at=progress.updated_at.isoformat()
+        )
+    return 0
+
+
+async def backfill(connection: asyncpg.Connection, args: argparse.Namespace) -> int:
+    progress = await ColumnBackfill(
+        connection,
+        COLUMN_MIGRATIONS[args.migration],
+        logger,
+        batch_size=args.batch_size,
+        duty_cycle=args.duty_cycle,
+        lock_timeout_ms=args.lock_timeout_ms
+    ).run(restart=args.restart)
+    logger.info(
+        'Backfill finished',
+        migration=args.migration,
+        rows_scanned=progress.rows_scanned,
+        rows_updated=progress.rows_updated
+    )
+    return 0
+
+
+async def verify(connection: asyncpg.Connection, args: argparse.Namespace) -> int:
+    result = await DualWriteVerifier(
+        connection,
+        COLUMN_MIGRATIONS[args.migration],
+        logger,
+        batch_size=args.batch_size,
+        duty_cycle=args.duty_cycle
+    ).run()
+    logger.info(
+        'Verification finished',
+        migration=args.migration,
+        ok=result.ok,
+        rows_checked=result.rows_checked,
+        pending=result.pending,
+        mismatched=result.mismatched,
+        samples=[str(row_id) for row_id in result.samples],
+        seconds=round(result.seconds, 3)
+    )
+    return 0 if result.ok else 1
+
+
+async def main() -> int:
+    args = parse_args()
+    connection = await asyncpg.connect(
+        settings.DATABASE_DSN,
+        server_settings={
+            'application_name': 'wallet-online-migration',
+            'statement_timeout': str(settings.ONLINE_MIGRATION_STATEMENT_TIMEOUT_MS),
+        }
+    )
+    try:
+        if args.command == 'status':
+            return await status(connection)
+        if args.command == 'backfill':
+            return await backfill(connection, args)
+        return await verify(connection, args)
+    finally:
+        await connection.close()
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,40 @@
+"""
+Operation queue worker.
+
+Usage:
+    python -m src.cli.operation_worker
+"""
+import asyncio
+import signal
+import sys
+from src.infrastructure.database.database import async_session_maker, engine
+from src.infrastructure.logger import logger
+from src.infrastructure.workers import OperationWorker
+from src.settings import settings
+
+
+async def main():
+    if settings.WALLET_STORAGE in ('memory', 'sharded'):
+        # Wallets outside the main wallets table are invisible to the worker; the API refuses new operations
+        logger.error('The operation worker does not support %s wallet storage', settings.WALLET_STORAGE)
+        sys.exit(1)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker = OperationWorker(
+        session_maker=async_session_maker,
+        logger=logger,
+        batch_size=settings.OPERATION_WORKER_BATCH_SIZE,
+        poll_interval=settings.OPERATION_WORKER_POLL_INTERVAL
+    )
+    try:
+        await worker.run(stop)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,32 @@
+"""
+Recompute wallet aggregates from the wallets table.
+
+Computes a fresh count and sum from a snapshot, adds the drift to the
+striped totals and prints it. Writers are not blocked during the scan.
+
+Usage:
+    python -m src.cli.reconcile_stats
+"""
+import asyncio
+from src.infrastructure.database.database import async_session_maker, engine
+from src.infrastructure.database.stats import recompute_totals
+from src.infrastructure.logger import logger
+
+
+async def main():
+    try:
+        before, after = await recompute_totals(async_session_maker)
+    finally:
+        await engine.dispose()
+
+    logger.info(
+        'Wallet stats reconciled',
+        wallet_count=after.wallet_count,
+        total_balance=str(after.total_balance),
+        wallet_count_drift=after.wallet_count - before.wallet_count,
+        total_balance_drift=str(after.total_balance - before.total_balance)
+    )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+Check every wallet for inconsistent balances.
+
+Finds negative balances, values that do not fit numeric(12, 2), mismatched
+minor-unit balances and, with --check-operations, balances that differ from
+the net sum of applied operations. Discrepancies are written as JSON lines
+to the report file; an interrupted pass resumes from its checkpoint.
+
+Usage:
+    python -m src.cli.reconcile_wallets [--restart] [--check-operations]
+"""
+import argparse
+import sys
+from src.infrastructure.logger import logger
+from src.infrastructure.reconciliation import ReconciliationCheckpoint, WalletReconciler
+from src.settings import settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Parallel wallet consistency check')
+    parser.add_argument('--processes', type=int, default=settings.RECONCILE_PROCESSES)
+    parser.add_argument('--connections', type=int, default=settings.RECONCILE_CONNECTIONS,
+                        help='Concurrent connections per process')
+    parser.add_argument('--ranges', type=int, default=settings.RECONCILE_RANGES,
+                        help='Number of key ranges for a new pass')
+    parser.add_argument('--fetch-size', type=int, default=settings.RECONCILE_FETCH_SIZE)
+    parser.add_argument('--duty-cycle', type=float, default=settings.RECONCILE_DUTY_CYCLE,
+                        help='Fraction of time each connection may spend querying')
+    parser.add_argument('--checkpoint', default=settings.RECONCILE_CHECKPOINT_PATH)
+    parser.add_argument('--report', default=settings.RECONCILE_REPORT_PATH)
+    parser.add_argument('--check-operations', action='store_true',
+                        help='Compare balances with applied operations; only meaningful when '
+                             'every balance change goes through the operation queue')
+    parser.add_argument('--restart', action='store_true', help='Ignore the checkpoint and start a new pass')
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    reconciler = WalletReconciler(
+        dsn=settings.DATABASE_DSN,
+        logger=logger,
+        checkpoint=ReconciliationCheckpoint(args.checkpoint),
+        report_path=args.report,
+        processes=args.processes,
+        connections=args.connections,
+        ranges=args.ranges,
+        fetch_size=args.fetch_size,
+        duty_cycle=args.duty_cycle,
+        statement_timeout_ms=settings.RECONCILE_STATEMENT_TIMEOUT_MS,
+        check_operations=args.check_operations
+    )
+    summary = reconciler.run(resume=not args.restart)
+    logger.info(
+        'Reconciliation finished',
+        ranges=summary.ranges,
+        skipped=summary.skipped,
+        checked=summary.checked,
+        discrepancies=summary.discrepancies,
+        seconds=round(summary.seconds, 3),
+        report=args.report
+    )
+    return 1 if summary.discrepancies else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Move wallet bucket ranges between shards while the API keeps serving.
+
+Wallets are assigned to shards by bucket, the low 16 bits of their ID
+(0-65535). The main database owns every bucket until the first move; extra
+shards are listed in SHARDS and must be migrated first. A move stops placing
+new wallets in the range, hands the range over step by step and finally
+moves wallets that workers with a stale map created on the old owner.
+An interrupted move is finished by running the same command again.
+
+Usage:
+    python -m src.cli.reshard status
+    python -m src.cli.reshard move 32768 65536 shard1 [--step-buckets 256] [--grace-seconds 15]
+"""
+import argparse
+import asyncio
+import sys
+import asyncpg
+from src.infrastructure.logger import logger
+from src.infrastructure.sharding import BUCKET_COUNT, MAIN_SHARD
+from src.infrastructure.sharding.engines import asyncpg_dsn
+from src.infrastructure.sharding.resharder import RangeMover
+from src.settings import settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Move wallet bucket ranges between shards')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('status', help='Show the shard map and the wallets of every shard')
+    move = commands.add_parser('move', help='Move buckets [start, end) to a shard')
+    move.add_argument('start', type=int)
+    move.add_argument('end', type=int)
+    move.add_argument('target', choices=[MAIN_SHARD, *settings.SHARDS])
+    move.add_argument('--step-buckets', type=int, default=settings.RESHARD_STEP_BUCKETS,
+                      help='Buckets handed over per transaction; bounds how long wallets stay locked')
+    move.add_argument('--grace-seconds', type=float, default=settings.RESHARD_GRACE_SECONDS,
+                      help='Time for every worker to pick up a map change')
+    args = parser.parse_args()
+    if args.command == 'move' and not 0 <= args.start < args.end <= BUCKET_COUNT:
+        parser.error(f'expected 0 <= start < end <= {BUCKET_COUNT}')
+    return args
+
+
+async def connect(dsn: str) -> asyncpg.Connection:
+    return await asyncpg.connect(
+        dsn,
+        server_settings={'application_name': 'wallet-reshard', 'statement_timeout': '0'}
+    )
+
+
+async def status(mover: RangeMover, shards: dict[str, asyncpg.Connection]) -> int:
+    for item in (await mover.load_map()).ranges:
+        logger.info('Shard range', start=item.start, end=item.end, shard=item.shard, state=item.state, peer=item.peer)
+    for name, connection in shards.items():
+        wallets = await connection.fetchval('SELECT coalesce(sum(wallet_count), 0) FROM wallet_stats')
+        logger.info('Shard', shard=name, wallets=wallets)
+    return 0
+
+
+async def main() -> int:
+    args = parse_args()
+    dsns = {MAIN_SHARD: settings.DATABASE_DSN, **{name: asyncpg_dsn(url) for name, url in settings.SHARDS.items()}}
+    # The map is written on its own connection while the source rows of a step stay locked
+    catalog = await connect(settings.DATABASE_DSN)
+    shards = {}
+    try:
+        for name, dsn in dsns.items():
+            shards[name] = await connect(dsn)
+        mover = RangeMover(
+            catalog,
+            shards,
+            logger,
+            step_buckets=getattr(args, 'step_buckets', settings.RESHARD_STEP_BUCKETS),
+            grace_seconds=getattr(args, 'grace_seconds', settings.RESHARD_GRACE_SECONDS),
+            channel=settings.SHARD_MAP_CHANNEL
+        )
+        if args.command == 'status':
+            return await status(mover, shards)
+        summary = await mover.move(args.start, args.end, args.target)
+        logger.info(
+            'Move finished',
+            start=args.start,
+            end=args.end,
+            target=args.target,
+            steps=summary.steps,
+            wallets=summary.wallets,
+            leftovers=summary.leftovers,
+            seconds=round(summary.seconds, 3)
+        )
+        return 0
+    finally:
+        for connection in (catalog, *shards.values()):
+            await connection.close()
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
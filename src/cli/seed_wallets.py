@@ -0,0 +1,131 @@
+"""
+Bulk-load generated wallets for benchmarks.
+
+Generates wallets with a chosen balance distribution (and, with
+--operations-mean, a consistent history of applied operations) and loads
+them with binary COPY in bounded memory. Secondary indexes are dropped for
+the load and rebuilt afterwards, wallet_stats is recomputed and the API
+workers are told to rebuild their wallet ID filters.
+
+With --workload it also writes a CSV of deposits and withdrawals for load
+tests, concentrated on a few hot wallets with a Zipf distribution.
+
+Run it against a benchmark database, not production: the deferred indexes
+are missing while the load runs.
+
+Usage:
+    python -m src.cli.seed_wallets --wallets 20000000 --distribution lognormal --scale 150 --shape 1.5 \\
+        --zero-fraction 0.3 --operations-mean 4
+    python -m src.cli.seed_wallets --wallets 1000000 --workload workloads/hot.csv --skew 1.1
+"""
+import argparse
+import asyncio
+import random
+import sys
+from decimal import Decimal
+import asyncpg
+from src.infrastructure.database.database import async_session_maker, engine
+from src.infrastructure.database.stats import recompute_totals
+from src.infrastructure.logger import logger
+from src.infrastructure.membership.wallet_id_filter import REBUILD_NOTIFICATION
+from src.infrastructure.seeding import (
+    DISTRIBUTIONS, WalletReservoir, WalletSeedGenerator, WalletSeedLoader, batches, make_distribution, write_workload
+)
+from src.settings import settings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Bulk-load generated wallets')
+    parser.add_argument('--wallets', type=int, default=1_000_000)
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='lognormal')
+    parser.add_argument('--scale', type=Decimal, default=Decimal('100'),
+                        help='Upper bound (uniform), median (lognormal) or minimum (pareto) balance')
+    parser.add_argument('--shape', type=float, default=1.5, help='Sigma (lognormal) or alpha (pareto)')
+    parser.add_argument('--zero-fraction', type=float, default=0.2, help='Share of empty wallets')
+    parser.add_argument('--days', type=float, default=365.0, help='Wallet creation times span this many days')
+    parser.add_argument('--operations-mean', type=float, default=0.0,
+                        help='Mean number of applied operations per wallet; 0 loads no history')
+    parser.add_argument('--batch-size', type=int, default=50_000, help='Wallets per COPY batch')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep-indexes', action='store_true', help='Maintain secondary indexes during the load')
+    parser.add_argument('--maintenance-work-mem', default='1GB', help='Memory for rebuilding the indexes')
+    parser.add_argument('--skip-stats', action='store_true', help='Do not recompute wallet_stats')
+    parser.add_argument('--workload', help='Write a hot-wallet workload CSV to this path')
+    parser.add_argument('--workload-operations', type=int, default=1_000_000)
+    parser.add_argument('--workload-wallets', type=int, default=10_000,
+                        help='Seeded wallets sampled as targets of the workload')
+    parser.add_argument('--skew', type=float, default=1.1, help='Zipf exponent of the workload; 0 is uniform')
+    return parser.parse_args()
+
+
+async def main() -> int:
+    args = parse_args()
+    distribution = make_distribution(args.distribution, args.scale, args.shape, args.zero_fraction)
+    generator = WalletSeedGenerator(
+        count=args.wallets,
+        distribution=distribution,
+        seed=args.seed,
+        days=args.days,
+        operations_mean=args.operations_mean
+    )
+    reservoir = WalletReservoir(args.workload_wallets, random.Random(args.seed + 1)) if args.workload else None
+
+    def sample_hot_wallets(wallets):
+        for wallet in wallets:
+            reservoir.offer(wallet.id)
+
+    connection = await asyncpg.connect(
+        settings.DATABASE_DSN,
+        server_settings={
+            'application_name': 'wallet-seed',
+            # A lost batch on crash is acceptable for seeding; the load does not wait for WAL flushes
+            'synchronous_commit': 'off',
+            'statement_timeout': '0',
+            'maintenance_work_mem': args.maintenance_work_mem,
+        }
+    )
+    try:
+        summary = await WalletSeedLoader(connection, logger).load(
+            batches(generator.wallets(), args.batch_size),
+            defer_indexes=not args.keep_indexes,
+            on_batch=sample_hot_wallets if reservoir else None
+        )
+        await connection.execute('SELECT pg_notify($1, $2)', settings.WALLET_CREATED_CHANNEL, REBUILD_NOTIFICATION)
+    finally:
+        await connection.close()
+
+    if not args.skip_stats:
+        try:
+            await recompute_totals(async_session_maker)
+        finally:
+            await engine.dispose()
+
+    logger.info(
+        'Seeding finished',
+        wallets=summary.wallets,
+        operations=summary.operations,
+        wallets_per_second=round(summary.wallets / summary.load_seconds) if summary.load_seconds else None,
+        load_seconds=round(summary.load_seconds, 3),
+        index_seconds=round(summary.index_seconds, 3)
+    )
+
+    if reservoir is not None and reservoir.wallet_ids:
+        hot_share = write_workload(
+            args.workload,
+            reservoir.wallet_ids,
+            operations=args.workload_operations,
+            skew=args.skew,
+            seed=args.seed
+        )
+        logger.info(
+            'Workload written',
+            path=args.workload,
+            operations=args.workload_operations,
+            wallets=len(reservoir.wallet_ids),
+            hottest_percent_share=round(hot_share, 3)
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
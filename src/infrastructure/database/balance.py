@@ -0,0 +1,91 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+from sqlalchemy import Select
+from src.application.domain.money import to_minor_units, from_minor_units
+from src.infrastructure.database.models.wallet import Wallet
+from src.settings import settings
+
+
+WALLET_LOCK_MODES = ('for_update', 'for_no_key_update')
+
+
+def with_wallet_lock(query: Select, lock_mode: Optional[str] = None) -> Select:
+    """
+    Lock the selected wallet rows for a balance change.
+
+    FOR NO KEY UPDATE is sufficient for balance changes since they never
+    modify the key, and unlike FOR UPDATE it does not conflict with the
+    FOR KEY SHARE locks taken by foreign key checks.
+
+    Args:
+        query: Select of wallet rows
+        lock_mode: One of WALLET_LOCK_MODES, settings.WALLET_LOCK_MODE when omitted
+
+    Returns:
+        Select: The query with its row lock clause
+
+    Raises:
+        ValueError: If the lock mode is unknown
+    """
+    lock_mode = lock_mode or settings.WALLET_LOCK_MODE
+    if lock_mode not in WALLET_LOCK_MODES:
+        raise ValueError(f'Unknown wallet lock mode: {lock_mode}')
+    # key_share without read renders FOR NO KEY UPDATE
+    return query.with_for_update(key_share=lock_mode == 'for_no_key_update')
+
+
+def current_minor_units(wallet: Wallet) -> int:
+    """
+    Get the wallet balance in minor units.
+
+    Falls back to the decimal column for rows the backfill has not reached yet.
+
+    Args:
+        wallet: The wallet entity
+
+    Returns:
+        int: Balance in minor units
+    """
+    if wallet.balance_minor is None:
+        return to_minor_units(wallet.balance)
+    return wallet.balance_minor
+
+
+def has_funds(wallet: Wallet, amount: Decimal) -> bool:
+    """
+    Check whether the wallet balance covers the amount.
+
+    Args:
+        wallet: The wallet entity
+        amount: The amount to cover
+
+    Returns:
+        bool: True if the balance is at least the amount
+    """
+    if settings.BALANCE_MINOR_UNITS:
+        return current_minor_units(wallet) >= to_minor_units(amount)
+    return wallet.balance >= amount
+
+
+def apply_balance_delta(wallet: Wallet, delta: Decimal):
+    """
+    Add a signed amount to the wallet balance, writing both balance columns.
+
+    With BALANCE_MINOR_UNITS enabled the arithmetic is done on the BIGINT
+    column and the numeric column is a converted mirror; otherwise the
+    numeric column is authoritative and the BIGINT column is the mirror.
+    Writing both keeps either mode valid during the online migration, and
+    keeps the numeric(12, 2) limit of 10^10 in both modes.
+
+    Args:
+        wallet: The locked wallet entity
+        delta: Signed amount (negative for withdrawals)
+    """
+    if settings.BALANCE_MINOR_UNITS:
+        balance_minor = current_minor_units(wallet) + to_minor_units(delta)
+        wallet.balance_minor = balance_minor
+        wallet.balance = from_minor_units(balance_minor)
+    else:
+        # Round like the numeric(12, 2) column so no refresh is needed after commit
+        wallet.balance = (wallet.balance + delta).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        wallet.balance_minor = to_minor_units(wallet.balance)
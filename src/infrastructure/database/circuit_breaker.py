@@ -0,0 +1,180 @@
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.application.exceptions import CircuitOpenError
+from src.settings import settings
+
+
+# SQLSTATEs meaning the server is unreachable or refusing connections: connection
+# exceptions, operator intervention (shutdown, cannot connect now) and too_many_connections.
+# Statement-level failures such as query_canceled (57014) or out_of_memory do not count
+OUTAGE_SQLSTATE_PREFIXES = ('08', '57P')
+TOO_MANY_CONNECTIONS = '53300'
+
+
+class CircuitState(str, Enum):
+    """
+    Enumeration of circuit breaker states.
+
+    Attributes:
+        CLOSED: Calls go through
+        OPEN: Calls fail fast until the reset timeout elapses
+        HALF_OPEN: One probe call at a time decides whether to close again
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+def is_outage(error: BaseException) -> bool:
+    """
+    Whether an error means the database is unavailable rather than the request being wrong.
+
+    Only connection-level failures count: connect and pool checkout timeouts,
+    socket errors, lost connections, refused connections and server shutdown.
+    Errors of a single statement, including statement_timeout cancellations,
+    constraint violations and syntax errors, do not.
+    The exception chain is walked since drivers wrap the original error.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (TimeoutError, OSError, PoolTimeoutError)):
+            return True
+        sqlstate = getattr(error, 'sqlstate', None)
+        if isinstance(sqlstate, str) and (sqlstate.startswith(OUTAGE_SQLSTATE_PREFIXES) or sqlstate == TOO_MANY_CONNECTIONS):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for the worker's database engine.
+
+    It opens after failure_threshold outage errors in a row; while open,
+    connection checkout raises CircuitOpenError at once instead of waiting
+    for the pool timeout. After reset_timeout the circuit is half-open and
+    lets a single checkout through as a probe: a successful statement
+    closes it, a failure opens it for another reset_timeout. A probe that
+    never reports back is replaced after reset_timeout.
+
+    All calls happen on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 5.0,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive outage errors that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            enabled: When False the breaker never rejects calls
+            clock: Monotonic clock, injectable for tests
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.enabled = enabled
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed, 0 when the circuit is closed."""
+        if self._state == CircuitState.CLOSED:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def before_call(self):
+        """
+        Admit a call or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight
+        """
+        if not self.enabled or self._state == CircuitState.CLOSED:
+            return
+        now = self._clock()
+        if self.state == CircuitState.OPEN:
+            retry_after = self.retry_after()
+        elif self._probe_started is None or now - self._probe_started >= self.reset_timeout:
+            self._probe_started = now
+            return
+        else:
+            retry_after = self._probe_started + self.reset_timeout - now
+        self.rejected += 1
+        raise CircuitOpenError('Database circuit is open after repeated failures', retry_after=retry_after)
+
+    def record_success(self):
+        """Reset the failure count; a success while open or half-open closes the circuit."""
+        self._failures = 0
+        self._probe_started = None
+        self._state = CircuitState.CLOSED
+
+    def record_failure(self):
+        """Count an outage error, opening the circuit at the threshold or on a failed probe."""
+        self._failures += 1
+        if self._state != CircuitState.CLOSED or self._failures >= self.failure_threshold:
+            if self._state == CircuitState.CLOSED:
+                self.opened += 1
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            self._probe_started = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot for health and admin endpoints."""
+        return {
+            'state': self.state.value,
+            'consecutive_failures': self._failures,
+            'retry_after_seconds': round(self.retry_after(), 3),
+            'opened': self.opened,
+            'rejected': self.rejected
+        }
+
+
+def instrument_circuit_breaker(engine: AsyncEngine, breaker: CircuitBreaker):
+    """
+    Feed statement outcomes of an engine into a breaker.
+
+    Checkout failures are recorded by InstrumentedAsyncQueuePool; errors
+    raised before a connection exists are skipped here to avoid counting
+    them twice.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def _after_cursor_execute(_conn, _cursor, _statement, _parameters, _context, _executemany):
+        breaker.record_success()
+
+    @event.listens_for(sync_engine, 'handle_error')
+    def _handle_error(context):
+        if context.connection is None:
+            return
+        if context.is_disconnect or is_outage(context.original_exception):
+            breaker.record_failure()
+
+
+circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.CIRCUIT_BREAKER_RESET_SECONDS,
+    enabled=settings.CIRCUIT_BREAKER_ENABLED
+)
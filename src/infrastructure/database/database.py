@@ -1,13 +1,27 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from src.infrastructure.database.circuit_breaker import circuit_breaker, instrument_circuit_breaker
+from src.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from src.infrastructure.tracing import tracer
+from src.infrastructure.tracing.sql import instrument_engine
 from src.settings import settings
 
 
 engine = create_async_engine(
     settings.DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_timeout=settings.DATABASE_POOL_TIMEOUT,
     pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    # Server-side statement timeout so long jobs can lift it with SET LOCAL; 0 disables it
+    connect_args={
+        'timeout': settings.DATABASE_CONNECT_TIMEOUT,
+        'server_settings': {'statement_timeout': str(settings.DATABASE_STATEMENT_TIMEOUT_MS)}
+    },
     echo=False
 )
+if settings.CIRCUIT_BREAKER_ENABLED:
+    instrument_circuit_breaker(engine, circuit_breaker)
+if settings.TRACING_ENABLED:
+    instrument_engine(engine, tracer)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
@@ -0,0 +1,237 @@
+import asyncio
+import contextvars
+import uuid
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.infrastructure.database.balance import apply_balance_delta, has_funds, with_wallet_lock
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.notify import notify_balance_changed
+from src.infrastructure.database.stats import apply_stats_delta
+from src.infrastructure.logger import Logger
+from src.application.exceptions import (
+    WalletNotFoundError,
+    InsufficientFundsError,
+    CircuitOpenError,
+    DatabaseError
+)
+
+
+class CommitFailedError(Exception):
+    """COMMIT of a batch failed; the server may or may not have applied it."""
+
+
+@dataclass
+class BalanceChange:
+    """
+    A deposit or withdrawal waiting for its batch.
+
+    Attributes:
+        wallet_id: The target wallet
+        amount: Positive amount
+        withdraw: True for withdrawals
+        future: Completed with the updated wallet or the operation's error
+    """
+    wallet_id: uuid.UUID
+    amount: Decimal
+    withdraw: bool
+    future: asyncio.Future = field(repr=False)
+
+
+class GroupCommitExecutor:
+    """
+    Applies concurrent balance changes of different wallets in shared transactions.
+
+    Changes arriving within the window are gathered into a batch of at most
+    max_batch distinct wallets; a second change of a wallet already in the
+    batch waits for the next one, so each wallet is changed at most once per
+    transaction and callers observe their own change in arrival order.
+    A batch locks its wallets with one locking SELECT in ID order,
+    which cannot deadlock with other batches or single-wallet transactions,
+    and commits once, so one WAL flush covers the whole batch.
+
+    Every change runs in its own savepoint: a missing wallet, insufficient
+    funds or a failing statement fails that caller only. If the batch fails
+    before COMMIT is sent (e.g. the lock query), its changes are retried one
+    by one. A failed COMMIT fails every caller with DatabaseError instead:
+    the connection may have dropped after the server committed, and a retry
+    would apply the changes twice.
+    Batches run one at a time; the next batch forms while the current one
+    commits, so batches grow with load.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        logger: Logger,
+        window: float = 0.002,
+        max_batch: int = 64,
+        lock_mode: Optional[str] = None
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            session_maker: Factory for database sessions
+            logger: Logger instance
+            window: Seconds to wait for more changes after the first one of a batch
+            max_batch: Maximum number of changes (and wallets) per transaction
+            lock_mode: Row lock of the batch, settings.WALLET_LOCK_MODE when omitted
+        """
+        self._session_maker = session_maker
+        self._logger = logger
+        self.window = window
+        self.max_batch = max_batch
+        self.lock_mode = lock_mode
+        self._batch: Dict[uuid.UUID, BalanceChange] = {}
+        self._waiting: List[BalanceChange] = []
+        self._full = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.changes = 0
+
+    async def submit(self, wallet_id: uuid.UUID, amount: Decimal, withdraw: bool) -> Wallet:
+        """
+        Apply a balance change as part of the next batch.
+
+        Args:
+            wallet_id: The target wallet
+            amount: Positive amount
+            withdraw: True for a withdrawal
+
+        Returns:
+            Wallet: The updated wallet
+
+        Raises:
+            WalletNotFoundError: If wallet is not found
+            InsufficientFundsError: If wallet has insufficient funds
+            DatabaseError: If the change could not be applied
+        """
+        change = BalanceChange(wallet_id, amount, withdraw, asyncio.get_running_loop().create_future())
+        self._enqueue(change)
+        if self._runner is None or self._runner.done():
+            # Fresh context: the runner serves many requests and must not
+            # write into the request event or trace of the one that started it
+            self._runner = asyncio.create_task(self._run(), context=contextvars.Context())
+        return await change.future
+
+    def _enqueue(self, change: BalanceChange):
+        if change.wallet_id in self._batch or len(self._batch) >= self.max_batch:
+            self._waiting.append(change)
+            return
+        self._batch[change.wallet_id] = change
+        if len(self._batch) >= self.max_batch:
+            self._full.set()
+
+    def _take_batch(self) -> List[BalanceChange]:
+        batch = list(self._batch.values())
+        self._batch = {}
+        self._full.clear()
+        waiting, self._waiting = self._waiting, []
+        for change in waiting:
+            self._enqueue(change)
+        return batch
+
+    async def _run(self):
+        while self._batch:
+            if len(self._batch) < self.max_batch and self.window > 0:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+            batch = self._take_batch()
+            try:
+                await self._apply_batch(batch)
+            except CircuitOpenError as e:
+                # Retrying one by one would only be rejected again
+                for change in batch:
+                    if not change.future.done():
+                        change.future.set_exception(e)
+            except CommitFailedError as e:
+                self._logger.error('Group commit batch commit failed, outcome unknown: %r', e.__cause__,
+                                   batch_size=len(batch))
+                for change in batch:
+                    if not change.future.done():
+                        change.future.set_exception(
+                            DatabaseError(f'Balance change outcome unknown, commit failed: {e.__cause__}')
+                        )
+            except Exception as e:
+                self._logger.warning('Group commit batch failed, retrying individually: %r', e, batch_size=len(batch))
+                for change in batch:
+                    if change.future.done():
+                        continue
+                    try:
+                        await self._apply_batch([change])
+                    except CircuitOpenError as error:
+                        change.future.set_exception(error)
+                    except CommitFailedError as error:
+                        change.future.set_exception(
+                            DatabaseError(f'Balance change outcome unknown, commit failed: {error.__cause__}')
+                        )
+                    except Exception as error:
+                        change.future.set_exception(DatabaseError(f'Balance change failed: {error}'))
+            self.batches += 1
+            self.changes += len(batch)
+
+    async def _apply_batch(self, batch: List[BalanceChange]):
+        """Apply one transaction's worth of changes and complete their callers."""
+        # Callers that gave up (e.g. a disconnected client) are not applied
+        batch = sorted((change for change in batch if not change.future.done()), key=lambda change: change.wallet_id)
+        if not batch:
+            return
+        results: Dict[uuid.UUID, object] = {}
+        async with self._session_maker() as session:
+            try:
+                query = with_wallet_lock(
+                    select(Wallet)
+                    .where(Wallet.id.in_([change.wallet_id for change in batch]))
+                    .order_by(Wallet.id),
+                    self.lock_mode
+                )
+                wallets = {wallet.id: wallet for wallet in (await session.execute(query)).scalars()}
+
+                balance_delta = Decimal('0.00')
+                for change in batch:
+                    wallet = wallets.get(change.wallet_id)
+                    if wallet is None:
+                        results[change.wallet_id] = WalletNotFoundError(f'Wallet with ID {change.wallet_id} not found')
+                        continue
+                    if change.withdraw and not has_funds(wallet, change.amount):
+                        results[change.wallet_id] = InsufficientFundsError(
+                            f'Insufficient funds: balance {wallet.balance}, '
+                            f'requested {change.amount}'
+                        )
+                        continue
+
+                    delta = -change.amount if change.withdraw else change.amount
+                    try:
+                        async with session.begin_nested():
+                            apply_balance_delta(wallet, delta)
+                            await session.flush()
+                            await notify_balance_changed(session, wallet)
+                    except Exception as e:
+                        results[change.wallet_id] = DatabaseError(f'Balance change failed: {e}')
+                        continue
+                    balance_delta += delta
+                    results[change.wallet_id] = wallet
+
+                if wallets:
+                    await apply_stats_delta(session, next(iter(wallets)), 0, balance_delta)
+                try:
+                    await session.commit()
+                except Exception as e:
+                    raise CommitFailedError() from e
+            except Exception:
+                await session.rollback()
+                raise
+
+        for change in batch:
+            result = results[change.wallet_id]
+            if change.future.done():
+                continue
+            if isinstance(result, Exception):
+                change.future.set_exception(result)
+            else:
+                change.future.set_result(result)
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.application.exceptions import CircuitOpenError
+from src.infrastructure.database.circuit_breaker import CircuitBreaker, circuit_breaker
+from src.infrastructure.database.database import engine
+from src.infrastructure.logger import Logger, logger
+from src.settings import settings
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """
+    Outcome of one database probe.
+
+    Attributes:
+        healthy: Whether the probe query succeeded
+        checked_at: When the probe finished
+        latency_ms: Duration of the probe
+        error: Failure reason of an unhealthy probe
+    """
+    healthy: bool
+    checked_at: datetime
+    latency_ms: float
+    error: Optional[str] = None
+
+
+class DatabaseHealthProbe:
+    """
+    Background database probe behind /health and /ready.
+
+    One `SELECT 1` per interval per worker, whatever the rate of health
+    checks: endpoints only read the last result. The probe goes through the
+    circuit breaker like any request, so it fails fast while the circuit is
+    open and serves as the half-open probe once the reset timeout elapses.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        breaker: CircuitBreaker,
+        logger: Logger,
+        timeout: float = 1.0,
+        max_age: float = 10.0
+    ):
+        """
+        Initialize the probe.
+
+        Args:
+            engine: Engine whose pool is probed
+            breaker: Circuit breaker guarding the engine
+            logger: Logger instance
+            timeout: Seconds before a probe counts as failed
+            max_age: Seconds after which a result is considered stale
+        """
+        self._engine = engine
+        self._breaker = breaker
+        self._logger = logger
+        self.timeout = timeout
+        self.max_age = max_age
+        self.result: Optional[ProbeResult] = None
+        self._monotonic_checked_at = 0.0
+
+    async def check(self) -> ProbeResult:
+        """Run one probe and store its result."""
+        started = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(self._query(), self.timeout)
+        except CircuitOpenError:
+            error = 'circuit open'
+        except asyncio.TimeoutError:
+            # A cancelled statement never reaches the engine's error hook
+            self._breaker.record_failure()
+            error = f'probe timed out after {self.timeout}s'
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+
+        healthy = error is None
+        if self.result is not None and self.result.healthy != healthy:
+            self._logger.warning('Database health changed', healthy=healthy, error=error)
+        self.result = ProbeResult(
+            healthy=healthy,
+            checked_at=datetime.now(UTC),
+            latency_ms=round((time.perf_counter() - started) * 1000, 3),
+            error=error
+        )
+        self._monotonic_checked_at = time.monotonic()
+        return self.result
+
+    async def _query(self):
+        async with self._engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+
+    async def run(self, stop: asyncio.Event, interval: float):
+        """Probe every interval until stopped."""
+        while not stop.is_set():
+            await self.check()
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the last probe succeeded and is recent enough to trust."""
+        return (
+            self.result is not None
+            and self.result.healthy
+            and time.monotonic() - self._monotonic_checked_at <= self.max_age
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Last probe result and breaker state for the health endpoints."""
+        result = self.result
+        return {
+            'healthy': self.healthy,
+            'checked_at': result.checked_at.isoformat() if result else None,
+            'latency_ms': result.latency_ms if result else None,
+            'error': result.error if result else 'not probed yet',
+            'circuit': self._breaker.stats()
+        }
+
+
+health_probe = DatabaseHealthProbe(
+    engine=engine,
+    breaker=circuit_breaker,
+    logger=logger,
+    timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+    # A few missed rounds (e.g. a blocked event loop) make the result stale
+    max_age=3 * settings.HEALTH_PROBE_INTERVAL_SECONDS + settings.HEALTH_PROBE_TIMEOUT_SECONDS
+)
@@ -12,7 +12,9 @@ from src.infrastructure.database.models import Base
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
-config.set_main_option("sqlalchemy.url", f"{settings.DATABASE_URL}?async_fallback=True")
+# Extra shards are migrated with: alembic -x database_url=postgresql+asyncpg://... upgrade head
+database_url = context.get_x_argument(as_dictionary=True).get('database_url', settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", f"{database_url}?async_fallback=True")
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -66,6 +68,9 @@ def run_migrations_online() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # DDL waiting for a lock queues every later query of the table behind
+        # it; fail fast instead so a deploy never stalls production traffic
+        connect_args={'server_settings': {'lock_timeout': str(settings.MIGRATION_LOCK_TIMEOUT_MS)}},
     )
 
     with connectable.connect() as connection:
@@ -0,0 +1,38 @@
+"""online_migration_progress
+
+Revision ID: a9c1e5f3b7d2
+Revises: f6b2d8e4a1c9
+Create Date: 2026-10-19 18:12:44.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c1e5f3b7d2'
+down_revision: Union[str, Sequence[str], None] = 'f6b2d8e4a1c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('online_migration_progress',
+    sa.Column('name', sa.String(length=64), nullable=False, comment='Column migration name'),
+    sa.Column('last_id', postgresql.UUID(as_uuid=True), nullable=True, comment='Highest row ID of the last committed chunk'),
+    sa.Column('rows_scanned', sa.BigInteger(), nullable=False, comment='Rows walked so far'),
+    sa.Column('rows_updated', sa.BigInteger(), nullable=False, comment='Rows written by the backfill so far'),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False, comment='Backfill start date'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, comment='Last chunk date'),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True, comment='Backfill end date'),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('online_migration_progress')
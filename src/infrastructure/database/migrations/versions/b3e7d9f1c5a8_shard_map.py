@@ -0,0 +1,43 @@
+"""shard_map
+
+Revision ID: b3e7d9f1c5a8
+Revises: a9c1e5f3b7d2
+Create Date: 2026-10-19 20:05:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from src.infrastructure.online_migration.ddl import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e7d9f1c5a8'
+down_revision: Union[str, Sequence[str], None] = 'a9c1e5f3b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Shard bucket of a wallet, the low 16 bits of its ID; must match sharding.buckets.BUCKET_SQL
+BUCKET = '(get_byte(uuid_send(id), 14) * 256 + get_byte(uuid_send(id), 15))'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('shard_map',
+    sa.Column('start_bucket', sa.Integer(), autoincrement=False, nullable=False, comment='First bucket of the range'),
+    sa.Column('end_bucket', sa.Integer(), nullable=False, comment='Bucket after the last one of the range'),
+    sa.Column('shard', sa.String(length=64), nullable=False, comment='Owning shard'),
+    sa.Column('state', sa.String(length=16), nullable=False, comment='active, moving or draining'),
+    sa.Column('peer', sa.String(length=64), nullable=True, comment='Other shard of a move'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, comment='Last change date'),
+    sa.PrimaryKeyConstraint('start_bucket')
+    )
+    # Lets the resharding tool lock and copy one bucket range without scanning the table
+    create_index_concurrently('ix_wallets_bucket_id', 'wallets', [sa.text(BUCKET), 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently('ix_wallets_bucket_id', 'wallets')
+    op.drop_table('shard_map')
@@ -0,0 +1,43 @@
+"""wallet_operations
+
+Revision ID: c41d2e7f9b03
+Revises: a7bf8c15589f
+Create Date: 2026-10-19 10:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d2e7f9b03'
+down_revision: Union[str, Sequence[str], None] = 'a7bf8c15589f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('wallet_operations',
+    sa.Column('id', sa.UUID(), nullable=False, comment='Operation ID'),
+    sa.Column('wallet_id', sa.UUID(), nullable=False, comment='Wallet ID'),
+    sa.Column('operation_type', sa.String(length=16), nullable=False, comment='Operation type'),
+    sa.Column('amount', sa.Numeric(precision=12, scale=2), nullable=False, comment='Operation amount'),
+    sa.Column('status', sa.String(length=16), nullable=False, comment='Processing status'),
+    sa.Column('error_code', sa.String(length=32), nullable=True, comment='Error code of a failed operation'),
+    sa.Column('balance_after', sa.Numeric(precision=12, scale=2), nullable=True, comment='Wallet balance after the operation'),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, comment='Record creation date'),
+    sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True, comment='Processing date'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_wallet_operations_pending', 'wallet_operations', ['created_at'], unique=False,
+                    postgresql_where=sa.text("status = 'pending'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_wallet_operations_pending', table_name='wallet_operations',
+                  postgresql_where=sa.text("status = 'pending'"))
+    op.drop_table('wallet_operations')
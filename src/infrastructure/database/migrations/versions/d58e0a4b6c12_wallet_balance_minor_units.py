@@ -0,0 +1,34 @@
+"""wallet_balance_minor_units
+
+Revision ID: d58e0a4b6c12
+Revises: c41d2e7f9b03
+Create Date: 2026-10-19 11:02:17.184420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd58e0a4b6c12'
+down_revision: Union[str, Sequence[str], None] = 'c41d2e7f9b03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Nullable column without a volatile default: metadata-only change, no table rewrite.
+    # It stays in the migration transaction, so a lock timeout rolls it back and a rerun
+    # starts clean. Existing rows are filled outside the deploy by
+    # `python -m src.cli.online_migration backfill balance_minor`; until then reads fall
+    # back to the numeric column.
+    op.add_column('wallets', sa.Column('balance_minor', sa.BigInteger(), nullable=True,
+                                       comment='Wallet balance in minor units'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('wallets', 'balance_minor')
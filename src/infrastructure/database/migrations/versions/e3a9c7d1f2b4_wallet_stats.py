@@ -0,0 +1,40 @@
+"""wallet_stats
+
+Revision ID: e3a9c7d1f2b4
+Revises: d58e0a4b6c12
+Create Date: 2026-10-19 14:02:17.903114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9c7d1f2b4'
+down_revision: Union[str, Sequence[str], None] = 'd58e0a4b6c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('wallet_stats',
+    sa.Column('stripe', sa.SmallInteger(), autoincrement=False, nullable=False, comment='Stripe number'),
+    sa.Column('wallet_count', sa.BigInteger(), nullable=False, comment='Number of wallets'),
+    sa.Column('total_balance', sa.Numeric(precision=20, scale=2), nullable=False, comment='Sum of wallet balances'),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, comment='Last update date'),
+    sa.PrimaryKeyConstraint('stripe')
+    )
+    # Seed stripe 0 with the current totals; writers create other stripes on first use.
+    # Wallets changed while this runs are corrected by `python -m src.cli.reconcile_stats`.
+    op.execute(
+        "INSERT INTO wallet_stats (stripe, wallet_count, total_balance, updated_at) "
+        "SELECT 0, count(*), coalesce(sum(balance), 0), now() FROM wallets"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('wallet_stats')
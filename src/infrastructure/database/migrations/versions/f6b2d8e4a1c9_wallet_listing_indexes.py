@@ -0,0 +1,36 @@
+"""wallet_listing_indexes
+
+Revision ID: f6b2d8e4a1c9
+Revises: e3a9c7d1f2b4
+Create Date: 2026-10-19 16:41:05.218734
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from src.infrastructure.online_migration.ddl import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2d8e4a1c9'
+down_revision: Union[str, Sequence[str], None] = 'e3a9c7d1f2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so writers are not blocked on a large table; the helper
+    # lifts the migration lock timeout for the build and rebuilds an INVALID
+    # index left by a failed one instead of skipping it.
+    create_index_concurrently('ix_wallets_created_at_id', 'wallets', ['created_at', 'id'], unique=False,
+                              postgresql_include=['balance', 'balance_minor'])
+    create_index_concurrently('ix_wallets_nonzero_created_at_id', 'wallets', ['created_at', 'id'], unique=False,
+                              postgresql_include=['balance', 'balance_minor'],
+                              postgresql_where=sa.text('balance <> 0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently('ix_wallets_nonzero_created_at_id', 'wallets')
+    drop_index_concurrently('ix_wallets_created_at_id', 'wallets')
@@ -1,7 +1,11 @@
 from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.migration_progress import MigrationProgress
+from src.infrastructure.database.models.shard_range import ShardRange
 from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.infrastructure.database.models.wallet_stats import WalletStats
 
 
 
-__all__ = ['Base', 'Wallet']
+__all__ = ['Base', 'MigrationProgress', 'ShardRange', 'Wallet', 'WalletOperation', 'WalletStats']
 
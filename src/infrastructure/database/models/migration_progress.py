@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, UTC
+from typing import Optional
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+from src.infrastructure.database.models.base import Base
+
+
+class MigrationProgress(Base):
+    """
+    Progress of an online column backfill.
+
+    Written by the backfill in the same transaction as each chunk, so the
+    recorded position never runs ahead of the data.
+
+    Attributes:
+        name: Column migration name
+        last_id: Highest row ID of the last committed chunk
+        rows_scanned: Rows walked so far
+        rows_updated: Rows written by the backfill so far
+        started_at: When the first chunk committed
+        updated_at: When the last chunk committed
+        finished_at: When the backfill reached the end of the table
+    """
+    __tablename__ = 'online_migration_progress'
+
+    name: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment='Column migration name'
+    )
+
+    last_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+        comment='Highest row ID of the last committed chunk'
+    )
+
+    rows_scanned: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment='Rows walked so far'
+    )
+
+    rows_updated: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment='Rows written by the backfill so far'
+    )
+
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment='Backfill start date'
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment='Last chunk date'
+    )
+
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment='Backfill end date'
+    )
@@ -0,0 +1,63 @@
+from datetime import datetime, UTC
+from typing import Optional
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.infrastructure.database.models.base import Base
+
+
+class ShardRange(Base):
+    """
+    One range of wallet buckets in the shard map.
+
+    The ranges of the catalog database cover all buckets without gaps. The
+    resharding tool rewrites them in a single transaction and announces
+    the change on settings.SHARD_MAP_CHANNEL.
+
+    Attributes:
+        start_bucket: First bucket of the range
+        end_bucket: Bucket after the last one of the range
+        shard: Shard that owns the wallets of the range
+        state: 'active', 'moving' (being copied to peer) or 'draining' (moved from peer, leftovers not cleaned up yet)
+        peer: Other shard of a move, None for active ranges
+        updated_at: Timestamp of the last change
+    """
+    __tablename__ = 'shard_map'
+
+    start_bucket: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=False,
+        comment='First bucket of the range'
+    )
+
+    end_bucket: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment='Bucket after the last one of the range'
+    )
+
+    shard: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment='Owning shard'
+    )
+
+    state: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default='active',
+        comment='active, moving or draining'
+    )
+
+    peer: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment='Other shard of a move'
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment='Last change date'
+    )
@@ -1,10 +1,11 @@
 import uuid
 from decimal import Decimal
-from uuid import uuid4
 from datetime import datetime, UTC
-from sqlalchemy import DateTime, Numeric
+from typing import Optional
+from sqlalchemy import BigInteger, DateTime, Index, Numeric, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
+from src.application.domain.uuid7 import uuid7
 from src.infrastructure.database.models.base import Base
 
 
@@ -15,17 +16,35 @@ class Wallet(Base):
     Represents a wallet entity with balance tracking and creation timestamp.
 
     Attributes:
-        id: Unique identifier for the wallet (UUID)
+        id: Unique identifier for the wallet (time-ordered UUIDv7)
         balance: Current balance of the wallet
+        balance_minor: Current balance in integer minor units (cents)
         created_at: Timestamp when the wallet was created
     """
     __tablename__ = 'wallets'
+    __table_args__ = (
+        # Keyset pagination of GET /wallets; the included balances let
+        # balance filters run as index-only scans
+        Index(
+            'ix_wallets_created_at_id',
+            'created_at',
+            'id',
+            postgresql_include=['balance', 'balance_minor']
+        ),
+        Index(
+            'ix_wallets_nonzero_created_at_id',
+            'created_at',
+            'id',
+            postgresql_include=['balance', 'balance_minor'],
+            postgresql_where=text('balance <> 0')
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         nullable=False,
-        default=uuid4,
+        default=uuid7,
         comment='Wallet ID'
     )
 
@@ -35,6 +54,13 @@ class Wallet(Base):
         comment='Wallet balance'
     )
 
+    balance_minor: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        default=0,
+        comment='Wallet balance in minor units'
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
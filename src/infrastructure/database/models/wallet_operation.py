@@ -0,0 +1,96 @@
+import uuid
+from decimal import Decimal
+from typing import Optional
+from datetime import datetime, UTC
+from sqlalchemy import DateTime, Numeric, String, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+from src.application.domain.operation_status import OperationStatus
+from src.application.domain.uuid7 import uuid7
+from src.infrastructure.database.models.base import Base
+
+
+class WalletOperation(Base):
+    """
+    Wallet operation queue model.
+
+    Durable outbox of operations accepted in asynchronous mode and applied
+    later by the operation worker.
+
+    Attributes:
+        id: Unique identifier for the operation (UUID)
+        wallet_id: Target wallet ID
+        operation_type: Operation type (deposit or withdraw)
+        amount: Operation amount
+        status: Processing status
+        error_code: Error code when the operation failed
+        balance_after: Wallet balance right after the operation was applied
+        created_at: Timestamp when the operation was accepted
+        processed_at: Timestamp when the worker processed the operation
+    """
+    __tablename__ = 'wallet_operations'
+    __table_args__ = (
+        Index(
+            'ix_wallet_operations_pending',
+            'created_at',
+            postgresql_where=text("status = 'pending'")
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        nullable=False,
+        default=uuid7,
+        comment='Operation ID'
+    )
+
+    wallet_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+        comment='Wallet ID'
+    )
+
+    operation_type: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        comment='Operation type'
+    )
+
+    amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=12, scale=2),
+        nullable=False,
+        comment='Operation amount'
+    )
+
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=OperationStatus.PENDING.value,
+        comment='Processing status'
+    )
+
+    error_code: Mapped[Optional[str]] = mapped_column(
+        String(32),
+        nullable=True,
+        comment='Error code of a failed operation'
+    )
+
+    balance_after: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(precision=12, scale=2),
+        nullable=True,
+        comment='Wallet balance after the operation'
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment='Record creation date'
+    )
+
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment='Processing date'
+    )
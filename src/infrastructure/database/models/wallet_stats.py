@@ -0,0 +1,51 @@
+from decimal import Decimal
+from datetime import datetime, UTC
+from sqlalchemy import BigInteger, DateTime, Numeric, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+from src.infrastructure.database.models.base import Base
+
+
+class WalletStats(Base):
+    """
+    Striped aggregates over all wallets.
+
+    Every wallet maps to one stripe and its changes are added to that
+    stripe's row in the same transaction, so concurrent writers of
+    different wallets rarely contend on the same row. Totals are the sum
+    over all stripes.
+
+    Attributes:
+        stripe: Stripe number
+        wallet_count: Number of wallets counted in this stripe
+        total_balance: Sum of balances counted in this stripe
+        updated_at: Timestamp of the last change
+    """
+    __tablename__ = 'wallet_stats'
+
+    stripe: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        autoincrement=False,
+        comment='Stripe number'
+    )
+
+    wallet_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment='Number of wallets'
+    )
+
+    total_balance: Mapped[Decimal] = mapped_column(
+        Numeric(precision=20, scale=2),
+        nullable=False,
+        default=Decimal('0.00'),
+        comment='Sum of wallet balances'
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment='Last update date'
+    )
@@ -0,0 +1,48 @@
+import json
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.models.wallet import Wallet
+from src.settings import settings
+
+
+async def notify_balance_changed(session: AsyncSession, wallet: Wallet):
+    """
+    Queue a balance change notification for stream subscribers.
+
+    NOTIFY is transactional, so the event is delivered only if the
+    surrounding transaction commits.
+
+    Args:
+        session: Session of the transaction that changed the balance
+        wallet: The wallet whose balance has changed
+    """
+    if not settings.BALANCE_STREAM_ENABLED:
+        return
+
+    payload = json.dumps({'wallet_id': str(wallet.id), 'balance': str(wallet.balance)})
+    await session.execute(select(func.pg_notify(settings.BALANCE_NOTIFY_CHANNEL, payload)))
+
+
+async def notify_wallet_created(session: AsyncSession, wallet: Wallet):
+    """
+    Announce a new wallet to the wallet ID filters of all workers.
+
+    Args:
+        session: Session of the transaction that creates the wallet
+        wallet: The new wallet; its ID must already be assigned
+    """
+    if not settings.WALLET_FILTER_ENABLED:
+        return
+
+    await session.execute(select(func.pg_notify(settings.WALLET_CREATED_CHANNEL, str(wallet.id))))
+
+
+async def publish_log_config(session: AsyncSession, config: dict):
+    """
+    Broadcast a logging configuration change to every worker process.
+
+    Args:
+        session: Session whose commit delivers the notification
+        config: Fields accepted by Logger.configure
+    """
+    await session.execute(select(func.pg_notify(settings.LOG_CONFIG_CHANNEL, json.dumps(config))))
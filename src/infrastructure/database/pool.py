@@ -0,0 +1,64 @@
+import time
+from typing import Type
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from src.infrastructure.database.circuit_breaker import CircuitBreaker, circuit_breaker, is_outage
+
+
+class PoolMetrics:
+    """
+    Connection acquisition statistics of the worker's engine pool.
+
+    Attributes:
+        wait_ewma: Exponentially weighted moving average of acquisition time in seconds
+        acquisitions: Total number of successful acquisitions
+        timeouts: Total number of failed acquisitions (pool timeout or connect error)
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        self._alpha = alpha
+        self.wait_ewma = 0.0
+        self.acquisitions = 0
+        self.timeouts = 0
+
+    def observe(self, wait: float, failed: bool = False):
+        self.wait_ewma += self._alpha * (wait - self.wait_ewma)
+        if failed:
+            self.timeouts += 1
+        else:
+            self.acquisitions += 1
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long callers wait for a connection.
+
+    Checkout goes through the circuit breaker: while it is open callers
+    fail fast instead of queueing for the pool timeout, and checkout
+    timeouts and connect errors count as failures.
+
+    The breaker and metrics are class attributes because SQLAlchemy builds
+    pools from the class alone; pool_class() binds others, e.g. per shard.
+    """
+    breaker: CircuitBreaker = circuit_breaker
+    metrics: PoolMetrics = pool_metrics
+
+    def connect(self):
+        self.breaker.before_call()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except Exception as e:
+            self.metrics.observe(time.perf_counter() - started, failed=True)
+            if is_outage(e):
+                self.breaker.record_failure()
+            raise
+        self.metrics.observe(time.perf_counter() - started)
+        return connection
+
+
+def pool_class(breaker: CircuitBreaker, metrics: PoolMetrics) -> Type[InstrumentedAsyncQueuePool]:
+    """InstrumentedAsyncQueuePool bound to its own breaker and metrics."""
+    return type('BoundInstrumentedAsyncQueuePool', (InstrumentedAsyncQueuePool,), {'breaker': breaker, 'metrics': metrics})
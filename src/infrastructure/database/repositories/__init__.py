@@ -1,10 +1,75 @@
-from fastapi.params import Depends
-from src.application.abstractions import IWalletRepository
+from src.application.abstractions import IWalletRepository, IOperationRepository, IStatsRepository
 from src.infrastructure.database.database import async_session_maker
+from src.infrastructure.database.group_commit import GroupCommitExecutor
 from src.infrastructure.database.repositories.wallet_repostiory import WalletRepository
-from src.infrastructure.logger import get_logger, Logger
+from src.infrastructure.database.repositories.operation_repository import (
+    OperationRepository,
+    UnavailableOperationRepository
+)
+from src.infrastructure.database.repositories.stats_repository import StatsRepository
+from src.infrastructure.logger import logger
+from src.infrastructure.memory import InMemoryStatsRepository, InMemoryWalletRepository
+from src.infrastructure.membership import wallet_id_filter
+from src.infrastructure.sharding import shard_map_store
+from src.infrastructure.sharding.engines import build_shards
+from src.infrastructure.sharding.repository import ShardedStatsRepository, ShardedWalletRepository
+from src.settings import settings
 
 
-async def get_wallet_repository(logger: Logger = Depends(get_logger)) -> IWalletRepository:
-    async with async_session_maker() as session:
-        yield WalletRepository(session=session, logger=logger)
+# Long-lived: sessions are opened per transaction inside the repositories
+shards = {}
+if settings.WALLET_STORAGE == 'memory':
+    wallet_repository = InMemoryWalletRepository(
+        directory=settings.MEMORY_STORE_DIR,
+        logger=logger,
+        lock_stripes=settings.MEMORY_STORE_LOCK_STRIPES,
+        fsync=settings.MEMORY_STORE_FSYNC,
+        flush_delay=settings.MEMORY_STORE_FLUSH_DELAY_MS / 1000
+    )
+    stats_repository = InMemoryStatsRepository(wallet_repository=wallet_repository, logger=logger)
+elif settings.WALLET_STORAGE == 'sharded':
+    # The wallet ID filter and group commit are per database and stay off here
+    shards = build_shards(settings.SHARDS)
+    wallet_repository = ShardedWalletRepository(
+        shards={name: WalletRepository(session_maker=item.session_maker, logger=logger) for name, item in shards.items()},
+        map_store=shard_map_store,
+        logger=logger
+    )
+    stats_repository = ShardedStatsRepository(
+        shards={name: StatsRepository(session_maker=item.session_maker, logger=logger) for name, item in shards.items()},
+        logger=logger
+    )
+else:
+    wallet_repository = WalletRepository(
+        session_maker=async_session_maker,
+        logger=logger,
+        wallet_filter=wallet_id_filter if settings.WALLET_FILTER_ENABLED else None,
+        group_commit=GroupCommitExecutor(
+            session_maker=async_session_maker,
+            logger=logger,
+            window=settings.GROUP_COMMIT_WINDOW_MS / 1000,
+            max_batch=settings.GROUP_COMMIT_MAX_BATCH
+        ) if settings.GROUP_COMMIT_ENABLED else None
+    )
+    stats_repository = StatsRepository(session_maker=async_session_maker, logger=logger)
+# The queue worker only sees the wallets table on main; other storages refuse new operations
+if settings.WALLET_STORAGE in ('memory', 'sharded'):
+    operation_repository = UnavailableOperationRepository(
+        session_maker=async_session_maker,
+        logger=logger,
+        storage=settings.WALLET_STORAGE
+    )
+else:
+    operation_repository = OperationRepository(session_maker=async_session_maker, logger=logger)
+
+
+async def get_wallet_repository() -> IWalletRepository:
+    return wallet_repository
+
+
+async def get_operation_repository() -> IOperationRepository:
+    return operation_repository
+
+
+async def get_stats_repository() -> IStatsRepository:
+    return stats_repository
@@ -0,0 +1,142 @@
+import uuid
+from decimal import Decimal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.abstractions import IOperationRepository
+from src.application.domain.operation_status import OperationStatus
+from src.application.domain.operation_type import Operation
+from src.application.domain.uuid7 import uuid7
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.application.exceptions import (
+    InvalidAmountError,
+    InvalidWalletIdError,
+    InvalidOperationIdError,
+    OperationNotFoundError,
+    OperationQueueUnavailableError,
+    CircuitOpenError,
+    DatabaseError
+)
+from src.infrastructure.logger import Logger
+from src.infrastructure.tracing import tracer
+
+
+class OperationRepository(IOperationRepository):
+    """
+    Repository implementation for the wallet operation queue.
+
+    Accepted operations are only inserted here; they are applied to wallet
+    balances by the operation worker. Sessions are opened per call, after
+    input validation.
+    """
+
+
+    @tracer.traced('OperationRepository.enqueue')
+    async def enqueue(self, wallet_id: str, operation_type: Operation, amount: Decimal) -> WalletOperation:
+        """
+        Insert an operation into the durable queue.
+
+        Args:
+            wallet_id: The target wallet ID
+            operation_type: The operation type
+            amount: The operation amount (must be positive)
+
+        Returns:
+            WalletOperation: The accepted operation in pending state
+
+        Raises:
+            InvalidAmountError: If amount is not positive
+            InvalidWalletIdError: If wallet ID format is invalid
+            DatabaseError: If the insert fails
+        """
+        if amount <= 0:
+            raise InvalidAmountError(f'Operation amount must be positive: {amount}')
+
+        try:
+            wallet_uuid = uuid.UUID(wallet_id)
+        except ValueError:
+            raise InvalidWalletIdError(f'Invalid wallet ID format: {wallet_id}')
+
+        try:
+            async with self._session_maker() as session:
+                operation = WalletOperation(
+                    id=uuid7(),
+                    wallet_id=wallet_uuid,
+                    operation_type=operation_type.value,
+                    amount=amount,
+                    status=OperationStatus.PENDING.value
+                )
+                session.add(operation)
+                await session.commit()
+
+            self._logger.add_event_fields(operation_id=str(operation.id), operation_status=operation.status)
+            return operation
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self._logger.add_event_fields(error=f'Operation enqueue failed: {e}')
+            raise DatabaseError(f'Failed to enqueue operation: {e}')
+
+
+    @tracer.traced('OperationRepository.get_operation')
+    async def get_operation(self, operation_id: str) -> WalletOperation:
+        """
+        Retrieve a queued operation by its ID.
+
+        Args:
+            operation_id: The operation ID to retrieve
+
+        Returns:
+            WalletOperation: The operation with its current status
+
+        Raises:
+            InvalidOperationIdError: If operation ID format is invalid
+            OperationNotFoundError: If operation is not found
+        """
+        try:
+            operation_uuid = uuid.UUID(operation_id)
+        except ValueError:
+            raise InvalidOperationIdError(f'Invalid operation ID format: {operation_id}')
+
+        async with self._session_maker() as session:
+            result = await session.execute(select(WalletOperation).where(WalletOperation.id == operation_uuid))
+            operation = result.scalar_one_or_none()
+
+        if operation is None:
+            raise OperationNotFoundError(f'Operation with ID {operation_id} not found')
+
+        return operation
+
+
+class UnavailableOperationRepository(OperationRepository):
+    """
+    Operation queue for wallet storages the queue worker cannot reach.
+
+    The worker applies operations to the wallets table of the main
+    database only, so with in-memory or sharded wallets an accepted
+    operation would later fail as WALLET_NOT_FOUND. New operations are
+    refused instead; operations queued earlier can still be looked up.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], logger: Logger, storage: str):
+        """
+        Initialize the repository.
+
+        Args:
+            session_maker: Factory for database sessions
+            logger: Logger instance
+            storage: Configured wallet storage, for the error message
+        """
+        super().__init__(session_maker, logger)
+        self._storage = storage
+
+
+    async def enqueue(self, wallet_id: str, operation_type: Operation, amount: Decimal) -> WalletOperation:
+        """
+        Refuse to queue an operation.
+
+        Raises:
+            OperationQueueUnavailableError: Always
+        """
+        raise OperationQueueUnavailableError(
+            f'Asynchronous operations are not supported with {self._storage} wallet storage; retry without async'
+        )
@@ -0,0 +1,36 @@
+from src.application.abstractions import IStatsRepository
+from src.application.domain.wallet_totals import WalletTotals
+from src.application.exceptions import CircuitOpenError, DatabaseError
+from src.infrastructure.database.stats import read_totals
+from src.infrastructure.tracing import tracer
+
+
+class StatsRepository(IStatsRepository):
+    """
+    Repository implementation for wallet aggregates.
+
+    Totals are read from the striped wallet_stats table, which writers keep
+    up to date in their own transactions, so the cost of a read does not
+    depend on the number of wallets.
+    """
+
+
+    @tracer.traced('StatsRepository.get_totals')
+    async def get_totals(self) -> WalletTotals:
+        """
+        Retrieve the wallet count and total balance.
+
+        Returns:
+            WalletTotals: Aggregates over all wallets
+
+        Raises:
+            DatabaseError: If the aggregates cannot be read
+        """
+        try:
+            async with self._session_maker() as session:
+                return await read_totals(session)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self._logger.add_event_fields(error=f'Stats retrieval failed: {e}')
+            raise DatabaseError(f'Failed to retrieve stats: {e}')
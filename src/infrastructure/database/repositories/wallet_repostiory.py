@@ -1,16 +1,29 @@
+import time
 import uuid
 from contextlib import asynccontextmanager
 from decimal import Decimal
-from sqlalchemy import select
+from typing import Optional
+from sqlalchemy import literal_column, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from src.application.abstractions import IWalletRepository
+from src.application.domain.uuid7 import uuid7
+from src.application.domain.wallet_page import SortOrder, WalletListQuery, WalletPage
+from src.infrastructure.database.balance import apply_balance_delta, has_funds, with_wallet_lock
+from src.infrastructure.database.group_commit import GroupCommitExecutor
 from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.notify import notify_balance_changed, notify_wallet_created
+from src.infrastructure.database.stats import apply_stats_delta
+from src.infrastructure.logger import Logger
+from src.infrastructure.membership.wallet_id_filter import WalletIdFilter
 from src.application.exceptions import (
     WalletNotFoundError,
     InsufficientFundsError,
     InvalidAmountError,
     InvalidWalletIdError,
+    CircuitOpenError,
     DatabaseError
 )
+from src.infrastructure.tracing import tracer
 
 
 class WalletRepository(IWalletRepository):
@@ -19,13 +32,43 @@ class WalletRepository(IWalletRepository):
 
     Provides methods for creating, retrieving, and modifying wallet entities
     with proper transaction handling and concurrency control.
-    """
 
+    The repository is long-lived: every method validates its input first and
+    only then opens a session, which is closed (returning its connection to
+    the pool) as soon as the transaction ends.
+
+    With a wallet ID filter, lookups of IDs the filter has never seen are
+    answered with WalletNotFoundError without opening a session.
+
+    With a group commit executor, deposits and withdrawals are applied in
+    transactions shared with concurrent changes of other wallets.
+
+    The row lock taken for balance changes (FOR UPDATE or FOR NO KEY UPDATE)
+    follows lock_mode, settings.WALLET_LOCK_MODE by default.
+    """
 
-    async def create(self) -> Wallet:
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        logger: Logger,
+        wallet_filter: Optional[WalletIdFilter] = None,
+        group_commit: Optional[GroupCommitExecutor] = None,
+        lock_mode: Optional[str] = None
+    ):
+        super().__init__(session_maker, logger)
+        self._wallet_filter = wallet_filter
+        self._group_commit = group_commit
+        self._lock_mode = lock_mode
+
+
+    @tracer.traced('WalletRepository.create')
+    async def create(self, wallet_id: Optional[uuid.UUID] = None) -> Wallet:
         """
         Create a new wallet with zero balance.
 
+        Args:
+            wallet_id: ID chosen by the caller, e.g. placed in a shard bucket; a new UUIDv7 by default
+
         Returns:
             Wallet: The created wallet entity
 
@@ -33,44 +76,60 @@ class WalletRepository(IWalletRepository):
             DatabaseError: If wallet creation fails
         """
         try:
-            wallet = Wallet(balance=Decimal('0.00'))
-            self._session.add(wallet)
-            await self._session.commit()
-            await self._session.refresh(wallet)
+            async with self._session_maker() as session:
+                wallet = Wallet(id=wallet_id or uuid7(), balance=Decimal('0.00'), balance_minor=0)
+                session.add(wallet)
+                # Autoflush inserts the wallet before its stats stripe is touched
+                await apply_stats_delta(session, wallet.id, 1, Decimal('0.00'))
+                await notify_wallet_created(session, wallet)
+                await session.commit()
 
-            self._logger.info(f'Wallet created with ID: {wallet.id}')
             return wallet
+        except CircuitOpenError:
+            raise
         except Exception as e:
-            self._logger.error(f'Wallet creation failed: {e}')
+            self._logger.add_event_fields(error=f'Wallet creation failed: {e}')
             raise DatabaseError(f'Failed to create wallet: {e}')
 
 
+    @staticmethod
+    def _parse_wallet_id(wallet_id: str) -> uuid.UUID:
+        """
+        Parse a wallet ID without touching the database.
+
+        Raises:
+            InvalidWalletIdError: If wallet ID format is invalid
+        """
+        try:
+            return uuid.UUID(wallet_id)
+        except ValueError:
+            raise InvalidWalletIdError(f'Invalid wallet ID format: {wallet_id}')
+
+
     @asynccontextmanager
-    async def _get_locked_wallet(self, wallet_id: str):
+    async def _get_locked_wallet(self, session: AsyncSession, wallet_uuid: uuid.UUID):
         """
         Get a wallet with row-level locking for concurrent operations.
 
         Args:
-            wallet_id: The wallet ID to retrieve
+            session: Session of the current transaction
+            wallet_uuid: The wallet ID to retrieve
 
         Yields:
             Wallet: The locked wallet entity
 
         Raises:
-            InvalidWalletIdError: If wallet ID format is invalid
             WalletNotFoundError: If wallet is not found
         """
-        try:
-            wallet_uuid = uuid.UUID(wallet_id)
-        except ValueError:
-            raise InvalidWalletIdError(f'Invalid wallet ID format: {wallet_id}')
-
-        query = select(Wallet).where(Wallet.id == wallet_uuid).with_for_update()
-        result = await self._session.execute(query)
+        query = with_wallet_lock(select(Wallet).where(Wallet.id == wallet_uuid), self._lock_mode)
+        started = time.perf_counter()
+        with tracer.span('wallet.lock', wallet_id=str(wallet_uuid)):
+            result = await session.execute(query)
+        self._logger.add_event_timing('lock_wait_ms', time.perf_counter() - started)
         wallet = result.scalar_one_or_none()
 
         if wallet is None:
-            raise WalletNotFoundError(f'Wallet with ID {wallet_id} not found')
+            raise WalletNotFoundError(f'Wallet with ID {wallet_uuid} not found')
 
         try:
             yield wallet
@@ -78,6 +137,19 @@ class WalletRepository(IWalletRepository):
             pass
 
 
+    async def _submit(self, wallet_uuid: uuid.UUID, amount: Decimal, withdraw: bool) -> Wallet:
+        """Apply a balance change through the group commit executor."""
+        started = time.perf_counter()
+        try:
+            return await self._group_commit.submit(wallet_uuid, amount, withdraw)
+        except DatabaseError as e:
+            self._logger.add_event_fields(error=f'Grouped balance change failed: {e}')
+            raise
+        finally:
+            self._logger.add_event_timing('db_time_ms', time.perf_counter() - started)
+
+
+    @tracer.traced('WalletRepository.deposit')
     async def deposit(self, wallet_id: str, amount: Decimal) -> Wallet:
         """
         Deposit money into a wallet.
@@ -95,30 +167,34 @@ class WalletRepository(IWalletRepository):
             WalletNotFoundError: If wallet is not found
             DatabaseError: If deposit operation fails
         """
-        try:
-            if amount <= 0:
-                raise InvalidAmountError(f'Deposit amount must be positive: {amount}')
-
-            async with self._get_locked_wallet(wallet_id) as wallet:
-                wallet.balance += amount
-                await self._session.commit()
-                await self._session.refresh(wallet)
-
-                self._logger.info(
-                    f'Wallet {wallet.id} deposited: +{amount}, '
-                    f'new balance: {wallet.balance}'
-                )
-                return wallet
-
-        except (InvalidAmountError, InvalidWalletIdError, WalletNotFoundError):
-            await self._session.rollback()
-            raise
-        except Exception as e:
-            await self._session.rollback()
-            self._logger.error(f'Unexpected deposit error: {str(e)}')
-            raise DatabaseError(f'Deposit operation failed: {e}')
-
-
+        if amount <= 0:
+            raise InvalidAmountError(f'Deposit amount must be positive: {amount}')
+        wallet_uuid = self._parse_wallet_id(wallet_id)
+        if self._group_commit is not None:
+            return await self._submit(wallet_uuid, amount, withdraw=False)
+
+        started = time.perf_counter()
+        async with self._session_maker() as session:
+            try:
+                async with self._get_locked_wallet(session, wallet_uuid) as wallet:
+                    apply_balance_delta(wallet, amount)
+                    await apply_stats_delta(session, wallet_uuid, 0, amount)
+                    await notify_balance_changed(session, wallet)
+                    await session.commit()
+
+                    self._logger.add_event_timing('db_time_ms', time.perf_counter() - started)
+                    return wallet
+
+            except (WalletNotFoundError, CircuitOpenError):
+                await session.rollback()
+                raise
+            except Exception as e:
+                await session.rollback()
+                self._logger.add_event_fields(error=f'Unexpected deposit error: {e}')
+                raise DatabaseError(f'Deposit operation failed: {e}')
+
+
+    @tracer.traced('WalletRepository.withdraw')
     async def withdraw(self, wallet_id: str, amount: Decimal) -> Wallet:
         """
         Withdraw money from a wallet.
@@ -137,36 +213,40 @@ class WalletRepository(IWalletRepository):
             InsufficientFundsError: If wallet has insufficient funds
             DatabaseError: If withdraw operation fails
         """
-        try:
-            if amount <= 0:
-                raise InvalidAmountError(f'Withdraw amount must be positive: {amount}')
-
-            async with self._get_locked_wallet(wallet_id) as wallet:
-                if wallet.balance < amount:
-                    raise InsufficientFundsError(
-                        f'Insufficient funds: balance {wallet.balance}, '
-                        f'requested {amount}'
-                    )
-
-                wallet.balance -= amount
-                await self._session.commit()
-                await self._session.refresh(wallet)
-
-                self._logger.info(
-                    f'Wallet {wallet.id} withdrawn: -{amount}, '
-                    f'new balance: {wallet.balance}'
-                )
-                return wallet
-
-        except (InvalidAmountError, InvalidWalletIdError, WalletNotFoundError, InsufficientFundsError):
-            await self._session.rollback()
-            raise
-        except Exception as e:
-            await self._session.rollback()
-            self._logger.error(f'Unexpected withdraw error: {str(e)}')
-            raise DatabaseError(f'Withdraw operation failed: {e}')
-
-
+        if amount <= 0:
+            raise InvalidAmountError(f'Withdraw amount must be positive: {amount}')
+        wallet_uuid = self._parse_wallet_id(wallet_id)
+        if self._group_commit is not None:
+            return await self._submit(wallet_uuid, amount, withdraw=True)
+
+        started = time.perf_counter()
+        async with self._session_maker() as session:
+            try:
+                async with self._get_locked_wallet(session, wallet_uuid) as wallet:
+                    if not has_funds(wallet, amount):
+                        raise InsufficientFundsError(
+                            f'Insufficient funds: balance {wallet.balance}, '
+                            f'requested {amount}'
+                        )
+
+                    apply_balance_delta(wallet, -amount)
+                    await apply_stats_delta(session, wallet_uuid, 0, -amount)
+                    await notify_balance_changed(session, wallet)
+                    await session.commit()
+
+                    self._logger.add_event_timing('db_time_ms', time.perf_counter() - started)
+                    return wallet
+
+            except (WalletNotFoundError, InsufficientFundsError, CircuitOpenError):
+                await session.rollback()
+                raise
+            except Exception as e:
+                await session.rollback()
+                self._logger.add_event_fields(error=f'Unexpected withdraw error: {e}')
+                raise DatabaseError(f'Withdraw operation failed: {e}')
+
+
+    @tracer.traced('WalletRepository.get_wallet')
     async def get_wallet(self, wallet_id: str) -> Wallet:
         """
         Retrieve a wallet by its ID.
@@ -181,20 +261,85 @@ class WalletRepository(IWalletRepository):
             InvalidWalletIdError: If wallet ID format is invalid
             WalletNotFoundError: If wallet is not found
         """
-        try:
-            wallet_uuid = uuid.UUID(wallet_id)
-        except ValueError:
-            self._logger.error(f'Invalid wallet ID: {wallet_id}')
-            raise InvalidWalletIdError(f'Invalid wallet ID format: {wallet_id}')
+        wallet_uuid = self._parse_wallet_id(wallet_id)
 
-        query = select(Wallet).where(Wallet.id == wallet_uuid)
-        result = await self._session.execute(query)
-        wallet = result.scalar_one_or_none()
+        if self._wallet_filter is not None and not self._wallet_filter.might_contain(wallet_uuid):
+            self._logger.add_event_fields(wallet_filter='miss')
+            raise WalletNotFoundError(f'Wallet with ID {wallet_id} not found')
+
+        started = time.perf_counter()
+        async with self._session_maker() as session:
+            query = select(Wallet).where(Wallet.id == wallet_uuid)
+            result = await session.execute(query)
+            wallet = result.scalar_one_or_none()
+        self._logger.add_event_timing('db_time_ms', time.perf_counter() - started)
 
         if wallet is None:
-            self._logger.error(f'Wallet with ID {wallet_id} not found')
+            if self._wallet_filter is not None and self._wallet_filter.ready:
+                self._wallet_filter.record_false_positive()
             raise WalletNotFoundError(f'Wallet with ID {wallet_id} not found')
 
-        self._logger.info(f'Wallet retrieved: {wallet.id}')
         return wallet
 
+
+    @staticmethod
+    def _list_query(query: WalletListQuery):
+        """
+        Build the keyset query of one listing page.
+
+        The cursor is a row-value comparison on (created_at, id), so every
+        page is an index range scan of limit + 1 entries whatever its depth.
+        The zero-balance predicate is rendered as a literal: a bound
+        parameter would keep the planner from matching the partial index.
+        """
+        key = tuple_(Wallet.created_at, Wallet.id)
+        descending = query.order == SortOrder.DESC
+        statement = select(Wallet)
+
+        if query.cursor is not None:
+            position = tuple_(query.cursor.created_at, query.cursor.wallet_id)
+            statement = statement.where(key < position if descending else key > position)
+        if query.excludes_zero:
+            statement = statement.where(Wallet.balance != literal_column('0'))
+        if query.min_balance is not None:
+            statement = statement.where(Wallet.balance >= query.min_balance)
+        if query.max_balance is not None:
+            statement = statement.where(Wallet.balance <= query.max_balance)
+        if query.created_from is not None:
+            statement = statement.where(Wallet.created_at >= query.created_from)
+        if query.created_to is not None:
+            statement = statement.where(Wallet.created_at < query.created_to)
+
+        if descending:
+            statement = statement.order_by(Wallet.created_at.desc(), Wallet.id.desc())
+        else:
+            statement = statement.order_by(Wallet.created_at.asc(), Wallet.id.asc())
+        return statement.limit(query.limit + 1)
+
+
+    @tracer.traced('WalletRepository.list_wallets')
+    async def list_wallets(self, query: WalletListQuery) -> WalletPage:
+        """
+        List wallets ordered by (created_at, id) with keyset pagination.
+
+        Args:
+            query: Page size, cursor, sort order and filters
+
+        Returns:
+            WalletPage: The wallets and the cursor of the next page
+
+        Raises:
+            DatabaseError: If the listing query fails
+        """
+        started = time.perf_counter()
+        try:
+            async with self._session_maker() as session:
+                result = await session.execute(self._list_query(query))
+                rows = list(result.scalars().all())
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self._logger.add_event_fields(error=f'Wallet listing failed: {e}')
+            raise DatabaseError(f'Failed to list wallets: {e}')
+        self._logger.add_event_timing('db_time_ms', time.perf_counter() - started)
+        return WalletPage.from_rows(rows, query.limit)
@@ -0,0 +1,100 @@
+import uuid
+from datetime import datetime, UTC
+from decimal import Decimal
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.domain.wallet_totals import WalletTotals
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.models.wallet_stats import WalletStats
+from src.settings import settings
+
+
+def stats_stripe(wallet_id: uuid.UUID) -> int:
+    """Stripe of a wallet; the low bits of UUIDv7 and UUIDv4 are random."""
+    return wallet_id.int % settings.WALLET_STATS_STRIPES
+
+
+async def apply_stats_delta(session: AsyncSession, wallet_id: uuid.UUID, count_delta: int, balance_delta: Decimal):
+    """
+    Add a change to the wallet's stats stripe in the current transaction.
+
+    Call after the wallet row is locked or inserted so that every
+    transaction takes its locks in the same order (wallet, then stripe).
+
+    Args:
+        session: Session of the transaction changing the wallet
+        wallet_id: The changed wallet
+        count_delta: Change of the wallet count
+        balance_delta: Change of the total balance
+    """
+    if not settings.WALLET_STATS_ENABLED or (count_delta == 0 and balance_delta == 0):
+        return
+
+    await _add_to_stripe(session, stats_stripe(wallet_id), count_delta, balance_delta)
+
+
+async def _add_to_stripe(session: AsyncSession, stripe: int, count_delta: int, balance_delta: Decimal):
+    now = datetime.now(UTC)
+    statement = insert(WalletStats).values(
+        stripe=stripe,
+        wallet_count=count_delta,
+        total_balance=balance_delta,
+        updated_at=now
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[WalletStats.stripe],
+        set_={
+            'wallet_count': WalletStats.wallet_count + statement.excluded.wallet_count,
+            'total_balance': WalletStats.total_balance + statement.excluded.total_balance,
+            'updated_at': now,
+        }
+    )
+    await session.execute(statement)
+
+
+async def read_totals(session: AsyncSession) -> WalletTotals:
+    """Sum the stripes; the cost depends on the stripe count only."""
+    row = (await session.execute(
+        select(
+            func.coalesce(func.sum(WalletStats.wallet_count), 0),
+            func.coalesce(func.sum(WalletStats.total_balance), Decimal('0.00'))
+        )
+    )).one()
+    return WalletTotals(wallet_count=int(row[0]), total_balance=Decimal(row[1]))
+
+
+async def recompute_totals(session_maker: async_sessionmaker[AsyncSession]) -> tuple[WalletTotals, WalletTotals]:
+    """
+    Correct the stripes to totals recomputed from the wallets table.
+
+    The stripes and the wallets are read from one REPEATABLE READ snapshot,
+    in which every committed change is counted in both, so their difference
+    is the drift. The drift is then added to stripe 0 in a short transaction
+    of its own: changes committed since the snapshot are already in the
+    stripes and stay counted once. Writers are never blocked by the scan.
+
+    Args:
+        session_maker: Factory for database sessions
+
+    Returns:
+        tuple: Totals before and after the correction, as of the snapshot
+    """
+    async with session_maker() as session:
+        await session.connection(execution_options={'isolation_level': 'REPEATABLE READ'})
+        # The full scan may outlast the statement timeout meant for API requests
+        await session.execute(text('SET LOCAL statement_timeout = 0'))
+        before = await read_totals(session)
+        row = (await session.execute(
+            select(func.count(), func.coalesce(func.sum(Wallet.balance), Decimal('0.00')))
+        )).one()
+        after = WalletTotals(wallet_count=int(row[0]), total_balance=Decimal(row[1]))
+        await session.rollback()
+
+    count_drift = after.wallet_count - before.wallet_count
+    balance_drift = after.total_balance - before.total_balance
+    if count_drift or balance_drift:
+        async with session_maker() as session:
+            await _add_to_stripe(session, 0, count_drift, balance_drift)
+            await session.commit()
+    return before, after
@@ -0,0 +1,62 @@
+import asyncio
+import uuid
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from src.infrastructure.database.balance import with_wallet_lock
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.settings import settings
+
+
+_PROBE_ID = uuid.UUID(int=0)
+
+
+def _hot_statements() -> list:
+    """
+    Statements issued on the request hot path.
+
+    They must be built the same way as in the repositories so that both the
+    SQLAlchemy compiled cache and asyncpg's per-connection prepared statement
+    cache are hit by the first real request.
+    """
+    return [
+        select(Wallet).where(Wallet.id == _PROBE_ID),
+        with_wallet_lock(select(Wallet).where(Wallet.id == _PROBE_ID)),
+        select(WalletOperation).where(WalletOperation.id == _PROBE_ID),
+        select(func.pg_notify(settings.BALANCE_NOTIFY_CHANNEL, '')),
+    ]
+
+
+async def _prepare(connection: AsyncConnection):
+    for statement in _hot_statements():
+        await connection.execute(statement)
+    # Nothing is committed, so the warm-up NOTIFY is never delivered
+    await connection.rollback()
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open pool connections up front and prepare the hot statements on each.
+
+    All connections are held at the same time so the pool really grows to
+    the requested size; they are returned to the pool afterwards. The first
+    connection also pays for asyncpg type introspection.
+
+    Args:
+        engine: Engine whose pool to warm up
+        connections: Number of connections to open
+
+    Returns:
+        int: Number of connections successfully warmed up
+    """
+    opened = [engine.connect() for _ in range(connections)]
+    try:
+        results = await asyncio.gather(*(connection.start() for connection in opened), return_exceptions=True)
+        started = [connection for connection, result in zip(opened, results) if not isinstance(result, BaseException)]
+        if not started:
+            raise next(result for result in results if isinstance(result, BaseException))
+
+        await asyncio.gather(*(_prepare(connection) for connection in started))
+        return len(started)
+    finally:
+        await asyncio.gather(*(connection.close() for connection in opened), return_exceptions=True)
@@ -1,9 +1,59 @@
+import atexit
+from typing import List
 from src.infrastructure.logger.log_format import LogFormat
 from src.infrastructure.logger.log_levels import LogLevel
-from src.infrastructure.logger.logger import Logger
+from src.infrastructure.logger.log_throttle import LogThrottle
+from src.infrastructure.logger.logger import Logger, BoundLogger
+from src.infrastructure.logger.sinks import LogSink, StdoutSink, BufferedFileSink, SocketSink
+from src.settings import settings
 
 
-logger = Logger(min_level=LogLevel.INFO, log_format=LogFormat.JSON)
+def _build_sinks() -> List[LogSink]:
+    """Create the sinks listed in LOG_SINKS (comma separated: stdout, file, socket)."""
+    sinks: List[LogSink] = []
+    for name in filter(None, (part.strip().lower() for part in settings.LOG_SINKS.split(','))):
+        if name == 'stdout':
+            sinks.append(StdoutSink(
+                level=LogLevel[settings.LOG_STDOUT_LEVEL.upper()],
+                log_format=LogFormat(settings.LOG_STDOUT_FORMAT.lower()),
+                buffer_bytes=settings.LOG_BUFFER_BYTES,
+            ))
+        elif name == 'file':
+            sinks.append(BufferedFileSink(
+                path=settings.LOG_FILE_PATH,
+                max_bytes=settings.LOG_FILE_MAX_BYTES,
+                rotate_interval=settings.LOG_FILE_ROTATE_SECONDS,
+                backup_count=settings.LOG_FILE_BACKUP_COUNT,
+                compress=settings.LOG_FILE_COMPRESS,
+                level=LogLevel[settings.LOG_FILE_LEVEL.upper()],
+                log_format=LogFormat(settings.LOG_FILE_FORMAT.lower()),
+                buffer_bytes=settings.LOG_BUFFER_BYTES,
+            ))
+        elif name == 'socket':
+            sinks.append(SocketSink(
+                address=settings.LOG_SOCKET_ADDRESS,
+                level=LogLevel[settings.LOG_SOCKET_LEVEL.upper()],
+                log_format=LogFormat(settings.LOG_SOCKET_FORMAT.lower()),
+                buffer_bytes=settings.LOG_BUFFER_BYTES,
+            ))
+        else:
+            raise ValueError(f'Unknown log sink: {name}')
+    return sinks
+
+
+logger = Logger(
+    min_level=LogLevel[settings.LOG_LEVEL.upper()],
+    log_format=LogFormat.JSON,
+    throttle=LogThrottle(
+        sample_rates=settings.LOG_SAMPLE_RATES,
+        rate=settings.LOG_RATE_LIMIT_PER_SECOND,
+        burst=settings.LOG_RATE_LIMIT_BURST,
+        report_interval=settings.LOG_SUPPRESSED_REPORT_SECONDS,
+    ),
+    sinks=_build_sinks(),
+    flush_interval=settings.LOG_FLUSH_INTERVAL,
+)
+atexit.register(logger.close)
 
 
 async def get_logger() -> Logger:
@@ -0,0 +1,126 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional
+from src.infrastructure.logger.log_levels import LogLevel
+
+
+class LogThrottle:
+    """
+    Sampling and rate limiting of log records.
+
+    Records are first sampled with a per-level ratio. Records at or above
+    rate_limit_level then pass a token bucket per call site, so a storm of
+    identical errors costs a bounded number of writes. Dropped records are
+    counted and reported periodically.
+    """
+
+    def __init__(
+        self,
+        sample_rates: Optional[Dict[str, float]] = None,
+        rate: float = 10.0,
+        burst: int = 20,
+        rate_limit_level: LogLevel = LogLevel.WARNING,
+        report_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        random_fn: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the throttle.
+
+        Args:
+            sample_rates: Fraction of records kept per level name, 1.0 when absent
+            rate: Tokens per second refilled into each call site's bucket; 0 disables rate limiting
+            burst: Bucket capacity
+            rate_limit_level: Lowest level subject to rate limiting
+            report_interval: Seconds between suppressed-count reports
+            clock: Monotonic clock, injectable for tests
+            random_fn: Source of uniform [0, 1) numbers, injectable for tests
+        """
+        self.sample_rates: Dict[str, float] = {}
+        self.set_sample_rates(sample_rates or {})
+        self.rate = rate
+        self.burst = burst
+        self.rate_limit_level = rate_limit_level
+        self.report_interval = report_interval
+        self._clock = clock
+        self._random = random_fn
+        self._buckets: Dict[Hashable, list[float]] = {}
+        self._suppressed: Dict[Hashable, int] = {}
+        self._sampled_out = 0
+        self._last_report = clock()
+        self._lock = threading.Lock()
+
+    def set_sample_rates(self, sample_rates: Dict[str, float]):
+        """
+        Replace the per-level sampling ratios.
+
+        Raises:
+            ValueError: If a level name is unknown or a ratio is outside [0, 1]
+        """
+        rates = {}
+        for name, ratio in sample_rates.items():
+            level_name = name.upper()
+            if level_name not in LogLevel.__members__:
+                raise ValueError(f'Unknown log level: {name}')
+            if not 0.0 <= ratio <= 1.0:
+                raise ValueError(f'Sample rate must be between 0 and 1: {ratio}')
+            rates[level_name] = float(ratio)
+        self.sample_rates = rates
+
+    def sample(self, level: LogLevel) -> bool:
+        """Decide whether a record of this level survives sampling."""
+        ratio = self.sample_rates.get(level.name, 1.0)
+        if ratio >= 1.0 or self._random() < ratio:
+            return True
+        with self._lock:
+            self._sampled_out += 1
+        return False
+
+    def admit(self, level: LogLevel, key: Hashable) -> bool:
+        """Take a token from the bucket of this call site, counting the record if none is left."""
+        if self.rate <= 0 or level < self.rate_limit_level:
+            return True
+
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now]
+            tokens = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= 1.0:
+                bucket[0] = tokens - 1.0
+                return True
+            bucket[0] = tokens
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+
+    def pop_report(self) -> Optional[Dict[str, int]]:
+        """
+        Return and reset drop counts once per report interval.
+
+        Returns:
+            Optional[dict]: Suppressed counts per call site and the sampled-out total,
+                or None if the interval has not elapsed or nothing was dropped
+        """
+        now = self._clock()
+        if now - self._last_report < self.report_interval:
+            return None
+
+        with self._lock:
+            self._last_report = now
+            if not self._suppressed and not self._sampled_out:
+                return None
+            report = {self._format_key(key): count for key, count in self._suppressed.items()}
+            if self._sampled_out:
+                report['sampled_out'] = self._sampled_out
+            self._suppressed.clear()
+            self._sampled_out = 0
+        return report
+
+    @staticmethod
+    def _format_key(key: Hashable) -> str:
+        if isinstance(key, tuple):
+            return ':'.join(str(part) for part in key if part is not None)
+        return str(key)
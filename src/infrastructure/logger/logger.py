@@ -1,23 +1,37 @@
 import traceback
 import inspect
 import sys
-import json
 from datetime import datetime
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from uuid import uuid4
 from contextvars import ContextVar
 from src.infrastructure.logger import LogFormat
 from src.infrastructure.logger.log_levels import LogLevel
+from src.infrastructure.logger.log_throttle import LogThrottle
+from src.infrastructure.logger.sinks import LogSink, SinkFlusher, format_record
+from src.infrastructure.logger.request_event import add_event_fields, add_event_timing
 
 
 trace_id_var: ContextVar[str] = ContextVar('trace_id', default='N/A')
 
+_DEBUG = LogLevel.DEBUG.value
+_INFO = LogLevel.INFO.value
+_WARNING = LogLevel.WARNING.value
+_ERROR = LogLevel.ERROR.value
+_CRITICAL = LogLevel.CRITICAL.value
+_EXCEPTION = LogLevel.EXCEPTION.value
+
 
 class Logger:
     """
     Synchronous custom logger with ContextVar support for trace_id.
     Supports JSON and text logging formats.
     Singleton pattern.
+
+    Messages are %-style templates formatted only when the record is
+    emitted; keyword arguments become structured fields:
+
+        logger.info('Processed %s operations', count, wallet_id=wallet_id)
     """
 
     _instance = None
@@ -33,10 +47,28 @@ class Logger:
         log_format: LogFormat = __default_format,
         min_level: LogLevel = LogLevel.INFO,
         id_generator: Optional[Callable[[], str]] = lambda: str(uuid4()),
+        throttle: Optional[LogThrottle] = None,
+        sinks: Optional[List[LogSink]] = None,
+        flush_interval: float = 1.0,
     ):
         self.log_format = log_format
         self.min_level = min_level
         self.id_generator = id_generator
+        self.throttle = throttle
+        self.sinks: List[LogSink] = []
+        self._flusher: Optional[SinkFlusher] = None
+        if sinks:
+            self.set_sinks(sinks, flush_interval)
+
+    @property
+    def min_level(self) -> LogLevel:
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, level: LogLevel):
+        self._min_level = level
+        # Plain int for the enabled-level check done on every call
+        self._min_value = level.value
 
     def set_format(self, log_format: LogFormat):
         """Set log format using LogFormat enum"""
@@ -47,6 +79,56 @@ class Logger:
     def set_min_level(self, level: LogLevel):
         self.min_level = level
 
+    def set_sinks(self, sinks: List[LogSink], flush_interval: float = 1.0):
+        """
+        Replace the output sinks. Without sinks records are written to stdout line by line.
+
+        Args:
+            sinks: Sinks receiving every record at or above their own level
+            flush_interval: Seconds between background flushes of buffered records
+        """
+        self.close()
+        self.sinks = list(sinks)
+        if self.sinks:
+            self._flusher = SinkFlusher(self.sinks, flush_interval)
+            self._flusher.start()
+
+    def close(self):
+        """Flush buffered records and release the sinks"""
+        if self._flusher is not None:
+            self._flusher.stop()
+            self._flusher = None
+
+    def configure(self, min_level: Optional[str] = None, sample_rates: Optional[Dict[str, float]] = None):
+        """
+        Change the minimum level and sampling ratios at runtime.
+
+        Args:
+            min_level: Level name, e.g. 'WARNING'
+            sample_rates: Fraction of records kept per level name
+
+        Raises:
+            ValueError: If a level name or sampling ratio is invalid
+        """
+        level = None
+        if min_level is not None:
+            if min_level.upper() not in LogLevel.__members__:
+                raise ValueError(f'Unknown log level: {min_level}')
+            level = LogLevel[min_level.upper()]
+        if sample_rates is not None:
+            if self.throttle is None:
+                self.throttle = LogThrottle()
+            self.throttle.set_sample_rates(sample_rates)
+        if level is not None:
+            self.min_level = level
+
+    def get_config(self) -> Dict[str, Any]:
+        """Current minimum level and sampling ratios"""
+        return {
+            'min_level': self.min_level.name,
+            'sample_rates': dict(self.throttle.sample_rates) if self.throttle else {},
+        }
+
     def new_trace_id(self) -> str:
         """Create and set new trace_id in context"""
         trace_id = self.id_generator()
@@ -64,6 +146,18 @@ class Logger:
         """Clear the trace_id in the context"""
         trace_id_var.set('N/A')
 
+    def bind(self, **fields: Any) -> 'BoundLogger':
+        """Create a child logger that adds the given fields to every record"""
+        return BoundLogger(self, fields)
+
+    def add_event_fields(self, **fields: Any):
+        """Attach fields to the current request's wide event instead of logging a line"""
+        add_event_fields(**fields)
+
+    def add_event_timing(self, name: str, seconds: float):
+        """Accumulate a duration in milliseconds on the current request's wide event"""
+        add_event_timing(name, seconds)
+
     def _prepare_log_data(self, level: LogLevel, message: str) -> Dict[str, Any]:
         frame = inspect.currentframe().f_back.f_back.f_back
         filename = frame.f_code.co_filename
@@ -83,41 +177,144 @@ class Logger:
 
         return log_data
 
-    def _log(self, level: LogLevel, message: str):
-        if level >= self.min_level:
+    def _log(
+        self,
+        level: LogLevel,
+        message: str,
+        args: Tuple[Any, ...] = (),
+        fields: Optional[Dict[str, Any]] = None,
+    ):
+        if level.value >= self._min_value:
+            throttle = self.throttle
+            if throttle is not None and not throttle.sample(level):
+                self._flush_suppressed(throttle)
+                return
+
             log_data = self._prepare_log_data(level, message)
+            if throttle is not None:
+                # Identical records are those from the same call site with the same error code
+                key = (level.name, log_data['file'], log_data['line'], fields.get('error_code') if fields else None)
+                if not throttle.admit(level, key):
+                    self._flush_suppressed(throttle)
+                    return
+            if args:
+                log_data['message'] = self._format_message(message, args)
+            if fields:
+                log_data.update(fields)
+
+            self._emit(level, log_data)
+
+            if throttle is not None:
+                self._flush_suppressed(throttle)
+
+    @staticmethod
+    def _format_message(message: str, args: Tuple[Any, ...]) -> str:
+        try:
+            return message % args
+        except (TypeError, ValueError):
+            # A broken template must not turn a log call into an error
+            return f"{message} {' '.join(map(str, args))}"
 
-            if self.log_format == LogFormat.JSON:
-                log_message = json.dumps(log_data, ensure_ascii=False)
-            else:
-                # Default text format
-                log_message = (
-                    f"{log_data['timestamp']} - {log_data['level']} - "
-                    f"{log_data['trace_id']} - {log_data['file']}:{log_data['line']} - "
-                    f"{log_data['message']}"
-                )
-                if 'exception' in log_data:
-                    log_message += f"\nTraceback:\n{log_data['exception']}"
+    def _flush_suppressed(self, throttle: LogThrottle):
+        """Write the periodic report of dropped records once its interval has elapsed"""
+        report = throttle.pop_report()
+        if not report:
+            return
 
-            self._write(log_message)
+        log_data = {
+            'timestamp': datetime.now().isoformat(),
+            'level': LogLevel.WARNING.name,
+            'trace_id': trace_id_var.get(),
+            'message': 'Suppressed log records',
+            'suppressed': report,
+        }
+        self._emit(LogLevel.WARNING, log_data)
+
+    def _emit(self, level: LogLevel, log_data: Dict[str, Any]):
+        sinks = self.sinks
+        if not sinks:
+            self._write(format_record(log_data, self.log_format))
+            return
+        for sink in sinks:
+            if level.value >= sink.level.value:
+                sink.emit(log_data, level)
 
     def _write(self, message: str):
         sys.stdout.write(message + "\n")
 
-    def debug(self, message: str):
-        self._log(LogLevel.DEBUG, message)
+    def debug(self, message: str, *args: Any, **fields: Any):
+        if self._min_value <= _DEBUG:
+            self._log(LogLevel.DEBUG, message, args, fields)
+
+    def info(self, message: str, *args: Any, **fields: Any):
+        if self._min_value <= _INFO:
+            self._log(LogLevel.INFO, message, args, fields)
+
+    def warning(self, message: str, *args: Any, **fields: Any):
+        if self._min_value <= _WARNING:
+            self._log(LogLevel.WARNING, message, args, fields)
+
+    def error(self, message: str, *args: Any, **fields: Any):
+        if self._min_value <= _ERROR:
+            self._log(LogLevel.ERROR, message, args, fields)
+
+    def critical(self, message: str, *args: Any, **fields: Any):
+        if self._min_value <= _CRITICAL:
+            self._log(LogLevel.CRITICAL, message, args, fields)
+
+    def exception(self, message: str, *args: Any, **fields: Any):
+        if self._min_value <= _EXCEPTION:
+            self._log(LogLevel.EXCEPTION, message, args, fields)
+
+    def event(self, message: str, fields: Dict[str, Any], level: LogLevel = LogLevel.INFO):
+        """Emit one structured record carrying all given fields"""
+        self._log(level, message, (), fields)
+
+
+class BoundLogger:
+    """
+    Child logger created by Logger.bind.
+
+    Shares the parent's level, format and throttle and adds its bound
+    fields to every record.
+    """
+
+    __slots__ = ('_logger', '_fields')
+
+    def __init__(self, logger: Logger, fields: Dict[str, Any]):
+        self._logger = logger
+        self._fields = fields
+
+    def bind(self, **fields: Any) -> 'BoundLogger':
+        """Create a child logger with additional fields"""
+        return BoundLogger(self._logger, {**self._fields, **fields})
+
+    def add_event_fields(self, **fields: Any):
+        add_event_fields(**fields)
+
+    def add_event_timing(self, name: str, seconds: float):
+        add_event_timing(name, seconds)
+
+    def debug(self, message: str, *args: Any, **fields: Any):
+        if self._logger._min_value <= _DEBUG:
+            self._logger._log(LogLevel.DEBUG, message, args, {**self._fields, **fields})
 
-    def info(self, message: str):
-        self._log(LogLevel.INFO, message)
+    def info(self, message: str, *args: Any, **fields: Any):
+        if self._logger._min_value <= _INFO:
+            self._logger._log(LogLevel.INFO, message, args, {**self._fields, **fields})
 
-    def warning(self, message: str):
-        self._log(LogLevel.WARNING, message)
+    def warning(self, message: str, *args: Any, **fields: Any):
+        if self._logger._min_value <= _WARNING:
+            self._logger._log(LogLevel.WARNING, message, args, {**self._fields, **fields})
 
-    def error(self, message: str):
-        self._log(LogLevel.ERROR, message)
+    def error(self, message: str, *args: Any, **fields: Any):
+        if self._logger._min_value <= _ERROR:
+            self._logger._log(LogLevel.ERROR, message, args, {**self._fields, **fields})
 
-    def critical(self, message: str):
-        self._log(LogLevel.CRITICAL, message)
+    def critical(self, message: str, *args: Any, **fields: Any):
+        if self._logger._min_value <= _CRITICAL:
+            self._logger._log(LogLevel.CRITICAL, message, args, {**self._fields, **fields})
 
-    def exception(self, message: str):
-        self._log(LogLevel.EXCEPTION, message)
+    def exception(self, message: str, *args: Any, **fields: Any):
+        if self._logger._min_value <= _EXCEPTION:
+            self._logger._log(LogLevel.EXCEPTION, message, args, {**self._fields, **fields})
@@ -0,0 +1,48 @@
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+
+request_event_var: ContextVar[Optional[dict[str, Any]]] = ContextVar('request_event', default=None)
+
+
+def start_request_event(**fields: Any) -> Token:
+    """
+    Start collecting fields for the current request.
+
+    The event dict is shared by reference with every task spawned from the
+    current context, so fields added by the handler are visible to the
+    middleware that emits the event.
+
+    Returns:
+        Token: Token to pass to finish_request_event
+    """
+    return request_event_var.set(dict(fields))
+
+
+def finish_request_event(token: Token) -> dict[str, Any]:
+    """
+    Stop collecting fields and return the collected event.
+
+    Args:
+        token: Token returned by start_request_event
+
+    Returns:
+        dict: Collected event fields
+    """
+    event = request_event_var.get() or {}
+    request_event_var.reset(token)
+    return event
+
+
+def add_event_fields(**fields: Any):
+    """Attach fields to the current request event. No-op outside a request."""
+    event = request_event_var.get()
+    if event is not None:
+        event.update(fields)
+
+
+def add_event_timing(name: str, seconds: float):
+    """Accumulate a duration (in milliseconds) on the current request event."""
+    event = request_event_var.get()
+    if event is not None:
+        event[name] = round(event.get(name, 0.0) + seconds * 1000, 3)
@@ -0,0 +1,337 @@
+import gzip
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from glob import escape, glob
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+from src.infrastructure.logger.log_format import LogFormat
+from src.infrastructure.logger.log_levels import LogLevel
+
+
+# Keys every record carries; anything else is rendered as key=value in text format
+BASE_KEYS = ('timestamp', 'level', 'trace_id', 'file', 'line', 'message', 'exception')
+
+# os.writev accepts at most IOV_MAX buffers per call
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+
+def format_record(record: Dict[str, Any], log_format: LogFormat) -> str:
+    """
+    Render a record as a single log line (without the trailing newline).
+
+    Args:
+        record: Record produced by Logger
+        log_format: JSON or TEXT
+
+    Returns:
+        str: Rendered record
+    """
+    if log_format == LogFormat.JSON:
+        return json.dumps(record, ensure_ascii=False, default=str)
+
+    location = f"{record['file']}:{record['line']} - " if 'file' in record else ''
+    line = (
+        f"{record['timestamp']} - {record['level']} - "
+        f"{record['trace_id']} - {location}{record['message']}"
+    )
+    fields = [f'{key}={value}' for key, value in record.items() if key not in BASE_KEYS]
+    if fields:
+        line += ' - ' + ' '.join(fields)
+    if 'exception' in record:
+        line += f"\nTraceback:\n{record['exception']}"
+    return line
+
+
+class LogSink(ABC):
+    """
+    Destination for log records with its own level and format.
+
+    Records are rendered on emit and buffered; flush() hands the buffer to
+    the destination in as few system calls as possible. Records at ERROR
+    and above flush immediately so they survive a crash.
+    """
+
+    def __init__(
+        self,
+        level: LogLevel = LogLevel.DEBUG,
+        log_format: LogFormat = LogFormat.JSON,
+        buffer_bytes: int = 64 * 1024,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            level: Lowest level written by this sink
+            log_format: Format of records written by this sink
+            buffer_bytes: Buffered size that triggers a flush
+        """
+        self.level = level
+        self.log_format = log_format
+        self.buffer_bytes = buffer_bytes
+        self.dropped = 0
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any], level: LogLevel):
+        """Render and buffer a record, flushing when the buffer is full."""
+        data = (format_record(record, self.log_format) + '\n').encode('utf-8')
+        with self._lock:
+            self._buffer.append(data)
+            self._buffered += len(data)
+            if self._buffered < self.buffer_bytes and level.value < LogLevel.ERROR.value:
+                return
+            self._flush_locked()
+
+    def flush(self):
+        """Write out buffered records."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush and release the destination."""
+        self.flush()
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        chunks, self._buffer, self._buffered = self._buffer, [], 0
+        try:
+            self._write_chunks(chunks)
+        except OSError:
+            # Logging must never take the application down with it
+            self.dropped += len(chunks)
+
+    @abstractmethod
+    def _write_chunks(self, chunks: List[bytes]):
+        """Write rendered records to the destination."""
+
+
+def _writev_all(fd: int, chunks: List[bytes]):
+    """Write all chunks with as few writev calls as IOV_MAX and short writes allow."""
+    while chunks:
+        batch = chunks[:IOV_MAX]
+        written = os.writev(fd, batch)
+        total = sum(len(chunk) for chunk in batch)
+        if written == total:
+            chunks = chunks[IOV_MAX:]
+            continue
+        # Short write: drop fully written chunks and retry from the partial one
+        remaining = []
+        for chunk in chunks:
+            if written >= len(chunk):
+                written -= len(chunk)
+                continue
+            remaining.append(chunk[written:])
+            written = 0
+        chunks = remaining
+
+
+class StdoutSink(LogSink):
+    """Buffered stdout sink writing batches with writev."""
+
+    def __init__(self, fd: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._fd = fd
+
+    def _write_chunks(self, chunks: List[bytes]):
+        _writev_all(self._fd if self._fd is not None else 1, chunks)
+
+
+class BufferedFileSink(LogSink):
+    """
+    Buffered file sink with size and time based rotation.
+
+    Rotated files are renamed with a timestamp suffix and optionally
+    compressed with gzip on a background thread; only the newest
+    backup_count rotated files are kept.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 100 * 1024 * 1024,
+        rotate_interval: float = 0.0,
+        backup_count: int = 7,
+        compress: bool = False,
+        clock=time.time,
+        **kwargs
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            path: Log file path; '{pid}' is replaced with the process ID so
+                every worker writes and rotates its own file
+            max_bytes: Rotate once the file would grow beyond this size, 0 disables
+            rotate_interval: Rotate after this many seconds, 0 disables
+            backup_count: Number of rotated files to keep
+            compress: Gzip rotated files in the background
+            clock: Wall clock, injectable for tests
+        """
+        super().__init__(**kwargs)
+        self.path = path.format(pid=os.getpid())
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self._clock = clock
+        self._compressions: List[threading.Thread] = []
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    def _open(self):
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._size = os.fstat(self._fd).st_size
+        self._opened_at = self._clock()
+
+    def _write_chunks(self, chunks: List[bytes]):
+        pending = sum(len(chunk) for chunk in chunks)
+        if self._should_rotate(pending):
+            self._rotate()
+        _writev_all(self._fd, chunks)
+        self._size += pending
+
+    def _should_rotate(self, pending: int) -> bool:
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size + pending > self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and self._clock() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self):
+        os.close(self._fd)
+        suffix = datetime.fromtimestamp(self._clock()).strftime('%Y%m%d-%H%M%S-%f')
+        rotated = f'{self.path}.{suffix}'
+        os.replace(self.path, rotated)
+        self._open()
+
+        if self.compress:
+            thread = threading.Thread(target=self._compress, args=(rotated,), daemon=True)
+            thread.start()
+            self._compressions = [t for t in self._compressions if t.is_alive()] + [thread]
+        else:
+            self._prune()
+
+    def _compress(self, rotated: str):
+        try:
+            with open(rotated, 'rb') as source, gzip.open(rotated + '.gz', 'wb') as target:
+                shutil.copyfileobj(source, target)
+            os.remove(rotated)
+        except OSError:
+            return
+        self._prune()
+
+    def _prune(self):
+        rotated = sorted(glob(f'{escape(self.path)}.*'))
+        for name in rotated[:-self.backup_count] if self.backup_count else rotated:
+            try:
+                os.remove(name)
+            except OSError:
+                pass
+
+    def wait_for_compression(self, timeout: Optional[float] = None):
+        """Wait for background compression of rotated files to finish."""
+        for thread in self._compressions:
+            thread.join(timeout)
+
+    def close(self):
+        super().close()
+        os.close(self._fd)
+
+
+class SocketSink(LogSink):
+    """
+    Sink for a local log shipper.
+
+    Supports 'udp://host:port' and 'unixgram:///path' datagram addresses,
+    where every record is one datagram, and 'unix:///path' stream sockets,
+    where buffered records are sent in one call per batch.
+    """
+
+    def __init__(self, address: str, **kwargs):
+        super().__init__(**kwargs)
+        self.address = address
+        parsed = urlparse(address)
+        self._scheme = parsed.scheme
+        if parsed.scheme == 'udp':
+            self._family, self._type = socket.AF_INET, socket.SOCK_DGRAM
+            self._target = (parsed.hostname, parsed.port)
+        elif parsed.scheme == 'unixgram':
+            self._family, self._type = socket.AF_UNIX, socket.SOCK_DGRAM
+            self._target = parsed.path
+        elif parsed.scheme == 'unix':
+            self._family, self._type = socket.AF_UNIX, socket.SOCK_STREAM
+            self._target = parsed.path
+        else:
+            raise ValueError(f'Unsupported log socket address: {address}')
+        self._socket: Optional[socket.socket] = None
+
+    def _connect(self) -> socket.socket:
+        if self._socket is None:
+            sock = socket.socket(self._family, self._type)
+            try:
+                sock.connect(self._target)
+            except OSError:
+                sock.close()
+                raise
+            self._socket = sock
+        return self._socket
+
+    def _write_chunks(self, chunks: List[bytes]):
+        try:
+            sock = self._connect()
+            if self._type == socket.SOCK_STREAM:
+                for start in range(0, len(chunks), IOV_MAX):
+                    sock.sendall(b''.join(chunks[start:start + IOV_MAX]))
+            else:
+                for chunk in chunks:
+                    sock.send(chunk)
+        except OSError:
+            # Reconnect on the next flush, e.g. after the shipper restarts
+            self._disconnect()
+            raise
+
+    def _disconnect(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def close(self):
+        super().close()
+        self._disconnect()
+
+
+class SinkFlusher:
+    """Background thread flushing sinks at a fixed interval."""
+
+    def __init__(self, sinks: List[LogSink], interval: float):
+        self._sinks = sinks
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='log-sink-flusher', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        for sink in self._sinks:
+            sink.close()
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            for sink in self._sinks:
+                sink.flush()
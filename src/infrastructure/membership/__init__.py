@@ -0,0 +1,19 @@
+from src.infrastructure.database.database import async_session_maker
+from src.infrastructure.logger import logger
+from src.infrastructure.membership.bloom_filter import BloomFilter
+from src.infrastructure.membership.wallet_id_filter import WalletIdFilter
+from src.settings import settings
+
+
+wallet_id_filter = WalletIdFilter(
+    session_maker=async_session_maker,
+    logger=logger,
+    false_positive_rate=settings.WALLET_FILTER_FALSE_POSITIVE_RATE,
+    headroom=settings.WALLET_FILTER_HEADROOM,
+    min_capacity=settings.WALLET_FILTER_MIN_CAPACITY,
+    grace_seconds=settings.WALLET_FILTER_GRACE_SECONDS
+)
+
+
+async def get_wallet_id_filter() -> WalletIdFilter:
+    return wallet_id_filter
@@ -0,0 +1,61 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Bloom filter over byte strings.
+
+    Sized for an expected number of items and a target false-positive
+    rate. Bit positions come from double hashing of one 128-bit BLAKE2b
+    digest, so a lookup costs a single hash.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of items
+            false_positive_rate: Target false-positive rate at capacity, between 0 and 1
+        """
+        if capacity <= 0:
+            raise ValueError(f'Capacity must be positive: {capacity}')
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError(f'False-positive rate must be between 0 and 1: {false_positive_rate}')
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: bytes):
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        return ((h1 + i * h2) % size for i in range(self.hash_count))
+
+    def add(self, item: bytes):
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: bytes) -> bool:
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    @property
+    def estimated_false_positive_rate(self) -> float:
+        """False-positive rate expected at the current number of items."""
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
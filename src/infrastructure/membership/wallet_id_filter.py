@@ -0,0 +1,214 @@
+import asyncio
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.logger import Logger
+from src.infrastructure.membership.bloom_filter import BloomFilter
+
+
+# Payload announcing wallets created in bulk (e.g. by the seeder) instead of one ID
+REBUILD_NOTIFICATION = '*'
+
+
+class WalletIdFilter:
+    """
+    Per-worker Bloom filter of existing wallet IDs.
+
+    A definite miss means the wallet does not exist and can be answered
+    without a database round trip. Wallets created on other workers arrive
+    by NOTIFY, so misses are only answered by a filter built while the
+    current LISTEN subscription was up. The filter fails open: while the
+    LISTEN connection is down, until a build under the current subscription
+    completes, and for UUIDv7 IDs generated within the grace window (whose
+    creation may not have reached this worker yet), every ID is reported as
+    possibly present.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        logger: Logger,
+        false_positive_rate: float = 0.01,
+        headroom: float = 2.0,
+        min_capacity: int = 100_000,
+        grace_seconds: float = 30.0,
+        scan_batch_size: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            session_maker: Factory for database sessions used by rebuilds
+            logger: Logger instance
+            false_positive_rate: Target false-positive rate
+            headroom: Capacity of a rebuilt filter relative to the current wallet count
+            min_capacity: Lower bound of the capacity
+            grace_seconds: Age under which UUIDv7 IDs bypass the filter
+            scan_batch_size: Rows fetched per round trip by the streaming scan
+            clock: Wall clock, injectable for tests
+        """
+        self._session_maker = session_maker
+        self._logger = logger
+        self.false_positive_rate = false_positive_rate
+        self.headroom = headroom
+        self.min_capacity = min_capacity
+        self.grace_seconds = grace_seconds
+        self.scan_batch_size = scan_batch_size
+        self._clock = clock
+        self._filter: Optional[BloomFilter] = None
+        self._pending: Optional[List[bytes]] = None
+        self._rebuild_lock = asyncio.Lock()
+        # Generation of the live LISTEN subscription (None while down) and of the one the filter was built under
+        self._subscriptions = 0
+        self._subscription: Optional[int] = None
+        self._built_under: Optional[int] = None
+        self.built_at: Optional[float] = None
+        self.build_seconds: Optional[float] = None
+        self.definite_misses = 0
+        self.false_positives = 0
+
+    @property
+    def ready(self) -> bool:
+        """Whether misses are answered: built, and no notification missed since the scan."""
+        return self._filter is not None and self._subscription is not None and self._built_under == self._subscription
+
+    def might_contain(self, wallet_id: uuid.UUID) -> bool:
+        """False only if the wallet definitely does not exist."""
+        bloom = self._filter
+        if not self.ready or self._is_recent(wallet_id):
+            return True
+        if wallet_id.bytes in bloom:
+            return True
+        self.definite_misses += 1
+        return False
+
+    def record_false_positive(self):
+        """Count a lookup the filter let through that found no wallet."""
+        self.false_positives += 1
+
+    def add(self, wallet_id: uuid.UUID):
+        """Add a newly created wallet, including to a filter that is being rebuilt."""
+        if self._filter is not None:
+            self._filter.add(wallet_id.bytes)
+        if self._pending is not None:
+            self._pending.append(wallet_id.bytes)
+
+    def handle_notification(self, payload: str):
+        """Add a wallet announced by any worker with NOTIFY, or fail open after a bulk load."""
+        if payload == REBUILD_NOTIFICATION:
+            self.invalidate()
+            return
+        try:
+            wallet_id = uuid.UUID(payload)
+        except ValueError:
+            self._logger.error('Malformed wallet created notification: %s', payload)
+            return
+        self.add(wallet_id)
+
+    def handle_subscribed(self):
+        """Note a new LISTEN subscription; a filter scanned before it may lack creations announced earlier."""
+        self._subscriptions += 1
+        self._subscription = self._subscriptions
+
+    def handle_disconnected(self):
+        """Fail open as soon as the LISTEN connection is lost or cannot be established."""
+        self._subscription = None
+        self.invalidate()
+
+    def needs_rebuild(self, rebuild_seconds: float) -> bool:
+        bloom = self._filter
+        if bloom is None or self.built_at is None or self._built_under != self._subscription:
+            return True
+        return bloom.count > bloom.capacity or self._clock() - self.built_at >= rebuild_seconds
+
+    async def rebuild(self):
+        """Build a new filter from a streaming scan of wallet IDs and swap it in."""
+        async with self._rebuild_lock:
+            started = time.perf_counter()
+            subscription = self._subscription
+            self._pending = []
+            try:
+                async with self._session_maker() as session:
+                    # Planner estimate: an exact COUNT(*) would scan the table once more
+                    estimate = await session.scalar(text(
+                        "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'wallets'::regclass"
+                    ))
+                    bloom = BloomFilter(
+                        capacity=max(self.min_capacity, int(float(estimate or 0) * self.headroom)),
+                        false_positive_rate=self.false_positive_rate
+                    )
+                    result = await session.stream_scalars(
+                        select(Wallet.id).execution_options(yield_per=self.scan_batch_size)
+                    )
+                    async for wallet_id in result:
+                        bloom.add(wallet_id.bytes)
+
+                for item in self._pending:
+                    bloom.add(item)
+                self._filter = bloom
+                self._built_under = subscription
+            finally:
+                self._pending = None
+
+            self.built_at = self._clock()
+            self.build_seconds = time.perf_counter() - started
+            self._logger.info(
+                'Wallet ID filter built',
+                wallets=bloom.count,
+                capacity=bloom.capacity,
+                memory_bytes=bloom.memory_bytes,
+                build_seconds=round(self.build_seconds, 3)
+            )
+
+    async def run(self, stop: asyncio.Event, rebuild_seconds: float, check_interval: float = 60.0):
+        """Build the filter, then rebuild it periodically or when it outgrows its capacity."""
+        while not stop.is_set():
+            if self.needs_rebuild(rebuild_seconds):
+                try:
+                    await self.rebuild()
+                except Exception as e:
+                    self._logger.error('Wallet ID filter build failed: %s', e)
+            try:
+                await asyncio.wait_for(stop.wait(), check_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def invalidate(self):
+        """
+        Stop answering misses until the next rebuild.
+
+        Called when wallet creations may have been missed: after a bulk load
+        and when the LISTEN connection is lost.
+        """
+        self._filter = None
+        self.built_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        bloom = self._filter
+        answered = self.definite_misses + self.false_positives
+        return {
+            'ready': self.ready,
+            'listening': self._subscription is not None,
+            'wallets': bloom.count if bloom else 0,
+            'capacity': bloom.capacity if bloom else 0,
+            'bits': bloom.size if bloom else 0,
+            'hash_count': bloom.hash_count if bloom else 0,
+            'memory_bytes': bloom.memory_bytes if bloom else 0,
+            'target_false_positive_rate': self.false_positive_rate,
+            'estimated_false_positive_rate': bloom.estimated_false_positive_rate if bloom else None,
+            'observed_false_positive_rate': self.false_positives / answered if answered else None,
+            'definite_misses': self.definite_misses,
+            'false_positives': self.false_positives,
+            'built_at': self.built_at,
+            'build_seconds': self.build_seconds,
+        }
+
+    def _is_recent(self, wallet_id: uuid.UUID) -> bool:
+        if wallet_id.version != 7:
+            return False
+        created_ms = wallet_id.int >> 80
+        return created_ms / 1000 >= self._clock() - self.grace_seconds
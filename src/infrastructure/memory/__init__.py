@@ -0,0 +1,4 @@
+from src.infrastructure.memory.stats_repository import InMemoryStatsRepository
+from src.infrastructure.memory.wal import WriteAheadLog
+from src.infrastructure.memory.wallet_repository import InMemoryWalletRepository
+from src.infrastructure.memory.wallet_state import WalletState
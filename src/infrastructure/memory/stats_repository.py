@@ -0,0 +1,25 @@
+from src.application.abstractions import IStatsRepository
+from src.application.domain.wallet_totals import WalletTotals
+from src.infrastructure.logger import Logger
+from src.infrastructure.memory.wallet_repository import InMemoryWalletRepository
+
+
+class InMemoryStatsRepository(IStatsRepository):
+    """Wallet aggregates of the in-memory wallet store."""
+
+    def __init__(self, wallet_repository: InMemoryWalletRepository, logger: Logger):
+        super().__init__(None, logger)
+        self._wallet_repository = wallet_repository
+
+
+    async def get_totals(self) -> WalletTotals:
+        """
+        Retrieve the wallet count and total balance.
+
+        Returns:
+            WalletTotals: Aggregates over all wallets
+
+        Raises:
+            DatabaseError: If the store is not open
+        """
+        return self._wallet_repository.totals()
@@ -0,0 +1,282 @@
+import asyncio
+import fcntl
+import os
+import re
+import struct
+import zlib
+from typing import List, Optional, Tuple
+from src.infrastructure.memory.wallet_state import WalletState
+
+
+# kind, wallet ID, value, CRC32 of the preceding fields
+RECORD = struct.Struct('<c16sqI')
+CREATE = b'C'
+BALANCE = b'B'
+
+_WAL_NAME = re.compile(r'^wal-(\d{8})\.log$')
+_SNAPSHOT_NAME = re.compile(r'^snapshot-(\d{8})\.bin$')
+
+
+def encode_record(kind: bytes, wallet_id: int, value: int) -> bytes:
+    """
+    Encode one log record.
+
+    Args:
+        kind: CREATE (value is the creation time in microseconds) or
+            BALANCE (value is the new balance in minor units)
+        wallet_id: Integer value of the wallet UUID
+        value: Record value
+
+    Returns:
+        bytes: Fixed-size record
+    """
+    body = struct.pack('<c16sq', kind, wallet_id.to_bytes(16, 'big'), value)
+    return body + struct.pack('<I', zlib.crc32(body))
+
+
+def read_records(data: bytes) -> Tuple[List[Tuple[bytes, int, int]], int]:
+    """
+    Decode records up to the first torn or corrupt one.
+
+    Returns:
+        tuple: Decoded (kind, wallet ID, value) records and the length of the valid prefix
+    """
+    records = []
+    offset = 0
+    while offset + RECORD.size <= len(data):
+        kind, wallet_id, value, crc = RECORD.unpack_from(data, offset)
+        if zlib.crc32(data[offset:offset + RECORD.size - 4]) != crc or kind not in (CREATE, BALANCE):
+            break
+        records.append((kind, int.from_bytes(wallet_id, 'big'), value))
+        offset += RECORD.size
+    return records, offset
+
+
+def apply_records(state: WalletState, records: List[Tuple[bytes, int, int]]):
+    """Replay decoded records onto a state."""
+    for kind, wallet_id, value in records:
+        if kind == CREATE:
+            state.add(wallet_id, value)
+            continue
+        slot = state.slot(wallet_id)
+        if slot is not None:
+            state.set_balance(slot, value)
+
+
+class WriteAheadLog:
+    """
+    Durable append-only log of wallet changes with group commit.
+
+    Appends are numbered with a log sequence number (LSN) and gathered while
+    the previous batch is being written, so one write+fdatasync covers all
+    of them; wait_durable() returns once a given LSN is on disk. Batches are
+    written in append order, so a crash loses a suffix of the log, never a
+    record in the middle. The directory holds numbered
+    generations: snapshot-N.bin is the state at the start of wal-N.log, and
+    recovery loads the newest snapshot and replays the logs from its
+    generation on. A lock file keeps a second process from opening the
+    same directory.
+    """
+
+    def __init__(self, directory: str, fsync: bool = True, flush_delay: float = 0.0):
+        """
+        Initialize the log.
+
+        Args:
+            directory: Directory holding logs and snapshots
+            fsync: Flush every batch to stable storage before acknowledging it
+            flush_delay: Extra seconds to wait for more appends before writing a batch
+        """
+        self.directory = directory
+        self.fsync = fsync
+        self.flush_delay = flush_delay
+        self.generation = 0
+        self.batches = 0
+        self._fd: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+        self._pending: List[bytes] = []
+        self._appended = 0
+        self._durable = 0
+        self._progress: Optional[asyncio.Future] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._failed: Optional[OSError] = None
+
+    def _path(self, pattern: str, generation: int) -> str:
+        return os.path.join(self.directory, pattern.format(generation))
+
+    def _generations(self, pattern: re.Pattern) -> List[int]:
+        return sorted(
+            int(match.group(1))
+            for match in (pattern.match(name) for name in os.listdir(self.directory))
+            if match
+        )
+
+    def open(self) -> WalletState:
+        """
+        Lock the directory, recover the state and start a new log generation.
+
+        Returns:
+            WalletState: State recovered from the newest snapshot and later logs
+
+        Raises:
+            RuntimeError: If another process holds the directory
+            ValueError: If the newest snapshot is corrupt
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock_fd = os.open(os.path.join(self.directory, 'LOCK'), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+            raise RuntimeError(f'Wallet store {self.directory} is used by another process')
+
+        snapshots = self._generations(_SNAPSHOT_NAME)
+        base = snapshots[-1] if snapshots else 0
+        if snapshots:
+            with open(self._path('snapshot-{:08d}.bin', base), 'rb') as file:
+                state = WalletState.from_snapshot(file.read())
+        else:
+            state = WalletState()
+
+        logs = [generation for generation in self._generations(_WAL_NAME) if generation >= base]
+        for generation in logs:
+            with open(self._path('wal-{:08d}.log', generation), 'rb') as file:
+                records, _ = read_records(file.read())
+            # A torn tail is an unacknowledged batch; it is dropped with its generation
+            apply_records(state, records)
+
+        # Always append to a fresh generation so a torn tail is never followed by valid records
+        self.generation = max([base] + logs) + 1 if logs else base
+        self._open_generation()
+        if logs:
+            self._write_snapshot(state, self.generation)
+        return state
+
+    def _open_generation(self):
+        self._fd = os.open(
+            self._path('wal-{:08d}.log', self.generation),
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644
+        )
+        self._sync_directory()
+
+    def _sync_directory(self):
+        if not self.fsync:
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @property
+    def durable_lsn(self) -> int:
+        """LSN of the last record known to be on disk."""
+        return self._durable
+
+    def append(self, record: bytes) -> int:
+        """
+        Queue a record for the next batch.
+
+        Returns:
+            int: LSN of the record, to be passed to wait_durable()
+
+        Raises:
+            OSError: If an earlier write failed; the log stays failed
+        """
+        if self._failed is not None:
+            raise self._failed
+        self._pending.append(record)
+        self._appended += 1
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        return self._appended
+
+    async def wait_durable(self, lsn: int):
+        """
+        Wait until the record with this LSN is on disk.
+
+        Raises:
+            OSError: If the log could not be written
+        """
+        while self._durable < lsn:
+            if self._failed is not None:
+                raise self._failed
+            if self._progress is None or self._progress.done():
+                self._progress = asyncio.get_running_loop().create_future()
+            await asyncio.shield(self._progress)
+
+    async def _flush_loop(self):
+        if self.flush_delay:
+            await asyncio.sleep(self.flush_delay)
+        while self._pending and self._failed is None:
+            records, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(self._write, b''.join(records))
+            except OSError as e:
+                # A partial batch may be on disk; refuse further writes until restart
+                self._failed = e
+            else:
+                self._durable += len(records)
+                self.batches += 1
+            if self._progress is not None and not self._progress.done():
+                self._progress.set_result(None)
+
+    def _write(self, data: bytes):
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        if self.fsync:
+            os.fdatasync(self._fd)
+
+    async def drain(self):
+        """Wait until every appended record is written."""
+        while self._flusher is not None and not self._flusher.done():
+            await asyncio.shield(self._flusher)
+
+    async def checkpoint(self, state: WalletState):
+        """
+        Snapshot the state and drop the logs it covers.
+
+        The caller must stop appends for the duration of the call, since the
+        state has to match the end of the current generation; the snapshot
+        itself is written from a copy in a thread.
+        """
+        await self.drain()
+        copy = state.copy()
+        os.close(self._fd)
+        self.generation += 1
+        self._open_generation()
+        await asyncio.to_thread(self._write_snapshot, copy, self.generation)
+
+    def _write_snapshot(self, state: WalletState, generation: int):
+        path = self._path('snapshot-{:08d}.bin', generation)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(state.to_snapshot())
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        os.replace(temporary, path)
+        self._sync_directory()
+
+        # Older generations are now redundant
+        for old in self._generations(_SNAPSHOT_NAME):
+            if old < generation:
+                os.remove(self._path('snapshot-{:08d}.bin', old))
+        for old in self._generations(_WAL_NAME):
+            if old < generation:
+                os.remove(self._path('wal-{:08d}.log', old))
+
+    async def close(self):
+        """Write out pending records and release the directory."""
+        await self.drain()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
@@ -0,0 +1,368 @@
+import asyncio
+import heapq
+import math
+import time
+from array import array
+import uuid
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from typing import List, Optional
+from src.application.abstractions import IWalletRepository
+from src.application.domain.money import MINOR_UNITS_PER_UNIT, from_minor_units
+from src.application.domain.uuid7 import uuid7
+from src.application.domain.wallet_page import SortOrder, WalletListQuery, WalletPage
+from src.application.domain.wallet_totals import WalletTotals
+from src.infrastructure.database.balance import apply_balance_delta, has_funds
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.logger import Logger
+from src.infrastructure.memory.wal import BALANCE, CREATE, WriteAheadLog, encode_record
+from src.infrastructure.memory.wallet_state import WalletState
+from src.application.exceptions import (
+    WalletNotFoundError,
+    InsufficientFundsError,
+    InvalidAmountError,
+    InvalidWalletIdError,
+    DatabaseError
+)
+from src.infrastructure.tracing import tracer
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _to_us(moment: datetime) -> int:
+    """Microseconds since the epoch, exact for timezone-aware datetimes."""
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+class InMemoryWalletRepository(IWalletRepository):
+    """
+    Wallet repository keeping all wallets in process memory.
+
+    Wallet state lives in a compact array-backed table; every change is
+    appended to a write-ahead log and acknowledged only once durable, with
+    concurrent changes sharing one fsync. Row locks are replaced by a fixed
+    set of asyncio locks picked by wallet ID, held while a change is checked,
+    applied and queued to the log. The lock is released before waiting for
+    the fsync (early lock release): a later change of the same wallet is
+    logged after this one, so a crash can only drop both, and reads wait for
+    the durability of the last change of the wallet they return.
+
+    The store belongs to a single process: run the API with one worker when
+    it is enabled. Balance change notifications and the operation queue
+    still go through Postgres and are not fed by this repository.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        logger: Logger,
+        lock_stripes: int = 1024,
+        fsync: bool = True,
+        flush_delay: float = 0.0
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            directory: Directory for the write-ahead log and snapshots
+            logger: Logger instance
+            lock_stripes: Number of wallet locks
+            fsync: Flush the log to stable storage before acknowledging changes
+            flush_delay: Extra seconds to gather changes into one log write
+        """
+        super().__init__(None, logger)
+        self._wal = WriteAheadLog(directory, fsync=fsync, flush_delay=flush_delay)
+        self._locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(lock_stripes)]
+        self._state: Optional[WalletState] = None
+        # LSN of the last change per slot; reads wait until it is durable
+        self._lsns = array('q')
+
+
+    async def start(self):
+        """
+        Recover the wallets from the log directory and accept changes.
+
+        Raises:
+            RuntimeError: If another process uses the directory
+        """
+        self._state = await asyncio.to_thread(self._wal.open)
+        self._lsns = array('q', bytes(8 * len(self._state)))
+        self._logger.info('In-memory wallet store opened', wallets=len(self._state), generation=self._wal.generation)
+
+
+    async def close(self):
+        """Snapshot the wallets and release the log directory."""
+        if self._state is None:
+            return
+        await self.snapshot()
+        await self._wal.close()
+        self._state = None
+
+
+    async def snapshot(self):
+        """Write a snapshot and drop the log it covers; changes wait meanwhile."""
+        async with AsyncExitStack() as stack:
+            for lock in self._locks:
+                await stack.enter_async_context(lock)
+            await self._wal.checkpoint(self._require_state())
+
+
+    async def run_snapshots(self, stop: asyncio.Event, interval: float):
+        """
+        Snapshot periodically until stop is set.
+
+        Args:
+            stop: Event that ends the loop once set
+            interval: Seconds between snapshots
+        """
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            if stop.is_set():
+                break
+            try:
+                await self.snapshot()
+            except Exception as e:
+                self._logger.error('Wallet snapshot failed: %r', e)
+
+
+    def totals(self) -> WalletTotals:
+        """Wallet count and total balance, maintained on every change."""
+        state = self._require_state()
+        return WalletTotals(wallet_count=len(state), total_balance=from_minor_units(state.total_minor))
+
+
+    def _require_state(self) -> WalletState:
+        if self._state is None:
+            raise DatabaseError('In-memory wallet store is not open')
+        return self._state
+
+
+    def _lock(self, wallet_uuid: uuid.UUID) -> asyncio.Lock:
+        return self._locks[wallet_uuid.int % len(self._locks)]
+
+
+    @staticmethod
+    def _parse_wallet_id(wallet_id: str) -> uuid.UUID:
+        """
+        Parse a wallet ID.
+
+        Raises:
+            InvalidWalletIdError: If wallet ID format is invalid
+        """
+        try:
+            return uuid.UUID(wallet_id)
+        except ValueError:
+            raise InvalidWalletIdError(f'Invalid wallet ID format: {wallet_id}')
+
+
+    def _wallet(self, state: WalletState, wallet_uuid: uuid.UUID, slot: int) -> Wallet:
+        """Build a detached entity; callers never share the stored state."""
+        balance_minor = state.balance(slot)
+        return Wallet(
+            id=wallet_uuid,
+            balance=from_minor_units(balance_minor),
+            balance_minor=balance_minor,
+            created_at=_EPOCH + timedelta(microseconds=state.created_us(slot))
+        )
+
+
+    def _log(self, record: bytes) -> int:
+        try:
+            return self._wal.append(record)
+        except OSError as e:
+            self._logger.add_event_fields(error=f'Wallet log write failed: {e}')
+            raise DatabaseError(f'Failed to write wallet log: {e}')
+
+
+    async def _wait_durable(self, lsn: int):
+        try:
+            await self._wal.wait_durable(lsn)
+        except OSError as e:
+            self._logger.add_event_fields(error=f'Wallet log write failed: {e}')
+            raise DatabaseError(f'Failed to write wallet log: {e}')
+
+
+    @tracer.traced('InMemoryWalletRepository.create')
+    async def create(self, wallet_id: Optional[uuid.UUID] = None) -> Wallet:
+        """
+        Create a new wallet with zero balance.
+
+        Args:
+            wallet_id: ID chosen by the caller; a new UUIDv7 by default
+
+        Returns:
+            Wallet: The created wallet entity
+
+        Raises:
+            DatabaseError: If the wallet already exists or the change cannot be logged
+        """
+        state = self._require_state()
+        wallet_uuid = wallet_id or uuid7()
+        created_us = time.time_ns() // 1000
+        async with self._lock(wallet_uuid):
+            if state.slot(wallet_uuid.int) is not None:
+                raise DatabaseError(f'Wallet {wallet_uuid} already exists')
+            lsn = self._log(encode_record(CREATE, wallet_uuid.int, created_us))
+            slot = state.add(wallet_uuid.int, created_us)
+            self._lsns.append(lsn)
+        await self._wait_durable(lsn)
+        return self._wallet(state, wallet_uuid, slot)
+
+
+    async def _change_balance(self, wallet_id: str, amount: Decimal, withdraw: bool) -> Wallet:
+        state = self._require_state()
+        wallet_uuid = self._parse_wallet_id(wallet_id)
+        started = time.perf_counter()
+        async with self._lock(wallet_uuid):
+            self._logger.add_event_timing('lock_wait_ms', time.perf_counter() - started)
+            slot = state.slot(wallet_uuid.int)
+            if slot is None:
+                raise WalletNotFoundError(f'Wallet with ID {wallet_uuid} not found')
+
+            # Same arithmetic as the database repository, including BALANCE_MINOR_UNITS
+            wallet = self._wallet(state, wallet_uuid, slot)
+            if withdraw and not has_funds(wallet, amount):
+                raise InsufficientFundsError(
+                    f'Insufficient funds: balance {wallet.balance}, '
+                    f'requested {amount}'
+                )
+            apply_balance_delta(wallet, -amount if withdraw else amount)
+
+            lsn = self._log(encode_record(BALANCE, wallet_uuid.int, wallet.balance_minor))
+            state.set_balance(slot, wallet.balance_minor)
+            self._lsns[slot] = lsn
+        await self._wait_durable(lsn)
+        self._logger.add_event_timing('db_time_ms', time.perf_counter() - started)
+        return wallet
+
+
+    @tracer.traced('InMemoryWalletRepository.deposit')
+    async def deposit(self, wallet_id: str, amount: Decimal) -> Wallet:
+        """
+        Deposit money into a wallet.
+
+        Args:
+            wallet_id: The wallet ID to deposit into
+            amount: The amount to deposit (must be positive)
+
+        Returns:
+            Wallet: The updated wallet entity
+
+        Raises:
+            InvalidAmountError: If amount is not positive
+            InvalidWalletIdError: If wallet ID format is invalid
+            WalletNotFoundError: If wallet is not found
+            DatabaseError: If the change cannot be logged
+        """
+        if amount <= 0:
+            raise InvalidAmountError(f'Deposit amount must be positive: {amount}')
+        return await self._change_balance(wallet_id, amount, withdraw=False)
+
+
+    @tracer.traced('InMemoryWalletRepository.withdraw')
+    async def withdraw(self, wallet_id: str, amount: Decimal) -> Wallet:
+        """
+        Withdraw money from a wallet.
+
+        Args:
+            wallet_id: The wallet ID to withdraw from
+            amount: The amount to withdraw (must be positive)
+
+        Returns:
+            Wallet: The updated wallet entity
+
+        Raises:
+            InvalidAmountError: If amount is not positive
+            InvalidWalletIdError: If wallet ID format is invalid
+            WalletNotFoundError: If wallet is not found
+            InsufficientFundsError: If wallet has insufficient funds
+            DatabaseError: If the change cannot be logged
+        """
+        if amount <= 0:
+            raise InvalidAmountError(f'Withdraw amount must be positive: {amount}')
+        return await self._change_balance(wallet_id, amount, withdraw=True)
+
+
+    @tracer.traced('InMemoryWalletRepository.get_wallet')
+    async def get_wallet(self, wallet_id: str) -> Wallet:
+        """
+        Retrieve a wallet by its ID.
+
+        Reads take no lock; a wallet whose last change is still being
+        written is returned once that change is durable.
+
+        Args:
+            wallet_id: The wallet ID to retrieve
+
+        Returns:
+            Wallet: The wallet entity
+
+        Raises:
+            InvalidWalletIdError: If wallet ID format is invalid
+            WalletNotFoundError: If wallet is not found
+        """
+        wallet_uuid = self._parse_wallet_id(wallet_id)
+        state = self._require_state()
+        slot = state.slot(wallet_uuid.int)
+        if slot is None:
+            raise WalletNotFoundError(f'Wallet with ID {wallet_id} not found')
+        await self._wait_durable(self._lsns[slot])
+        return self._wallet(state, wallet_uuid, slot)
+
+
+    @tracer.traced('InMemoryWalletRepository.list_wallets')
+    async def list_wallets(self, query: WalletListQuery) -> WalletPage:
+        """
+        List wallets ordered by (created_at, id) with keyset pagination.
+
+        The table has no ordered index, so every page is a scan selecting
+        the limit + 1 smallest keys past the cursor; pages are stable under
+        the same cursor semantics as the database repository.
+
+        Args:
+            query: Page size, cursor, sort order and filters
+
+        Returns:
+            WalletPage: The wallets and the cursor of the next page
+        """
+        state = self._require_state()
+        descending = query.order == SortOrder.DESC
+        cursor = None
+        if query.cursor is not None:
+            cursor = (_to_us(query.cursor.created_at), query.cursor.wallet_id.int)
+        # Balances are whole minor units: round bounds inwards
+        min_minor = None if query.min_balance is None else math.ceil(query.min_balance * MINOR_UNITS_PER_UNIT)
+        max_minor = None if query.max_balance is None else math.floor(query.max_balance * MINOR_UNITS_PER_UNIT)
+        created_from = None if query.created_from is None else _to_us(query.created_from)
+        created_to = None if query.created_to is None else _to_us(query.created_to)
+
+        def matches(entry) -> bool:
+            wallet_id, balance, created = entry
+            if cursor is not None:
+                key = (created, wallet_id)
+                if (key >= cursor) if descending else (key <= cursor):
+                    return False
+            if query.excludes_zero and balance == 0:
+                return False
+            if min_minor is not None and balance < min_minor:
+                return False
+            if max_minor is not None and balance > max_minor:
+                return False
+            if created_from is not None and created < created_from:
+                return False
+            return created_to is None or created < created_to
+
+        select = heapq.nlargest if descending else heapq.nsmallest
+        entries = select(query.limit + 1, filter(matches, state), key=lambda entry: (entry[2], entry[0]))
+
+        rows = []
+        for wallet_id, _balance, _created in entries:
+            slot = state.slot(wallet_id)
+            await self._wait_durable(self._lsns[slot])
+            rows.append(self._wallet(state, uuid.UUID(int=wallet_id), slot))
+        return WalletPage.from_rows(rows, query.limit)
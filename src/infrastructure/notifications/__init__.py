@@ -0,0 +1,39 @@
+import json
+from src.infrastructure.logger import logger
+from src.infrastructure.membership import wallet_id_filter
+from src.infrastructure.notifications.balance_broadcaster import BalanceBroadcaster, BalanceEvent, BalanceSubscription
+from src.infrastructure.notifications.listener import PgNotificationListener
+from src.infrastructure.sharding import shard_map_store
+from src.settings import settings
+
+
+notification_listener = PgNotificationListener(dsn=settings.DATABASE_DSN, logger=logger)
+balance_broadcaster = BalanceBroadcaster(logger=logger, buffer_size=settings.BALANCE_STREAM_BUFFER_SIZE)
+
+if settings.BALANCE_STREAM_ENABLED and settings.WALLET_STORAGE != 'sharded':
+    notification_listener.add_handler(settings.BALANCE_NOTIFY_CHANNEL, balance_broadcaster.handle_notification)
+    notification_listener.add_reconnect_handler(balance_broadcaster.resync)
+
+
+def handle_log_config(payload: str):
+    """Apply a logging configuration change published by any worker."""
+    try:
+        logger.configure(**json.loads(payload))
+    except (ValueError, TypeError) as e:
+        logger.error('Malformed logging configuration: %s', e)
+
+
+notification_listener.add_handler(settings.LOG_CONFIG_CHANNEL, handle_log_config)
+
+if settings.WALLET_FILTER_ENABLED:
+    notification_listener.add_handler(settings.WALLET_CREATED_CHANNEL, wallet_id_filter.handle_notification)
+    notification_listener.add_subscribe_handler(wallet_id_filter.handle_subscribed)
+    notification_listener.add_disconnect_handler(wallet_id_filter.handle_disconnected)
+
+if settings.WALLET_STORAGE == 'sharded':
+    notification_listener.add_handler(settings.SHARD_MAP_CHANNEL, shard_map_store.handle_notification)
+    notification_listener.add_reconnect_handler(shard_map_store.schedule_refresh)
+
+
+async def get_balance_broadcaster() -> BalanceBroadcaster:
+    return balance_broadcaster
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Optional
+from src.infrastructure.logger import Logger
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceEvent:
+    """
+    Balance change delivered to stream subscribers.
+
+    Attributes:
+        wallet_id: Canonical string form of the wallet UUID
+        balance: New balance as decimal string (same wire format as the API)
+        resync: True when events may have been lost and the balance must be re-read
+        evicted: True when the subscriber was dropped for falling behind
+    """
+    wallet_id: str
+    balance: Optional[str] = None
+    resync: bool = False
+    evicted: bool = False
+
+
+class BalanceSubscription:
+    """Bounded per-subscriber event buffer."""
+
+    __slots__ = ('wallet_id', '_queue', 'evicted')
+
+    def __init__(self, wallet_id: str, buffer_size: int):
+        self.wallet_id = wallet_id
+        self._queue: asyncio.Queue[BalanceEvent] = asyncio.Queue(maxsize=buffer_size)
+        self.evicted = False
+
+    def offer(self, event: BalanceEvent) -> bool:
+        """Enqueue an event without blocking. Returns False if the buffer is full."""
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def evict(self):
+        """Drop buffered events and leave a single eviction marker."""
+        self.evicted = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(BalanceEvent(wallet_id=self.wallet_id, evicted=True))
+
+    async def get(self, timeout: float) -> Optional[BalanceEvent]:
+        """Wait for the next event, returning None if nothing arrives within timeout."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class BalanceBroadcaster:
+    """
+    In-memory fan-out of balance change notifications to stream subscribers.
+
+    Fed by the worker's LISTEN connection; a subscriber whose buffer is full
+    is evicted instead of slowing down delivery to everyone else.
+    """
+
+    def __init__(self, logger: Logger, buffer_size: int):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            logger: Logger instance for diagnostics
+            buffer_size: Maximum number of undelivered events per subscriber
+        """
+        self._logger = logger
+        self._buffer_size = buffer_size
+        self._subscriptions: dict[str, set[BalanceSubscription]] = {}
+        self.evicted_total = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def subscribe(self, wallet_id: str) -> BalanceSubscription:
+        """Register a subscriber for a wallet."""
+        subscription = BalanceSubscription(wallet_id, self._buffer_size)
+        self._subscriptions.setdefault(wallet_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: BalanceSubscription):
+        """Remove a subscriber. Safe to call more than once."""
+        subscriptions = self._subscriptions.get(subscription.wallet_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.wallet_id]
+
+    def publish(self, event: BalanceEvent):
+        """Deliver an event to every subscriber of its wallet."""
+        for subscription in tuple(self._subscriptions.get(event.wallet_id, ())):
+            if not subscription.offer(event):
+                self._evict(subscription)
+
+    def handle_notification(self, payload: str):
+        """Parse a NOTIFY payload and publish it."""
+        try:
+            data = json.loads(payload)
+            event = BalanceEvent(wallet_id=data['wallet_id'], balance=data['balance'])
+        except (ValueError, KeyError, TypeError) as e:
+            self._logger.error('Malformed balance notification: %s', e)
+            return
+        self.publish(event)
+
+    def resync(self):
+        """Tell every subscriber to re-read its balance after missed notifications."""
+        for wallet_id in tuple(self._subscriptions):
+            self.publish(BalanceEvent(wallet_id=wallet_id, resync=True))
+
+    def _evict(self, subscription: BalanceSubscription):
+        self.unsubscribe(subscription)
+        subscription.evict()
+        self.evicted_total += 1
+        self._logger.warning('Evicted slow balance stream subscriber', wallet_id=subscription.wallet_id)
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Callable, Optional
+import asyncpg
+from src.infrastructure.logger import Logger
+
+
+NotificationHandler = Callable[[str], None]
+ConnectionHandler = Callable[[], None]
+
+
+class PgNotificationListener:
+    """
+    Single LISTEN connection per worker process.
+
+    Dispatches NOTIFY payloads of registered channels to in-process handlers
+    and reconnects in the background when the connection is lost. Consumers
+    that must not trust their state while notifications may be missed are
+    told when the subscription is established and when it is lost.
+    """
+
+    def __init__(self, dsn: str, logger: Logger, reconnect_delay: float = 1.0):
+        """
+        Initialize the listener.
+
+        Args:
+            dsn: libpq connection string for the dedicated LISTEN connection
+            logger: Logger instance for connection diagnostics
+            reconnect_delay: Seconds to wait before reconnecting after a failure
+        """
+        self._dsn = dsn
+        self._logger = logger
+        self._reconnect_delay = reconnect_delay
+        self._handlers: dict[str, list[NotificationHandler]] = {}
+        self._reconnect_handlers: list[ConnectionHandler] = []
+        self._subscribe_handlers: list[ConnectionHandler] = []
+        self._disconnect_handlers: list[ConnectionHandler] = []
+        self._task: Optional[asyncio.Task] = None
+        self._connected_once = False
+
+    def add_handler(self, channel: str, handler: NotificationHandler):
+        """Register a handler for a channel. Must be called before start()."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def add_reconnect_handler(self, handler: ConnectionHandler):
+        """Register a callback invoked after the connection is re-established."""
+        self._reconnect_handlers.append(handler)
+
+    def add_subscribe_handler(self, handler: ConnectionHandler):
+        """Register a callback invoked once every channel is subscribed, on the first connection too."""
+        self._subscribe_handlers.append(handler)
+
+    def add_disconnect_handler(self, handler: ConnectionHandler):
+        """Register a callback invoked when the connection is lost or cannot be established."""
+        self._disconnect_handlers.append(handler)
+
+    async def start(self):
+        """Start listening in a background task."""
+        if self._task is None and self._handlers:
+            self._task = asyncio.create_task(self._run(), name='pg-notification-listener')
+
+    async def stop(self):
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            connection: Optional[asyncpg.Connection] = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                lost = asyncio.get_running_loop().create_future()
+                connection.add_termination_listener(
+                    lambda _connection: lost.done() or lost.set_result(None)
+                )
+                for channel in self._handlers:
+                    await connection.add_listener(channel, self._dispatch)
+
+                if self._connected_once:
+                    # Notifications sent while we were disconnected are lost
+                    self._call(self._reconnect_handlers)
+                self._connected_once = True
+                self._call(self._subscribe_handlers)
+                self._logger.info('Listening on channels: %s', ', '.join(self._handlers))
+
+                await lost
+                self._logger.warning('LISTEN connection lost')
+                self._call(self._disconnect_handlers)
+            except asyncio.CancelledError:
+                self._call(self._disconnect_handlers)
+                raise
+            except Exception as e:
+                self._logger.error('LISTEN connection failed: %s', e)
+                self._call(self._disconnect_handlers)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(self._reconnect_delay)
+
+    def _call(self, handlers: list[ConnectionHandler]):
+        for handler in handlers:
+            try:
+                handler()
+            except Exception as e:
+                self._logger.error('Connection handler failed: %s', e)
+
+    def _dispatch(self, _connection: asyncpg.Connection, _pid: int, channel: str, payload: str):
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception as e:
+                self._logger.error('Notification handler failed on channel %s: %s', channel, e)
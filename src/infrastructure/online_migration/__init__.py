@@ -0,0 +1,3 @@
+from src.infrastructure.online_migration.backfill import BackfillProgress, ColumnBackfill, PROGRESS_TABLE
+from src.infrastructure.online_migration.columns import BALANCE_MINOR, COLUMN_MIGRATIONS, ColumnMigration
+from src.infrastructure.online_migration.verify import DualWriteVerifier, VerificationResult
@@ -0,0 +1,231 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+import asyncpg
+from src.infrastructure.logger import Logger
+from src.infrastructure.online_migration.columns import ColumnMigration
+
+
+PROGRESS_TABLE = 'online_migration_progress'
+
+# Errors of a chunk that waited too long or lost a deadlock; the chunk is
+# rolled back and retried smaller instead of failing the backfill
+RETRYABLE_ERRORS = (
+    asyncpg.exceptions.LockNotAvailableError,
+    asyncpg.exceptions.QueryCanceledError,
+    asyncpg.exceptions.DeadlockDetectedError,
+)
+
+
+@dataclass(frozen=True)
+class BackfillProgress:
+    """
+    Persisted state of a backfill.
+
+    Attributes:
+        name: Column migration name
+        last_id: Highest ID of the last committed chunk, None before the first
+        rows_scanned: Rows walked so far
+        rows_updated: Rows written by the backfill so far
+        started_at: When the first chunk committed
+        updated_at: When the last chunk committed
+        finished_at: When the last chunk was reached, None while running
+    """
+    name: str
+    last_id: Optional[UUID]
+    rows_scanned: int
+    rows_updated: int
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+
+class ColumnBackfill:
+    """
+    Chunked, throttled and resumable backfill of a column migration.
+
+    Each chunk is one short transaction: it picks the next batch_size IDs
+    above the last committed one, updates the pending rows among them and
+    records the new position in the progress table. Progress commits
+    together with the data, so an interrupted backfill resumes exactly after
+    the last finished chunk.
+
+    Rows locked by the application are waited for at most lock_timeout_ms;
+    a chunk that times out or deadlocks is rolled back and retried at half
+    the size, and the size grows back after successful chunks. The pending
+    predicate is rechecked after a wait, so rows dual-written in the
+    meantime are not overwritten. Between chunks the backfill sleeps to keep
+    its connection busy for at most duty_cycle of the wall time.
+    """
+
+    def __init__(
+        self,
+        connection: asyncpg.Connection,
+        migration: ColumnMigration,
+        logger: Logger,
+        batch_size: int = 5000,
+        duty_cycle: float = 0.5,
+        lock_timeout_ms: int = 2000,
+        max_retries: int = 10,
+        min_batch_size: int = 100,
+        progress_interval: float = 5.0
+    ):
+        """
+        Initialize the backfill.
+
+        Args:
+            connection: Dedicated connection (asyncpg)
+            migration: The column migration to backfill
+            logger: Logger for progress reporting
+            batch_size: Rows per chunk
+            duty_cycle: Fraction of time the connection may spend in chunks, in (0, 1]
+            lock_timeout_ms: Longest wait for a row lock held by the application
+            max_retries: Consecutive failed chunks before giving up
+            min_batch_size: Smallest chunk size after retries
+            progress_interval: Seconds between progress log records
+
+        Raises:
+            ValueError: If duty_cycle is outside (0, 1]
+        """
+        if not 0.0 < duty_cycle <= 1.0:
+            raise ValueError(f'Duty cycle must be in (0, 1]: {duty_cycle}')
+        self._connection = connection
+        self._migration = migration
+        self._logger = logger
+        self.batch_size = batch_size
+        self.duty_cycle = duty_cycle
+        self.lock_timeout_ms = lock_timeout_ms
+        self.max_retries = max_retries
+        self.min_batch_size = min(min_batch_size, batch_size)
+        self.progress_interval = progress_interval
+
+    async def progress(self) -> Optional[BackfillProgress]:
+        """Get the persisted progress, None if the backfill never ran."""
+        row = await self._connection.fetchrow(
+            'SELECT name, last_id, rows_scanned, rows_updated, started_at, updated_at, finished_at '
+            f'FROM {PROGRESS_TABLE} WHERE name = $1',
+            self._migration.name
+        )
+        return None if row is None else BackfillProgress(**dict(row))
+
+    async def _estimated_rows(self) -> int:
+        estimate = await self._connection.fetchval(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = $1::regclass',
+            self._migration.table
+        )
+        return max(0, estimate or 0)
+
+    async def _chunk(self, last_id: Optional[UUID], batch_size: int) -> Tuple[Optional[UUID], int, int]:
+        table = self._migration.table
+        async with self._connection.transaction():
+            await self._connection.execute(f"SET LOCAL lock_timeout = '{self.lock_timeout_ms}ms'")
+            chunk = await self._connection.fetchrow(
+                'SELECT count(*) AS rows, (array_agg(id ORDER BY id DESC))[1] AS upper_id '
+                f'FROM (SELECT id FROM {table} WHERE ($1::uuid IS NULL OR id > $1) ORDER BY id LIMIT $2) chunk',
+                last_id, batch_size
+            )
+            scanned, upper_id = chunk['rows'], chunk['upper_id']
+            updated = 0
+            if scanned:
+                status = await self._connection.execute(
+                    f'UPDATE {table} SET {self._migration.assignments} '
+                    f'WHERE ($1::uuid IS NULL OR id > $1) AND id <= $2 AND ({self._migration.pending})',
+                    last_id, upper_id
+                )
+                updated = int(status.split()[-1])
+            # A short chunk reached the end; later rows are dual-written by the application
+            finished = scanned < batch_size
+            await self._connection.execute(
+                f'INSERT INTO {PROGRESS_TABLE} '
+                '(name, last_id, rows_scanned, rows_updated, started_at, updated_at, finished_at) '
+                'VALUES ($1, $2, $3, $4, now(), now(), CASE WHEN $5 THEN now() END) '
+                'ON CONFLICT (name) DO UPDATE SET '
+                'last_id = EXCLUDED.last_id, '
+                f'rows_scanned = {PROGRESS_TABLE}.rows_scanned + EXCLUDED.rows_scanned, '
+                f'rows_updated = {PROGRESS_TABLE}.rows_updated + EXCLUDED.rows_updated, '
+                'updated_at = now(), finished_at = EXCLUDED.finished_at',
+                self._migration.name, upper_id if scanned else last_id, scanned, updated, finished
+            )
+        return (upper_id if scanned else last_id), scanned, updated
+
+    async def run(self, restart: bool = False) -> BackfillProgress:
+        """
+        Backfill all pending rows, resuming from the persisted progress.
+
+        Args:
+            restart: Discard the progress and walk the table from the start
+
+        Returns:
+            BackfillProgress: Final progress
+
+        Raises:
+            asyncpg.PostgresError: If a chunk failed max_retries times in a row, or on other errors
+        """
+        if restart:
+            await self._connection.execute(f'DELETE FROM {PROGRESS_TABLE} WHERE name = $1', self._migration.name)
+        progress = await self.progress()
+        if progress is not None and progress.finished:
+            return progress
+
+        last_id = progress.last_id if progress else None
+        scanned = progress.rows_scanned if progress else 0
+        updated = progress.rows_updated if progress else 0
+        estimated = await self._estimated_rows()
+        batch_size = self.batch_size
+        retries = 0
+        started = last_logged = time.perf_counter()
+        scanned_by_run = 0
+
+        while True:
+            chunk_started = time.perf_counter()
+            try:
+                last_id, chunk_scanned, chunk_updated = await self._chunk(last_id, batch_size)
+            except RETRYABLE_ERRORS as e:
+                retries += 1
+                if retries > self.max_retries:
+                    raise
+                batch_size = max(self.min_batch_size, batch_size // 2)
+                self._logger.warning(
+                    'Backfill chunk retried',
+                    migration=self._migration.name,
+                    error=type(e).__name__,
+                    retries=retries,
+                    batch_size=batch_size
+                )
+                await asyncio.sleep(min(5.0, 0.05 * 2 ** retries))
+                continue
+
+            finished = chunk_scanned < batch_size
+            retries = 0
+            batch_size = min(self.batch_size, batch_size * 2)
+            scanned += chunk_scanned
+            updated += chunk_updated
+            scanned_by_run += chunk_scanned
+
+            now = time.perf_counter()
+            if finished or now - last_logged >= self.progress_interval:
+                last_logged = now
+                rate = scanned_by_run / max(now - started, 1e-9)
+                self._logger.info(
+                    'Backfill progress',
+                    migration=self._migration.name,
+                    rows_scanned=scanned,
+                    rows_updated=updated,
+                    estimated_rows=estimated,
+                    percent=round(min(100.0, 100.0 * scanned / estimated), 1) if estimated else None,
+                    rows_per_second=round(rate),
+                    eta_seconds=round(max(0, estimated - scanned) / rate) if rate and not finished else 0
+                )
+            if finished:
+                return await self.progress()
+
+            # Throttle: leave the database (1 - duty_cycle) of the wall time
+            if self.duty_cycle < 1.0:
+                await asyncio.sleep((time.perf_counter() - chunk_started) * (1.0 / self.duty_cycle - 1.0))
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Dict
+from src.application.domain.money import MINOR_UNITS_PER_UNIT
+
+
+@dataclass(frozen=True)
+class ColumnMigration:
+    """
+    Online change of a column: backfill of existing rows and dual-write check.
+
+    The application writes the new column for every row it changes
+    (dual-write) from the moment the column exists; the backfill fills the
+    rows nobody has touched since. Rows are walked in `id` (uuid) order.
+
+    Attributes:
+        name: Identifier used by the CLI and the progress table
+        table: Migrated table
+        assignments: SET clause computing the new column from the old ones
+        pending: Predicate of rows not written yet
+        mismatch: Predicate of written rows disagreeing with the old columns
+    """
+    name: str
+    table: str
+    assignments: str
+    pending: str
+    mismatch: str
+
+
+BALANCE_MINOR = ColumnMigration(
+    name='balance_minor',
+    table='wallets',
+    assignments=f'balance_minor = (balance * {MINOR_UNITS_PER_UNIT})::bigint',
+    pending='balance_minor IS NULL',
+    mismatch=f'balance_minor <> balance * {MINOR_UNITS_PER_UNIT}'
+)
+
+
+COLUMN_MIGRATIONS: Dict[str, ColumnMigration] = {
+    migration.name: migration for migration in (BALANCE_MINOR,)
+}
@@ -0,0 +1,88 @@
+from typing import Any, Sequence
+from alembic import op
+import sqlalchemy as sa
+
+
+def _invalid_index_exists(index_name: str) -> bool:
+    return bool(op.get_bind().execute(
+        sa.text(
+            'SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+            'WHERE c.relname = :name AND NOT i.indisvalid'
+        ),
+        {'name': index_name}
+    ).scalar())
+
+
+def create_index_concurrently(index_name: str, table_name: str, columns: Sequence[Any], **kwargs):
+    """
+    Build an index without blocking writers of the table.
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction, so the build
+    runs in an autocommit block of the migration. A build that failed or was
+    interrupted leaves an INVALID index behind which IF NOT EXISTS would
+    silently keep; it is dropped and rebuilt. The build has to wait for
+    transactions older than itself, so the migration lock timeout is lifted
+    for its duration.
+
+    Args:
+        index_name: Name of the index
+        table_name: Indexed table
+        columns: Indexed columns or expressions
+        **kwargs: Further op.create_index options (unique, postgresql_where, ...)
+    """
+    with op.get_context().autocommit_block():
+        if _invalid_index_exists(index_name):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+        op.execute('SET lock_timeout = 0')
+        try:
+            op.create_index(index_name, table_name, columns,
+                            postgresql_concurrently=True, if_not_exists=True, **kwargs)
+        finally:
+            op.execute('RESET lock_timeout')
+
+
+def drop_index_concurrently(index_name: str, table_name: str):
+    """
+    Drop an index without blocking queries of the table.
+
+    Args:
+        index_name: Name of the index
+        table_name: Indexed table
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+
+
+def set_not_null_online(table_name: str, column_name: str):
+    """
+    Make a backfilled column NOT NULL without a long exclusive lock.
+
+    A plain SET NOT NULL scans the whole table under an ACCESS EXCLUSIVE
+    lock. Instead a CHECK constraint is added NOT VALID (brief lock, no
+    scan), validated under a lock that lets reads and writes continue, and
+    SET NOT NULL then uses the validated constraint instead of scanning.
+    Each step commits on its own, so a rerun picks up where a failed one
+    stopped.
+
+    Args:
+        table_name: Table of the column
+        column_name: Column whose backfill has finished and been verified
+    """
+    constraint = f'{table_name}_{column_name}_not_null'
+    with op.get_context().autocommit_block():
+        exists = op.get_bind().execute(
+            sa.text('SELECT 1 FROM pg_constraint WHERE conname = :name AND conrelid = CAST(:table AS regclass)'),
+            {'name': constraint, 'table': table_name}
+        ).scalar()
+        if not exists:
+            op.execute(
+                f'ALTER TABLE {table_name} ADD CONSTRAINT {constraint} '
+                f'CHECK ({column_name} IS NOT NULL) NOT VALID'
+            )
+        op.execute('SET lock_timeout = 0')
+        try:
+            op.execute(f'ALTER TABLE {table_name} VALIDATE CONSTRAINT {constraint}')
+        finally:
+            op.execute('RESET lock_timeout')
+        op.alter_column(table_name, column_name, nullable=False)
+        op.drop_constraint(constraint, table_name, type_='check')
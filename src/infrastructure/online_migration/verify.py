@@ -0,0 +1,118 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+from uuid import UUID
+import asyncpg
+from src.infrastructure.logger import Logger
+from src.infrastructure.online_migration.columns import ColumnMigration
+
+
+@dataclass
+class VerificationResult:
+    """
+    Outcome of a dual-write verification pass.
+
+    Attributes:
+        rows_checked: Rows compared
+        pending: Rows the new column has not been written for yet
+        mismatched: Rows whose new column disagrees with the old ones
+        samples: IDs of the first mismatched rows
+        seconds: Duration of the pass
+    """
+    rows_checked: int = 0
+    pending: int = 0
+    mismatched: int = 0
+    samples: List[UUID] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every row is written and consistent, so reads may switch to the new column."""
+        return self.pending == 0 and self.mismatched == 0
+
+
+class DualWriteVerifier:
+    """
+    Read-only comparison of the old and new columns of a column migration.
+
+    Run after the backfill and before switching reads (e.g. enabling
+    BALANCE_MINOR_UNITS): a clean pass proves the backfill covered every row
+    and that the application writes both columns consistently. Chunks are
+    single statements over an ID range, so each sees a consistent snapshot
+    of its rows and no locks are taken; the pass is throttled like the
+    backfill.
+    """
+
+    def __init__(
+        self,
+        connection: asyncpg.Connection,
+        migration: ColumnMigration,
+        logger: Logger,
+        batch_size: int = 5000,
+        duty_cycle: float = 0.5,
+        sample_limit: int = 100
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            connection: Dedicated connection (asyncpg)
+            migration: The column migration to verify
+            logger: Logger for reporting mismatches
+            batch_size: Rows per chunk
+            duty_cycle: Fraction of time the connection may spend in chunks, in (0, 1]
+            sample_limit: Mismatched IDs to keep for the report
+
+        Raises:
+            ValueError: If duty_cycle is outside (0, 1]
+        """
+        if not 0.0 < duty_cycle <= 1.0:
+            raise ValueError(f'Duty cycle must be in (0, 1]: {duty_cycle}')
+        self._connection = connection
+        self._migration = migration
+        self._logger = logger
+        self.batch_size = batch_size
+        self.duty_cycle = duty_cycle
+        self.sample_limit = sample_limit
+
+    async def run(self) -> VerificationResult:
+        """
+        Compare all rows.
+
+        Returns:
+            VerificationResult: Counts of pending and mismatched rows
+        """
+        started = time.perf_counter()
+        result = VerificationResult()
+        last_id: Optional[UUID] = None
+        query = (
+            'SELECT count(*) AS rows, (array_agg(id ORDER BY id DESC))[1] AS upper_id, '
+            f'count(*) FILTER (WHERE {self._migration.pending}) AS pending, '
+            f'coalesce(array_agg(id ORDER BY id) FILTER (WHERE {self._migration.mismatch}), '
+            "'{}'::uuid[]) AS mismatched "
+            f'FROM (SELECT * FROM {self._migration.table} WHERE ($1::uuid IS NULL OR id > $1) '
+            'ORDER BY id LIMIT $2) chunk'
+        )
+        while True:
+            chunk_started = time.perf_counter()
+            chunk = await self._connection.fetchrow(query, last_id, self.batch_size)
+            result.rows_checked += chunk['rows']
+            result.pending += chunk['pending']
+            result.mismatched += len(chunk['mismatched'])
+            result.samples.extend(chunk['mismatched'][:self.sample_limit - len(result.samples)])
+            if chunk['mismatched']:
+                self._logger.warning(
+                    'Dual-write mismatch',
+                    migration=self._migration.name,
+                    ids=[str(row_id) for row_id in chunk['mismatched'][:10]],
+                    count=len(chunk['mismatched'])
+                )
+            if chunk['rows'] < self.batch_size:
+                break
+            last_id = chunk['upper_id']
+            if self.duty_cycle < 1.0:
+                await asyncio.sleep((time.perf_counter() - chunk_started) * (1.0 / self.duty_cycle - 1.0))
+
+        result.seconds = time.perf_counter() - started
+        return result
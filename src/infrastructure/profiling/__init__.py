@@ -0,0 +1,19 @@
+from src.infrastructure.profiling.artifacts import ProfileArtifactStore
+from src.infrastructure.profiling.sampler import (
+    StackSampler,
+    collapse_frame,
+    format_collapsed,
+    profile_marker_var,
+    task_marker_filter
+)
+from src.settings import settings
+
+
+profile_store = ProfileArtifactStore(
+    directory=settings.PROFILING_OUTPUT_DIR,
+    max_artifacts=settings.PROFILING_MAX_ARTIFACTS
+)
+
+
+async def get_profile_store() -> ProfileArtifactStore:
+    return profile_store
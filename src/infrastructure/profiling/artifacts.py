@@ -0,0 +1,70 @@
+import asyncio
+import os
+import re
+from typing import Optional
+
+
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9._-]+$')
+
+
+class ProfileArtifactStore:
+    """Keeps the newest collapsed-stack profiles as files in one directory."""
+
+    def __init__(self, directory: str, max_artifacts: int = 100):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the artifacts
+            max_artifacts: Number of artifacts kept; older ones are deleted, 0 keeps none
+        """
+        self.directory = directory
+        self.max_artifacts = max_artifacts
+
+    async def save(self, name: str, content: str) -> str:
+        """
+        Store a profile.
+
+        The file is written and old artifacts are pruned in a worker thread,
+        off the event loop.
+
+        Args:
+            name: Artifact name, letters, digits, '.', '_' and '-' only
+            content: Collapsed stacks
+
+        Returns:
+            str: Name under which the profile can be read back
+
+        Raises:
+            ValueError: If the name contains other characters
+        """
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f'Invalid profile name: {name}')
+        filename = f'{name}.collapsed'
+        await asyncio.to_thread(self._write, filename, content)
+        return filename
+
+    def _write(self, filename: str, content: str):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, filename), 'w', encoding='utf-8') as file:
+            file.write(content)
+        self._prune()
+
+    def read(self, filename: str) -> Optional[str]:
+        """Read a stored profile, or None if it does not exist or the name is invalid."""
+        if not _NAME_PATTERN.match(filename):
+            return None
+        try:
+            with open(os.path.join(self.directory, filename), encoding='utf-8') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def _prune(self):
+        entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.collapsed')]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:max(len(entries) - self.max_artifacts, 0)]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
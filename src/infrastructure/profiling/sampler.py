@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+
+# Marks the tasks of a profiled request; tasks spawned by the request inherit it
+profile_marker_var: ContextVar[Optional[object]] = ContextVar('profile_marker', default=None)
+
+
+def collapse_frame(frame) -> str:
+    """
+    Render a stack as one collapsed-stack line, root first.
+
+    Args:
+        frame: Innermost frame of the stack
+
+    Returns:
+        str: Frames joined by ';' as 'function (file:line)'
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f'{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+def format_collapsed(counts: Counter) -> str:
+    """Format aggregated stacks in the collapsed format read by flamegraph tools."""
+    return ''.join(f'{stack} {count}\n' for stack, count in counts.most_common())
+
+
+def task_marker_filter(loop: asyncio.AbstractEventLoop, marker: object) -> Callable[[], bool]:
+    """
+    Build a predicate that is true while the loop runs a task of the marked request.
+
+    On Python versions without Task.get_context, or where the loop's current
+    task cannot be read from another thread, every sample matches, so the
+    profile also contains concurrently running requests.
+    """
+    def is_marked() -> bool:
+        # Called from the sampler thread; an explicit loop makes current_task a plain lookup
+        try:
+            task = asyncio.current_task(loop)
+        except RuntimeError:
+            return True
+        if task is None:
+            return False
+        get_context = getattr(task, 'get_context', None)
+        if get_context is None:
+            return True
+        return get_context().get(profile_marker_var) is marker
+    return is_marked
+
+
+class StackSampler:
+    """
+    Statistical profiler sampling the stack of one thread from a background thread.
+
+    Nothing runs and nothing is hooked into the interpreter while the
+    sampler is stopped.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval: float = 0.005,
+        should_sample: Optional[Callable[[], bool]] = None,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            thread_id: Ident of the thread to sample, normally the event loop thread
+            interval: Seconds between samples
+            should_sample: Optional predicate deciding whether the current sample counts
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self._should_sample = should_sample
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """Stop sampling and return the aggregated stacks."""
+        self._stop.set()
+        self._thread.join()
+        return self.counts
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            if self._should_sample is not None and not self._should_sample():
+                continue
+            self.counts[collapse_frame(frame)] += 1
+            self.samples += 1
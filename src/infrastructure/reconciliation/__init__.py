@@ -0,0 +1,5 @@
+from src.infrastructure.reconciliation.checkpoint import ReconciliationCheckpoint
+from src.infrastructure.reconciliation.checks import Discrepancy, DiscrepancyKind, classify
+from src.infrastructure.reconciliation.keyspace import KeyRange, split_keyspace
+from src.infrastructure.reconciliation.runner import ReconciliationSummary, WalletReconciler
+
@@ -0,0 +1,69 @@
+import json
+import os
+from typing import Any, Dict, Iterable, Set
+
+
+class ReconciliationCheckpoint:
+    """
+    Record of finished key ranges, persisted after every step.
+
+    The file also stores the parameters that define the ranges, so a resumed
+    run keeps the same split even if the table grew in the meantime.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: JSON file holding the checkpoint
+        """
+        self.path = path
+        self.params: Dict[str, Any] = {}
+        self.done: Set[int] = set()
+
+    def load(self) -> bool:
+        """
+        Read the checkpoint file.
+
+        Returns:
+            bool: True if a checkpoint was found
+        """
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return False
+        self.params = data['params']
+        self.done = set(data['done'])
+        return True
+
+    def start(self, params: Dict[str, Any]):
+        """Begin a new pass with the given range parameters."""
+        self.params = params
+        self.done = set()
+        self.save()
+
+    def mark_done(self, indexes: Iterable[int]):
+        """Record finished ranges and persist the checkpoint."""
+        self.done.update(indexes)
+        self.save()
+
+    def save(self):
+        """Write the checkpoint atomically."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump({'params': self.params, 'done': sorted(self.done)}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+    def clear(self):
+        """Remove the checkpoint after a finished pass."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+from src.application.domain.money import MINOR_UNITS_PER_UNIT
+
+
+# Largest magnitude that fits into numeric(12, 2)
+MAX_BALANCE = Decimal('9999999999.99')
+
+
+class DiscrepancyKind(str, Enum):
+    """Kinds of wallet inconsistencies found by reconciliation."""
+    NULL_BALANCE = 'null_balance'
+    NEGATIVE_BALANCE = 'negative_balance'
+    OUT_OF_RANGE = 'out_of_range'
+    SCALE_EXCEEDED = 'scale_exceeded'
+    MINOR_UNITS_MISMATCH = 'minor_units_mismatch'
+    OPERATIONS_MISMATCH = 'operations_mismatch'
+
+
+@dataclass(frozen=True)
+class Discrepancy:
+    """
+    Inconsistency of one wallet.
+
+    Attributes:
+        wallet_id: The inconsistent wallet
+        kind: What is wrong
+        balance: Stored balance
+        expected: Value the balance disagrees with, if any
+    """
+    wallet_id: UUID
+    kind: DiscrepancyKind
+    balance: Optional[Decimal]
+    expected: Optional[Decimal] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'wallet_id': str(self.wallet_id),
+            'kind': self.kind.value,
+            'balance': None if self.balance is None else str(self.balance),
+            'expected': None if self.expected is None else str(self.expected),
+        }
+
+
+# Rows matching this predicate are returned by the range scan; everything
+# else is consistent and never leaves the server. Keep in sync with classify().
+SUSPECT_PREDICATE = (
+    'w.balance IS NULL'
+    ' OR w.balance < 0'
+    f' OR abs(w.balance) > {MAX_BALANCE}'
+    ' OR w.balance <> round(w.balance, 2)'
+    f' OR (w.balance_minor IS NOT NULL AND w.balance_minor <> w.balance * {MINOR_UNITS_PER_UNIT})'
+)
+
+OPERATIONS_PREDICATE = 'coalesce(ops.total, 0) <> w.balance'
+
+
+def classify(
+    wallet_id: UUID,
+    balance: Optional[Decimal],
+    balance_minor: Optional[int],
+    operations_total: Optional[Decimal] = None
+) -> List[Discrepancy]:
+    """
+    List everything that is wrong with one wallet row.
+
+    Args:
+        wallet_id: Wallet ID
+        balance: Stored balance
+        balance_minor: Stored balance in minor units, None before backfill
+        operations_total: Net sum of applied operations, None when history is not checked
+
+    Returns:
+        List[Discrepancy]: Found inconsistencies, empty for a consistent wallet
+    """
+    if balance is None:
+        return [Discrepancy(wallet_id, DiscrepancyKind.NULL_BALANCE, None)]
+
+    found = []
+    if balance < 0:
+        found.append(Discrepancy(wallet_id, DiscrepancyKind.NEGATIVE_BALANCE, balance))
+    if abs(balance) > MAX_BALANCE:
+        found.append(Discrepancy(wallet_id, DiscrepancyKind.OUT_OF_RANGE, balance))
+    if (balance * MINOR_UNITS_PER_UNIT) % 1 != 0:
+        found.append(Discrepancy(wallet_id, DiscrepancyKind.SCALE_EXCEEDED, balance))
+    if balance_minor is not None and Decimal(balance_minor) != balance * MINOR_UNITS_PER_UNIT:
+        found.append(Discrepancy(
+            wallet_id,
+            DiscrepancyKind.MINOR_UNITS_MISMATCH,
+            balance,
+            Decimal(balance_minor).scaleb(-2)
+        ))
+    if operations_total is not None and operations_total != balance:
+        found.append(Discrepancy(wallet_id, DiscrepancyKind.OPERATIONS_MISMATCH, balance, operations_total))
+    return found
@@ -0,0 +1,65 @@
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+UUID_SPACE = 1 << 128
+
+
+@dataclass(frozen=True)
+class KeyRange:
+    """
+    Half-open range of wallet IDs [start, end).
+
+    Attributes:
+        index: Position of the range, used for checkpointing
+        start: Lowest ID in the range as an integer
+        end: First ID after the range as an integer, None for the last range
+    """
+    index: int
+    start: int
+    end: Optional[int]
+
+    @property
+    def start_uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.start)
+
+    @property
+    def end_uuid(self) -> Optional[uuid.UUID]:
+        return None if self.end is None else uuid.UUID(int=self.end)
+
+
+def split_keyspace(count: int, low: int = 0, high: int = UUID_SPACE) -> List[KeyRange]:
+    """
+    Split [low, high) into count contiguous ranges of near-equal width.
+
+    Wallet IDs are UUIDv7, so they occupy a narrow, time-ordered band of
+    the UUID space; splitting between the lowest and highest existing ID
+    instead of the whole space keeps ranges comparable in size. The first
+    range is open to the bottom and the last one to the top, so rows
+    outside [low, high) are still covered.
+
+    Args:
+        count: Number of ranges
+        low: Lowest ID as an integer
+        high: Upper bound as an integer
+
+    Returns:
+        List[KeyRange]: Ranges covering the whole UUID space in order
+
+    Raises:
+        ValueError: If count is not positive or the bounds are empty
+    """
+    if count < 1:
+        raise ValueError(f'Range count must be positive: {count}')
+    if high <= low:
+        raise ValueError(f'Empty key space: [{low}, {high})')
+
+    count = min(count, high - low)
+    width = high - low
+    bounds = [low + width * i // count for i in range(count)]
+    ranges = []
+    for i, start in enumerate(bounds):
+        end = bounds[i + 1] if i + 1 < count else None
+        ranges.append(KeyRange(index=i, start=0 if i == 0 else start, end=end))
+    return ranges
@@ -0,0 +1,248 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import asyncpg
+from src.infrastructure.logger import Logger
+from src.infrastructure.reconciliation.checkpoint import ReconciliationCheckpoint
+from src.infrastructure.reconciliation.keyspace import KeyRange, split_keyspace
+from src.infrastructure.reconciliation.scanner import scan_range
+
+
+# Event loop and connection pool of a reconciliation worker process
+_worker_state: Optional[Tuple[asyncio.AbstractEventLoop, asyncpg.Pool]] = None
+
+
+def _init_worker(dsn: str, connections: int, statement_timeout_ms: int):
+    global _worker_state
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    pool = loop.run_until_complete(asyncpg.create_pool(
+        dsn,
+        min_size=connections,
+        max_size=connections,
+        server_settings={
+            'application_name': 'wallet-reconcile',
+            'statement_timeout': str(statement_timeout_ms),
+        }
+    ))
+    _worker_state = (loop, pool)
+
+
+def _check_ranges(
+    ranges: List[KeyRange],
+    check_operations: bool,
+    fetch_size: int,
+    duty_cycle: float
+) -> List[Tuple[int, List[dict]]]:
+    loop, pool = _worker_state
+    return loop.run_until_complete(_check_ranges_async(pool, ranges, check_operations, fetch_size, duty_cycle))
+
+
+async def _check_ranges_async(
+    pool: asyncpg.Pool,
+    ranges: List[KeyRange],
+    check_operations: bool,
+    fetch_size: int,
+    duty_cycle: float
+) -> List[Tuple[int, List[dict]]]:
+    async def check(key_range: KeyRange) -> Tuple[int, List[dict]]:
+        async with pool.acquire() as connection:
+            started = time.perf_counter()
+            found = await scan_range(connection, key_range, check_operations, fetch_size)
+            elapsed = time.perf_counter() - started
+        # Throttle: keep each connection busy for at most duty_cycle of the wall time
+        if duty_cycle < 1.0:
+            await asyncio.sleep(elapsed * (1.0 / duty_cycle - 1.0))
+        return key_range.index, [discrepancy.to_dict() for discrepancy in found]
+
+    return list(await asyncio.gather(*(check(key_range) for key_range in ranges)))
+
+
+@dataclass
+class ReconciliationSummary:
+    """
+    Outcome of a reconciliation pass.
+
+    Attributes:
+        ranges: Total number of key ranges
+        skipped: Ranges already finished by a previous, interrupted run
+        checked: Ranges checked by this run
+        discrepancies: Number of inconsistencies found by this run, per kind
+        seconds: Duration of this run
+    """
+    ranges: int = 0
+    skipped: int = 0
+    checked: int = 0
+    discrepancies: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+
+class WalletReconciler:
+    """
+    Parallel consistency check of all wallets.
+
+    The ID space between the lowest and highest wallet ID is split into many
+    more ranges than there are connections. Worker processes, each with its
+    own connection pool, scan groups of ranges concurrently; finished ranges
+    are appended to the discrepancy report and then to the checkpoint, so an
+    interrupted pass resumes where it stopped (a range may be reported twice,
+    never skipped).
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        logger: Logger,
+        checkpoint: ReconciliationCheckpoint,
+        report_path: str,
+        processes: int = 4,
+        connections: int = 2,
+        ranges: int = 4096,
+        fetch_size: int = 10000,
+        duty_cycle: float = 0.5,
+        statement_timeout_ms: int = 60000,
+        check_operations: bool = False,
+    ):
+        """
+        Initialize the reconciler.
+
+        Args:
+            dsn: Postgres connection string (asyncpg format)
+            logger: Logger for progress reporting
+            checkpoint: Checkpoint of finished ranges
+            report_path: JSON lines file receiving discrepancies
+            processes: Number of worker processes
+            connections: Concurrent connections per worker process
+            ranges: Number of key ranges for a new pass
+            fetch_size: Rows fetched per cursor round trip
+            duty_cycle: Fraction of time each connection may spend querying, in (0, 1]
+            statement_timeout_ms: Statement timeout of reconciliation connections
+            check_operations: Also compare balances with the sum of applied operations
+
+        Raises:
+            ValueError: If duty_cycle is outside (0, 1]
+        """
+        if not 0.0 < duty_cycle <= 1.0:
+            raise ValueError(f'Duty cycle must be in (0, 1]: {duty_cycle}')
+        self._dsn = dsn
+        self._logger = logger
+        self._checkpoint = checkpoint
+        self._report_path = report_path
+        self._processes = processes
+        self._connections = connections
+        self._ranges = ranges
+        self._fetch_size = fetch_size
+        self._duty_cycle = duty_cycle
+        self._statement_timeout_ms = statement_timeout_ms
+        self._check_operations = check_operations
+
+    async def _key_bounds(self) -> Optional[Tuple[int, int]]:
+        connection = await asyncpg.connect(self._dsn)
+        try:
+            row = await connection.fetchrow('SELECT min(id) AS low, max(id) AS high FROM wallets')
+        finally:
+            await connection.close()
+        if row['low'] is None:
+            return None
+        return row['low'].int, row['high'].int + 1
+
+    def _plan(self, resume: bool) -> Optional[List[KeyRange]]:
+        if resume and self._checkpoint.load():
+            params = self._checkpoint.params
+            self._check_operations = params['check_operations']
+            return split_keyspace(params['ranges'], params['low'], params['high'])
+
+        bounds = asyncio.run(self._key_bounds())
+        if bounds is None:
+            return None
+        low, high = bounds
+        ranges = split_keyspace(self._ranges, low, high)
+        self._checkpoint.start({
+            'ranges': len(ranges),
+            'low': low,
+            'high': high,
+            'check_operations': self._check_operations,
+        })
+        # A new pass starts a new report
+        if os.path.exists(self._report_path):
+            os.remove(self._report_path)
+        return ranges
+
+    def run(self, resume: bool = True) -> ReconciliationSummary:
+        """
+        Check all wallets, resuming an interrupted pass if one is recorded.
+
+        Args:
+            resume: Continue from the checkpoint instead of starting over
+
+        Returns:
+            ReconciliationSummary: Counts of checked ranges and found discrepancies
+        """
+        started = time.perf_counter()
+        summary = ReconciliationSummary()
+        ranges = self._plan(resume)
+        if ranges is None:
+            self._checkpoint.clear()
+            return summary
+
+        pending = [key_range for key_range in ranges if key_range.index not in self._checkpoint.done]
+        summary.ranges = len(ranges)
+        summary.skipped = len(ranges) - len(pending)
+        groups = [pending[i:i + self._connections] for i in range(0, len(pending), self._connections)]
+        kinds: Counter = Counter()
+
+        directory = os.path.dirname(self._report_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # spawn: workers must not inherit the parent's logger threads or sockets
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+            max_workers=self._processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._dsn, self._connections, self._statement_timeout_ms)
+        ) as executor, open(self._report_path, 'a', encoding='utf-8') as report:
+            # Keep a bounded number of groups in flight so progress is checkpointed steadily
+            queue = iter(groups)
+            in_flight = set()
+            for group in queue:
+                in_flight.add(executor.submit(
+                    _check_ranges, group, self._check_operations, self._fetch_size, self._duty_cycle
+                ))
+                if len(in_flight) < self._processes * 2:
+                    continue
+                in_flight = self._collect(in_flight, report, kinds, summary)
+            while in_flight:
+                in_flight = self._collect(in_flight, report, kinds, summary)
+
+        self._checkpoint.clear()
+        summary.discrepancies = dict(kinds)
+        summary.seconds = time.perf_counter() - started
+        return summary
+
+    def _collect(self, in_flight: set, report, kinds: Counter, summary: ReconciliationSummary) -> set:
+        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            results = future.result()
+            for _, discrepancies in results:
+                for discrepancy in discrepancies:
+                    report.write(json.dumps(discrepancy) + '\n')
+                    kinds[discrepancy['kind']] += 1
+            report.flush()
+            os.fsync(report.fileno())
+            self._checkpoint.mark_done(index for index, _ in results)
+            summary.checked += len(results)
+        self._logger.info(
+            'Reconciliation progress',
+            checked=summary.skipped + summary.checked,
+            ranges=summary.ranges,
+            discrepancies=sum(kinds.values())
+        )
+        return in_flight
@@ -0,0 +1,79 @@
+from typing import Any, List, Tuple
+import asyncpg
+from src.infrastructure.reconciliation.checks import Discrepancy, OPERATIONS_PREDICATE, SUSPECT_PREDICATE, classify
+from src.infrastructure.reconciliation.keyspace import KeyRange
+
+
+def build_range_query(key_range: KeyRange, check_operations: bool) -> Tuple[str, List[Any]]:
+    """
+    Build the scan of one key range.
+
+    The consistency predicates run on the server, so only suspect rows are
+    sent back; a healthy range costs one index range scan and no transfer.
+
+    Args:
+        key_range: Range of wallet IDs to scan
+        check_operations: Also compare balances with the sum of applied operations
+
+    Returns:
+        tuple: SQL text and its arguments
+    """
+    args: List[Any] = [key_range.start_uuid]
+    bounds = 'w.id >= $1'
+    operation_bounds = 'o.wallet_id >= $1'
+    if key_range.end is not None:
+        args.append(key_range.end_uuid)
+        bounds += ' AND w.id < $2'
+        operation_bounds += ' AND o.wallet_id < $2'
+
+    if not check_operations:
+        return (
+            'SELECT w.id, w.balance, w.balance_minor, NULL::numeric AS operations_total '
+            f'FROM wallets w WHERE {bounds} AND ({SUSPECT_PREDICATE})',
+            args
+        )
+
+    return (
+        'SELECT w.id, w.balance, w.balance_minor, coalesce(ops.total, 0) AS operations_total '
+        'FROM wallets w LEFT JOIN ('
+        "SELECT o.wallet_id, sum(CASE WHEN o.operation_type = 'deposit' THEN o.amount ELSE -o.amount END) AS total "
+        f"FROM wallet_operations o WHERE o.status = 'applied' AND {operation_bounds} GROUP BY o.wallet_id"
+        ') ops ON ops.wallet_id = w.id '
+        f'WHERE {bounds} AND ({SUSPECT_PREDICATE} OR {OPERATIONS_PREDICATE})',
+        args
+    )
+
+
+async def scan_range(
+    connection: asyncpg.Connection,
+    key_range: KeyRange,
+    check_operations: bool,
+    fetch_size: int
+) -> List[Discrepancy]:
+    """
+    Find inconsistent wallets in one key range.
+
+    Rows are streamed through a server-side cursor inside a read-only
+    repeatable read transaction, so a range with many bad rows does not
+    have to fit in memory at once and sees a single snapshot.
+
+    Args:
+        connection: Connection to scan on
+        key_range: Range of wallet IDs to scan
+        check_operations: Also compare balances with the sum of applied operations
+        fetch_size: Rows fetched per cursor round trip
+
+    Returns:
+        List[Discrepancy]: Inconsistencies found in the range
+    """
+    sql, args = build_range_query(key_range, check_operations)
+    found: List[Discrepancy] = []
+    async with connection.transaction(isolation='repeatable_read', readonly=True):
+        async for record in connection.cursor(sql, *args, prefetch=fetch_size):
+            found.extend(classify(
+                record['id'],
+                record['balance'],
+                record['balance_minor'],
+                record['operations_total'] if check_operations else None
+            ))
+    return found
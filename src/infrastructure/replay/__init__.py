@@ -0,0 +1,2 @@
+from src.infrastructure.replay.columns import OperationColumns
+from src.infrastructure.replay.engine import ReplayResult, replay
@@ -0,0 +1,114 @@
+import json
+from array import array
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Mapping, Optional
+import numpy as np
+from src.application.domain.money import to_minor_units
+from src.application.domain.operation_type import Operation
+
+
+@dataclass
+class OperationColumns:
+    """
+    Operation log in columnar form.
+
+    Wallets are interned to dense integer codes so that grouping and
+    per-wallet reductions are plain array operations.
+
+    Attributes:
+        wallet: Wallet code of every operation
+        deposit: True for deposits, False for withdrawals
+        amount: Amount of every operation in minor units
+        wallet_ids: Wallet ID of every code
+    """
+    wallet: np.ndarray
+    deposit: np.ndarray
+    amount: np.ndarray
+    wallet_ids: List[str]
+    _codes: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.wallet)
+
+    def code(self, wallet_id: str) -> Optional[int]:
+        """Code of a wallet ID, None if the wallet does not occur in the log."""
+        if not self._codes:
+            self._codes = {value: index for index, value in enumerate(self.wallet_ids)}
+        return self._codes.get(wallet_id)
+
+    def initial_balances(self, balances: Mapping[str, Decimal]) -> np.ndarray:
+        """
+        Convert starting balances to a minor-unit array indexed by wallet code.
+
+        Wallets without an entry start from zero, like newly created wallets;
+        entries for wallets without operations are ignored.
+        """
+        initial = np.zeros(len(self.wallet_ids), dtype=np.int64)
+        for wallet_id, balance in balances.items():
+            code = self.code(wallet_id)
+            if code is not None:
+                initial[code] = to_minor_units(Decimal(balance))
+        return initial
+
+    def save(self, path: str):
+        """Store the columns as an uncompressed .npz file for fast reloading."""
+        np.savez(
+            path,
+            wallet=self.wallet,
+            deposit=self.deposit,
+            amount=self.amount,
+            wallet_ids=np.array(self.wallet_ids, dtype=str)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'OperationColumns':
+        """Load columns stored with save()."""
+        with np.load(path) as data:
+            return cls(
+                wallet=data['wallet'],
+                deposit=data['deposit'],
+                amount=data['amount'],
+                wallet_ids=data['wallet_ids'].tolist()
+            )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping]) -> 'OperationColumns':
+        """
+        Build columns from operation records.
+
+        Every record needs wallet_id, operation_type ('deposit' or 'withdraw',
+        case-insensitive) and amount (decimal string or number), the fields of
+        the operation API and of the wallet_operations table.
+
+        Raises:
+            ValueError: If a record is malformed
+        """
+        codes: Dict[str, int] = {}
+        wallet = array('q')
+        deposit = array('b')
+        amount = array('q')
+        for number, record in enumerate(records, start=1):
+            try:
+                wallet_id = str(record['wallet_id'])
+                operation = Operation(str(record['operation_type']).lower())
+                value = to_minor_units(Decimal(str(record['amount'])))
+            except (KeyError, ValueError, InvalidOperation) as e:
+                raise ValueError(f'Invalid operation record {number}: {e!r}')
+            wallet.append(codes.setdefault(wallet_id, len(codes)))
+            deposit.append(operation == Operation.DEPOSIT)
+            amount.append(value)
+
+        return cls(
+            wallet=np.frombuffer(wallet, dtype=np.int64).copy(),
+            deposit=np.frombuffer(deposit, dtype=np.int8).astype(bool),
+            amount=np.frombuffer(amount, dtype=np.int64).copy(),
+            wallet_ids=list(codes),
+            _codes=codes
+        )
+
+    @classmethod
+    def read_jsonl(cls, path: str) -> 'OperationColumns':
+        """Load an operation log with one JSON record per line; blank lines are skipped."""
+        with open(path, encoding='utf-8') as file:
+            return cls.from_records(json.loads(line) for line in file if line.strip())
@@ -0,0 +1,202 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+import numpy as np
+from src.application.domain.money import from_minor_units
+from src.infrastructure.replay.columns import OperationColumns
+
+
+@dataclass
+class ReplayResult:
+    """
+    Outcome of replaying an operation log.
+
+    Per-wallet arrays are indexed by wallet code, per-operation arrays are
+    in log order.
+
+    Attributes:
+        columns: The replayed operations
+        final_balance: Balance of every wallet after the log, in minor units
+        first_overdraft: Log index of the first withdrawal rejected for
+            insufficient funds per wallet, -1 if there was none
+        rejected: Withdrawals rejected for insufficient funds
+        invalid: Operations rejected for a non-positive amount
+        balance_after: Balance after every operation in minor units,
+            only computed on request
+    """
+    columns: OperationColumns
+    final_balance: np.ndarray
+    first_overdraft: np.ndarray
+    rejected: np.ndarray
+    invalid: np.ndarray
+    balance_after: Optional[np.ndarray] = None
+
+    def balance(self, wallet_id: str) -> Decimal:
+        """Final balance of a wallet."""
+        code = self.columns.code(wallet_id)
+        if code is None:
+            raise KeyError(wallet_id)
+        return from_minor_units(int(self.final_balance[code]))
+
+
+def _stable_order(wallet: np.ndarray, wallets: int) -> np.ndarray:
+    """
+    Permutation sorting operations by wallet, keeping log order within a wallet.
+
+    Packs (wallet code, log index) into one int64 and sorts the values, which
+    is several times faster than a stable argsort; falls back to the argsort
+    when the packed key would not fit.
+    """
+    count = len(wallet)
+    bits = count.bit_length()
+    if max(wallets, 1).bit_length() + bits > 63:
+        return np.argsort(wallet, kind='stable')
+    key = (wallet.astype(np.int64) << bits) | np.arange(count, dtype=np.int64)
+    key.sort()
+    return key & ((1 << bits) - 1)
+
+
+def _segment_starts(segment: np.ndarray) -> np.ndarray:
+    """Positions where a run of equal, sorted segment IDs begins."""
+    if len(segment) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.flatnonzero(np.concatenate(([True], segment[1:] != segment[:-1])))
+
+
+def _segmented_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Running sum of values restarting at every segment start."""
+    total = np.cumsum(values)
+    if len(values) == 0:
+        return total
+    offsets = total[starts] - values[starts]
+    lengths = np.diff(np.append(starts, len(values)))
+    return total - np.repeat(offsets, lengths)
+
+
+def replay(
+    columns: OperationColumns,
+    initial_balance: Optional[np.ndarray] = None,
+    with_balances: bool = False,
+    max_vector_rounds: int = 32
+) -> ReplayResult:
+    """
+    Replay an operation log with the semantics of WalletRepository.
+
+    Operations of a wallet are applied in log order. A deposit always
+    succeeds; a withdrawal larger than the current balance is rejected and
+    leaves the balance unchanged; an operation with a non-positive amount is
+    rejected as invalid.
+
+    Operations are stably sorted by wallet and balances computed as
+    segmented cumulative sums in integer minor units. A withdrawal that
+    drives its wallet negative is the first rejection of that wallet; it is
+    removed and only the rest of that wallet is recomputed, starting from the
+    balance before it, until no wallet goes negative. Each round removes one
+    rejection per wallet and touches fewer rows; wallets still unresolved
+    after max_vector_rounds are finished with a sequential loop, which bounds
+    the cost of wallets with long runs of rejected withdrawals.
+
+    Args:
+        columns: Operations to replay
+        initial_balance: Starting balance per wallet code in minor units, zero if omitted
+        with_balances: Also return the balance after every operation
+        max_vector_rounds: Vectorised rounds before falling back to the sequential loop
+
+    Returns:
+        ReplayResult: Final balances, first overdraft per wallet and rejected operations
+    """
+    count = len(columns)
+    wallets = len(columns.wallet_ids)
+    initial = np.zeros(wallets, dtype=np.int64) if initial_balance is None else initial_balance.astype(np.int64)
+
+    order = _stable_order(columns.wallet, wallets)
+    segment = columns.wallet[order]
+    amount = columns.amount[order]
+    invalid_sorted = amount <= 0
+    effective = np.where(columns.deposit[order], amount, -amount)
+    effective[invalid_sorted] = 0
+    rejected_sorted = np.zeros(count, dtype=bool)
+
+    # Rows still to be resolved (positions in sorted order) and the balance
+    # of every wallet before its first unresolved row
+    rows = np.arange(count)
+    base = initial.copy()
+    for _ in range(max_vector_rounds):
+        if len(rows) == 0:
+            break
+        # The first round covers every row; skip the gathers
+        full = len(rows) == count
+        row_segment = segment if full else segment[rows]
+        row_effective = effective.copy() if full else effective[rows]
+        balance = _segmented_cumsum(row_effective, _segment_starts(row_segment)) + base[row_segment]
+
+        overdraft = np.flatnonzero((row_effective < 0) & (balance < 0))
+        if len(overdraft) == 0:
+            rows = rows[:0]
+            break
+        # First overdraft of every affected wallet; rows are sorted by wallet
+        first = overdraft[_segment_starts(row_segment[overdraft])]
+        overdraft_segment = row_segment[first]
+        rejected_rows = rows[first]
+        rejected_sorted[rejected_rows] = True
+        effective[rejected_rows] = 0
+        base[overdraft_segment] = balance[first] - row_effective[first]
+
+        cut = np.full(wallets, count, dtype=np.int64)
+        cut[overdraft_segment] = rejected_rows
+        rows = rows[rows > cut[row_segment]]
+
+    if len(rows):
+        _replay_sequential(rows, segment, effective, rejected_sorted, base)
+
+    final_balance = initial.copy()
+    starts = _segment_starts(segment)
+    if count:
+        final_balance[segment[starts]] += np.add.reduceat(effective, starts)
+
+    rejected = np.empty(count, dtype=bool)
+    rejected[order] = rejected_sorted
+    invalid = np.empty(count, dtype=bool)
+    invalid[order] = invalid_sorted
+
+    # Stable sort: the first rejected row of a wallet in sorted order is its earliest in the log
+    first_overdraft = np.full(wallets, -1, dtype=np.int64)
+    rejected_positions = np.flatnonzero(rejected_sorted)
+    if len(rejected_positions):
+        first = rejected_positions[_segment_starts(segment[rejected_positions])]
+        first_overdraft[segment[first]] = order[first]
+
+    balance_after = None
+    if with_balances:
+        balance_after = np.empty(count, dtype=np.int64)
+        balance_after[order] = _segmented_cumsum(effective, starts) + initial[segment]
+
+    return ReplayResult(
+        columns=columns,
+        final_balance=final_balance,
+        first_overdraft=first_overdraft,
+        rejected=rejected,
+        invalid=invalid,
+        balance_after=balance_after
+    )
+
+
+def _replay_sequential(
+    rows: np.ndarray,
+    segment: np.ndarray,
+    effective: np.ndarray,
+    rejected: np.ndarray,
+    base: np.ndarray
+):
+    """Resolve the remaining rows one by one, updating effective and rejected in place."""
+    current_segment = -1
+    balance = 0
+    for row, row_segment, value in zip(rows.tolist(), segment[rows].tolist(), effective[rows].tolist()):
+        if row_segment != current_segment:
+            current_segment = row_segment
+            balance = int(base[row_segment])
+        if value < 0 and balance + value < 0:
+            rejected[row] = True
+            effective[row] = 0
+            continue
+        balance += value
@@ -0,0 +1,7 @@
+from src.infrastructure.seeding.distributions import (
+    BalanceDistribution, DISTRIBUTIONS, LogNormalBalance, ParetoBalance, UniformBalance, ZeroInflated, ZipfSampler,
+    make_distribution
+)
+from src.infrastructure.seeding.generator import SeedOperation, SeedWallet, WalletSeedGenerator, batches
+from src.infrastructure.seeding.loader import DeferredIndex, SeedSummary, WalletSeedLoader
+from src.infrastructure.seeding.workload import WalletReservoir, write_workload
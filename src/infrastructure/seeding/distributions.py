@@ -0,0 +1,132 @@
+import bisect
+import math
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import Decimal
+from src.application.domain.money import to_minor_units
+from src.infrastructure.reconciliation.checks import MAX_BALANCE
+
+
+MAX_BALANCE_MINOR = to_minor_units(MAX_BALANCE)
+
+DISTRIBUTIONS = ('uniform', 'lognormal', 'pareto')
+
+
+class BalanceDistribution(ABC):
+    """Distribution of seeded wallet balances, sampled in minor units."""
+
+    @abstractmethod
+    def sample(self, rng: random.Random) -> int:
+        """Draw one balance in minor units, within numeric(12, 2)."""
+
+
+@dataclass(frozen=True)
+class UniformBalance(BalanceDistribution):
+    """Balances spread evenly between low and high."""
+    low: Decimal
+    high: Decimal
+
+    def sample(self, rng: random.Random) -> int:
+        return rng.randint(to_minor_units(self.low), min(to_minor_units(self.high), MAX_BALANCE_MINOR))
+
+
+@dataclass(frozen=True)
+class LogNormalBalance(BalanceDistribution):
+    """Most balances near the median with a long right tail; sigma widens the tail."""
+    median: Decimal
+    sigma: float
+
+    def sample(self, rng: random.Random) -> int:
+        value = rng.lognormvariate(math.log(to_minor_units(self.median)), self.sigma)
+        return min(int(value), MAX_BALANCE_MINOR)
+
+
+@dataclass(frozen=True)
+class ParetoBalance(BalanceDistribution):
+    """Power-law balances above minimum: a few wallets hold most of the money (alpha ~1.16 is 80/20)."""
+    minimum: Decimal
+    alpha: float
+
+    def sample(self, rng: random.Random) -> int:
+        value = to_minor_units(self.minimum) * rng.paretovariate(self.alpha)
+        return min(int(value), MAX_BALANCE_MINOR)
+
+
+@dataclass(frozen=True)
+class ZeroInflated(BalanceDistribution):
+    """A share of empty wallets on top of another distribution."""
+    base: BalanceDistribution
+    zero_fraction: float
+
+    def sample(self, rng: random.Random) -> int:
+        if rng.random() < self.zero_fraction:
+            return 0
+        return self.base.sample(rng)
+
+
+def make_distribution(name: str, scale: Decimal, shape: float, zero_fraction: float = 0.0) -> BalanceDistribution:
+    """
+    Build a balance distribution from CLI parameters.
+
+    Args:
+        name: One of DISTRIBUTIONS
+        scale: Upper bound (uniform), median (lognormal) or minimum (pareto)
+        shape: Sigma (lognormal) or alpha (pareto); unused for uniform
+        zero_fraction: Share of wallets with a zero balance
+
+    Returns:
+        BalanceDistribution: The distribution
+
+    Raises:
+        ValueError: If the name is unknown or a parameter is out of range
+    """
+    if not 0.0 <= zero_fraction <= 1.0:
+        raise ValueError(f'Zero fraction must be in [0, 1]: {zero_fraction}')
+    if scale <= 0:
+        raise ValueError(f'Scale must be positive: {scale}')
+    if name == 'uniform':
+        distribution = UniformBalance(Decimal('0.01'), scale)
+    elif name == 'lognormal':
+        distribution = LogNormalBalance(scale, shape)
+    elif name == 'pareto':
+        distribution = ParetoBalance(scale, shape)
+    else:
+        raise ValueError(f'Unknown balance distribution: {name}')
+    return ZeroInflated(distribution, zero_fraction) if zero_fraction else distribution
+
+
+class ZipfSampler:
+    """
+    Ranks 0..n-1 drawn with probability proportional to 1 / (rank + 1) ** s.
+
+    With s around 1 a handful of ranks get a large share of the draws,
+    which models hot wallets; s = 0 is uniform.
+    """
+
+    def __init__(self, n: int, s: float):
+        """
+        Initialize the sampler.
+
+        Args:
+            n: Number of ranks
+            s: Skew exponent, >= 0
+
+        Raises:
+            ValueError: If n < 1 or s < 0
+        """
+        if n < 1 or s < 0:
+            raise ValueError(f'Zipf needs n >= 1 and s >= 0: n={n}, s={s}')
+        total = 0.0
+        self._cumulative = []
+        for rank in range(n):
+            total += 1.0 / (rank + 1) ** s
+            self._cumulative.append(total)
+
+    def sample(self, rng: random.Random) -> int:
+        rank = bisect.bisect_right(self._cumulative, rng.random() * self._cumulative[-1])
+        return min(rank, len(self._cumulative) - 1)
+
+    def share(self, ranks: int) -> float:
+        """Expected fraction of draws falling on the top ranks."""
+        return self._cumulative[min(ranks, len(self._cumulative)) - 1] / self._cumulative[-1]
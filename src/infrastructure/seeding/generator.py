@@ -0,0 +1,195 @@
+import math
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from typing import Iterator, List, Optional, Tuple
+from src.application.domain.money import from_minor_units
+from src.application.domain.operation_status import OperationStatus
+from src.application.domain.operation_type import Operation
+from src.infrastructure.seeding.distributions import BalanceDistribution, MAX_BALANCE_MINOR
+
+
+WALLET_COLUMNS = ('id', 'balance', 'balance_minor', 'created_at')
+OPERATION_COLUMNS = (
+    'id', 'wallet_id', 'operation_type', 'amount', 'status', 'error_code', 'balance_after', 'created_at', 'processed_at'
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_APPLIED = OperationStatus.APPLIED.value
+_DEPOSIT = Operation.DEPOSIT.value
+_WITHDRAW = Operation.WITHDRAW.value
+
+
+def _uuid7(timestamp_ms: int, sequence: int, rng: random.Random) -> uuid.UUID:
+    # Same layout as src.application.domain.uuid7, for a given time and a reproducible random part
+    return uuid.UUID(int=(
+        (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | (sequence & 0xFFF) << 64
+        | 0b10 << 62
+        | rng.getrandbits(62)
+    ))
+
+
+@dataclass(frozen=True)
+class SeedOperation:
+    """
+    Applied operation of a seeded wallet's history.
+
+    Attributes:
+        id: Operation ID (UUIDv7 of created_at)
+        operation_type: Operation value, deposit or withdraw
+        amount_minor: Amount in minor units
+        balance_after_minor: Wallet balance after the operation, in minor units
+        created_at: When the operation was applied
+    """
+    id: uuid.UUID
+    operation_type: str
+    amount_minor: int
+    balance_after_minor: int
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class SeedWallet:
+    """
+    Generated wallet.
+
+    Attributes:
+        id: Wallet ID (UUIDv7 of created_at)
+        balance_minor: Balance in minor units
+        created_at: Creation timestamp
+        operations: History ending at the balance, oldest first
+    """
+    id: uuid.UUID
+    balance_minor: int
+    created_at: datetime
+    operations: Tuple[SeedOperation, ...] = ()
+
+    def record(self) -> tuple:
+        """Row of the wallets table, in WALLET_COLUMNS order."""
+        return self.id, from_minor_units(self.balance_minor), self.balance_minor, self.created_at
+
+    def operation_records(self) -> List[tuple]:
+        """Rows of the wallet_operations table, in OPERATION_COLUMNS order."""
+        return [
+            (
+                operation.id, self.id, operation.operation_type, from_minor_units(operation.amount_minor),
+                _APPLIED, None, from_minor_units(operation.balance_after_minor),
+                operation.created_at, operation.created_at
+            )
+            for operation in self.operations
+        ]
+
+
+class WalletSeedGenerator:
+    """
+    Reproducible stream of wallets for bulk loading.
+
+    Wallets are created evenly over the last `days` days in ID order, so
+    the primary key is appended to like in production. With a positive
+    operations_mean every wallet with money gets a history of applied
+    deposits and withdrawals that never goes negative and ends at its
+    balance, so balances agree with the operations table. Nothing is held
+    in memory beyond the wallet being generated.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        distribution: BalanceDistribution,
+        seed: int = 0,
+        days: float = 365.0,
+        operations_mean: float = 0.0,
+        now: Optional[datetime] = None
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            count: Number of wallets
+            distribution: Distribution of the balances
+            seed: Random seed; the same seed yields the same wallets
+            days: Creation times span this many days before now
+            operations_mean: Mean history length per wallet, 0 for no history
+            now: End of the creation time span, the current time when omitted
+        """
+        self.count = count
+        self.distribution = distribution
+        self.seed = seed
+        self.days = days
+        self.operations_mean = operations_mean
+        self.now = now or datetime.now(UTC)
+
+    def wallets(self) -> Iterator[SeedWallet]:
+        """Generate the wallets, oldest first."""
+        rng = random.Random(self.seed)
+        span_us = int(self.days * 86_400_000_000)
+        start = self.now - timedelta(microseconds=span_us)
+        step_us = span_us / max(self.count, 1)
+        last_ms, sequence = -1, 0
+        for index in range(self.count):
+            # One creation time per slot: ascending without sorting
+            created_at = start + timedelta(microseconds=int((index + rng.random()) * step_us))
+            timestamp_ms = (created_at - _EPOCH) // timedelta(milliseconds=1)
+            if timestamp_ms <= last_ms:
+                sequence += 1
+                timestamp_ms = last_ms + sequence // 0x1000
+                sequence &= 0xFFF
+            else:
+                sequence = rng.getrandbits(11)
+            last_ms = timestamp_ms
+
+            balance = self.distribution.sample(rng)
+            operations = self._history(rng, balance, created_at) if self.operations_mean > 0 else ()
+            yield SeedWallet(_uuid7(timestamp_ms, sequence, rng), balance, created_at, operations)
+
+    def _history(self, rng: random.Random, balance: int, created_at: datetime) -> Tuple[SeedOperation, ...]:
+        # Geometric length with the requested mean; a balance needs at least one deposit
+        p = 1.0 / (self.operations_mean + 1.0)
+        length = int(math.log(1.0 - rng.random()) / math.log(1.0 - p)) if p < 1.0 else 0
+        if balance > 0:
+            length = max(length, 1)
+        if length == 0:
+            return ()
+
+        # A random walk over non-negative balances that ends at the wallet balance
+        ceiling = min(max(2 * balance, 100_00), MAX_BALANCE_MINOR)
+        path = [rng.randint(0, ceiling) for _ in range(length - 1)] + [balance]
+        span_us = max(1, (self.now - created_at) // timedelta(microseconds=1))
+        offsets = sorted(int(rng.random() * span_us) for _ in range(length))
+        operations, previous = [], 0
+        for target, offset in zip(path, offsets):
+            if target == previous:
+                continue
+            applied_at = created_at + timedelta(microseconds=offset)
+            operations.append(SeedOperation(
+                id=_uuid7((applied_at - _EPOCH) // timedelta(milliseconds=1), rng.getrandbits(12), rng),
+                operation_type=_DEPOSIT if target > previous else _WITHDRAW,
+                amount_minor=abs(target - previous),
+                balance_after_minor=target,
+                created_at=applied_at
+            ))
+            previous = target
+        return tuple(operations)
+
+
+def batches(wallets: Iterator[SeedWallet], size: int) -> Iterator[Tuple[List[SeedWallet], List[tuple], List[tuple]]]:
+    """
+    Group wallets into COPY batches.
+
+    Yields:
+        tuple: The wallets, their wallets rows and their wallet_operations rows
+    """
+    def rows(batch: List[SeedWallet]):
+        return batch, [item.record() for item in batch], [row for item in batch for row in item.operation_records()]
+
+    batch: List[SeedWallet] = []
+    for wallet in wallets:
+        batch.append(wallet)
+        if len(batch) == size:
+            yield rows(batch)
+            batch = []
+    if batch:
+        yield rows(batch)
@@ -0,0 +1,171 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+import asyncpg
+from src.infrastructure.logger import Logger
+from src.infrastructure.seeding.generator import OPERATION_COLUMNS, WALLET_COLUMNS, SeedWallet
+
+
+@dataclass(frozen=True)
+class DeferredIndex:
+    """Secondary index dropped for the load, with the statement that recreates it."""
+    table: str
+    name: str
+    definition: str
+
+
+@dataclass
+class SeedSummary:
+    """
+    Outcome of a seeding run.
+
+    Attributes:
+        wallets: Wallets loaded
+        operations: History rows loaded
+        load_seconds: Time spent generating and copying
+        index_seconds: Time spent rebuilding deferred indexes
+    """
+    wallets: int = 0
+    operations: int = 0
+    load_seconds: float = 0.0
+    index_seconds: float = 0.0
+
+
+async def secondary_indexes(connection: asyncpg.Connection, table: str) -> List[DeferredIndex]:
+    """
+    Indexes of a table that no constraint depends on.
+
+    Primary keys and unique constraints stay in place: they guard the load
+    itself, and UUIDv7 keys only ever append to the primary key.
+    """
+    rows = await connection.fetch(
+        'SELECT c.relname AS name, pg_get_indexdef(c.oid) AS definition '
+        'FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+        'WHERE i.indrelid = $1::regclass '
+        'AND NOT EXISTS (SELECT 1 FROM pg_constraint k WHERE k.conindid = i.indexrelid) '
+        'ORDER BY c.relname',
+        table
+    )
+    return [DeferredIndex(table, row['name'], row['definition']) for row in rows]
+
+
+class WalletSeedLoader:
+    """
+    Bulk loader of generated wallets through binary COPY.
+
+    Generation and loading form a two-stage pipeline: the next batch is
+    generated in a worker thread while the current one is copied, so at
+    most two batches are in memory whatever the total. Each batch is copied
+    in its own transaction; wallets and their history commit together.
+
+    Secondary indexes are dropped before the load and rebuilt afterwards,
+    also when the load fails: one sorted build is far cheaper than
+    maintaining the index row by row.
+    """
+
+    def __init__(self, connection: asyncpg.Connection, logger: Logger, progress_interval: float = 5.0):
+        """
+        Initialize the loader.
+
+        Args:
+            connection: Dedicated connection (asyncpg)
+            logger: Logger for progress reporting
+            progress_interval: Seconds between progress log records
+        """
+        self._connection = connection
+        self._logger = logger
+        self.progress_interval = progress_interval
+
+    async def drop_indexes(self, tables: Sequence[str]) -> List[DeferredIndex]:
+        """Drop the secondary indexes of the tables and return their definitions."""
+        deferred = []
+        for table in tables:
+            for index in await secondary_indexes(self._connection, table):
+                # Logged first so the definition survives a crash before the rebuild
+                self._logger.info('Index deferred', table=table, index=index.name, definition=index.definition)
+                await self._connection.execute(f'DROP INDEX IF EXISTS {index.name}')
+                deferred.append(index)
+        return deferred
+
+    async def rebuild_indexes(self, deferred: Sequence[DeferredIndex]):
+        """Recreate dropped indexes and refresh planner statistics of their tables."""
+        for index in deferred:
+            started = time.perf_counter()
+            await self._connection.execute(index.definition)
+            self._logger.info('Index rebuilt', index=index.name, seconds=round(time.perf_counter() - started, 3))
+        for table in dict.fromkeys(index.table for index in deferred):
+            await self._connection.execute(f'ANALYZE {table}')
+
+    async def load(
+        self,
+        batches: Iterator[Tuple[List[SeedWallet], List[tuple], List[tuple]]],
+        defer_indexes: bool = True,
+        on_batch: Optional[Callable[[List[SeedWallet]], None]] = None
+    ) -> SeedSummary:
+        """
+        Copy all batches into wallets and wallet_operations.
+
+        Args:
+            batches: Output of generator.batches
+            defer_indexes: Drop secondary indexes during the load
+            on_batch: Called with the wallets of each loaded batch
+
+        Returns:
+            SeedSummary: Loaded rows and timings
+
+        Raises:
+            Exception: The error that stopped the load; a failed index rebuild
+                after it is logged rather than raised in its place
+        """
+        summary = SeedSummary()
+        tables = ('wallets', 'wallet_operations')
+        deferred = await self.drop_indexes(tables) if defer_indexes else []
+        started = last_logged = time.perf_counter()
+        pending = None
+        failed = True
+        try:
+            pending = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+            while True:
+                batch = await pending
+                if batch is None:
+                    break
+                pending = asyncio.ensure_future(asyncio.to_thread(next, batches, None))
+                wallets, wallet_rows, operation_rows = batch
+                async with self._connection.transaction():
+                    await self._connection.copy_records_to_table('wallets', records=wallet_rows, columns=WALLET_COLUMNS)
+                    if operation_rows:
+                        await self._connection.copy_records_to_table(
+                            'wallet_operations', records=operation_rows, columns=OPERATION_COLUMNS
+                        )
+                summary.wallets += len(wallet_rows)
+                summary.operations += len(operation_rows)
+                if on_batch is not None:
+                    on_batch(wallets)
+
+                now = time.perf_counter()
+                if now - last_logged >= self.progress_interval:
+                    last_logged = now
+                    self._logger.info(
+                        'Seeding progress',
+                        wallets=summary.wallets,
+                        operations=summary.operations,
+                        wallets_per_second=round(summary.wallets / (now - started))
+                    )
+            failed = False
+        finally:
+            summary.load_seconds = time.perf_counter() - started
+            if failed and pending is not None:
+                # The generator thread cannot be interrupted; let it finish and drop its batch or error
+                await asyncio.gather(pending, return_exceptions=True)
+            if deferred:
+                rebuild_started = time.perf_counter()
+                try:
+                    await self.rebuild_indexes(deferred)
+                except Exception as e:
+                    if not failed:
+                        raise
+                    # The load error propagates; the deferred definitions are in the log for a manual rebuild
+                    self._logger.error('Index rebuild after failed load failed: %s', e)
+                summary.index_seconds = time.perf_counter() - rebuild_started
+        return summary
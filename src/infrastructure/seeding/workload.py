@@ -0,0 +1,90 @@
+import csv
+import os
+import random
+import uuid
+from typing import List
+from src.application.domain.money import from_minor_units
+from src.application.domain.operation_type import Operation
+from src.infrastructure.seeding.distributions import ZipfSampler
+
+
+WORKLOAD_COLUMNS = ('wallet_id', 'operation_type', 'amount')
+
+
+class WalletReservoir:
+    """
+    Uniform sample of a fixed number of wallet IDs from a stream of any length.
+
+    Lets the seeder pick the hot wallets of a workload while wallets are
+    generated, without keeping all IDs in memory.
+    """
+
+    def __init__(self, size: int, rng: random.Random):
+        """
+        Initialize the reservoir.
+
+        Args:
+            size: Number of wallet IDs to keep
+            rng: Random source
+        """
+        self.size = size
+        self._rng = rng
+        self._seen = 0
+        self.wallet_ids: List[uuid.UUID] = []
+
+    def offer(self, wallet_id: uuid.UUID):
+        """Consider one wallet of the stream."""
+        self._seen += 1
+        if len(self.wallet_ids) < self.size:
+            self.wallet_ids.append(wallet_id)
+            return
+        slot = self._rng.randrange(self._seen)
+        if slot < self.size:
+            self.wallet_ids[slot] = wallet_id
+
+
+def write_workload(
+    path: str,
+    wallet_ids: List[uuid.UUID],
+    operations: int,
+    skew: float,
+    seed: int = 0,
+    withdraw_ratio: float = 0.5,
+    max_amount_minor: int = 100_00
+) -> float:
+    """
+    Write a skewed deposit/withdraw workload for load tests.
+
+    Wallets are ranked in random order and each operation targets a rank
+    drawn from a Zipf distribution, so a few wallets receive most of the
+    traffic, like popular merchant wallets do. The file is CSV with a
+    header of WORKLOAD_COLUMNS; amounts have two decimal places.
+
+    Args:
+        path: Output CSV file
+        wallet_ids: Wallets the workload may target
+        operations: Number of operations
+        skew: Zipf exponent; 0 is uniform, around 1 is strongly skewed
+        seed: Random seed
+        withdraw_ratio: Share of withdrawals
+        max_amount_minor: Largest amount in minor units
+
+    Returns:
+        float: Share of the operations expected on the hottest 1% of the wallets
+    """
+    rng = random.Random(seed)
+    ranked = list(wallet_ids)
+    rng.shuffle(ranked)
+    zipf = ZipfSampler(len(ranked), skew)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(WORKLOAD_COLUMNS)
+        for _ in range(operations):
+            operation = Operation.WITHDRAW if rng.random() < withdraw_ratio else Operation.DEPOSIT
+            amount = from_minor_units(rng.randint(1, max_amount_minor))
+            writer.writerow((ranked[zipf.sample(rng)], operation.value, amount))
+    return zipf.share(max(1, len(ranked) // 100))
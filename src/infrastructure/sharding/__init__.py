@@ -0,0 +1,9 @@
+from src.infrastructure.database.database import async_session_maker
+from src.infrastructure.logger import logger
+from src.infrastructure.sharding.buckets import BUCKET_COUNT, BUCKET_SQL, bucket_of, with_bucket
+from src.infrastructure.sharding.shard_map import ACTIVE, DRAINING, MAIN_SHARD, MOVING, BucketRange, ShardMap
+from src.infrastructure.sharding.store import ShardMapStore
+
+
+# The main database is the catalog: it holds the shard map for all workers
+shard_map_store = ShardMapStore(session_maker=async_session_maker, logger=logger)
@@ -0,0 +1,32 @@
+import uuid
+
+
+BUCKET_BITS = 16
+BUCKET_COUNT = 1 << BUCKET_BITS
+BUCKET_MASK = BUCKET_COUNT - 1
+
+# Same value as bucket_of() for a uuid column; backs the ix_wallets_bucket_id expression index
+BUCKET_SQL = '(get_byte(uuid_send(id), 14) * 256 + get_byte(uuid_send(id), 15))'
+
+
+def bucket_of(wallet_id: uuid.UUID) -> int:
+    """
+    Shard bucket of a wallet: the 16 least significant bits of its ID.
+
+    The bits are random in IDs that were not placed with with_bucket (UUIDv4
+    or UUIDv7 alike), so buckets are a stable, uniform hash of every
+    existing wallet ID without a lookup.
+    """
+    return wallet_id.int & BUCKET_MASK
+
+
+def with_bucket(wallet_id: uuid.UUID, bucket: int) -> uuid.UUID:
+    """
+    Copy of a new wallet ID placed in the given bucket.
+
+    Only the tail of the random rand_b field is replaced: the timestamp and
+    sequence counter of a UUIDv7 stay in front, so placed IDs still sort
+    by creation time and keep appending to the primary key.
+    """
+    return uuid.UUID(int=(wallet_id.int & ~BUCKET_MASK) | (bucket & BUCKET_MASK))
+
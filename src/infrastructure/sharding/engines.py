@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Dict, Mapping
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from src.infrastructure.database.circuit_breaker import CircuitBreaker, circuit_breaker, instrument_circuit_breaker
+from src.infrastructure.database.database import async_session_maker, engine
+from src.infrastructure.database.pool import PoolMetrics, pool_class, pool_metrics
+from src.infrastructure.sharding.shard_map import MAIN_SHARD
+from src.infrastructure.tracing import tracer
+from src.infrastructure.tracing.sql import instrument_engine
+from src.settings import settings
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    Connections of one wallet database.
+
+    Attributes:
+        name: Shard name used in the shard map
+        engine: Engine with the shard's own pool
+        session_maker: Session factory bound to the engine
+        breaker: Circuit breaker of the shard; an outage of one shard does not fail the others
+        metrics: Acquisition statistics of the shard's pool
+    """
+    name: str
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[AsyncSession]
+    breaker: CircuitBreaker
+    metrics: PoolMetrics
+
+
+def asyncpg_dsn(url: str) -> str:
+    """Plain libpq DSN of a SQLAlchemy asyncpg URL, for raw asyncpg connections."""
+    return url.replace('postgresql+asyncpg://', 'postgresql://', 1)
+
+
+def create_shard(name: str, url: str) -> Shard:
+    """
+    Engine, pool and breaker of an extra shard, configured like the main engine.
+
+    Args:
+        name: Shard name
+        url: SQLAlchemy URL of the shard database (postgresql+asyncpg://...)
+    """
+    breaker = CircuitBreaker(
+        failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=settings.CIRCUIT_BREAKER_RESET_SECONDS,
+        enabled=settings.CIRCUIT_BREAKER_ENABLED
+    )
+    metrics = PoolMetrics()
+    shard_engine = create_async_engine(
+        url,
+        poolclass=pool_class(breaker, metrics),
+        pool_size=settings.SHARD_POOL_SIZE,
+        max_overflow=settings.SHARD_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        connect_args={
+            'timeout': settings.DATABASE_CONNECT_TIMEOUT,
+            'server_settings': {'statement_timeout': str(settings.DATABASE_STATEMENT_TIMEOUT_MS)}
+        },
+        echo=False
+    )
+    if settings.CIRCUIT_BREAKER_ENABLED:
+        instrument_circuit_breaker(shard_engine, breaker)
+    if settings.TRACING_ENABLED:
+        instrument_engine(shard_engine, tracer)
+    session_maker = async_sessionmaker(shard_engine, expire_on_commit=False, class_=AsyncSession)
+    return Shard(name, shard_engine, session_maker, breaker, metrics)
+
+
+def build_shards(urls: Mapping[str, str]) -> Dict[str, Shard]:
+    """
+    All shards: the main database, which also holds the shard map, and the configured extras.
+
+    Raises:
+        ValueError: If an extra shard is named like the main one
+    """
+    if MAIN_SHARD in urls:
+        raise ValueError(f'Shard name {MAIN_SHARD!r} is reserved for the main database')
+    shards = {MAIN_SHARD: Shard(MAIN_SHARD, engine, async_session_maker, circuit_breaker, pool_metrics)}
+    for name, url in urls.items():
+        shards[name] = create_shard(name, url)
+    return shards
+
+
+async def dispose_shards(shards: Mapping[str, Shard]):
+    """Close the pools of the extra shards; the main engine is disposed by its owner."""
+    for shard in shards.values():
+        if shard.name != MAIN_SHARD:
+            await shard.engine.dispose()
@@ -0,0 +1,191 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable, Callable, Mapping
+from src.application.abstractions import IStatsRepository, IWalletRepository
+from src.application.domain.uuid7 import uuid7
+from src.application.domain.wallet_page import SortOrder, WalletCursor, WalletListQuery, WalletPage
+from src.application.domain.wallet_totals import WalletTotals
+from src.application.exceptions import DatabaseError, WalletNotFoundError
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.repositories.wallet_repostiory import WalletRepository
+from src.infrastructure.logger import Logger
+from src.infrastructure.sharding.buckets import with_bucket
+from src.infrastructure.sharding.shard_map import ShardMap
+from src.infrastructure.sharding.store import ShardMapStore
+from src.infrastructure.tracing import tracer
+
+
+class ShardedWalletRepository(IWalletRepository):
+    """
+    Wallet repository spread over several databases.
+
+    Every wallet lives on the shard that the shard map assigns to its
+    bucket (the low 16 bits of its ID). New wallets get a UUIDv7 placed in
+    a bucket drawn from the active ranges, so shards fill in proportion to
+    the buckets they own and moving ranges receive no new wallets.
+
+    Single-wallet calls go to one shard. A wallet that is not found there
+    may have just been moved: the map is reloaded and the call is retried
+    once on the new owner. Listings fan out to all shards in parallel and
+    are merged by (created_at, id); copies of wallets on a shard that does
+    not own them, left mid-move, are skipped.
+    """
+
+    def __init__(self, shards: Mapping[str, WalletRepository], map_store: ShardMapStore, logger: Logger):
+        """
+        Initialize the repository.
+
+        Args:
+            shards: Repository of every shard by name
+            map_store: Worker-local copy of the shard map
+            logger: Logger for request fields
+        """
+        super().__init__(None, logger)
+        self._shards = dict(shards)
+        self._map_store = map_store
+
+
+    def _repository(self, shard: str) -> WalletRepository:
+        try:
+            return self._shards[shard]
+        except KeyError:
+            raise DatabaseError(f'Shard {shard} is not configured')
+
+
+    async def _current_map(self) -> ShardMap:
+        return self._map_store.map if self._map_store.loaded else await self._map_store.refresh()
+
+
+    async def _routed(self, wallet_id: str, call: Callable[[WalletRepository], Awaitable[Wallet]]) -> Wallet:
+        """
+        Run a single-wallet call on the wallet's shard.
+
+        Raises:
+            InvalidWalletIdError: If wallet ID format is invalid
+            WalletNotFoundError: If no shard has the wallet
+        """
+        wallet_uuid = WalletRepository._parse_wallet_id(wallet_id)
+        started = self._map_store.now()
+        shard = (await self._current_map()).shard_for(wallet_uuid)
+        self._logger.add_event_fields(shard=shard)
+        try:
+            return await call(self._repository(shard))
+        except WalletNotFoundError:
+            # A map loaded before the call began may predate the move; one loaded since is current
+            owner = (await self._map_store.refresh(force=False, since=started)).shard_for(wallet_uuid)
+            if owner == shard:
+                raise
+            self._logger.add_event_fields(shard=owner, shard_map='stale')
+            return await call(self._repository(owner))
+
+
+    @tracer.traced('ShardedWalletRepository.create')
+    async def create(self) -> Wallet:
+        """
+        Create a new wallet with zero balance on the shard of a freshly placed ID.
+
+        Returns:
+            Wallet: The created wallet entity
+
+        Raises:
+            DatabaseError: If wallet creation fails
+        """
+        shard_map = await self._current_map()
+        wallet_id = with_bucket(uuid7(), shard_map.place())
+        shard = shard_map.shard_for(wallet_id)
+        self._logger.add_event_fields(shard=shard)
+        return await self._repository(shard).create(wallet_id)
+
+
+    @tracer.traced('ShardedWalletRepository.deposit')
+    async def deposit(self, wallet_id: str, amount: Decimal) -> Wallet:
+        return await self._routed(wallet_id, lambda repository: repository.deposit(wallet_id, amount))
+
+
+    @tracer.traced('ShardedWalletRepository.withdraw')
+    async def withdraw(self, wallet_id: str, amount: Decimal) -> Wallet:
+        return await self._routed(wallet_id, lambda repository: repository.withdraw(wallet_id, amount))
+
+
+    @tracer.traced('ShardedWalletRepository.get_wallet')
+    async def get_wallet(self, wallet_id: str) -> Wallet:
+        return await self._routed(wallet_id, lambda repository: repository.get_wallet(wallet_id))
+
+
+    @tracer.traced('ShardedWalletRepository.list_wallets')
+    async def list_wallets(self, query: WalletListQuery) -> WalletPage:
+        """
+        List wallets of all shards ordered by (created_at, id) with keyset pagination.
+
+        Every shard returns its own next page. A shard that has more rows
+        was only read up to its last row, so the merged page stops there:
+        it may be shorter than the limit, but never skips a wallet.
+
+        Args:
+            query: Page size, cursor, sort order and filters
+
+        Returns:
+            WalletPage: The wallets and the cursor of the next page
+
+        Raises:
+            DatabaseError: If the listing query fails on any shard
+        """
+        shard_map = await self._current_map()
+        names = sorted(shard_map.shards)
+        pages = await asyncio.gather(*(self._repository(name).list_wallets(query) for name in names))
+
+        descending = query.order == SortOrder.DESC
+
+        def key(wallet: Wallet) -> tuple:
+            return wallet.created_at, wallet.id
+
+        owned = sorted(
+            (wallet for name, page in zip(names, pages) for wallet in page.items
+             if shard_map.shard_for(wallet.id) == name),
+            key=key,
+            reverse=descending
+        )
+        bounds = [key(page.items[-1]) for page in pages if page.next_cursor is not None]
+        bound = (max(bounds) if descending else min(bounds)) if bounds else None
+        if bound is not None:
+            owned = [wallet for wallet in owned if (key(wallet) >= bound if descending else key(wallet) <= bound)]
+
+        items = owned[:query.limit]
+        if len(owned) > query.limit:
+            last = key(items[-1])
+        elif bound is not None:
+            last = bound
+        else:
+            return WalletPage(items=items)
+        return WalletPage(items=items, next_cursor=WalletCursor(*last).encode())
+
+
+class ShardedStatsRepository(IStatsRepository):
+    """
+    Wallet aggregates summed over all shards.
+
+    Each shard keeps its own wallet_stats, so totals cost one small
+    parallel read per shard.
+    """
+
+    def __init__(self, shards: Mapping[str, IStatsRepository], logger: Logger):
+        super().__init__(None, logger)
+        self._shards = dict(shards)
+
+
+    @tracer.traced('ShardedStatsRepository.get_totals')
+    async def get_totals(self) -> WalletTotals:
+        """
+        Retrieve the wallet count and total balance.
+
+        Returns:
+            WalletTotals: Aggregates over all wallets of all shards
+
+        Raises:
+            DatabaseError: If the aggregates of any shard cannot be read
+        """
+        totals = await asyncio.gather(*(repository.get_totals() for repository in self._shards.values()))
+        return WalletTotals(
+            wallet_count=sum(item.wallet_count for item in totals),
+            total_balance=sum((item.total_balance for item in totals), Decimal('0.00'))
+        )
@@ -0,0 +1,254 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Awaitable, Callable, Mapping, Sequence
+import asyncpg
+from src.infrastructure.logger import Logger
+from src.infrastructure.sharding.buckets import BUCKET_SQL
+from src.infrastructure.sharding.shard_map import ACTIVE, DRAINING, MOVING, BucketRange, ShardMap
+from src.settings import settings
+
+
+# Advisory lock on the catalog held for a whole run, so two moves never rewrite the map at once
+RESHARD_LOCK_KEY = 0x52534844
+
+WALLET_COLUMNS = ('id', 'balance', 'balance_minor', 'created_at')
+
+_SELECT_RANGE = (
+    f'SELECT id, balance, balance_minor, created_at FROM wallets '
+    f'WHERE {BUCKET_SQL} >= $1 AND {BUCKET_SQL} < $2 ORDER BY id FOR UPDATE'
+)
+_DELETE_RANGE = f'DELETE FROM wallets WHERE {BUCKET_SQL} >= $1 AND {BUCKET_SQL} < $2 RETURNING balance'
+_DELETE_IDS = 'DELETE FROM wallets WHERE id = ANY($1::uuid[])'
+_INSERT_ROWS = (
+    'INSERT INTO wallets (id, balance, balance_minor, created_at) '
+    'SELECT * FROM unnest($1::uuid[], $2::numeric[], $3::bigint[], $4::timestamptz[]) '
+    'ON CONFLICT (id) DO NOTHING RETURNING balance'
+)
+_ADD_STATS = (
+    'INSERT INTO wallet_stats (stripe, wallet_count, total_balance, updated_at) VALUES (0, $1, $2, now()) '
+    'ON CONFLICT (stripe) DO UPDATE SET '
+    'wallet_count = wallet_stats.wallet_count + EXCLUDED.wallet_count, '
+    'total_balance = wallet_stats.total_balance + EXCLUDED.total_balance, '
+    'updated_at = EXCLUDED.updated_at'
+)
+
+
+@dataclass
+class MoveSummary:
+    """
+    Outcome of a range move.
+
+    Attributes:
+        steps: Cutovers performed
+        wallets: Wallets moved by the cutovers
+        leftovers: Wallets found on the old owner after the grace period and moved
+        seconds: Wall time of the run
+    """
+    steps: int = 0
+    wallets: int = 0
+    leftovers: int = 0
+    seconds: float = 0.0
+
+
+async def _add_stats(connection: asyncpg.Connection, count: int, total: Decimal):
+    if settings.WALLET_STATS_ENABLED and count:
+        await connection.execute(_ADD_STATS, count, total)
+
+
+async def _insert(connection: asyncpg.Connection, rows: Sequence[asyncpg.Record]) -> tuple[int, Decimal]:
+    """Insert wallet rows missing on the connection's shard; returns the count and balance inserted."""
+    if not rows:
+        return 0, Decimal('0.00')
+    inserted = await connection.fetch(
+        _INSERT_ROWS, *([row[column] for row in rows] for column in WALLET_COLUMNS)
+    )
+    return len(inserted), _total(inserted)
+
+
+def _total(rows: Sequence[asyncpg.Record]) -> Decimal:
+    return sum((row['balance'] for row in rows), Decimal('0.00'))
+
+
+class RangeMover:
+    """
+    Online move of bucket ranges between shards.
+
+    A move walks every range through three map states, and a run that was
+    interrupted picks up where the map says it stopped:
+
+    1. moving: new wallets are no longer placed in the range. After a grace
+       period every worker has seen this, so only the move adds wallets.
+    2. draining, one step of step_buckets at a time: the step's wallets are
+       locked on the old owner, copied to the new one, the map is flipped
+       and announced, and the rows are deleted from the old owner. Calls
+       blocked by the lock find no wallet afterwards, reload the map and
+       retry on the new owner; a step bounds how long they wait.
+    3. active: after another grace period, wallets that workers with a stale
+       map still created on the old owner are moved over, and the range is
+       released for placement again.
+
+    Every transaction leaves the map, the wallets and each shard's
+    wallet_stats consistent, so a crash between them only repeats work.
+    Totals summed over shards can count a step's wallets twice for the
+    instant between its two commits.
+    """
+
+    def __init__(
+        self,
+        catalog: asyncpg.Connection,
+        shards: Mapping[str, asyncpg.Connection],
+        logger: Logger,
+        step_buckets: int = 256,
+        grace_seconds: float = 15.0,
+        channel: str = 'shard_map',
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """
+        Initialize the mover.
+
+        Args:
+            catalog: Connection to the database holding shard_map, separate from the shard connections
+            shards: Connection to every shard by name
+            logger: Logger for progress reporting
+            step_buckets: Buckets moved per cutover transaction
+            grace_seconds: Time for every worker to pick up a map change
+            channel: NOTIFY channel announcing map changes
+            sleep: Sleep function, injectable for tests
+        """
+        self._catalog = catalog
+        self._shards = dict(shards)
+        self._logger = logger
+        self.step_buckets = step_buckets
+        self.grace_seconds = grace_seconds
+        self._channel = channel
+        self._sleep = sleep
+
+    async def load_map(self) -> ShardMap:
+        rows = await self._catalog.fetch(
+            'SELECT start_bucket, end_bucket, shard, state, peer FROM shard_map ORDER BY start_bucket'
+        )
+        if not rows:
+            return ShardMap.single()
+        return ShardMap([BucketRange(*row) for row in rows])
+
+    async def save_map(self, shard_map: ShardMap):
+        """Replace the stored map in one transaction and announce it to the workers."""
+        async with self._catalog.transaction():
+            await self._catalog.execute('DELETE FROM shard_map')
+            await self._catalog.executemany(
+                'INSERT INTO shard_map (start_bucket, end_bucket, shard, state, peer, updated_at) '
+                'VALUES ($1, $2, $3, $4, $5, now())',
+                [(item.start, item.end, item.shard, item.state, item.peer) for item in shard_map.ranges]
+            )
+            await self._catalog.execute('SELECT pg_notify($1, $2)', self._channel, '')
+
+    def _connection(self, shard: str) -> asyncpg.Connection:
+        try:
+            return self._shards[shard]
+        except KeyError:
+            raise ValueError(f'Shard {shard} is not configured')
+
+    async def move(self, start: int, end: int, target: str) -> MoveSummary:
+        """
+        Move buckets [start, end) to the target shard, or finish an interrupted move.
+
+        Raises:
+            ValueError: If a shard is unknown or part of the range is moving elsewhere
+            RuntimeError: If another run holds the resharding lock
+        """
+        started = time.perf_counter()
+        summary = MoveSummary()
+        self._connection(target)
+        if not await self._catalog.fetchval('SELECT pg_try_advisory_lock($1)', RESHARD_LOCK_KEY):
+            raise RuntimeError('Another resharding run is in progress')
+        try:
+            shard_map = await self.load_map()
+            ranges = shard_map.slice(start, end)
+            for item in ranges:
+                if (item.state == MOVING and item.peer != target) or (item.state == DRAINING and item.shard != target):
+                    raise ValueError(
+                        f'Buckets {item.start}-{item.end} are {item.state} between {item.shard} and {item.peer}; '
+                        f'finish that move first'
+                    )
+                self._connection(item.shard)
+
+            marked = [item for item in ranges if item.state == ACTIVE and item.shard != target]
+            if marked:
+                for item in marked:
+                    shard_map = shard_map.assign(item.start, item.end, item.shard, MOVING, target)
+                await self.save_map(shard_map)
+                self._logger.info('Range marked moving', start=start, end=end, target=target)
+                await self._sleep(self.grace_seconds)
+
+            for item in shard_map.slice(start, end):
+                if item.state != MOVING:
+                    continue
+                for step_start in range(item.start, item.end, self.step_buckets):
+                    step_end = min(step_start + self.step_buckets, item.end)
+                    shard_map = shard_map.assign(step_start, step_end, target, DRAINING, item.shard)
+                    moved = await self._cutover(item.shard, target, step_start, step_end, shard_map)
+                    summary.steps += 1
+                    summary.wallets += moved
+                    self._logger.info(
+                        'Range step moved', start=step_start, end=step_end, source=item.shard, target=target,
+                        wallets=moved
+                    )
+
+            draining = [item for item in shard_map.slice(start, end) if item.state == DRAINING]
+            if draining:
+                await self._sleep(self.grace_seconds)
+                for item in draining:
+                    summary.leftovers += await self._drain(item.peer, target, item.start, item.end)
+                    shard_map = shard_map.assign(item.start, item.end, target, ACTIVE)
+                    await self.save_map(shard_map)
+        finally:
+            await self._catalog.execute('SELECT pg_advisory_unlock($1)', RESHARD_LOCK_KEY)
+
+        summary.seconds = time.perf_counter() - started
+        return summary
+
+    async def _cutover(self, source: str, target: str, start: int, end: int, shard_map: ShardMap) -> int:
+        """
+        Hand buckets [start, end) over from source to target.
+
+        The source rows stay locked from the copy until they are deleted,
+        so no change can slip in between. Rows a failed earlier attempt left
+        on the target are replaced, never counted twice.
+        """
+        source_connection = self._connection(source)
+        target_connection = self._connection(target)
+        async with source_connection.transaction():
+            rows = await source_connection.fetch(_SELECT_RANGE, start, end)
+            async with target_connection.transaction():
+                stale = await target_connection.fetch(_DELETE_RANGE, start, end)
+                await _add_stats(target_connection, -len(stale), -_total(stale))
+                count, total = await _insert(target_connection, rows)
+                await _add_stats(target_connection, count, total)
+            await self.save_map(shard_map)
+            if rows:
+                await source_connection.execute(_DELETE_IDS, [row['id'] for row in rows])
+                await _add_stats(source_connection, -len(rows), -_total(rows))
+        return len(rows)
+
+    async def _drain(self, source: str, target: str, start: int, end: int) -> int:
+        """
+        Move wallets left on the old owner of a draining range.
+
+        The target owns the range by now, so wallets it already has are kept
+        as they are and only the missing ones are copied.
+        """
+        source_connection = self._connection(source)
+        target_connection = self._connection(target)
+        async with source_connection.transaction():
+            rows = await source_connection.fetch(_SELECT_RANGE, start, end)
+            if not rows:
+                return 0
+            async with target_connection.transaction():
+                count, total = await _insert(target_connection, rows)
+                await _add_stats(target_connection, count, total)
+            await source_connection.execute(_DELETE_IDS, [row['id'] for row in rows])
+            await _add_stats(source_connection, -len(rows), -_total(rows))
+        self._logger.info('Leftover wallets moved', start=start, end=end, source=source, target=target, wallets=count)
+        return count
@@ -0,0 +1,145 @@
+import bisect
+import random
+import uuid
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence, Set
+from src.infrastructure.sharding.buckets import BUCKET_COUNT, bucket_of
+
+
+MAIN_SHARD = 'main'
+
+ACTIVE = 'active'
+MOVING = 'moving'
+DRAINING = 'draining'
+STATES = (ACTIVE, MOVING, DRAINING)
+
+
+@dataclass(frozen=True)
+class BucketRange:
+    """
+    Buckets [start, end) and the shard that owns their wallets.
+
+    Attributes:
+        start: First bucket of the range
+        end: Bucket after the last one of the range
+        shard: Owning shard; every read and write of the range goes there
+        state: ACTIVE; MOVING until the wallets are handed over to peer;
+            DRAINING after the handover, until leftovers on peer are moved too
+        peer: Target of a MOVING range, former owner of a DRAINING one
+    """
+    start: int
+    end: int
+    shard: str
+    state: str = ACTIVE
+    peer: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+
+class ShardMap:
+    """
+    Immutable assignment of all buckets to shards.
+
+    Wallets are routed by bucket_of(id), so a lookup is a binary search
+    over a handful of ranges. New wallets are placed in active ranges only:
+    nothing is created in a range whose wallets are being moved.
+    """
+
+    def __init__(self, ranges: Sequence[BucketRange]):
+        """
+        Initialize the map.
+
+        Args:
+            ranges: Ranges covering all buckets without gaps or overlaps, in any order
+
+        Raises:
+            ValueError: If the ranges do not cover the buckets exactly or a move has no peer
+        """
+        self.ranges = tuple(sorted(ranges, key=lambda item: item.start))
+        position = 0
+        for item in self.ranges:
+            if item.start != position or item.end <= item.start:
+                raise ValueError(f'Shard map has a gap or overlap at bucket {position}')
+            if item.state not in STATES:
+                raise ValueError(f'Unknown shard range state: {item.state}')
+            if item.state != ACTIVE and (item.peer is None or item.peer == item.shard):
+                raise ValueError(f'Range {item.start}-{item.end} is {item.state} without a peer shard')
+            position = item.end
+        if position != BUCKET_COUNT:
+            raise ValueError(f'Shard map ends at bucket {position}, expected {BUCKET_COUNT}')
+
+        self._starts = [item.start for item in self.ranges]
+        self._placeable = [item for item in self.ranges if item.state == ACTIVE]
+        self._placeable_size = sum(item.size for item in self._placeable)
+
+    @classmethod
+    def single(cls, shard: str = MAIN_SHARD) -> 'ShardMap':
+        """Map of one shard owning every bucket, the layout before any resharding."""
+        return cls([BucketRange(0, BUCKET_COUNT, shard)])
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ShardMap) and self.ranges == other.ranges
+
+    def __hash__(self) -> int:
+        return hash(self.ranges)
+
+    @property
+    def shards(self) -> Set[str]:
+        """Every shard the map refers to, owners and peers."""
+        return {item.shard for item in self.ranges} | {item.peer for item in self.ranges if item.peer}
+
+    def range_of(self, bucket: int) -> BucketRange:
+        return self.ranges[bisect.bisect_right(self._starts, bucket) - 1]
+
+    def shard_for(self, wallet_id: uuid.UUID) -> str:
+        """Shard that owns a wallet."""
+        return self.range_of(bucket_of(wallet_id)).shard
+
+    def place(self, rng: Optional[random.Random] = None) -> int:
+        """
+        Bucket for a new wallet, drawn uniformly from the active ranges.
+
+        Shards therefore fill in proportion to the buckets they own.
+        """
+        rng = rng or random
+        if not self._placeable:
+            return rng.randrange(BUCKET_COUNT)
+        offset = rng.randrange(self._placeable_size)
+        for item in self._placeable:
+            if offset < item.size:
+                return item.start + offset
+            offset -= item.size
+        raise AssertionError('unreachable')
+
+    def split(self, start: int, end: int) -> 'ShardMap':
+        """Equivalent map with range boundaries at start and end."""
+        if not 0 <= start < end <= BUCKET_COUNT:
+            raise ValueError(f'Invalid bucket range {start}-{end}')
+        ranges: List[BucketRange] = []
+        for item in self.ranges:
+            cuts = [cut for cut in (start, end) if item.start < cut < item.end]
+            bounds = [item.start, *cuts, item.end]
+            ranges.extend(replace(item, start=low, end=high) for low, high in zip(bounds, bounds[1:]))
+        return ShardMap(ranges)
+
+    def slice(self, start: int, end: int) -> List[BucketRange]:
+        """Ranges of the split map within [start, end)."""
+        return [item for item in self.split(start, end).ranges if start <= item.start and item.end <= end]
+
+    def assign(self, start: int, end: int, shard: str, state: str = ACTIVE, peer: Optional[str] = None) -> 'ShardMap':
+        """
+        Map with buckets [start, end) set to one range.
+
+        Neighbouring ranges that end up identical are merged, so the map
+        does not fragment as ranges move back and forth.
+        """
+        outside = [item for item in self.split(start, end).ranges if item.end <= start or item.start >= end]
+        ranges: List[BucketRange] = []
+        for item in sorted([*outside, BucketRange(start, end, shard, state, peer)], key=lambda value: value.start):
+            if ranges and replace(ranges[-1], start=item.start, end=item.end) == item:
+                ranges[-1] = replace(ranges[-1], end=item.end)
+            else:
+                ranges.append(item)
+        return ShardMap(ranges)
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from typing import Callable, Optional, Set
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.infrastructure.database.models.shard_range import ShardRange
+from src.infrastructure.logger import Logger
+from src.infrastructure.sharding.shard_map import MAIN_SHARD, BucketRange, ShardMap
+
+
+class ShardMapStore:
+    """
+    Worker-local copy of the shard map kept in the catalog database.
+
+    The map is reloaded periodically, as soon as the resharding tool
+    announces a change with NOTIFY, and on demand when a wallet was not
+    found where the map pointed. On-demand reloads are rate limited so a
+    burst of lookups of unknown IDs costs one query, not one per request;
+    a lookup that started after the last load still gets a fresh map.
+    An empty shard_map table means the main database owns every bucket.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        logger: Logger,
+        default_shard: str = MAIN_SHARD,
+        min_interval: float = 0.1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            session_maker: Session factory of the catalog database
+            logger: Logger for map changes and load failures
+            default_shard: Owner of every bucket while shard_map is empty
+            min_interval: Minimum seconds between on-demand reloads
+            clock: Monotonic clock, injectable for tests
+        """
+        self._session_maker = session_maker
+        self._logger = logger
+        self._default_shard = default_shard
+        self._min_interval = min_interval
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._map = ShardMap.single(default_shard)
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def map(self) -> ShardMap:
+        return self._map
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def now(self) -> float:
+        """Current time on the clock that stamps loaded_at."""
+        return self._clock()
+
+    async def refresh(self, force: bool = True, since: Optional[float] = None) -> ShardMap:
+        """
+        Reload the map from the catalog.
+
+        Args:
+            force: Reload even if the last load is more recent than min_interval
+            since: Skip an unforced reload only if the map was loaded at or after
+                this time (see now()), instead of within min_interval
+
+        Returns:
+            ShardMap: The current map
+        """
+        async with self._lock:
+            if not force and self._fresh(since):
+                return self._map
+            async with self._session_maker() as session:
+                rows = (await session.execute(select(ShardRange).order_by(ShardRange.start_bucket))).scalars().all()
+            loaded = ShardMap([
+                BucketRange(row.start_bucket, row.end_bucket, row.shard, row.state, row.peer) for row in rows
+            ]) if rows else ShardMap.single(self._default_shard)
+            if loaded != self._map:
+                self._logger.info('Shard map changed', ranges=len(loaded.ranges), shards=sorted(loaded.shards))
+            self._map = loaded
+            self.loaded_at = self._clock()
+            return loaded
+
+    def _fresh(self, since: Optional[float]) -> bool:
+        if self.loaded_at is None:
+            return False
+        if since is not None:
+            return self.loaded_at >= since
+        return self._clock() - self.loaded_at < self._min_interval
+
+    def handle_notification(self, _payload: str):
+        """Reload the map after the resharding tool announced a change."""
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """Reload the map in the background, e.g. after changes may have been missed."""
+        task = asyncio.get_running_loop().create_task(self._refresh_logged())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh_logged(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            self._logger.error('Shard map reload failed: %s', e)
+
+    async def run(self, stop: asyncio.Event, interval: float):
+        """Reload the map every interval until stopped, in case a notification was missed."""
+        while not stop.is_set():
+            await self._refresh_logged()
+            try:
+                await asyncio.wait_for(stop.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,25 @@
+import atexit
+from typing import Optional
+from src.infrastructure.tracing.exporter import FileSpanExporter, to_otlp
+from src.infrastructure.tracing.tracer import Span, SpanExporter, Tracer
+from src.settings import settings
+
+
+exporter: Optional[SpanExporter] = None
+if settings.TRACING_ENABLED and settings.TRACING_EXPORT_PATH:
+    exporter = FileSpanExporter(
+        path=settings.TRACING_EXPORT_PATH,
+        service_name=settings.TRACING_SERVICE_NAME,
+        interval=settings.TRACING_EXPORT_INTERVAL,
+    )
+    atexit.register(exporter.shutdown)
+
+tracer = Tracer(
+    sample_ratio=settings.TRACING_SAMPLE_RATIO if settings.TRACING_ENABLED else 0.0,
+    buffer_size=settings.TRACING_BUFFER_SIZE,
+    exporter=exporter,
+)
+
+
+async def get_tracer() -> Tracer:
+    return tracer
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List
+from src.infrastructure.tracing.tracer import Span, SpanExporter
+
+
+def _otlp_trace_id(trace_id: str) -> str:
+    """OTLP trace IDs are 16 bytes of hex; X-Trace-ID values are usually UUIDs."""
+    try:
+        return uuid.UUID(trace_id).hex
+    except ValueError:
+        return hashlib.md5(trace_id.encode('utf-8')).hexdigest()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def to_otlp(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """
+    Convert spans to the OTLP/JSON trace export format.
+
+    Args:
+        spans: Finished spans
+        service_name: Value of the service.name resource attribute
+
+    Returns:
+        dict: ExportTraceServiceRequest-shaped document
+    """
+    otlp_spans = []
+    for span in spans:
+        attributes = {'trace_id': span.trace_id, **span.attributes}
+        otlp_span = {
+            'traceId': _otlp_trace_id(span.trace_id),
+            'spanId': span.span_id,
+            'name': span.name,
+            'kind': 1,
+            'startTimeUnixNano': str(span.start_ns),
+            'endTimeUnixNano': str(span.end_ns),
+            'attributes': [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items()],
+            'status': {'code': 2, 'message': span.error} if span.error else {'code': 1},
+        }
+        if span.parent_id:
+            otlp_span['parentSpanId'] = span.parent_id
+        otlp_spans.append(otlp_span)
+
+    return {
+        'resourceSpans': [{
+            'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': service_name}}]},
+            'scopeSpans': [{'scope': {'name': 'wallet.tracing'}, 'spans': otlp_spans}],
+        }]
+    }
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Appends batches of spans as OTLP/JSON lines to a local file.
+
+    A collector (or a stand-in tailing the file) can ship the lines as-is.
+    Batches are written from a background thread every interval seconds.
+    """
+
+    def __init__(self, path: str, service_name: str, interval: float = 5.0, max_queue: int = 10000):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: Output file; '{pid}' is replaced with the process ID
+            service_name: Value of the service.name resource attribute
+            interval: Seconds between batch writes
+            max_queue: Spans held between writes; the oldest are dropped beyond it
+        """
+        self.path = path.format(pid=os.getpid())
+        self.service_name = service_name
+        self._interval = interval
+        self._queue: Deque[Span] = deque(maxlen=max_queue)
+        self._stop = threading.Event()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name='span-exporter', daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span):
+        self._queue.append(span)
+
+    def flush(self):
+        """Write queued spans as one OTLP/JSON line."""
+        spans = []
+        while self._queue:
+            spans.append(self._queue.popleft())
+        if not spans:
+            return
+        line = json.dumps(to_otlp(spans, self.service_name), ensure_ascii=False) + '\n'
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write(line)
+
+    def shutdown(self):
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            try:
+                self.flush()
+            except OSError:
+                pass
@@ -0,0 +1,41 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.infrastructure.tracing.tracer import Tracer
+
+
+_SPANS_KEY = 'tracing_spans'
+
+
+def instrument_engine(engine: AsyncEngine, tracer: Tracer, max_statement_length: int = 500):
+    """
+    Record a span for every SQL statement executed through the engine.
+
+    Cursor events run inside SQLAlchemy's greenlet, which carries the
+    caller's context, so statements nest under the current span.
+
+    Args:
+        engine: Engine to instrument
+        tracer: Tracer recording the spans
+        max_statement_length: Statements are truncated to this many characters
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span = tracer.start_span('sql', **{'db.statement': statement[:max_statement_length]})
+        conn.info.setdefault(_SPANS_KEY, []).append(span)
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get(_SPANS_KEY)
+        span = stack.pop() if stack else None
+        if span is not None:
+            span.set_attribute('db.rows', cursor.rowcount)
+            tracer.end_span(span)
+
+    @event.listens_for(sync_engine, 'handle_error')
+    def handle_error(context):
+        stack = context.connection.info.get(_SPANS_KEY) if context.connection is not None else None
+        span = stack.pop() if stack else None
+        if span is not None:
+            tracer.end_span(span, context.original_exception)
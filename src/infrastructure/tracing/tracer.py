@@ -0,0 +1,183 @@
+import functools
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+from src.infrastructure.logger.logger import trace_id_var
+
+
+_NOOP_SCOPE = nullcontext()
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+
+class SpanExporter(ABC):
+    """Receives finished spans of sampled traces."""
+
+    @abstractmethod
+    def export(self, span: Span):
+        """Queue a finished span for export. Must not block."""
+
+    def shutdown(self):
+        """Export what is still queued and stop."""
+
+
+class _SpanScope:
+    """Context manager making a span current for its duration."""
+
+    __slots__ = ('_tracer', '_span', '_token')
+
+    def __init__(self, tracer: 'Tracer', span: Span):
+        self._tracer = tracer
+        self._span = span
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = self._tracer._current.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        self._tracer._current.reset(self._token)
+        self._tracer.end_span(self._span, exc)
+        return False
+
+
+class Tracer:
+    """
+    Minimal span API on top of the logger's trace_id.
+
+    A trace is started by trace() with probability sample_ratio; span()
+    and start_span() only record inside a sampled trace, so unsampled
+    requests pay a single contextvar lookup per instrumented call.
+    Finished spans are kept in a bounded ring buffer for the admin
+    endpoint and passed to the exporter.
+    """
+
+    def __init__(
+        self,
+        sample_ratio: float = 0.01,
+        buffer_size: int = 10000,
+        exporter: Optional[SpanExporter] = None,
+        random_fn: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the tracer.
+
+        Args:
+            sample_ratio: Fraction of traces recorded, between 0 and 1
+            buffer_size: Number of finished spans kept in memory
+            exporter: Optional exporter of finished spans
+            random_fn: Source of uniform [0, 1) numbers, injectable for tests
+        """
+        self.sample_ratio = sample_ratio
+        self.exporter = exporter
+        self._random = random_fn
+        self._current: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+        self._spans: Deque[Span] = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def current_span(self) -> Optional[Span]:
+        return self._current.get()
+
+    def trace(self, name: str, force: bool = False, **attributes: Any):
+        """
+        Start a root span for the current trace_id if the trace is sampled.
+
+        Args:
+            name: Span name
+            force: Record the trace regardless of the sampling ratio
+            **attributes: Span attributes
+
+        Returns:
+            Context manager yielding the root Span, or None if not sampled
+        """
+        if self._current.get() is not None:
+            return self.span(name, **attributes)
+        if not force and (self.sample_ratio <= 0 or self._random() >= self.sample_ratio):
+            return _NOOP_SCOPE
+        span = Span(
+            trace_id=trace_id_var.get(),
+            span_id=os.urandom(8).hex(),
+            parent_id=None,
+            name=name,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        return _SpanScope(self, span)
+
+    def span(self, name: str, **attributes: Any):
+        """
+        Record a child span of the current span.
+
+        Returns:
+            Context manager yielding the Span, or None outside a sampled trace
+        """
+        span = self.start_span(name, **attributes)
+        if span is None:
+            return _NOOP_SCOPE
+        return _SpanScope(self, span)
+
+    def start_span(self, name: str, **attributes: Any) -> Optional[Span]:
+        """Start a child span without making it current, e.g. for leaf operations timed by callbacks."""
+        parent = self._current.get()
+        if parent is None:
+            return None
+        return Span(
+            trace_id=parent.trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id,
+            name=name,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None):
+        """Finish a span and hand it to the buffer and exporter."""
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f'{type(error).__name__}: {error}'
+        with self._lock:
+            self._spans.append(span)
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def traced(self, name: str):
+        """Decorate an async function to run inside a child span."""
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if self._current.get() is None:
+                    return await func(*args, **kwargs)
+                with self.span(name):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        """Finished spans of a trace still held in the ring buffer, oldest first."""
+        with self._lock:
+            return [span for span in self._spans if span.trace_id == trace_id]
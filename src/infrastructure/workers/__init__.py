@@ -0,0 +1 @@
+from src.infrastructure.workers.operation_worker import OperationWorker, apply_operations
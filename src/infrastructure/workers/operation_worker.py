@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime, UTC
+from decimal import Decimal
+from typing import Iterable
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.domain.operation_status import OperationStatus
+from src.application.domain.operation_type import Operation
+from src.infrastructure.database.balance import apply_balance_delta, with_wallet_lock
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.infrastructure.database.notify import notify_balance_changed
+from src.infrastructure.database.stats import apply_stats_delta
+from src.infrastructure.logger import Logger
+
+
+def apply_operations(balance: Decimal, operations: Iterable[WalletOperation], processed_at: datetime) -> Decimal:
+    """
+    Apply queued operations of one wallet in order.
+
+    Mirrors WalletRepository.deposit/withdraw semantics: a withdrawal that
+    exceeds the current balance fails and leaves the balance untouched.
+
+    Args:
+        balance: Balance before the first operation
+        operations: Operations of a single wallet in acceptance order
+        processed_at: Processing timestamp to record on each operation
+
+    Returns:
+        Decimal: Balance after all operations
+    """
+    for operation in operations:
+        operation.processed_at = processed_at
+
+        if operation.operation_type == Operation.WITHDRAW.value and balance < operation.amount:
+            operation.status = OperationStatus.FAILED.value
+            operation.error_code = 'INSUFFICIENT_FUNDS'
+            continue
+
+        if operation.operation_type == Operation.DEPOSIT.value:
+            balance += operation.amount
+        else:
+            balance -= operation.amount
+
+        operation.status = OperationStatus.APPLIED.value
+        operation.balance_after = balance
+
+    return balance
+
+
+class OperationWorker:
+    """
+    Drains the wallet operation queue in batches.
+
+    Each batch claims pending operations with FOR UPDATE SKIP LOCKED, so
+    several workers can run side by side. Operations are grouped by wallet,
+    wallets are locked in sorted ID order to avoid deadlocks, and the whole
+    batch is committed in one transaction. Each wallet is applied in its own
+    savepoint: if the database rejects it, only that wallet's operations
+    fail, so one bad row cannot stall the queue. Ordering is guaranteed per wallet
+    within a batch; across concurrent workers it is best effort.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        logger: Logger,
+        batch_size: int,
+        poll_interval: float
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            session_maker: Factory for database sessions
+            logger: Logger instance
+            batch_size: Maximum number of operations claimed per batch
+            poll_interval: Seconds to sleep when the queue is empty
+        """
+        self._session_maker = session_maker
+        self._logger = logger.bind(component='operation_worker')
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+
+    async def run(self, stop: asyncio.Event):
+        """
+        Process batches until stop is set.
+
+        Args:
+            stop: Event that ends the loop once set
+        """
+        self._logger.info('Operation worker started')
+        while not stop.is_set():
+            try:
+                processed = await self.process_batch()
+            except Exception as e:
+                self._logger.error('Operation batch failed: %s', e)
+                processed = 0
+
+            if processed < self._batch_size:
+                try:
+                    await asyncio.wait_for(stop.wait(), self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        self._logger.info('Operation worker stopped')
+
+    async def process_batch(self) -> int:
+        """
+        Claim and apply one batch of pending operations.
+
+        Returns:
+            int: Number of operations processed
+        """
+        async with self._session_maker() as session:
+            query = (
+                select(WalletOperation)
+                .where(WalletOperation.status == OperationStatus.PENDING.value)
+                .order_by(WalletOperation.created_at)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            operations = (await session.execute(query)).scalars().all()
+            if not operations:
+                return 0
+
+            by_wallet: dict[UUID, list[WalletOperation]] = {}
+            for operation in operations:
+                by_wallet.setdefault(operation.wallet_id, []).append(operation)
+
+            wallets_query = with_wallet_lock(
+                select(Wallet)
+                .where(Wallet.id.in_(by_wallet))
+                .order_by(Wallet.id)
+            )
+            wallets = {wallet.id: wallet for wallet in (await session.execute(wallets_query)).scalars()}
+
+            processed_at = datetime.now(UTC)
+            applied = 0
+            balance_delta = Decimal('0.00')
+            for wallet_id, wallet_operations in by_wallet.items():
+                wallet = wallets.get(wallet_id)
+                if wallet is None:
+                    for operation in wallet_operations:
+                        operation.status = OperationStatus.FAILED.value
+                        operation.error_code = 'WALLET_NOT_FOUND'
+                        operation.processed_at = processed_at
+                    continue
+
+                try:
+                    # A row the database rejects (e.g. a balance overflow) fails its wallet, not the batch
+                    async with session.begin_nested():
+                        balance = apply_operations(wallet.balance, wallet_operations, processed_at)
+                        delta = balance - wallet.balance
+                        if delta:
+                            apply_balance_delta(wallet, delta)
+                            await session.flush()
+                            await notify_balance_changed(session, wallet)
+                except Exception as e:
+                    self._logger.error('Operations of wallet %s failed: %s', wallet_id, e)
+                    for operation in wallet_operations:
+                        operation.status = OperationStatus.FAILED.value
+                        operation.error_code = 'PROCESSING_FAILED'
+                        operation.balance_after = None
+                        operation.processed_at = processed_at
+                    continue
+                balance_delta += delta
+                applied += sum(1 for operation in wallet_operations if operation.status == OperationStatus.APPLIED.value)
+
+            # Totals only need the sum, so the whole batch costs one stripe update
+            await apply_stats_delta(session, next(iter(by_wallet)), 0, balance_delta)
+
+            await session.commit()
+
+        self._logger.info(
+            'Processed operation batch',
+            operations=len(operations),
+            wallets=len(by_wallet),
+            applied=applied
+        )
+        return len(operations)
@@ -1,18 +1,40 @@
+import asyncio
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
-from fastapi import FastAPI, Depends, HTTPException, APIRouter, status
-from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi import FastAPI, Depends, APIRouter, status
+from fastapi.responses import JSONResponse
+from fastapi.security import HTTPBasicCredentials
+from src.infrastructure.database.database import engine
+from src.infrastructure.database.health import health_probe
+from src.infrastructure.database.repositories import shards, wallet_repository
+from src.infrastructure.database.warmup import warm_up_pool
 from src.infrastructure.logger import logger
+from src.infrastructure.memory import InMemoryWalletRepository
+from src.infrastructure.membership import wallet_id_filter
+from src.infrastructure.notifications import notification_listener
+from src.infrastructure.profiling import profile_store
+from src.infrastructure.sharding import shard_map_store
+from src.infrastructure.sharding.engines import dispose_shards
+from src.presentation.middleware.admission_control import AdmissionControlMiddleware, admission_controller
+from src.presentation.middleware.profiling import ProfilingMiddleware
 from src.presentation.middleware.trace_id import TraceIDMiddleware
+from src.presentation.routing.admin_router import admin_router
+from src.presentation.security import verify_credentials
 from src.presentation.routing.wallet_router import wallets_router
+from src.presentation.routing.stats_router import stats_router
 from src.presentation.exception_handlers import (
     wallet_not_found_handler,
     insufficient_funds_handler,
     invalid_amount_handler,
     invalid_wallet_id_handler,
     database_error_handler,
-    wallet_error_handler
+    wallet_error_handler,
+    operation_not_found_handler,
+    invalid_operation_id_handler,
+    operation_queue_unavailable_handler,
+    invalid_cursor_handler,
+    circuit_open_handler
 )
 from src.application.exceptions import (
     WalletNotFoundError,
@@ -20,20 +42,78 @@ from src.application.exceptions import (
     InvalidAmountError,
     InvalidWalletIdError,
     DatabaseError,
-    WalletError
+    WalletError,
+    OperationNotFoundError,
+    InvalidOperationIdError,
+    OperationQueueUnavailableError,
+    InvalidCursorError,
+    CircuitOpenError
 )
 from src.settings import settings
 
 
+async def warm_up(application: FastAPI):
+    """
+    Pay first-request costs before the worker reports ready.
+
+    Builds the OpenAPI schema and opens and prepares pool connections.
+    A failed or timed out pool warm-up is logged and does not block readiness.
+    """
+    started = time.perf_counter()
+    application.openapi()
+    try:
+        connections = await asyncio.wait_for(
+            warm_up_pool(engine, settings.DATABASE_WARMUP_CONNECTIONS),
+            settings.DATABASE_WARMUP_TIMEOUT
+        )
+        logger.info('Warm-up finished in %.3fs, connections: %s', time.perf_counter() - started, connections)
+    except Exception as e:
+        logger.error('Connection pool warm-up failed: %r', e)
+    application.state.ready = True
+
+
 @asynccontextmanager
 async def lifespan(_application: FastAPI) -> AsyncGenerator:
     """
     Application lifespan manager.
 
     Handles application startup and shutdown events with proper logging.
+    Warm-up runs in the background; /ready reports 503 until it finishes.
+    The database health probe runs for the lifetime of the worker, and so
+    does the shard map refresh with sharded storage.
     """
+    _application.state.ready = False
+    memory_store = wallet_repository if isinstance(wallet_repository, InMemoryWalletRepository) else None
+    if memory_store is not None:
+        await memory_store.start()
+    await notification_listener.start()
+    warm_up_task = asyncio.create_task(warm_up(_application))
+    stop_background = asyncio.Event()
+    background_tasks = [asyncio.create_task(
+        health_probe.run(stop_background, settings.HEALTH_PROBE_INTERVAL_SECONDS)
+    )]
+    if memory_store is not None:
+        background_tasks.append(asyncio.create_task(
+            memory_store.run_snapshots(stop_background, settings.MEMORY_STORE_SNAPSHOT_SECONDS)
+        ))
+    elif settings.WALLET_STORAGE == 'sharded':
+        background_tasks.append(asyncio.create_task(
+            shard_map_store.run(stop_background, settings.SHARD_MAP_REFRESH_SECONDS)
+        ))
+    elif settings.WALLET_FILTER_ENABLED:
+        # Start listening before the scan so creations during the build are not missed
+        background_tasks.append(asyncio.create_task(
+            wallet_id_filter.run(stop_background, settings.WALLET_FILTER_REBUILD_SECONDS)
+        ))
     logger.info('API Started')
     yield
+    warm_up_task.cancel()
+    stop_background.set()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await notification_listener.stop()
+    if memory_store is not None:
+        await memory_store.close()
+    await dispose_shards(shards)
     logger.info('API Stopped')
 
 
@@ -50,39 +130,42 @@ app: FastAPI = FastAPI(
     }
 )
 
-# Initialize HTTP Basic authentication
-security = HTTPBasic(description='Basic Authentication for AndNowIT API')
-
-# Function to verify user credentials
-async def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)):
-    """
-    Validate user credentials for API documentation access.
-
-    Args:
-        credentials: HTTP Basic authentication credentials
-
-    Raises:
-        HTTPException: If credentials are invalid
-    """
-    correct_username = settings.DOCS_USERNAME  # Username
-    correct_password = settings.DOCS_PASSWORD  # Password hash
-
-    if credentials.username != correct_username or not credentials.password == correct_password:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Incorrect username or password')
+app.state.ready = False
 
 app_router = APIRouter(prefix='/api/v1')
 app_router.include_router(wallets_router)
+app_router.include_router(stats_router)
 
 app.include_router(app_router)
+app.include_router(admin_router)
 
 # Added middleware
 app.add_middleware(TraceIDMiddleware, logger=logger)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        logger=logger,
+        interval=settings.PROFILING_INTERVAL_MS / 1000
+    )
+if settings.ADMISSION_CONTROL_ENABLED:
+    # Added last so it runs first and sheds load before any other work
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=admission_controller,
+        retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS
+    )
 
 # Register exception handlers
 app.add_exception_handler(WalletNotFoundError, wallet_not_found_handler)
 app.add_exception_handler(InsufficientFundsError, insufficient_funds_handler)
 app.add_exception_handler(InvalidAmountError, invalid_amount_handler)
 app.add_exception_handler(InvalidWalletIdError, invalid_wallet_id_handler)
+app.add_exception_handler(OperationNotFoundError, operation_not_found_handler)
+app.add_exception_handler(InvalidOperationIdError, invalid_operation_id_handler)
+app.add_exception_handler(OperationQueueUnavailableError, operation_queue_unavailable_handler)
+app.add_exception_handler(InvalidCursorError, invalid_cursor_handler)
+app.add_exception_handler(CircuitOpenError, circuit_open_handler)
 app.add_exception_handler(DatabaseError, database_error_handler)
 app.add_exception_handler(WalletError, wallet_error_handler)
 
@@ -94,6 +177,9 @@ async def custom_swagger_ui_html(_credentials: HTTPBasicCredentials = Depends(ve
     Returns:
         HTMLResponse: Swagger UI interface
     """
+    # Docs-only import, kept off the worker import path
+    from fastapi.openapi.docs import get_swagger_ui_html
+
     return get_swagger_ui_html(
         openapi_url=getattr(app, 'openapi_url', '/openapi.json'),
         title=getattr(app, 'title', 'FastAPI') + ' - Swagger UI',
@@ -110,6 +196,8 @@ async def custom_redoc_html(_credentials: HTTPBasicCredentials = Depends(verify_
     Returns:
         HTMLResponse: ReDoc interface
     """
+    from fastapi.openapi.docs import get_redoc_html
+
     return get_redoc_html(
         openapi_url=getattr(app, 'openapi_url', '/openapi.json'),
         title=getattr(app, 'title', 'FastAPI') + ' - ReDoc',
@@ -125,3 +213,39 @@ async def ping():
         dict: Simple health status response
     """
     return {'message': 'pong', 'status': 'ok'}
+
+@app.get('/health')
+async def health():
+    """
+    Health endpoint with the database status.
+
+    Served from the last background probe, so health checks never reach
+    the database themselves.
+
+    Returns:
+        dict: Health status with the probe result and circuit breaker state
+    """
+    database = health_probe.stats()
+    if not database['healthy']:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={'status': 'unavailable', 'database': database}
+        )
+    return {'status': 'ok', 'database': database}
+
+@app.get('/ready')
+async def ready():
+    """
+    Readiness endpoint.
+
+    Returns 503 until startup warm-up has finished, and while the last
+    database probe failed unless wallets are kept in memory.
+
+    Returns:
+        dict: Readiness status response
+    """
+    if not app.state.ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={'status': 'warming_up'})
+    if settings.WALLET_STORAGE != 'memory' and not health_probe.healthy:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={'status': 'database_unavailable'})
+    return {'status': 'ready'}
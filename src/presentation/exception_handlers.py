@@ -6,8 +6,14 @@ from src.application.exceptions import (
     InvalidAmountError,
     InvalidWalletIdError,
     DatabaseError,
-    WalletError
+    WalletError,
+    OperationNotFoundError,
+    InvalidOperationIdError,
+    OperationQueueUnavailableError,
+    InvalidCursorError,
+    CircuitOpenError
 )
+from src.infrastructure.logger.request_event import add_event_fields
 
 
 async def wallet_not_found_handler(_request: Request, exc: WalletNotFoundError):
@@ -54,6 +60,63 @@ async def invalid_wallet_id_handler(_request: Request, exc: InvalidWalletIdError
     )
 
 
+async def operation_not_found_handler(_request: Request, exc: OperationNotFoundError):
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={
+            'detail': str(exc),
+            'error_code': 'OPERATION_NOT_FOUND',
+            'error_type': 'not_found'
+        }
+    )
+
+
+async def invalid_operation_id_handler(_request: Request, exc: InvalidOperationIdError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            'detail': str(exc),
+            'error_code': 'INVALID_OPERATION_ID',
+            'error_type': 'validation_error'
+        }
+    )
+
+
+async def operation_queue_unavailable_handler(_request: Request, exc: OperationQueueUnavailableError):
+    return JSONResponse(
+        status_code=status.HTTP_501_NOT_IMPLEMENTED,
+        content={
+            'detail': str(exc),
+            'error_code': 'OPERATION_QUEUE_UNAVAILABLE',
+            'error_type': 'server_error'
+        }
+    )
+
+
+async def invalid_cursor_handler(_request: Request, exc: InvalidCursorError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={
+            'detail': str(exc),
+            'error_code': 'INVALID_CURSOR',
+            'error_type': 'validation_error'
+        }
+    )
+
+
+async def circuit_open_handler(_request: Request, exc: CircuitOpenError):
+    add_event_fields(error_code='DATABASE_UNAVAILABLE', error=str(exc))
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={'Retry-After': str(exc.retry_after)},
+        content={
+            'detail': str(exc),
+            'error_code': 'DATABASE_UNAVAILABLE',
+            'error_type': 'server_error'
+        }
+    )
+
+
 async def database_error_handler(_request: Request, exc: DatabaseError):
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
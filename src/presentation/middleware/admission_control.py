@@ -0,0 +1,188 @@
+import re
+import time
+from typing import Callable, Optional
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from src.infrastructure.database.pool import pool_metrics
+from src.settings import settings
+
+
+class AdmissionController:
+    """
+    Adaptive in-flight limiter for DB-bound requests of one worker.
+
+    The worker-wide limit follows AIMD: it grows by roughly one slot per
+    `limit` completed requests while latency and pool wait are healthy, and
+    is cut multiplicatively (at most once per adjustment interval) when
+    either exceeds its target. A separate fixed cap bounds concurrent
+    requests per wallet, since those serialize on the wallet row lock anyway.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        min_in_flight: int,
+        max_per_wallet: int,
+        target_latency: float,
+        target_pool_wait: float,
+        pool_wait: Callable[[], float],
+        decrease_factor: float = 0.9,
+        adjust_interval: float = 1.0,
+        alpha: float = 0.2
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_in_flight: Upper bound of the adaptive worker-wide limit
+            min_in_flight: Lower bound of the adaptive worker-wide limit
+            max_per_wallet: Maximum concurrent requests per wallet
+            target_latency: Request latency (seconds) above which the limit shrinks
+            target_pool_wait: Pool acquisition time (seconds) above which the limit shrinks
+            pool_wait: Callable returning the current average pool acquisition time
+            decrease_factor: Multiplier applied to the limit under pressure
+            adjust_interval: Minimum seconds between two decreases
+            alpha: Smoothing factor of the latency moving average
+        """
+        self._max_in_flight = max_in_flight
+        self._min_in_flight = min_in_flight
+        self._max_per_wallet = max_per_wallet
+        self._target_latency = target_latency
+        self._target_pool_wait = target_pool_wait
+        self._pool_wait = pool_wait
+        self._decrease_factor = decrease_factor
+        self._adjust_interval = adjust_interval
+        self._alpha = alpha
+
+        self.limit = float(max_in_flight)
+        self.in_flight = 0
+        self.latency_ewma = 0.0
+        self.admitted = 0
+        self.shed_overloaded = 0
+        self.shed_wallet_busy = 0
+        self._per_wallet: dict[str, int] = {}
+        self._last_decrease = 0.0
+
+    def try_acquire(self, wallet_id: Optional[str]) -> Optional[int]:
+        """
+        Try to admit a request.
+
+        Args:
+            wallet_id: Wallet the request operates on, if any
+
+        Returns:
+            Optional[int]: None if admitted, otherwise the HTTP status to reject with
+        """
+        if self.in_flight >= int(self.limit):
+            self.shed_overloaded += 1
+            return status.HTTP_503_SERVICE_UNAVAILABLE
+
+        if wallet_id is not None:
+            if self._per_wallet.get(wallet_id, 0) >= self._max_per_wallet:
+                self.shed_wallet_busy += 1
+                return status.HTTP_429_TOO_MANY_REQUESTS
+            self._per_wallet[wallet_id] = self._per_wallet.get(wallet_id, 0) + 1
+
+        self.in_flight += 1
+        self.admitted += 1
+        return None
+
+    def release(self, wallet_id: Optional[str], latency: float):
+        """
+        Release an admitted request and adapt the limit.
+
+        Args:
+            wallet_id: Wallet passed to try_acquire
+            latency: Request latency in seconds
+        """
+        self.in_flight -= 1
+        if wallet_id is not None:
+            remaining = self._per_wallet[wallet_id] - 1
+            if remaining:
+                self._per_wallet[wallet_id] = remaining
+            else:
+                del self._per_wallet[wallet_id]
+
+        self.latency_ewma += self._alpha * (latency - self.latency_ewma)
+
+        if self.latency_ewma > self._target_latency or self._pool_wait() > self._target_pool_wait:
+            now = time.monotonic()
+            if now - self._last_decrease >= self._adjust_interval:
+                self.limit = max(float(self._min_in_flight), self.limit * self._decrease_factor)
+                self._last_decrease = now
+        else:
+            self.limit = min(float(self._max_in_flight), self.limit + 1 / self.limit)
+
+    def stats(self) -> dict:
+        """Get current limit, load and shed counters."""
+        return {
+            'limit': int(self.limit),
+            'in_flight': self.in_flight,
+            'latency_ewma_ms': round(self.latency_ewma * 1000, 2),
+            'pool_wait_ms': round(self._pool_wait() * 1000, 2),
+            'admitted': self.admitted,
+            'shed_overloaded': self.shed_overloaded,
+            'shed_wallet_busy': self.shed_wallet_busy,
+        }
+
+
+class AdmissionControlMiddleware(BaseHTTPMiddleware):
+    """
+    Rejects DB-bound requests early when the worker is saturated.
+
+    Returns 503 when the worker-wide limit is reached and 429 when too many
+    requests target the same wallet, both with Retry-After.
+    """
+
+    _db_bound_path = re.compile(r'^/api/v1/wallets(?:/|$)')
+    _wallet_operation_path = re.compile(r'^/api/v1/wallets/([^/]+)/operation$')
+
+    def __init__(self, app, controller: AdmissionController, retry_after: int):
+        super().__init__(app)
+        self.controller = controller
+        self.retry_after = retry_after
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        # Long-lived streams hold no connection after the initial snapshot
+        if not self._db_bound_path.match(path) or path.endswith('/stream'):
+            return await call_next(request)
+
+        match = self._wallet_operation_path.match(path)
+        wallet_id = match.group(1).lower() if match else None
+
+        rejected = self.controller.try_acquire(wallet_id)
+        if rejected is not None:
+            return self._reject(rejected)
+
+        started = time.perf_counter()
+        try:
+            return await call_next(request)
+        finally:
+            self.controller.release(wallet_id, time.perf_counter() - started)
+
+    def _reject(self, status_code: int) -> JSONResponse:
+        if status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+            content = {
+                'detail': 'Too many concurrent operations on this wallet',
+                'error_code': 'WALLET_BUSY',
+                'error_type': 'rate_limited'
+            }
+        else:
+            content = {
+                'detail': 'Service is overloaded, retry later',
+                'error_code': 'OVERLOADED',
+                'error_type': 'server_error'
+            }
+        return JSONResponse(status_code=status_code, content=content, headers={'Retry-After': str(self.retry_after)})
+
+
+admission_controller = AdmissionController(
+    max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+    min_in_flight=settings.ADMISSION_MIN_IN_FLIGHT,
+    max_per_wallet=settings.ADMISSION_MAX_PER_WALLET,
+    target_latency=settings.ADMISSION_TARGET_LATENCY_MS / 1000,
+    target_pool_wait=settings.ADMISSION_TARGET_POOL_WAIT_MS / 1000,
+    pool_wait=lambda: pool_metrics.wait_ewma
+)
@@ -0,0 +1,89 @@
+import asyncio
+import re
+import threading
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.logger import Logger
+from src.infrastructure.profiling import (
+    ProfileArtifactStore,
+    StackSampler,
+    format_collapsed,
+    profile_marker_var,
+    task_marker_filter
+)
+from src.presentation.security import authorization_header_valid
+
+
+PROFILE_HEADER = b'x-profile'
+ARTIFACT_HEADER = b'x-profile-artifact'
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that carry an X-Profile header and admin credentials.
+
+    The stack of the event loop thread is sampled while one of the
+    request's tasks is running. The collapsed stacks are stored as an
+    artifact whose name is returned in the X-Profile-Artifact header and
+    can be downloaded from /admin/profiles/{name}.
+
+    Plain ASGI middleware: requests without the header only pay for a scan
+    of the header list.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileArtifactStore, logger: Logger, interval: float):
+        self.app = app
+        self.store = store
+        self.logger = logger
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        profile = False
+        authorization = None
+        trace_id = None
+        for name, value in scope['headers']:
+            if name == PROFILE_HEADER:
+                profile = True
+            elif name == b'authorization':
+                authorization = value.decode('latin-1')
+            elif name == b'x-trace-id':
+                trace_id = value.decode('latin-1')
+
+        if not profile or not authorization_header_valid(authorization):
+            await self.app(scope, receive, send)
+            return
+
+        await self._profile(scope, receive, send, trace_id)
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send, trace_id):
+        marker = object()
+        token = profile_marker_var.set(marker)
+        sampler = StackSampler(
+            thread_id=threading.get_ident(),
+            interval=self.interval,
+            should_sample=task_marker_filter(asyncio.get_running_loop(), marker)
+        )
+        suffix = re.sub(r'[^A-Za-z0-9._-]', '_', trace_id)[:64] if trace_id else 'request'
+        name = f'{int(time.time() * 1000)}-{suffix}'
+        artifact = f'{name}.collapsed'.encode()
+
+        async def send_with_artifact(message: Message):
+            if message['type'] == 'http.response.start':
+                # The artifact is written once the response is finished; its name is known up front
+                message = {**message, 'headers': [*message.get('headers', []), (ARTIFACT_HEADER, artifact)]}
+            await send(message)
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_artifact)
+        finally:
+            counts = sampler.stop()
+            profile_marker_var.reset(token)
+            try:
+                await self.store.save(name, format_collapsed(counts))
+            except (OSError, ValueError) as e:
+                self.logger.error('Saving request profile failed: %s', e)
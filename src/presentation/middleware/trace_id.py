@@ -1,11 +1,20 @@
+import time
 import uuid
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from src.infrastructure.logger import Logger
+from src.infrastructure.logger.log_levels import LogLevel
+from src.infrastructure.logger.request_event import start_request_event, finish_request_event
+from src.infrastructure.tracing import tracer
 from src.settings import settings
 
 
 class TraceIDMiddleware(BaseHTTPMiddleware):
+    """
+    Sets the trace ID for the request and emits one wide structured event
+    per request with everything the handler, service and repository attached.
+    """
+
     def __init__(self, app, logger: Logger):
         super().__init__(app)
         self.logger = logger
@@ -22,10 +31,29 @@ class TraceIDMiddleware(BaseHTTPMiddleware):
 
         self.logger.set_trace_id(x_trace_id)
 
-        self.logger.debug(f'Request started: {request.method} {request.url} - TraceID: {x_trace_id}')
-
-        response = await call_next(request)
-
-        self.logger.debug(f'Request finished: {request.method} {request.url} - TraceID: {x_trace_id} - Status: {response.status_code}')
-
-        return response
+        token = start_request_event(method=request.method, path=request.url.path)
+        started = time.perf_counter()
+        status_code = 500
+        try:
+            with tracer.trace('http.request', **{'http.method': request.method, 'http.target': request.url.path}) as span:
+                if span is not None:
+                    self.logger.add_event_fields(trace_sampled=True)
+                response = await call_next(request)
+                status_code = response.status_code
+                if span is not None:
+                    span.set_attribute('http.status_code', status_code)
+            return response
+        except Exception as e:
+            self.logger.add_event_fields(error_type=type(e).__name__, error=str(e))
+            raise
+        finally:
+            event = finish_request_event(token)
+            event['status'] = status_code
+            event['duration_ms'] = round((time.perf_counter() - started) * 1000, 3)
+            if status_code >= 500:
+                level = LogLevel.ERROR
+            elif status_code >= 400:
+                level = LogLevel.WARNING
+            else:
+                level = LogLevel.INFO
+            self.logger.event('request', event, level=level)
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from src.infrastructure.database.database import async_session_maker
+from src.infrastructure.database.notify import publish_log_config
+from src.infrastructure.database.pool import pool_metrics
+from src.infrastructure.logger import get_logger, Logger
+from src.infrastructure.membership import get_wallet_id_filter, WalletIdFilter
+from src.infrastructure.profiling import get_profile_store, ProfileArtifactStore, StackSampler, format_collapsed
+from src.infrastructure.tracing import get_tracer, to_otlp, Tracer
+from src.presentation.middleware.admission_control import admission_controller
+from src.presentation.schemas.log_config import LogConfigSchema
+from src.presentation.security import verify_credentials
+from src.settings import settings
+
+
+admin_router = APIRouter(prefix='/admin', tags=['admin'], dependencies=[Depends(verify_credentials)])
+
+# One admin-triggered profile per worker at a time
+_profile_lock = asyncio.Lock()
+
+
+@admin_router.get(path='/admission', status_code=status.HTTP_200_OK)
+async def get_admission_stats():
+    """
+    Get admission control state of this worker.
+
+    Returns:
+        dict: Current limit, in-flight requests, latency/pool wait averages and shed counts
+    """
+    return {
+        **admission_controller.stats(),
+        'pool_acquisitions': pool_metrics.acquisitions,
+        'pool_timeouts': pool_metrics.timeouts,
+    }
+
+
+@admin_router.get(path='/wallet-filter', status_code=status.HTTP_200_OK)
+async def get_wallet_filter_stats(wallet_filter: WalletIdFilter = Depends(get_wallet_id_filter)):
+    """
+    Get the state of this worker's wallet ID filter.
+
+    Returns:
+        dict: Size, memory use, estimated and observed false-positive rates and miss counts
+    """
+    return wallet_filter.stats()
+
+
+@admin_router.get(path='/logging', status_code=status.HTTP_200_OK, response_model=LogConfigSchema)
+async def get_logging_config(logger: Logger = Depends(get_logger)):
+    """
+    Get the logging configuration of this worker.
+
+    Returns:
+        LogConfigSchema: Minimum level and sampling ratios
+    """
+    return LogConfigSchema(**logger.get_config())
+
+
+@admin_router.put(path='/logging', status_code=status.HTTP_200_OK, response_model=LogConfigSchema)
+async def update_logging_config(config: LogConfigSchema, logger: Logger = Depends(get_logger)):
+    """
+    Change the minimum level and sampling ratios on all workers.
+
+    The change is applied to this worker immediately and broadcast with
+    NOTIFY to every other worker, which apply it on receipt.
+
+    Args:
+        config: Fields to change; omitted fields are left as they are
+
+    Returns:
+        LogConfigSchema: The configuration now in effect on this worker
+
+    Raises:
+        HTTPException: If the configuration is invalid or cannot be broadcast
+    """
+    changes = config.model_dump(exclude_none=True)
+    try:
+        logger.configure(**changes)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        async with async_session_maker() as session:
+            await publish_log_config(session, changes)
+            await session.commit()
+    except Exception as e:
+        logger.error('Logging configuration broadcast failed: %s', e)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Configuration applied to this worker only; broadcast failed'
+        )
+
+    return LogConfigSchema(**logger.get_config())
+
+
+@admin_router.get(path='/traces/{trace_id}', status_code=status.HTTP_200_OK)
+async def get_trace(trace_id: str, tracer: Tracer = Depends(get_tracer)):
+    """
+    Get the recorded spans of a sampled trace from this worker's ring buffer.
+
+    Args:
+        trace_id: Value of the request's X-Trace-ID
+
+    Returns:
+        dict: Spans in OTLP/JSON format
+
+    Raises:
+        HTTPException: If no spans of the trace are buffered on this worker
+    """
+    spans = tracer.get_trace(trace_id)
+    if not spans:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Trace {trace_id} not found')
+    return to_otlp(spans, settings.TRACING_SERVICE_NAME)
+
+
+@admin_router.post(path='/profile', status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+async def run_profile(
+        seconds: float = Query(default=10.0, gt=0, le=settings.PROFILING_MAX_SECONDS),
+        interval_ms: float = Query(default=settings.PROFILING_INTERVAL_MS, ge=1.0, le=1000.0),
+        store: ProfileArtifactStore = Depends(get_profile_store),
+        logger: Logger = Depends(get_logger)
+):
+    """
+    Sample the event loop of this worker for the given number of seconds.
+
+    Args:
+        seconds: Profiling duration
+        interval_ms: Sampling interval in milliseconds
+
+    Returns:
+        PlainTextResponse: Aggregated collapsed stacks, also stored as an artifact
+            named in X-Profile-Artifact unless saving failed
+
+    Raises:
+        HTTPException: If a profile is already running on this worker
+    """
+    if _profile_lock.locked():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail='A profile is already running on this worker')
+
+    async with _profile_lock:
+        sampler = StackSampler(thread_id=threading.get_ident(), interval=interval_ms / 1000)
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            counts = sampler.stop()
+
+    content = format_collapsed(counts)
+    try:
+        filename = await store.save(f'{int(time.time() * 1000)}-admin', content)
+    except (OSError, ValueError) as e:
+        logger.error('Saving admin profile failed: %s', e)
+        return PlainTextResponse(content)
+    return PlainTextResponse(content, headers={'X-Profile-Artifact': filename})
+
+
+@admin_router.get(path='/profiles/{name}', status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
+async def get_profile(name: str, store: ProfileArtifactStore = Depends(get_profile_store)):
+    """
+    Download a stored profile artifact.
+
+    Args:
+        name: Artifact name from the X-Profile-Artifact header
+
+    Returns:
+        PlainTextResponse: Collapsed stacks
+
+    Raises:
+        HTTPException: If the artifact does not exist on this worker
+    """
+    content = store.read(name)
+    if content is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'Profile {name} not found')
+    return PlainTextResponse(content)
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, status, Depends, HTTPException
+from src.application.contracts import IStatsService
+from src.application.domain.wallet_totals import WalletTotals
+from src.application.exceptions import CircuitOpenError, DatabaseError
+from src.application.services import get_stats_service
+from src.infrastructure.logger import get_logger, Logger
+from src.infrastructure.tracing import tracer
+from src.presentation.schemas.stats import StatsSchema
+
+
+stats_router = APIRouter(prefix='/stats', tags=['stats'])
+
+
+@stats_router.get(path='', status_code=status.HTTP_200_OK, response_model=StatsSchema)
+@tracer.traced('stats.get_stats')
+async def get_stats(
+        logger: Logger = Depends(get_logger),
+        stats_service: IStatsService = Depends(get_stats_service)
+):
+    """
+    Get the number of wallets and the sum of their balances.
+
+    Answered from maintained aggregates in constant time, independent of
+    the number of wallets.
+
+    Returns:
+        StatsSchema: Wallet aggregates
+
+    Raises:
+        HTTPException: If the aggregates cannot be read
+    """
+    try:
+        totals: WalletTotals = await stats_service.get_totals()
+        return StatsSchema(wallet_count=totals.wallet_count, total_balance=totals.total_balance)
+
+    except CircuitOpenError:
+        # Answered with 503 and Retry-After by circuit_open_handler
+        raise
+    except DatabaseError as e:
+        logger.add_event_fields(error_code='DATABASE_ERROR', error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Database operation failed')
+    except Exception as e:
+        logger.add_event_fields(error_code='INTERNAL_ERROR', error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal server error')
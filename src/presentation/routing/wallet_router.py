@@ -1,17 +1,33 @@
+import uuid
+from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from fastapi import APIRouter, Path, status, Depends, HTTPException
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Path, status, Depends, HTTPException, Request
 from fastapi.params import Query
-from src.application.contracts import IWalletService
+from fastapi.responses import StreamingResponse, JSONResponse
+from src.application.contracts import IWalletService, IOperationService
 from src.application.domain.operation_type import Operation
-from src.application.services import get_wallet_service
+from src.application.domain.wallet_page import SortOrder, WalletCursor, WalletListQuery, WalletPage
+from src.application.services import get_wallet_service, get_operation_service
 from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.models.wallet_operation import WalletOperation
 from src.infrastructure.logger import get_logger, Logger
-from src.presentation.schemas.wallet import WalletSchema
+from src.infrastructure.notifications import get_balance_broadcaster, BalanceBroadcaster, BalanceSubscription
+from src.infrastructure.tracing import tracer
+from src.presentation.schemas.operation import OperationSchema
+from src.presentation.schemas.wallet import WalletListItemSchema, WalletPageSchema, WalletSchema
+from src.presentation.sse import format_sse, SSE_HEARTBEAT
+from src.settings import settings
 from src.application.exceptions import (
     WalletNotFoundError,
     InsufficientFundsError,
     InvalidAmountError,
     InvalidWalletIdError,
+    InvalidOperationIdError,
+    InvalidCursorError,
+    OperationNotFoundError,
+    OperationQueueUnavailableError,
+    CircuitOpenError,
     DatabaseError
 )
 
@@ -20,6 +36,7 @@ wallets_router = APIRouter(prefix='/wallets', tags=['wallets'])
 
 
 @wallets_router.post(path='/create', status_code=201, response_model=WalletSchema)
+@tracer.traced('wallets.create_wallet')
 async def create_wallet(
         logger: Logger = Depends(get_logger),
         wallet_service: IWalletService = Depends(get_wallet_service)
@@ -37,41 +54,64 @@ async def create_wallet(
     """
     try:
         wallet: Wallet = await wallet_service.create()
-        logger.info(f'Wallet created: {wallet.id}')
+        logger.add_event_fields(wallet_id=str(wallet.id))
         return WalletSchema(id=str(wallet.id), balance=wallet.balance)
 
+    except CircuitOpenError:
+        # Answered with 503 and Retry-After by circuit_open_handler
+        raise
+
     except DatabaseError as e:
-        logger.error(f'Database error during wallet creation: {e}')
+        logger.add_event_fields(error_code='DATABASE_ERROR', error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Database operation failed')
     except Exception as e:
-        logger.error(f'Unexpected error during wallet creation: {e}')
+        logger.add_event_fields(error_code='INTERNAL_ERROR', error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal server error')
 
 
-@wallets_router.post(path='/{wallet_id}/operation', status_code=status.HTTP_201_CREATED, response_model=WalletSchema)
+@wallets_router.post(
+    path='/{wallet_id}/operation',
+    status_code=status.HTTP_201_CREATED,
+    response_model=WalletSchema,
+    responses={status.HTTP_202_ACCEPTED: {'model': OperationSchema}}
+)
+@tracer.traced('wallets.wallet_operation')
 async def wallet_operation(
         wallet_id: str = Path(title='Wallet ID'),
         amount: str = Query(title='Amount', description='Amount as decimal string (e.g., "100.50")'),
         operation_type: Operation = Query(title='Operation'),
+        async_mode: bool = Query(
+            default=False,
+            alias='async',
+            title='Asynchronous mode',
+            description='Accept the operation into the queue and return 202 without waiting for the new balance'
+        ),
         logger: Logger = Depends(get_logger),
-        wallet_service: IWalletService = Depends(get_wallet_service)
+        wallet_service: IWalletService = Depends(get_wallet_service),
+        operation_service: IOperationService = Depends(get_operation_service)
 ):
     """
     Perform a wallet operation (deposit or withdraw).
 
-    Executes a deposit or withdrawal operation on the specified wallet.
+    Executes a deposit or withdrawal operation on the specified wallet. In
+    asynchronous mode the operation is only queued and applied later by the
+    operation worker; its outcome is available from the operation status
+    endpoint.
 
     Args:
         wallet_id: The wallet ID to perform the operation on
         amount: The amount for the operation as decimal string (must be positive)
         operation_type: The type of operation (DEPOSIT or WITHDRAW)
+        async_mode: Queue the operation instead of applying it synchronously
 
     Returns:
         WalletSchema: The updated wallet information
+        OperationSchema: The accepted operation (202, asynchronous mode)
 
     Raises:
         HTTPException: If the operation fails for any reason
     """
+    logger.add_event_fields(wallet_id=wallet_id, operation=operation_type.value, amount=amount, async_mode=async_mode)
     try:
         # Validate and convert amount string to Decimal
         try:
@@ -80,7 +120,15 @@ async def wallet_operation(
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Amount must be positive')
         except (InvalidOperation, ValueError):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid amount format')
-        
+
+        if async_mode:
+            operation: WalletOperation = await operation_service.enqueue(wallet_id, operation_type, amount_decimal)
+            logger.add_event_fields(operation_id=str(operation.id))
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content=_operation_schema(operation).model_dump(mode='json')
+            )
+
         if operation_type == Operation.DEPOSIT:
             wallet: Wallet = await wallet_service.deposit(wallet_id, amount_decimal)
         elif operation_type == Operation.WITHDRAW:
@@ -88,35 +136,203 @@ async def wallet_operation(
         else:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid operation type')
 
-        logger.info(f'Operation {operation_type.value} completed for wallet {wallet_id}')
+        logger.add_event_fields(balance_after=str(wallet.balance))
         return WalletSchema(id=str(wallet.id), balance=wallet.balance)
 
+    except HTTPException:
+        # Request validation errors raised above, before any service call
+        raise
+
     except InvalidWalletIdError as e:
-        logger.error(f'Invalid wallet ID: {e}')
+        logger.add_event_fields(error_code='INVALID_WALLET_ID', error=str(e))
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     except WalletNotFoundError as e:
-        logger.error(f'Wallet not found: {e}')
+        logger.add_event_fields(error_code='WALLET_NOT_FOUND', error=str(e))
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
     except InvalidAmountError as e:
-        logger.error(f'Invalid amount: {e}')
+        logger.add_event_fields(error_code='INVALID_AMOUNT', error=str(e))
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     except InsufficientFundsError as e:
-        logger.error(f'Insufficient funds: {e}')
+        logger.add_event_fields(error_code='INSUFFICIENT_FUNDS', error=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    except OperationQueueUnavailableError as e:
+        logger.add_event_fields(error_code='OPERATION_QUEUE_UNAVAILABLE', error=str(e))
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e))
+
+    except CircuitOpenError:
+        # Answered with 503 and Retry-After by circuit_open_handler
+        raise
+
+    except DatabaseError as e:
+        logger.add_event_fields(error_code='DATABASE_ERROR', error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Database operation failed')
+
+    except Exception as e:
+        logger.add_event_fields(error_code='INTERNAL_ERROR', error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal server error')
+
+
+@wallets_router.get(path='', status_code=status.HTTP_200_OK, response_model=WalletPageSchema)
+@tracer.traced('wallets.list_wallets')
+async def list_wallets(
+        limit: int = Query(default=50, ge=1, le=settings.WALLET_LIST_MAX_LIMIT, title='Page size'),
+        cursor: Optional[str] = Query(default=None, title='Cursor', description='next_cursor of the previous page'),
+        order: SortOrder = Query(default=SortOrder.ASC, title='Sort order', description='Order by creation date'),
+        min_balance: Optional[str] = Query(default=None, title='Minimum balance', description='Inclusive, decimal string'),
+        max_balance: Optional[str] = Query(default=None, title='Maximum balance', description='Inclusive, decimal string'),
+        created_from: Optional[datetime] = Query(default=None, title='Created from', description='Inclusive'),
+        created_to: Optional[datetime] = Query(default=None, title='Created to', description='Exclusive'),
+        nonzero: bool = Query(default=False, title='Non-zero only', description='Only wallets with a non-zero balance'),
+        logger: Logger = Depends(get_logger),
+        wallet_service: IWalletService = Depends(get_wallet_service)
+):
+    """
+    List wallets with keyset pagination.
+
+    Wallets are ordered by creation date and ID. Each page carries an
+    opaque cursor of its last wallet; passing it back returns the next
+    page, so deep pages cost the same as the first one.
+
+    Args:
+        limit: Maximum number of wallets on the page
+        cursor: Cursor returned with the previous page
+        order: Ascending or descending creation date
+        min_balance: Lowest balance included
+        max_balance: Highest balance included
+        created_from: Earliest creation date included
+        created_to: Creation date before which wallets are included
+        nonzero: Only wallets with a non-zero balance
+
+    Returns:
+        WalletPageSchema: The wallets and the cursor of the next page
+
+    Raises:
+        HTTPException: If a parameter is invalid or the listing fails
+    """
+    logger.add_event_fields(limit=limit, order=order.value, paginated=cursor is not None)
+    try:
+        query = WalletListQuery(
+            limit=limit,
+            cursor=WalletCursor.decode(cursor) if cursor is not None else None,
+            order=order,
+            min_balance=_parse_balance(min_balance),
+            max_balance=_parse_balance(max_balance),
+            created_from=_require_timezone(created_from),
+            created_to=_require_timezone(created_to),
+            nonzero=nonzero
+        )
+        page: WalletPage = await wallet_service.list_wallets(query)
+        logger.add_event_fields(wallet_count=len(page.items))
+        return WalletPageSchema(
+            items=[
+                WalletListItemSchema(id=str(wallet.id), balance=wallet.balance, created_at=wallet.created_at)
+                for wallet in page.items
+            ],
+            next_cursor=page.next_cursor
+        )
+
+    except HTTPException:
+        raise
+
+    except InvalidCursorError as e:
+        logger.add_event_fields(error_code='INVALID_CURSOR', error=str(e))
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    except CircuitOpenError:
+        # Answered with 503 and Retry-After by circuit_open_handler
+        raise
+
     except DatabaseError as e:
-        logger.error(f'Database error: {e}')
+        logger.add_event_fields(error_code='DATABASE_ERROR', error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Database operation failed')
 
     except Exception as e:
-        logger.error(f'Unexpected error: {e}')
+        logger.add_event_fields(error_code='INTERNAL_ERROR', error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal server error')
 
 
+def _parse_balance(value: Optional[str]) -> Optional[Decimal]:
+    if value is None:
+        return None
+    try:
+        balance = Decimal(value)
+    except InvalidOperation:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid balance format')
+    if not balance.is_finite():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Invalid balance format')
+    return balance
+
+
+def _require_timezone(value: Optional[datetime]) -> Optional[datetime]:
+    # created_at is timestamptz; a naive bound would be compared in the server's time zone
+    if value is not None and value.tzinfo is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Dates must include a time zone')
+    return value
+
+
+@wallets_router.get(path='/operations/{operation_id}', status_code=status.HTTP_200_OK, response_model=OperationSchema)
+@tracer.traced('wallets.get_operation')
+async def get_operation(
+        operation_id: str = Path(title='Operation ID'),
+        logger: Logger = Depends(get_logger),
+        operation_service: IOperationService = Depends(get_operation_service)
+):
+    """
+    Get the status of an asynchronously accepted operation.
+
+    Args:
+        operation_id: The operation ID returned with 202 Accepted
+
+    Returns:
+        OperationSchema: The operation and its processing status
+
+    Raises:
+        HTTPException: If the operation is not found or other errors occur
+    """
+    logger.add_event_fields(operation_id=operation_id)
+    try:
+        operation: WalletOperation = await operation_service.get_operation(operation_id=operation_id)
+        return _operation_schema(operation)
+
+    except InvalidOperationIdError as e:
+        logger.add_event_fields(error_code='INVALID_OPERATION_ID', error=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    except OperationNotFoundError as e:
+        logger.add_event_fields(error_code='OPERATION_NOT_FOUND', error=str(e))
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    except CircuitOpenError:
+        # Answered with 503 and Retry-After by circuit_open_handler
+        raise
+
+    except DatabaseError as e:
+        logger.add_event_fields(error_code='DATABASE_ERROR', error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Database operation failed')
+
+    except Exception as e:
+        logger.add_event_fields(error_code='INTERNAL_ERROR', error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal server error')
+
+
+def _operation_schema(operation: WalletOperation) -> OperationSchema:
+    return OperationSchema(
+        id=str(operation.id),
+        wallet_id=str(operation.wallet_id),
+        operation_type=operation.operation_type,
+        amount=operation.amount,
+        status=operation.status,
+        balance_after=operation.balance_after,
+        error_code=operation.error_code
+    )
+
+
 @wallets_router.get(path='/{wallet_id}', status_code=status.HTTP_200_OK, response_model=WalletSchema)
+@tracer.traced('wallets.get_wallet')
 async def get_wallet(
         wallet_id: str = Path(title='Wallet ID'),
         logger: Logger = Depends(get_logger),
@@ -136,23 +352,143 @@ async def get_wallet(
     Raises:
         HTTPException: If the wallet is not found or other errors occur
     """
+    logger.add_event_fields(wallet_id=wallet_id)
     try:
         wallet: Wallet = await wallet_service.get_wallet(wallet_id=wallet_id)
-        logger.info(f'Wallet retrieved: {wallet.id}')
         return WalletSchema(id=str(wallet.id), balance=wallet.balance)
 
     except InvalidWalletIdError as e:
-        logger.error(f'Invalid wallet ID: {e}')
+        logger.add_event_fields(error_code='INVALID_WALLET_ID', error=str(e))
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     except WalletNotFoundError as e:
-        logger.error(f'Wallet not found: {e}')
+        logger.add_event_fields(error_code='WALLET_NOT_FOUND', error=str(e))
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+    except CircuitOpenError:
+        # Answered with 503 and Retry-After by circuit_open_handler
+        raise
+
     except DatabaseError as e:
-        logger.error(f'Database error: {e}')
+        logger.add_event_fields(error_code='DATABASE_ERROR', error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Database operation failed')
 
     except Exception as e:
-        logger.error(f'Unexpected error: {e}')
+        logger.add_event_fields(error_code='INTERNAL_ERROR', error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal server error')
+
+
+@wallets_router.get(path='/{wallet_id}/stream', status_code=status.HTTP_200_OK, response_class=StreamingResponse)
+async def stream_wallet_balance(
+        request: Request,
+        wallet_id: str = Path(title='Wallet ID'),
+        logger: Logger = Depends(get_logger),
+        wallet_service: IWalletService = Depends(get_wallet_service),
+        broadcaster: BalanceBroadcaster = Depends(get_balance_broadcaster)
+):
+    """
+    Stream balance changes of a wallet as server-sent events.
+
+    Sends the current balance first, then a `balance` event after every
+    committed deposit or withdrawal. Slow consumers receive an `evicted`
+    event and are disconnected; if the balance cannot be re-read after
+    missed notifications, an `error` event ends the stream.
+
+    Args:
+        wallet_id: The wallet ID to subscribe to
+
+    Returns:
+        StreamingResponse: text/event-stream of balance events
+
+    Raises:
+        HTTPException: If the stream is disabled or unsupported, the wallet is not found or other errors occur
+    """
+    logger.add_event_fields(wallet_id=wallet_id)
+    if not settings.BALANCE_STREAM_ENABLED:
+        logger.add_event_fields(error_code='BALANCE_STREAM_DISABLED')
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail='Balance stream is disabled')
+    if settings.WALLET_STORAGE == 'sharded':
+        # Balances are only notified on the main database's LISTEN connection
+        logger.add_event_fields(error_code='BALANCE_STREAM_UNAVAILABLE')
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail='Balance stream is not supported for sharded wallet storage'
+        )
+
+    try:
+        wallet_uuid = uuid.UUID(wallet_id)
+    except ValueError:
+        logger.add_event_fields(error_code='INVALID_WALLET_ID')
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f'Invalid wallet ID format: {wallet_id}')
+
+    # Subscribe before reading the snapshot so no change can slip in between
+    subscription = broadcaster.subscribe(str(wallet_uuid))
+    try:
+        wallet: Wallet = await wallet_service.get_wallet(wallet_id=wallet_id)
+
+    except WalletNotFoundError as e:
+        broadcaster.unsubscribe(subscription)
+        logger.add_event_fields(error_code='WALLET_NOT_FOUND', error=str(e))
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    except CircuitOpenError:
+        broadcaster.unsubscribe(subscription)
+        # Answered with 503 and Retry-After by circuit_open_handler
+        raise
+
+    except Exception as e:
+        broadcaster.unsubscribe(subscription)
+        logger.add_event_fields(error_code='INTERNAL_ERROR', error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Internal server error')
+
+    return StreamingResponse(
+        _balance_event_stream(request, wallet, subscription, broadcaster, wallet_service, logger),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def _stream_error_code(error: Exception) -> str:
+    if isinstance(error, WalletNotFoundError):
+        return 'WALLET_NOT_FOUND'
+    if isinstance(error, CircuitOpenError):
+        return 'DATABASE_UNAVAILABLE'
+    if isinstance(error, DatabaseError):
+        return 'DATABASE_ERROR'
+    return 'INTERNAL_ERROR'
+
+
+async def _balance_event_stream(
+        request: Request,
+        wallet: Wallet,
+        subscription: BalanceSubscription,
+        broadcaster: BalanceBroadcaster,
+        wallet_service: IWalletService,
+        logger: Logger
+) -> AsyncIterator[str]:
+    try:
+        yield format_sse('balance', {'id': str(wallet.id), 'balance': str(wallet.balance)})
+
+        while True:
+            event = await subscription.get(timeout=settings.BALANCE_STREAM_HEARTBEAT_SECONDS)
+            if await request.is_disconnected():
+                break
+
+            if event is None:
+                yield SSE_HEARTBEAT
+            elif event.evicted:
+                yield format_sse('evicted', {'id': event.wallet_id})
+                break
+            elif event.resync:
+                try:
+                    wallet = await wallet_service.get_wallet(wallet_id=event.wallet_id)
+                except Exception as e:
+                    # The response has started: report the failure in-band and let the client reconnect
+                    logger.warning('Balance stream resync failed: %s', e, wallet_id=event.wallet_id)
+                    yield format_sse('error', {'id': event.wallet_id, 'error_code': _stream_error_code(e)})
+                    break
+                yield format_sse('balance', {'id': str(wallet.id), 'balance': str(wallet.balance)})
+            else:
+                yield format_sse('balance', {'id': event.wallet_id, 'balance': event.balance})
+    finally:
+        broadcaster.unsubscribe(subscription)
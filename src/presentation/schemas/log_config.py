@@ -0,0 +1,14 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class LogConfigSchema(BaseModel):
+    """
+    Pydantic schema for the runtime logging configuration.
+
+    Attributes:
+        min_level: Minimum level name (DEBUG, INFO, WARNING, ERROR, CRITICAL, EXCEPTION)
+        sample_rates: Fraction of records kept per level name, between 0 and 1
+    """
+    min_level: Optional[str] = None
+    sample_rates: Optional[dict[str, float]] = None
@@ -0,0 +1,34 @@
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, field_serializer
+
+
+class OperationSchema(BaseModel):
+    """
+    Pydantic schema for asynchronously processed wallet operations.
+
+    Attributes:
+        id: Unique identifier for the operation
+        wallet_id: Target wallet ID
+        operation_type: Operation type (deposit or withdraw)
+        amount: Operation amount
+        status: Processing status (pending, applied or failed)
+        balance_after: Wallet balance after the operation was applied
+        error_code: Error code of a failed operation
+    """
+    id: str
+    wallet_id: str
+    operation_type: str
+    amount: Decimal
+    status: str
+    balance_after: Optional[Decimal] = None
+    error_code: Optional[str] = None
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True
+    )
+
+    @field_serializer('amount', 'balance_after')
+    def serialize_decimal(self, value: Optional[Decimal]) -> Optional[str]:
+        """Serialize Decimal amounts to string."""
+        return None if value is None else str(value)
@@ -0,0 +1,23 @@
+from decimal import Decimal
+from pydantic import BaseModel, ConfigDict, field_serializer
+
+
+class StatsSchema(BaseModel):
+    """
+    Pydantic schema for wallet aggregates.
+
+    Attributes:
+        wallet_count: Number of wallets
+        total_balance: Sum of all wallet balances
+    """
+    wallet_count: int
+    total_balance: Decimal
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True
+    )
+
+    @field_serializer('total_balance')
+    def serialize_total_balance(self, value: Decimal) -> str:
+        """Serialize Decimal total balance to string."""
+        return str(value)
@@ -1,4 +1,6 @@
+from datetime import datetime
 from decimal import Decimal
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, field_serializer
 
 
@@ -21,3 +23,25 @@ class WalletSchema(BaseModel):
     def serialize_balance(self, value: Decimal) -> str:
         """Serialize Decimal balance to string."""
         return str(value)
+
+
+class WalletListItemSchema(WalletSchema):
+    """
+    Pydantic schema for a wallet in a listing.
+
+    Attributes:
+        created_at: Timestamp when the wallet was created
+    """
+    created_at: datetime
+
+
+class WalletPageSchema(BaseModel):
+    """
+    Pydantic schema for one page of the wallet listing.
+
+    Attributes:
+        items: Wallets in listing order
+        next_cursor: Cursor to pass for the following page, null on the last page
+    """
+    items: List[WalletListItemSchema]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,55 @@
+import base64
+import binascii
+import secrets
+from typing import Optional
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from src.settings import settings
+
+
+# Initialize HTTP Basic authentication
+security = HTTPBasic(description='Basic Authentication for AndNowIT API')
+
+
+def credentials_match(username: str, password: str) -> bool:
+    """Compare credentials with the configured ones in constant time."""
+    username_ok = secrets.compare_digest(username.encode('utf-8'), settings.DOCS_USERNAME.encode('utf-8'))
+    password_ok = secrets.compare_digest(password.encode('utf-8'), settings.DOCS_PASSWORD.encode('utf-8'))
+    return username_ok and password_ok
+
+
+def authorization_header_valid(authorization: Optional[str]) -> bool:
+    """
+    Check a raw 'Authorization: Basic ...' header value, for code running outside FastAPI dependencies.
+
+    Args:
+        authorization: Header value or None
+
+    Returns:
+        bool: True if it carries the configured credentials
+    """
+    if not authorization:
+        return False
+    scheme, _, encoded = authorization.partition(' ')
+    if scheme.lower() != 'basic':
+        return False
+    try:
+        username, separator, password = base64.b64decode(encoded).decode('utf-8').partition(':')
+    except (binascii.Error, UnicodeDecodeError):
+        return False
+    return bool(separator) and credentials_match(username, password)
+
+
+# Function to verify user credentials
+async def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)):
+    """
+    Validate user credentials for API documentation and admin access.
+
+    Args:
+        credentials: HTTP Basic authentication credentials
+
+    Raises:
+        HTTPException: If credentials are invalid
+    """
+    if not credentials_match(credentials.username, credentials.password):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Incorrect username or password')
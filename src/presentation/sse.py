@@ -0,0 +1,19 @@
+import json
+from typing import Any
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    """
+    Format a server-sent event frame.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        str: Frame ready to be written to a text/event-stream response
+    """
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+
+SSE_HEARTBEAT = ': heartbeat\n\n'
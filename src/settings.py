@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv, find_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,19 +13,141 @@ class Settings(BaseSettings):
     DATABASE_NAME: str
     DATABASE_USER: str
     DATABASE_PASSWORD: str
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_WARMUP_CONNECTIONS: int = 5
+    DATABASE_WARMUP_TIMEOUT: float = 10.0
+    DATABASE_CONNECT_TIMEOUT: float = 5.0
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 10000
+
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_BREAKER_RESET_SECONDS: float = 5.0
+    HEALTH_PROBE_INTERVAL_SECONDS: float = 2.0
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = 1.0
+
+    # The numeric(12, 2) balance column is still written as a mirror, so balances
+    # stay below 10^10 (9 999 999 999.99) even when read from the BIGINT column
+    BALANCE_MINOR_UNITS: bool = False
+    WALLET_LOCK_MODE: str = 'for_update'
 
     DOCS_USERNAME: str
     DOCS_PASSWORD: str
 
+    BALANCE_STREAM_ENABLED: bool = True
+    BALANCE_NOTIFY_CHANNEL: str = 'wallet_balance'
+    BALANCE_STREAM_BUFFER_SIZE: int = 32
+    BALANCE_STREAM_HEARTBEAT_SECONDS: float = 15.0
+
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_IN_FLIGHT: int = 64
+    ADMISSION_MIN_IN_FLIGHT: int = 4
+    ADMISSION_MAX_PER_WALLET: int = 4
+    ADMISSION_TARGET_LATENCY_MS: float = 250.0
+    ADMISSION_TARGET_POOL_WAIT_MS: float = 25.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+
+    OPERATION_WORKER_BATCH_SIZE: int = 1000
+    OPERATION_WORKER_POLL_INTERVAL: float = 0.5
+
+    LOG_LEVEL: str = 'INFO'
+    LOG_SAMPLE_RATES: dict[str, float] = {}
+    LOG_RATE_LIMIT_PER_SECOND: float = 10.0
+    LOG_RATE_LIMIT_BURST: int = 20
+    LOG_SUPPRESSED_REPORT_SECONDS: float = 60.0
+    LOG_CONFIG_CHANNEL: str = 'log_config'
+    LOG_SINKS: str = 'stdout'
+    LOG_BUFFER_BYTES: int = 64 * 1024
+    LOG_FLUSH_INTERVAL: float = 1.0
+    LOG_STDOUT_LEVEL: str = 'DEBUG'
+    LOG_STDOUT_FORMAT: str = 'json'
+    LOG_FILE_PATH: str = 'logs/wallet-{pid}.log'
+    LOG_FILE_LEVEL: str = 'DEBUG'
+    LOG_FILE_FORMAT: str = 'json'
+    LOG_FILE_MAX_BYTES: int = 100 * 1024 * 1024
+    LOG_FILE_ROTATE_SECONDS: float = 86400.0
+    LOG_FILE_BACKUP_COUNT: int = 7
+    LOG_FILE_COMPRESS: bool = True
+    LOG_SOCKET_ADDRESS: str = 'udp://127.0.0.1:5140'
+    LOG_SOCKET_LEVEL: str = 'INFO'
+    LOG_SOCKET_FORMAT: str = 'json'
+
+    TRACING_ENABLED: bool = True
+    TRACING_SAMPLE_RATIO: float = 0.01
+    TRACING_BUFFER_SIZE: int = 10000
+    TRACING_EXPORT_PATH: Optional[str] = None
+    TRACING_EXPORT_INTERVAL: float = 5.0
+    TRACING_SERVICE_NAME: str = 'wallet-api'
+
+    PROFILING_ENABLED: bool = True
+    PROFILING_OUTPUT_DIR: str = 'profiles'
+    PROFILING_INTERVAL_MS: float = 5.0
+    PROFILING_MAX_SECONDS: float = 60.0
+    PROFILING_MAX_ARTIFACTS: int = 100
+
+    WALLET_FILTER_ENABLED: bool = True
+    WALLET_FILTER_FALSE_POSITIVE_RATE: float = 0.01
+    WALLET_FILTER_HEADROOM: float = 2.0
+    WALLET_FILTER_MIN_CAPACITY: int = 100_000
+    WALLET_FILTER_GRACE_SECONDS: float = 30.0
+    WALLET_FILTER_REBUILD_SECONDS: float = 3600.0
+    WALLET_CREATED_CHANNEL: str = 'wallet_created'
+
+    WALLET_STATS_ENABLED: bool = True
+    WALLET_STATS_STRIPES: int = 16
+
+    WALLET_LIST_MAX_LIMIT: int = 500
+
+    GROUP_COMMIT_ENABLED: bool = False
+    GROUP_COMMIT_WINDOW_MS: float = 2.0
+    GROUP_COMMIT_MAX_BATCH: int = 64
+
+    WALLET_STORAGE: str = 'postgres'
+    MEMORY_STORE_DIR: str = 'data/wallets'
+    MEMORY_STORE_LOCK_STRIPES: int = 1024
+    MEMORY_STORE_FSYNC: bool = True
+    MEMORY_STORE_FLUSH_DELAY_MS: float = 0.0
+    MEMORY_STORE_SNAPSHOT_SECONDS: float = 300.0
+
+    RECONCILE_PROCESSES: int = 4
+    RECONCILE_CONNECTIONS: int = 2
+    RECONCILE_RANGES: int = 4096
+    RECONCILE_FETCH_SIZE: int = 10000
+    RECONCILE_DUTY_CYCLE: float = 0.5
+    RECONCILE_STATEMENT_TIMEOUT_MS: int = 60000
+    RECONCILE_CHECKPOINT_PATH: str = 'reconcile/checkpoint.json'
+    RECONCILE_REPORT_PATH: str = 'reconcile/discrepancies.jsonl'
+
+    MIGRATION_LOCK_TIMEOUT_MS: int = 5000
+    ONLINE_MIGRATION_BATCH_SIZE: int = 5000
+    ONLINE_MIGRATION_DUTY_CYCLE: float = 0.5
+    ONLINE_MIGRATION_LOCK_TIMEOUT_MS: int = 2000
+    ONLINE_MIGRATION_STATEMENT_TIMEOUT_MS: int = 30000
+
+    SHARDS: dict[str, str] = {}
+    SHARD_MAP_CHANNEL: str = 'shard_map'
+    SHARD_MAP_REFRESH_SECONDS: float = 5.0
+    SHARD_POOL_SIZE: int = 10
+    SHARD_MAX_OVERFLOW: int = 5
+    RESHARD_STEP_BUCKETS: int = 256
+    RESHARD_GRACE_SECONDS: float = 15.0
+
     @property
     def DATABASE_URL(self) -> str:
         """Get database URL"""
         return f'postgresql+asyncpg://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}'
 
+    @property
+    def DATABASE_DSN(self) -> str:
+        """Get plain libpq DSN for raw asyncpg connections"""
+        return f'postgresql://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}'
+
     @property
     def EXCLUDED_PATHS(self) -> list[str]:
         """Get excluded paths"""
-        return ['/docs', '/redoc', '/openapi.json', '/health']
+        return ['/docs', '/redoc', '/openapi.json', '/health', '/ready']
 
 
     model_config = SettingsConfigDict(env_file='.env', env_file_encoding='utf-8', enable_decoding=True)
@@ -42,18 +42,31 @@ def mock_session():
     session.refresh = AsyncMock()
     # Use regular Mock for synchronous methods
     session.add = Mock()
+    # Repositories open sessions as `async with session_maker() as session`
+    session.__aenter__.return_value = session
     return session
 
 
 @pytest.fixture
-def repository(mock_session):
+def mock_session_maker(mock_session):
     """
-    Create a repository instance with mock session for testing.
+    Create a mock session factory returning the mock session.
 
     Returns:
-        WalletRepository: Repository instance with mock session
+        Mock: Callable session factory
     """
-    return WalletRepository(mock_session, Mock())
+    return Mock(return_value=mock_session)
+
+
+@pytest.fixture
+def repository(mock_session_maker):
+    """
+    Create a repository instance with mock session factory for testing.
+
+    Returns:
+        WalletRepository: Repository instance with mock session factory
+    """
+    return WalletRepository(mock_session_maker, Mock())
 
 
 @pytest.fixture
@@ -0,0 +1,110 @@
+"""
+Unit tests for AdmissionController.
+
+Tests worker-wide and per-wallet admission limits, shed counters and
+adaptation of the limit to latency and pool wait.
+"""
+from fastapi import status
+from src.presentation.middleware.admission_control import AdmissionController
+
+
+def make_controller(pool_wait: float = 0.0, **overrides) -> AdmissionController:
+    options = {
+        'max_in_flight': 4,
+        'min_in_flight': 1,
+        'max_per_wallet': 2,
+        'target_latency': 0.1,
+        'target_pool_wait': 0.01,
+        'pool_wait': lambda: pool_wait,
+        'adjust_interval': 0.0,
+    }
+    options.update(overrides)
+    return AdmissionController(**options)
+
+
+class TestAdmissionController:
+    """Test cases for AdmissionController."""
+
+    def test_rejects_with_503_over_worker_limit(self):
+        """Test that requests above the worker limit are shed with 503."""
+        # Arrange
+        controller = make_controller()
+        for _ in range(4):
+            assert controller.try_acquire(None) is None
+
+        # Act
+        result = controller.try_acquire(None)
+
+        # Assert
+        assert result == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert controller.shed_overloaded == 1
+
+    def test_rejects_with_429_over_wallet_limit(self):
+        """Test that requests above the per-wallet limit are shed with 429."""
+        # Arrange
+        controller = make_controller()
+        controller.try_acquire('wallet-a')
+        controller.try_acquire('wallet-a')
+
+        # Act
+        result = controller.try_acquire('wallet-a')
+
+        # Assert
+        assert result == status.HTTP_429_TOO_MANY_REQUESTS
+        assert controller.try_acquire('wallet-b') is None
+        assert controller.shed_wallet_busy == 1
+
+    def test_release_frees_wallet_slot(self):
+        """Test that releasing a request frees its wallet slot."""
+        # Arrange
+        controller = make_controller()
+        controller.try_acquire('wallet-a')
+        controller.try_acquire('wallet-a')
+
+        # Act
+        controller.release('wallet-a', 0.01)
+
+        # Assert
+        assert controller.try_acquire('wallet-a') is None
+        assert controller.in_flight == 2
+
+    def test_limit_shrinks_on_high_latency(self):
+        """Test that the limit decreases when latency exceeds the target."""
+        # Arrange
+        controller = make_controller(alpha=1.0)
+        controller.try_acquire(None)
+
+        # Act
+        controller.release(None, 1.0)
+
+        # Assert
+        assert controller.limit < 4
+
+    def test_limit_shrinks_on_pool_wait(self):
+        """Test that the limit decreases when pool acquisition is slow."""
+        # Arrange
+        controller = make_controller(pool_wait=0.5)
+        controller.try_acquire(None)
+
+        # Act
+        controller.release(None, 0.01)
+
+        # Assert
+        assert controller.limit < 4
+
+    def test_limit_recovers_and_stays_within_bounds(self):
+        """Test that the limit grows back but never exceeds its bounds."""
+        # Arrange
+        controller = make_controller(alpha=1.0)
+        for _ in range(50):
+            controller.try_acquire(None)
+            controller.release(None, 1.0)
+        assert controller.limit == 1
+
+        # Act
+        for _ in range(200):
+            controller.try_acquire(None)
+            controller.release(None, 0.001)
+
+        # Assert
+        assert controller.limit == 4
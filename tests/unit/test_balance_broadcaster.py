@@ -0,0 +1,158 @@
+"""
+Unit tests for BalanceBroadcaster.
+
+Tests in-memory fan-out of balance notifications, bounded subscriber
+buffers and slow-consumer eviction, and the SSE stream built on them.
+"""
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from fastapi.testclient import TestClient
+from src.application.exceptions import CircuitOpenError
+from src.infrastructure.notifications import get_balance_broadcaster
+from src.infrastructure.notifications.balance_broadcaster import BalanceBroadcaster, BalanceEvent
+from src.main import app
+from src.presentation.routing.wallet_router import _balance_event_stream
+from src.settings import settings
+
+
+class TestBalanceBroadcaster:
+    """Test cases for BalanceBroadcaster."""
+
+    @pytest.mark.asyncio
+    async def test_notification_fans_out_to_wallet_subscribers(self):
+        """Test that a notification reaches every subscriber of the wallet only."""
+        # Arrange
+        broadcaster = BalanceBroadcaster(logger=Mock(), buffer_size=4)
+        first = broadcaster.subscribe('wallet-a')
+        second = broadcaster.subscribe('wallet-a')
+        other = broadcaster.subscribe('wallet-b')
+
+        # Act
+        broadcaster.handle_notification(json.dumps({'wallet_id': 'wallet-a', 'balance': '150.00'}))
+
+        # Assert
+        assert (await first.get(timeout=0.1)).balance == '150.00'
+        assert (await second.get(timeout=0.1)).balance == '150.00'
+        assert await other.get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_evicted(self):
+        """Test that a subscriber with a full buffer is evicted."""
+        # Arrange
+        broadcaster = BalanceBroadcaster(logger=Mock(), buffer_size=2)
+        slow = broadcaster.subscribe('wallet-a')
+
+        # Act
+        for balance in ('1.00', '2.00', '3.00'):
+            broadcaster.publish(BalanceEvent(wallet_id='wallet-a', balance=balance))
+
+        # Assert
+        event = await slow.get(timeout=0.1)
+        assert event.evicted
+        assert slow.evicted
+        assert broadcaster.subscriber_count == 0
+        assert broadcaster.evicted_total == 1
+
+    @pytest.mark.asyncio
+    async def test_resync_notifies_all_subscribers(self):
+        """Test that resync sends a resync marker to every subscribed wallet."""
+        # Arrange
+        broadcaster = BalanceBroadcaster(logger=Mock(), buffer_size=4)
+        first = broadcaster.subscribe('wallet-a')
+        second = broadcaster.subscribe('wallet-b')
+
+        # Act
+        broadcaster.resync()
+
+        # Assert
+        assert (await first.get(timeout=0.1)).resync
+        assert (await second.get(timeout=0.1)).resync
+
+    def test_unsubscribe_is_idempotent(self):
+        """Test that unsubscribing twice does not fail."""
+        # Arrange
+        broadcaster = BalanceBroadcaster(logger=Mock(), buffer_size=4)
+        subscription = broadcaster.subscribe('wallet-a')
+
+        # Act
+        broadcaster.unsubscribe(subscription)
+        broadcaster.unsubscribe(subscription)
+
+        # Assert
+        assert broadcaster.subscriber_count == 0
+
+    def test_malformed_notification_is_ignored(self):
+        """Test that malformed payloads are logged and dropped."""
+        # Arrange
+        logger = Mock()
+        broadcaster = BalanceBroadcaster(logger=logger, buffer_size=4)
+
+        # Act
+        broadcaster.handle_notification('not-json')
+
+        # Assert
+        logger.error.assert_called_once()
+
+
+class TestBalanceStream:
+    """Test cases for the wallet balance SSE stream."""
+
+    @pytest.mark.asyncio
+    async def test_failed_resync_ends_stream_with_error_event(self):
+        """Test that a resync whose balance read fails sends an error event and unsubscribes."""
+        # Arrange
+        request = Mock(is_disconnected=AsyncMock(return_value=False))
+        wallet = SimpleNamespace(id='wallet-a', balance='100.00')
+        subscription = Mock(get=AsyncMock(return_value=BalanceEvent(wallet_id='wallet-a', resync=True)))
+        broadcaster = Mock()
+        wallet_service = AsyncMock()
+        wallet_service.get_wallet.side_effect = CircuitOpenError('open', retry_after=2)
+
+        # Act
+        frames = [frame async for frame in _balance_event_stream(
+            request, wallet, subscription, broadcaster, wallet_service, Mock()
+        )]
+
+        # Assert
+        assert len(frames) == 2
+        assert frames[-1].startswith('event: error')
+        assert 'DATABASE_UNAVAILABLE' in frames[-1]
+        broadcaster.unsubscribe.assert_called_once_with(subscription)
+
+    def test_disabled_stream_is_refused(self, monkeypatch):
+        """Test that the stream answers 503 without subscribing when it is disabled."""
+        # Arrange
+        monkeypatch.setattr(settings, 'BALANCE_STREAM_ENABLED', False)
+        broadcaster = Mock()
+        app.dependency_overrides[get_balance_broadcaster] = lambda: broadcaster
+        try:
+            client = TestClient(app)
+
+            # Act
+            response = client.get('/api/v1/wallets/0190a8f4-7c2e-7000-8000-000000000000/stream')
+        finally:
+            app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 503
+        broadcaster.subscribe.assert_not_called()
+
+    def test_sharded_storage_refuses_stream(self, monkeypatch):
+        """Test that the stream answers 501 without subscribing for sharded wallet storage."""
+        # Arrange
+        monkeypatch.setattr(settings, 'WALLET_STORAGE', 'sharded')
+        broadcaster = Mock()
+        app.dependency_overrides[get_balance_broadcaster] = lambda: broadcaster
+        try:
+            client = TestClient(app)
+
+            # Act
+            response = client.get('/api/v1/wallets/0190a8f4-7c2e-7000-8000-000000000000/stream')
+        finally:
+            app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 501
+        broadcaster.subscribe.assert_not_called()
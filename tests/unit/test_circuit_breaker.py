@@ -0,0 +1,329 @@
+"""
+Unit tests for the database circuit breaker and health probe.
+
+Covers the breaker state machine, outage classification, the background
+probe and how open circuits surface over HTTP.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError, TimeoutError as PoolTimeoutError
+from src.application.exceptions import CircuitOpenError, DatabaseError
+from src.application.services import get_stats_service, get_wallet_service
+from src.infrastructure.database.circuit_breaker import CircuitBreaker, CircuitState, is_outage
+from src.infrastructure.database.health import DatabaseHealthProbe, health_probe
+from src.infrastructure.notifications import get_balance_broadcaster
+from src.main import app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SqlStateError(Exception):
+    def __init__(self, sqlstate: str):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=3, reset_timeout=5.0, clock=clock)
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test that the threshold of failures in a row opens the circuit."""
+        # Act
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.before_call()
+        assert error.value.retry_after == 5
+        assert isinstance(error.value, DatabaseError)
+
+    def test_success_resets_failure_count(self, breaker):
+        """Test that failures must be consecutive."""
+        # Act
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.CLOSED
+        breaker.before_call()
+
+    def test_half_open_admits_single_probe(self, breaker, clock):
+        """Test that after the reset timeout one call goes through and others fail fast."""
+        # Arrange
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 5.0
+
+        # Act
+        breaker.before_call()
+
+        # Assert
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_successful_probe_closes(self, breaker, clock):
+        """Test that a successful probe closes the circuit."""
+        # Arrange
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 5.0
+        breaker.before_call()
+
+        # Act
+        breaker.record_success()
+
+        # Assert
+        assert breaker.state == CircuitState.CLOSED
+        breaker.before_call()
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        """Test that a failed probe opens the circuit for another reset timeout."""
+        # Arrange
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 5.0
+        breaker.before_call()
+
+        # Act
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CircuitState.OPEN
+        clock.now += 4.9
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_lost_probe_is_replaced(self, breaker, clock):
+        """Test that a probe that never reports back does not keep the circuit half-open forever."""
+        # Arrange
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 5.0
+        breaker.before_call()
+
+        # Act
+        clock.now += 5.0
+
+        # Assert
+        breaker.before_call()
+
+    def test_disabled_never_rejects(self, clock):
+        """Test that a disabled breaker lets every call through."""
+        # Arrange
+        breaker = CircuitBreaker(failure_threshold=1, enabled=False, clock=clock)
+        breaker.record_failure()
+
+        # Act & Assert
+        breaker.before_call()
+
+
+class TestIsOutage:
+    """Test cases for outage classification."""
+
+    @pytest.mark.parametrize('error', [
+        ConnectionRefusedError(),
+        TimeoutError(),
+        PoolTimeoutError('QueuePool limit reached'),
+        SqlStateError('08006'),
+        SqlStateError('57P01'),
+        SqlStateError('53300'),
+    ])
+    def test_outage_errors(self, error):
+        """Test that connectivity, shutdown and checkout timeout errors count."""
+        assert is_outage(error)
+
+    @pytest.mark.parametrize('error', [
+        SqlStateError('23505'),
+        SqlStateError('40P01'),
+        SqlStateError('57014'),
+        SqlStateError('53200'),
+        ValueError('bad input'),
+    ])
+    def test_request_errors(self, error):
+        """Test that errors of a single statement, including statement timeouts, do not count."""
+        assert not is_outage(error)
+
+    def test_wrapped_error(self):
+        """Test that the cause of a wrapped driver error is inspected."""
+        # Arrange
+        try:
+            try:
+                raise SqlStateError('08001')
+            except SqlStateError as cause:
+                raise IntegrityError('INSERT', {}, Exception('wrapped')) from cause
+        except IntegrityError as error:
+            wrapped = error
+
+        # Act & Assert
+        assert is_outage(wrapped)
+
+
+def _engine(execute_side_effect=None):
+    connection = AsyncMock()
+    connection.execute.side_effect = execute_side_effect
+    context = MagicMock()
+    context.__aenter__.return_value = connection
+    engine = Mock()
+    engine.connect.return_value = context
+    return engine
+
+
+class TestDatabaseHealthProbe:
+    """Test cases for DatabaseHealthProbe."""
+
+    @pytest.mark.asyncio
+    async def test_healthy(self, breaker):
+        """Test that a successful probe is reported healthy."""
+        # Arrange
+        probe = DatabaseHealthProbe(_engine(), breaker, Mock())
+
+        # Act
+        result = await probe.check()
+
+        # Assert
+        assert result.healthy
+        assert probe.healthy
+        assert probe.stats()['circuit']['state'] == 'closed'
+
+    @pytest.mark.asyncio
+    async def test_circuit_open(self, breaker):
+        """Test that an open circuit is reported without an error trace."""
+        # Arrange
+        probe = DatabaseHealthProbe(_engine(CircuitOpenError('open', retry_after=1)), breaker, Mock())
+
+        # Act
+        result = await probe.check()
+
+        # Assert
+        assert not result.healthy
+        assert result.error == 'circuit open'
+
+    @pytest.mark.asyncio
+    async def test_timeout_counts_as_failure(self, breaker):
+        """Test that a hung probe times out and is recorded by the breaker."""
+        # Arrange
+        async def hang(*_args):
+            await asyncio.sleep(10)
+        probe = DatabaseHealthProbe(_engine(hang), breaker, Mock(), timeout=0.01)
+
+        # Act
+        result = await probe.check()
+
+        # Assert
+        assert not result.healthy
+        assert 'timed out' in result.error
+        assert breaker.stats()['consecutive_failures'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_result_is_unhealthy(self, breaker):
+        """Test that a result older than max_age is not trusted."""
+        # Arrange
+        probe = DatabaseHealthProbe(_engine(), breaker, Mock(), max_age=0.0)
+
+        # Act
+        await probe.check()
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert probe.result.healthy
+        assert not probe.healthy
+
+
+class TestCircuitOpenResponses:
+    """Test cases for HTTP responses while the circuit is open."""
+
+    def test_endpoint_returns_503_with_retry_after(self):
+        """Test that a rejected call maps to 503 rather than 500."""
+        # Arrange
+        stats_service = AsyncMock()
+        stats_service.get_totals.side_effect = CircuitOpenError('open', retry_after=2.5)
+        app.dependency_overrides[get_stats_service] = lambda: stats_service
+        try:
+            client = TestClient(app)
+
+            # Act
+            response = client.get('/api/v1/stats')
+        finally:
+            app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '3'
+
+    def test_wallet_endpoint_uses_global_handler(self):
+        """Test that wallet routes let CircuitOpenError reach the application-wide handler."""
+        # Arrange
+        wallet_service = AsyncMock()
+        wallet_service.get_wallet.side_effect = CircuitOpenError('open', retry_after=1)
+        app.dependency_overrides[get_wallet_service] = lambda: wallet_service
+        try:
+            client = TestClient(app)
+
+            # Act
+            response = client.get('/api/v1/wallets/0190a8f4-7c2e-7000-8000-000000000000')
+        finally:
+            app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+        assert response.json()['error_code'] == 'DATABASE_UNAVAILABLE'
+
+    def test_stream_endpoint_uses_global_handler(self):
+        """Test that the balance stream answers an open circuit with 503 and drops its subscription."""
+        # Arrange
+        wallet_service = AsyncMock()
+        wallet_service.get_wallet.side_effect = CircuitOpenError('open', retry_after=2)
+        broadcaster = Mock()
+        app.dependency_overrides[get_wallet_service] = lambda: wallet_service
+        app.dependency_overrides[get_balance_broadcaster] = lambda: broadcaster
+        try:
+            client = TestClient(app)
+
+            # Act
+            response = client.get('/api/v1/wallets/0190a8f4-7c2e-7000-8000-000000000000/stream')
+        finally:
+            app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '2'
+        broadcaster.unsubscribe.assert_called_once_with(broadcaster.subscribe.return_value)
+
+    def test_health_served_from_probe(self, monkeypatch):
+        """Test that /health reports the last probe result without querying."""
+        # Arrange
+        monkeypatch.setattr(health_probe, 'result', None)
+        client = TestClient(app)
+
+        # Act
+        response = client.get('/health')
+
+        # Assert
+        assert response.status_code == 503
+        assert response.json()['database']['error'] == 'not probed yet'
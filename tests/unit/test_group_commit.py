@@ -0,0 +1,206 @@
+"""
+Unit tests for GroupCommitExecutor.
+
+Tests batching of concurrent balance changes, per-change failure isolation
+and the individual retry of failed batches.
+"""
+import asyncio
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+from src.infrastructure.database.group_commit import GroupCommitExecutor
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.repositories.wallet_repostiory import WalletRepository
+from src.application.exceptions import (
+    DatabaseError,
+    InsufficientFundsError,
+    WalletNotFoundError
+)
+
+
+def _wallets(*balances: str) -> list[Wallet]:
+    return [Wallet(id=uuid4(), balance=Decimal(balance), balance_minor=None) for balance in balances]
+
+
+def _session(wallets: list[Wallet]) -> AsyncMock:
+    """Session whose lock query returns the given wallets."""
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    session.begin_nested = MagicMock(return_value=AsyncMock())
+    result = MagicMock()
+    result.scalars.return_value = sorted(wallets, key=lambda wallet: wallet.id)
+    session.execute.return_value = result
+    return session
+
+
+class TestGroupCommitExecutor:
+    """Test cases for GroupCommitExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_distinct_wallets_share_one_transaction(self):
+        """Test that concurrent changes of different wallets commit together."""
+        # Arrange
+        wallets = _wallets('10.00', '20.00', '30.00')
+        session = _session(wallets)
+        session_maker = Mock(return_value=session)
+        executor = GroupCommitExecutor(session_maker, Mock(), window=0.01, max_batch=10)
+
+        # Act
+        results = await asyncio.gather(
+            executor.submit(wallets[0].id, Decimal('5.00'), withdraw=False),
+            executor.submit(wallets[1].id, Decimal('5.00'), withdraw=True),
+            executor.submit(wallets[2].id, Decimal('0.50'), withdraw=False),
+        )
+
+        # Assert
+        assert [wallet.balance for wallet in results] == [Decimal('15.00'), Decimal('15.00'), Decimal('30.50')]
+        session_maker.assert_called_once()
+        session.commit.assert_awaited_once()
+        lock_query = str(session.execute.call_args_list[0].args[0])
+        assert 'ORDER BY wallets.id' in lock_query
+        assert 'FOR UPDATE' in lock_query
+        assert executor.batches == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_poison_batch(self):
+        """Test that missing wallets and insufficient funds fail only their own callers."""
+        # Arrange
+        wallets = _wallets('10.00', '10.00')
+        session = _session(wallets)
+        executor = GroupCommitExecutor(Mock(return_value=session), Mock(), window=0.01, max_batch=10)
+
+        # Act
+        results = await asyncio.gather(
+            executor.submit(wallets[0].id, Decimal('50.00'), withdraw=True),
+            executor.submit(wallets[1].id, Decimal('1.00'), withdraw=True),
+            executor.submit(uuid4(), Decimal('1.00'), withdraw=False),
+            return_exceptions=True
+        )
+
+        # Assert
+        assert isinstance(results[0], InsufficientFundsError)
+        assert results[1].balance == Decimal('9.00')
+        assert isinstance(results[2], WalletNotFoundError)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_statement_rolls_back_its_savepoint_only(self):
+        """Test that a change whose statement fails gets a DatabaseError while the rest commit."""
+        # Arrange
+        wallets = _wallets('10.00', '10.00')
+        first = min(wallets, key=lambda wallet: wallet.id)
+        second = max(wallets, key=lambda wallet: wallet.id)
+        session = _session(wallets)
+        session.flush.side_effect = [Exception('numeric field overflow'), None]
+        executor = GroupCommitExecutor(Mock(return_value=session), Mock(), window=0.01, max_batch=10)
+
+        # Act
+        results = await asyncio.gather(
+            executor.submit(first.id, Decimal('1.00'), withdraw=False),
+            executor.submit(second.id, Decimal('1.00'), withdraw=False),
+            return_exceptions=True
+        )
+
+        # Assert
+        assert isinstance(results[0], DatabaseError)
+        assert results[1].balance == Decimal('11.00')
+        assert session.begin_nested.call_count == 2
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_same_wallet_goes_to_next_batch_in_order(self):
+        """Test that a second change of a wallet waits for the next transaction."""
+        # Arrange
+        wallets = _wallets('10.00')
+        session = _session(wallets)
+        session_maker = Mock(return_value=session)
+        executor = GroupCommitExecutor(session_maker, Mock(), window=0.01, max_batch=10)
+
+        # Act
+        results = await asyncio.gather(
+            executor.submit(wallets[0].id, Decimal('5.00'), withdraw=False),
+            executor.submit(wallets[0].id, Decimal('12.00'), withdraw=True),
+        )
+
+        # Assert
+        assert session_maker.call_count == 2
+        assert results[1].balance == Decimal('3.00')
+
+    @pytest.mark.asyncio
+    async def test_max_batch(self):
+        """Test that a full batch is applied without waiting for the window."""
+        # Arrange
+        wallets = _wallets('1.00', '1.00', '1.00')
+        session_maker = Mock(return_value=_session(wallets))
+        executor = GroupCommitExecutor(session_maker, Mock(), window=10.0, max_batch=1)
+
+        # Act
+        await asyncio.wait_for(
+            asyncio.gather(*(executor.submit(wallet.id, Decimal('1.00'), withdraw=False) for wallet in wallets)),
+            1.0
+        )
+
+        # Assert
+        assert session_maker.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_is_not_retried(self):
+        """Test that a failed COMMIT fails every caller instead of applying the changes again."""
+        # Arrange
+        wallets = _wallets('10.00', '10.00')
+        batch_session = _session(wallets)
+        batch_session.commit.side_effect = Exception('connection lost')
+        session_maker = Mock(side_effect=[batch_session, _session(wallets), _session(wallets)])
+        executor = GroupCommitExecutor(session_maker, Mock(), window=0.01, max_batch=10)
+
+        # Act
+        results = await asyncio.gather(
+            *(executor.submit(wallet.id, Decimal('1.00'), withdraw=False) for wallet in wallets),
+            return_exceptions=True
+        )
+
+        # Assert
+        assert session_maker.call_count == 1
+        batch_session.rollback.assert_awaited_once()
+        assert all(isinstance(result, DatabaseError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_lock_query_retried_individually(self):
+        """Test that a batch failing before COMMIT is retried change by change."""
+        # Arrange
+        wallets = _wallets('10.00', '10.00')
+        batch_session = _session(wallets)
+        batch_session.execute.side_effect = Exception('deadlock detected')
+        session_maker = Mock(side_effect=[batch_session, _session(wallets), _session(wallets)])
+        executor = GroupCommitExecutor(session_maker, Mock(), window=0.01, max_batch=10)
+
+        # Act
+        results = await asyncio.gather(*(executor.submit(wallet.id, Decimal('1.00'), withdraw=False) for wallet in wallets))
+
+        # Assert
+        assert session_maker.call_count == 3
+        batch_session.commit.assert_not_awaited()
+        assert all(isinstance(result, Wallet) for result in results)
+
+
+class TestWalletRepositoryGroupCommit:
+    """Test cases for WalletRepository with group commit."""
+
+    @pytest.mark.asyncio
+    async def test_changes_go_through_executor(self, mock_session_maker):
+        """Test that deposits and withdrawals are submitted to the executor."""
+        # Arrange
+        wallet_id = uuid4()
+        executor = Mock(spec=GroupCommitExecutor)
+        executor.submit = AsyncMock(return_value=Wallet(id=wallet_id, balance=Decimal('1.00')))
+        repository = WalletRepository(mock_session_maker, Mock(), group_commit=executor)
+
+        # Act
+        await repository.deposit(str(wallet_id), Decimal('1.00'))
+        await repository.withdraw(str(wallet_id), Decimal('1.00'))
+
+        # Assert
+        assert executor.submit.await_args_list[0].args == (wallet_id, Decimal('1.00'), False)
+        assert executor.submit.await_args_list[1].args == (wallet_id, Decimal('1.00'), True)
+        mock_session_maker.assert_not_called()
@@ -0,0 +1,265 @@
+"""
+Unit tests for InMemoryWalletRepository.
+
+Mirrors the WalletRepository behaviour tests and covers the write-ahead
+log: group commit, recovery, torn tails and snapshots.
+"""
+import asyncio
+import os
+import shutil
+import pytest
+import pytest_asyncio
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+from src.settings import settings
+from src.infrastructure.memory import InMemoryStatsRepository, InMemoryWalletRepository
+from src.application.exceptions import (
+    DatabaseError,
+    WalletNotFoundError,
+    InsufficientFundsError,
+    InvalidAmountError,
+    InvalidWalletIdError
+)
+
+
+@pytest_asyncio.fixture
+async def repository(tmp_path):
+    """Open repository on an empty directory."""
+    repository = InMemoryWalletRepository(str(tmp_path / 'store'), Mock(), lock_stripes=16)
+    await repository.start()
+    yield repository
+    await repository.close()
+
+
+async def _reopen(directory: str) -> InMemoryWalletRepository:
+    repository = InMemoryWalletRepository(directory, Mock(), lock_stripes=16)
+    await repository.start()
+    return repository
+
+
+class TestInMemoryWalletRepository:
+    """Test cases for InMemoryWalletRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_wallet_success(self, repository):
+        """Test successful wallet retrieval."""
+        # Arrange
+        wallet = await repository.create()
+
+        # Act
+        result = await repository.get_wallet(str(wallet.id))
+
+        # Assert
+        assert result.id == wallet.id
+        assert result.balance == Decimal('0.00')
+        assert result.created_at == wallet.created_at
+
+    @pytest.mark.asyncio
+    async def test_create_with_given_id(self, repository):
+        """Test that a caller-chosen wallet ID is used and cannot be created twice."""
+        # Arrange
+        wallet_id = uuid4()
+
+        # Act
+        wallet = await repository.create(wallet_id)
+
+        # Assert
+        assert wallet.id == wallet_id
+        assert (await repository.get_wallet(str(wallet_id))).id == wallet_id
+        with pytest.raises(DatabaseError):
+            await repository.create(wallet_id)
+
+    @pytest.mark.asyncio
+    async def test_get_wallet_not_found(self, repository):
+        """Test wallet retrieval when wallet not found."""
+        with pytest.raises(WalletNotFoundError):
+            await repository.get_wallet(str(uuid4()))
+
+    @pytest.mark.asyncio
+    async def test_deposit_success(self, repository):
+        """Test successful deposit operation."""
+        # Arrange
+        wallet = await repository.create()
+
+        # Act
+        result = await repository.deposit(str(wallet.id), Decimal('50.00'))
+
+        # Assert
+        assert result.balance == Decimal('50.00')
+        assert result.balance_minor == 5000
+
+    @pytest.mark.asyncio
+    async def test_withdraw_success(self, repository):
+        """Test successful withdraw operation."""
+        # Arrange
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('100.00'))
+
+        # Act
+        result = await repository.withdraw(str(wallet.id), Decimal('30.00'))
+
+        # Assert
+        assert result.balance == Decimal('70.00')
+
+    @pytest.mark.asyncio
+    async def test_withdraw_insufficient_funds(self, repository):
+        """Test withdraw with insufficient funds leaves the balance unchanged."""
+        # Arrange
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('50.00'))
+
+        # Act & Assert
+        with pytest.raises(InsufficientFundsError):
+            await repository.withdraw(str(wallet.id), Decimal('100.00'))
+        assert (await repository.get_wallet(str(wallet.id))).balance == Decimal('50.00')
+
+    @pytest.mark.asyncio
+    async def test_withdraw_in_minor_units_mode(self, repository, monkeypatch):
+        """Test that withdraw works in integer minor units when enabled."""
+        # Arrange
+        monkeypatch.setattr(settings, 'BALANCE_MINOR_UNITS', True)
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('100.00'))
+
+        # Act
+        result = await repository.withdraw(str(wallet.id), Decimal('0.01'))
+
+        # Assert
+        assert result.balance_minor == 9999
+        assert result.balance == Decimal('99.99')
+
+    @pytest.mark.asyncio
+    async def test_withdraw_insufficient_funds_in_minor_units_mode(self, repository, monkeypatch):
+        """Test that the funds check uses minor units when enabled."""
+        # Arrange
+        monkeypatch.setattr(settings, 'BALANCE_MINOR_UNITS', True)
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('0.01'))
+
+        # Act & Assert
+        with pytest.raises(InsufficientFundsError):
+            await repository.withdraw(str(wallet.id), Decimal('0.02'))
+
+    @pytest.mark.asyncio
+    async def test_invalid_wallet_id(self, repository):
+        """Test that an invalid wallet ID is rejected."""
+        with pytest.raises(InvalidWalletIdError):
+            await repository.deposit('not-a-uuid', Decimal('1.00'))
+
+    @pytest.mark.asyncio
+    async def test_invalid_amount(self, repository):
+        """Test that a non-positive amount is rejected."""
+        with pytest.raises(InvalidAmountError):
+            await repository.withdraw(str(uuid4()), Decimal('0'))
+
+    @pytest.mark.asyncio
+    async def test_not_started(self, tmp_path):
+        """Test that using a store that was never opened is a database error."""
+        repository = InMemoryWalletRepository(str(tmp_path), Mock())
+        with pytest.raises(DatabaseError):
+            await repository.create()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_withdrawals_never_overdraw(self, repository):
+        """Test that concurrent withdrawals are serialised per wallet and share log writes."""
+        # Arrange
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('100.00'))
+        batches = repository._wal.batches
+
+        # Act
+        results = await asyncio.gather(
+            *(repository.withdraw(str(wallet.id), Decimal('10.00')) for _ in range(30)),
+            *(repository.create() for _ in range(30)),
+            return_exceptions=True
+        )
+
+        # Assert
+        failed = [result for result in results[:30] if isinstance(result, InsufficientFundsError)]
+        assert len(failed) == 20
+        assert (await repository.get_wallet(str(wallet.id))).balance == Decimal('0.00')
+        assert repository._wal.batches - batches < 40
+
+    @pytest.mark.asyncio
+    async def test_totals(self, repository):
+        """Test that totals follow every change."""
+        # Arrange
+        first = await repository.create()
+        await repository.create()
+        await repository.deposit(str(first.id), Decimal('12.34'))
+
+        # Act
+        totals = await InMemoryStatsRepository(repository, Mock()).get_totals()
+
+        # Assert
+        assert totals.wallet_count == 2
+        assert totals.total_balance == Decimal('12.34')
+
+
+class TestInMemoryWalletStoreDurability:
+    """Test cases for the write-ahead log and snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_restore_after_close(self, tmp_path):
+        """Test that a cleanly closed store is restored from its snapshot."""
+        # Arrange
+        directory = str(tmp_path / 'store')
+        repository = await _reopen(directory)
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('5.25'))
+        await repository.close()
+
+        # Act
+        restored = await _reopen(directory)
+
+        # Assert
+        assert (await restored.get_wallet(str(wallet.id))).balance == Decimal('5.25')
+        assert sorted(os.listdir(directory)) == ['LOCK', 'snapshot-00000002.bin', 'wal-00000002.log']
+        await restored.close()
+
+    @pytest.mark.asyncio
+    async def test_recover_from_log_after_crash(self, repository, tmp_path):
+        """Test that acknowledged changes survive without a snapshot and a torn tail is ignored."""
+        # Arrange
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('7.00'))
+        await repository.withdraw(str(wallet.id), Decimal('2.00'))
+        crashed = str(tmp_path / 'crashed')
+        shutil.copytree(repository._wal.directory, crashed)
+        log = os.path.join(crashed, f'wal-{repository._wal.generation:08d}.log')
+        with open(log, 'ab') as file:
+            file.write(b'torn')
+
+        # Act
+        recovered = await _reopen(crashed)
+
+        # Assert
+        assert (await recovered.get_wallet(str(wallet.id))).balance == Decimal('5.00')
+        await recovered.deposit(str(wallet.id), Decimal('1.00'))
+        await recovered.close()
+        reopened = await _reopen(crashed)
+        assert (await reopened.get_wallet(str(wallet.id))).balance == Decimal('6.00')
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_drops_covered_logs(self, repository):
+        """Test that a snapshot replaces the logs before it."""
+        # Arrange
+        wallet = await repository.create()
+        await repository.deposit(str(wallet.id), Decimal('1.00'))
+
+        # Act
+        await repository.snapshot()
+        await repository.deposit(str(wallet.id), Decimal('1.00'))
+
+        # Assert
+        files = sorted(os.listdir(repository._wal.directory))
+        generation = repository._wal.generation
+        assert files == ['LOCK', f'snapshot-{generation:08d}.bin', f'wal-{generation:08d}.log']
+
+    @pytest.mark.asyncio
+    async def test_directory_locked(self, repository):
+        """Test that a second store cannot open the same directory."""
+        with pytest.raises(RuntimeError):
+            await _reopen(repository._wal.directory)
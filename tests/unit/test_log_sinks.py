@@ -0,0 +1,170 @@
+"""
+Unit tests for log sinks.
+
+Tests per-sink formatting and levels, buffering, file rotation with
+background compression and the datagram socket sink.
+"""
+import gzip
+import os
+import socket
+from glob import glob
+from src.infrastructure.logger.log_format import LogFormat
+from src.infrastructure.logger.log_levels import LogLevel
+from src.infrastructure.logger.sinks import BufferedFileSink, SocketSink, StdoutSink, format_record
+
+
+def make_record(message: str = 'hello', **fields) -> dict:
+    return {
+        'timestamp': '2024-01-01T00:00:00',
+        'level': 'INFO',
+        'file': 'app.py',
+        'line': 1,
+        'trace_id': 'N/A',
+        'message': message,
+        **fields,
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFormatRecord:
+    """Test cases for record rendering."""
+
+    def test_text_format_appends_fields(self):
+        """Test that non-base keys are rendered as key=value pairs."""
+        # Act
+        line = format_record(make_record(wallet_id='w1'), LogFormat.TEXT)
+
+        # Assert
+        assert line == '2024-01-01T00:00:00 - INFO - N/A - app.py:1 - hello - wallet_id=w1'
+
+
+class TestStdoutSink:
+    """Test cases for StdoutSink."""
+
+    def test_buffers_until_error_then_writes_in_one_batch(self, tmp_path):
+        """Test that records are held until an ERROR record forces a flush."""
+        # Arrange
+        path = tmp_path / 'out.log'
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        sink = StdoutSink(fd=fd, log_format=LogFormat.TEXT)
+
+        # Act
+        sink.emit(make_record('first'), LogLevel.INFO)
+        before_error = path.read_text()
+        sink.emit(make_record('second'), LogLevel.ERROR)
+        os.close(fd)
+
+        # Assert
+        assert before_error == ''
+        assert path.read_text().splitlines()[1].endswith('second')
+
+
+class TestBufferedFileSink:
+    """Test cases for BufferedFileSink."""
+
+    def test_rotates_by_size_and_compresses(self, tmp_path):
+        """Test that a full file is rotated and the rotated file is gzipped in the background."""
+        # Arrange
+        clock = FakeClock()
+        sink = BufferedFileSink(
+            path=str(tmp_path / 'app.log'),
+            max_bytes=200,
+            compress=True,
+            buffer_bytes=1,
+            clock=clock,
+        )
+
+        # Act
+        for i in range(5):
+            clock.now += 1
+            sink.emit(make_record(f'record {i}'), LogLevel.INFO)
+        sink.wait_for_compression()
+        sink.close()
+
+        # Assert
+        compressed = glob(str(tmp_path / 'app.log.*.gz'))
+        assert compressed
+        assert b'record 0' in gzip.open(compressed[0]).read()
+        assert 'record 4' in (tmp_path / 'app.log').read_text()
+
+    def test_rotates_by_time_and_prunes_backups(self, tmp_path):
+        """Test that time based rotation keeps only backup_count rotated files."""
+        # Arrange
+        clock = FakeClock()
+        sink = BufferedFileSink(
+            path=str(tmp_path / 'app.log'),
+            max_bytes=0,
+            rotate_interval=60,
+            backup_count=2,
+            buffer_bytes=1,
+            clock=clock,
+        )
+
+        # Act
+        for i in range(5):
+            sink.emit(make_record(f'record {i}'), LogLevel.INFO)
+            clock.now += 61
+        sink.close()
+
+        # Assert
+        assert len(glob(str(tmp_path / 'app.log.*'))) == 2
+
+    def test_sink_level_filters_in_logger(self, tmp_path, monkeypatch):
+        """Test that a sink only receives records at or above its level."""
+        # Arrange
+        from src.infrastructure.logger import logger
+        sink = BufferedFileSink(path=str(tmp_path / 'errors.log'), level=LogLevel.ERROR)
+        monkeypatch.setattr(logger, 'sinks', [sink])
+        monkeypatch.setattr(logger, 'min_level', LogLevel.INFO)
+
+        # Act
+        logger.info('not for this sink')
+        logger.error('for this sink')
+        sink.close()
+
+        # Assert
+        content = (tmp_path / 'errors.log').read_text()
+        assert 'for this sink' in content
+        assert 'not for this sink' not in content
+
+
+class TestSocketSink:
+    """Test cases for SocketSink."""
+
+    def test_sends_one_datagram_per_record(self):
+        """Test that UDP records are delivered as separate datagrams on flush."""
+        # Arrange
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(('127.0.0.1', 0))
+        receiver.settimeout(1)
+        port = receiver.getsockname()[1]
+        sink = SocketSink(address=f'udp://127.0.0.1:{port}')
+
+        # Act
+        sink.emit(make_record('one'), LogLevel.INFO)
+        sink.emit(make_record('two'), LogLevel.INFO)
+        sink.flush()
+
+        # Assert
+        assert b'"one"' in receiver.recv(65536)
+        assert b'"two"' in receiver.recv(65536)
+        sink.close()
+        receiver.close()
+
+    def test_unreachable_shipper_drops_records(self, tmp_path):
+        """Test that a missing unix socket drops records instead of raising."""
+        # Arrange
+        sink = SocketSink(address=f'unix://{tmp_path}/missing.sock')
+
+        # Act
+        sink.emit(make_record('lost'), LogLevel.ERROR)
+
+        # Assert
+        assert sink.dropped == 1
@@ -0,0 +1,199 @@
+"""
+Unit tests for the logger.
+
+Tests per-level sampling, the per-call-site token bucket, periodic
+suppressed-count reports, runtime reconfiguration, lazy template
+formatting and bound loggers.
+"""
+import pytest
+from src.infrastructure.logger import logger
+from src.infrastructure.logger.log_levels import LogLevel
+from src.infrastructure.logger.log_throttle import LogThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Route the global logger's output into a list and restore its configuration afterwards."""
+    lines = []
+    monkeypatch.setattr(logger, '_write', lines.append)
+    monkeypatch.setattr(logger, 'sinks', [])
+    monkeypatch.setattr(logger, 'min_level', logger.min_level)
+    monkeypatch.setattr(logger, 'throttle', LogThrottle())
+    return lines
+
+
+class TestLogThrottle:
+    """Test cases for LogThrottle."""
+
+    def test_sampling_drops_by_level(self):
+        """Test that records are kept according to the ratio of their level only."""
+        # Arrange
+        throttle = LogThrottle(sample_rates={'info': 0.5}, random_fn=lambda: 0.7)
+
+        # Act & Assert
+        assert throttle.sample(LogLevel.INFO) is False
+        assert throttle.sample(LogLevel.ERROR) is True
+
+    def test_rate_limit_suppresses_after_burst(self, clock):
+        """Test that a call site is cut off after its burst and refilled over time."""
+        # Arrange
+        throttle = LogThrottle(rate=1.0, burst=2, clock=clock)
+        key = ('ERROR', 'file.py', 10, None)
+
+        # Act
+        admitted = [throttle.admit(LogLevel.ERROR, key) for _ in range(5)]
+        clock.now = 1.0
+        after_refill = throttle.admit(LogLevel.ERROR, key)
+
+        # Assert
+        assert admitted == [True, True, False, False, False]
+        assert after_refill is True
+
+    def test_rate_limit_ignores_levels_below_threshold(self, clock):
+        """Test that INFO records are not rate limited by default."""
+        # Arrange
+        throttle = LogThrottle(rate=1.0, burst=1, clock=clock)
+
+        # Act & Assert
+        assert all(throttle.admit(LogLevel.INFO, 'key') for _ in range(10))
+
+    def test_report_is_periodic_and_resets_counts(self, clock):
+        """Test that suppressed counts are reported once per interval and then reset."""
+        # Arrange
+        throttle = LogThrottle(rate=1.0, burst=1, report_interval=60.0, clock=clock)
+        key = ('ERROR', 'file.py', 10, 'WALLET_NOT_FOUND')
+        for _ in range(4):
+            throttle.admit(LogLevel.ERROR, key)
+
+        # Act
+        early = throttle.pop_report()
+        clock.now = 60.0
+        report = throttle.pop_report()
+        clock.now = 120.0
+        empty = throttle.pop_report()
+
+        # Assert
+        assert early is None
+        assert report == {'ERROR:file.py:10:WALLET_NOT_FOUND': 3}
+        assert empty is None
+
+    def test_invalid_sample_rate_is_rejected(self):
+        """Test that ratios outside [0, 1] and unknown levels raise ValueError."""
+        # Arrange
+        throttle = LogThrottle()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            throttle.set_sample_rates({'INFO': 1.5})
+        with pytest.raises(ValueError):
+            throttle.set_sample_rates({'VERBOSE': 0.5})
+
+
+class TestLoggerThrottling:
+    """Test cases for throttling in Logger."""
+
+    def test_identical_errors_are_rate_limited_and_reported(self, captured, clock):
+        """Test that repeated errors from one call site are capped and summarized."""
+        # Arrange
+        logger.throttle = LogThrottle(rate=1.0, burst=2, report_interval=10.0, clock=clock)
+
+        # Act
+        for _ in range(5):
+            logger.error('Wallet not found')
+        clock.now = 10.0
+        logger.info('next record')
+
+        # Assert
+        assert sum('Wallet not found' in line for line in captured) == 2
+        assert 'Suppressed log records' in captured[-1]
+
+    def test_configure_changes_level_and_sampling(self, captured):
+        """Test that runtime configuration changes the level and sampling ratios."""
+        # Act
+        logger.configure(min_level='warning', sample_rates={'WARNING': 0.25})
+
+        # Assert
+        assert logger.get_config() == {'min_level': 'WARNING', 'sample_rates': {'WARNING': 0.25}}
+        logger.info('dropped by level')
+        assert captured == []
+
+    def test_configure_rejects_unknown_level_without_partial_change(self, captured):
+        """Test that an invalid update leaves the configuration untouched."""
+        # Arrange
+        before = logger.get_config()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            logger.configure(min_level='ERROR', sample_rates={'INFO': 2.0})
+        assert logger.get_config() == before
+
+
+class TestLoggerTemplates:
+    """Test cases for lazy message formatting and bound loggers."""
+
+    def test_template_is_formatted_with_fields(self, captured):
+        """Test that args fill the template and keyword fields are attached."""
+        # Arrange
+        logger.min_level = LogLevel.INFO
+
+        # Act
+        logger.info('Wallet %s deposited: +%s', 'w1', '10.00', operation='DEPOSIT')
+
+        # Assert
+        assert len(captured) == 1
+        assert 'Wallet w1 deposited: +10.00' in captured[0]
+        assert 'DEPOSIT' in captured[0]
+
+    def test_disabled_level_does_not_format(self, captured):
+        """Test that arguments of a disabled record are never stringified."""
+        # Arrange
+        logger.min_level = LogLevel.WARNING
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError('formatted a disabled record')
+
+        # Act
+        logger.debug('value %s', Exploding())
+        logger.info('value %s', Exploding())
+
+        # Assert
+        assert captured == []
+
+    def test_broken_template_does_not_raise(self, captured):
+        """Test that a template/argument mismatch still produces a record."""
+        # Arrange
+        logger.min_level = LogLevel.INFO
+
+        # Act
+        logger.info('no placeholders', 'extra')
+
+        # Assert
+        assert 'no placeholders extra' in captured[0]
+
+    def test_bound_logger_adds_fields_and_reports_caller(self, captured):
+        """Test that bound fields are merged and the call site is the caller, not the wrapper."""
+        # Arrange
+        logger.min_level = LogLevel.INFO
+        bound = logger.bind(wallet_id='w1').bind(component='test')
+
+        # Act
+        bound.info('bound record', amount=5)
+
+        # Assert
+        assert 'wallet_id' in captured[0] and 'w1' in captured[0]
+        assert 'component' in captured[0] and 'amount' in captured[0]
+        assert 'test_logger.py' in captured[0]
@@ -0,0 +1,34 @@
+"""
+Unit tests for minor-unit money conversion.
+
+Tests conversion between the decimal wire format and integer minor units.
+"""
+from decimal import Decimal
+from src.application.domain.money import to_minor_units, from_minor_units
+
+
+class TestMinorUnits:
+    """Test cases for to_minor_units/from_minor_units."""
+
+    def test_to_minor_units(self):
+        """Test conversion of two-place decimals."""
+        assert to_minor_units(Decimal('150.00')) == 15000
+        assert to_minor_units(Decimal('0.01')) == 1
+        assert to_minor_units(Decimal('-25.50')) == -2550
+
+    def test_to_minor_units_rounds_like_numeric_column(self):
+        """Test that extra places are rounded half away from zero."""
+        assert to_minor_units(Decimal('1.005')) == 101
+        assert to_minor_units(Decimal('1.004')) == 100
+        assert to_minor_units(Decimal('-1.005')) == -101
+
+    def test_from_minor_units_keeps_wire_format(self):
+        """Test that converted balances serialize with two decimal places."""
+        assert str(from_minor_units(15000)) == '150.00'
+        assert str(from_minor_units(0)) == '0.00'
+        assert str(from_minor_units(5)) == '0.05'
+
+    def test_round_trip_beyond_numeric_precision(self):
+        """Test that balances above the numeric(12, 2) cap convert exactly."""
+        minor_units = 9_000_000_000_000_000
+        assert to_minor_units(from_minor_units(minor_units)) == minor_units
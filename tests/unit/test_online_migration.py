@@ -0,0 +1,205 @@
+"""
+Unit tests for the online migration toolkit.
+
+Covers chunking, resuming and retrying of column backfills, the dual-write
+verification and the non-blocking DDL helpers.
+"""
+import uuid
+import asyncpg
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock, MagicMock, Mock
+from src.infrastructure.online_migration import BALANCE_MINOR, ColumnBackfill, DualWriteVerifier
+from src.infrastructure.online_migration import ddl
+
+
+IDS = sorted(uuid.uuid4() for _ in range(3))
+
+
+def _connection(fetchrow=(), execute=None, estimate=3):
+    connection = MagicMock()
+    connection.fetchrow = AsyncMock(side_effect=list(fetchrow))
+    connection.fetchval = AsyncMock(return_value=estimate)
+    connection.execute = AsyncMock(side_effect=execute)
+    return connection
+
+
+def _progress(last_id=None, finished=False):
+    now = datetime.now(UTC)
+    return {
+        'name': 'balance_minor', 'last_id': last_id, 'rows_scanned': 2, 'rows_updated': 2,
+        'started_at': now, 'updated_at': now, 'finished_at': now if finished else None
+    }
+
+
+def _executed(connection, prefix):
+    return [call.args for call in connection.execute.call_args_list if call.args[0].startswith(prefix)]
+
+
+class TestColumnBackfill:
+    """Test cases for ColumnBackfill."""
+
+    @pytest.mark.asyncio
+    async def test_walks_table_in_chunks(self):
+        """Test that chunks continue after the last ID and the short chunk finishes the backfill."""
+        # Arrange
+        connection = _connection(
+            fetchrow=[None, {'rows': 2, 'upper_id': IDS[1]}, {'rows': 1, 'upper_id': IDS[2]},
+                      _progress(IDS[2], finished=True)],
+            execute=lambda sql, *args: 'UPDATE 1' if sql.startswith('UPDATE') else 'OK'
+        )
+        backfill = ColumnBackfill(connection, BALANCE_MINOR, Mock(), batch_size=2, duty_cycle=1.0)
+
+        # Act
+        progress = await backfill.run()
+
+        # Assert
+        assert progress.finished
+        updates = _executed(connection, 'UPDATE')
+        assert [args[1:] for args in updates] == [(None, IDS[1]), (IDS[1], IDS[2])]
+        assert 'balance_minor IS NULL' in updates[0][0]
+        saved = _executed(connection, 'INSERT INTO online_migration_progress')
+        assert [args[2:] for args in saved] == [(IDS[1], 2, 1, False), (IDS[2], 1, 1, True)]
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_last_chunk(self):
+        """Test that a resumed backfill starts after the persisted position."""
+        # Arrange
+        connection = _connection(
+            fetchrow=[_progress(IDS[1]), {'rows': 0, 'upper_id': None}, _progress(IDS[1], finished=True)],
+            execute=lambda sql, *args: 'OK'
+        )
+        backfill = ColumnBackfill(connection, BALANCE_MINOR, Mock(), batch_size=2, duty_cycle=1.0)
+
+        # Act
+        await backfill.run()
+
+        # Assert
+        assert connection.fetchrow.call_args_list[1].args[1:] == (IDS[1], 2)
+        assert _executed(connection, 'UPDATE') == []
+
+    @pytest.mark.asyncio
+    async def test_finished_backfill_is_not_repeated(self):
+        """Test that a finished backfill returns without walking the table."""
+        # Arrange
+        connection = _connection(fetchrow=[_progress(IDS[2], finished=True)])
+        backfill = ColumnBackfill(connection, BALANCE_MINOR, Mock())
+
+        # Act
+        progress = await backfill.run()
+
+        # Assert
+        assert progress.finished
+        connection.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lock_timeout_retries_smaller_chunk(self, monkeypatch):
+        """Test that a chunk hitting the lock timeout is retried at half the size."""
+        # Arrange
+        monkeypatch.setattr('asyncio.sleep', AsyncMock())
+        connection = _connection(fetchrow=[None, _progress(IDS[0], finished=True)])
+        backfill = ColumnBackfill(connection, BALANCE_MINOR, Mock(), batch_size=1000, duty_cycle=1.0)
+        backfill._chunk = AsyncMock(side_effect=[
+            asyncpg.exceptions.LockNotAvailableError('lock timeout'),
+            (IDS[0], 1, 1),
+        ])
+
+        # Act
+        await backfill.run()
+
+        # Assert
+        assert [call.args[1] for call in backfill._chunk.call_args_list] == [1000, 500]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, monkeypatch):
+        """Test that persistent lock timeouts fail the backfill."""
+        # Arrange
+        monkeypatch.setattr('asyncio.sleep', AsyncMock())
+        connection = _connection(fetchrow=[None])
+        backfill = ColumnBackfill(connection, BALANCE_MINOR, Mock(), max_retries=2)
+        backfill._chunk = AsyncMock(side_effect=asyncpg.exceptions.LockNotAvailableError('lock timeout'))
+
+        # Act & Assert
+        with pytest.raises(asyncpg.exceptions.LockNotAvailableError):
+            await backfill.run()
+        assert backfill._chunk.call_count == 3
+
+    def test_invalid_duty_cycle(self):
+        """Test that the duty cycle must be in (0, 1]."""
+        with pytest.raises(ValueError):
+            ColumnBackfill(Mock(), BALANCE_MINOR, Mock(), duty_cycle=0.0)
+
+
+class TestDualWriteVerifier:
+    """Test cases for DualWriteVerifier."""
+
+    @pytest.mark.asyncio
+    async def test_reports_pending_and_mismatched_rows(self):
+        """Test that counts add up over chunks and mismatches are sampled."""
+        # Arrange
+        connection = _connection(fetchrow=[
+            {'rows': 2, 'upper_id': IDS[1], 'pending': 1, 'mismatched': [IDS[0]]},
+            {'rows': 1, 'upper_id': IDS[2], 'pending': 0, 'mismatched': []},
+        ])
+        verifier = DualWriteVerifier(connection, BALANCE_MINOR, Mock(), batch_size=2, duty_cycle=1.0)
+
+        # Act
+        result = await verifier.run()
+
+        # Assert
+        assert (result.rows_checked, result.pending, result.mismatched) == (3, 1, 1)
+        assert result.samples == [IDS[0]]
+        assert not result.ok
+        assert connection.fetchrow.call_args_list[1].args[1] == IDS[1]
+
+    @pytest.mark.asyncio
+    async def test_clean_pass(self):
+        """Test that fully written, consistent rows pass."""
+        # Arrange
+        connection = _connection(fetchrow=[{'rows': 1, 'upper_id': IDS[0], 'pending': 0, 'mismatched': []}])
+        verifier = DualWriteVerifier(connection, BALANCE_MINOR, Mock(), batch_size=2)
+
+        # Act
+        result = await verifier.run()
+
+        # Assert
+        assert result.ok
+
+
+class TestDdl:
+    """Test cases for the non-blocking DDL helpers."""
+
+    @pytest.mark.parametrize('invalid', [True, False])
+    def test_create_index_concurrently(self, monkeypatch, invalid):
+        """Test that an invalid leftover is dropped and the build runs concurrently."""
+        # Arrange
+        op = MagicMock()
+        op.get_bind.return_value.execute.return_value.scalar.return_value = 1 if invalid else None
+        monkeypatch.setattr(ddl, 'op', op)
+
+        # Act
+        ddl.create_index_concurrently('ix_wallets_balance', 'wallets', ['balance'])
+
+        # Assert
+        assert op.drop_index.called == invalid
+        op.create_index.assert_called_once_with(
+            'ix_wallets_balance', 'wallets', ['balance'], postgresql_concurrently=True, if_not_exists=True
+        )
+        op.get_context.return_value.autocommit_block.assert_called_once()
+
+    def test_set_not_null_online(self, monkeypatch):
+        """Test that NOT NULL goes through a validated check constraint."""
+        # Arrange
+        op = MagicMock()
+        op.get_bind.return_value.execute.return_value.scalar.return_value = None
+        monkeypatch.setattr(ddl, 'op', op)
+
+        # Act
+        ddl.set_not_null_online('wallets', 'balance_minor')
+
+        # Assert
+        statements = [call.args[0] for call in op.execute.call_args_list]
+        assert any('CHECK (balance_minor IS NOT NULL) NOT VALID' in statement for statement in statements)
+        assert any('VALIDATE CONSTRAINT wallets_balance_minor_not_null' in statement for statement in statements)
+        op.alter_column.assert_called_once_with('wallets', 'balance_minor', nullable=False)
+        op.drop_constraint.assert_called_once_with('wallets_balance_minor_not_null', 'wallets', type_='check')
@@ -0,0 +1,105 @@
+"""
+Unit tests for OperationService.
+
+Tests acceptance of asynchronous operations and status retrieval, and
+their refusal with wallet storages the queue worker cannot reach.
+"""
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+from fastapi.testclient import TestClient
+from src.application.domain.operation_type import Operation
+from src.application.services import get_operation_service
+from src.application.services.operation_service import OperationService
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.main import app
+from src.infrastructure.database.repositories.operation_repository import (
+    OperationRepository,
+    UnavailableOperationRepository
+)
+from src.application.exceptions import (
+    DatabaseError,
+    OperationNotFoundError,
+    OperationQueueUnavailableError
+)
+
+
+class TestOperationService:
+    """Test cases for OperationService."""
+
+    @pytest.fixture
+    def mock_operation_repository(self):
+        """Create a mock operation repository."""
+        return AsyncMock(spec=OperationRepository)
+
+    @pytest.mark.asyncio
+    async def test_enqueue_success(self, mock_operation_repository):
+        """Test successful operation acceptance."""
+        # Arrange
+        wallet_id = str(uuid4())
+        operation = WalletOperation(id=uuid4(), wallet_id=wallet_id, operation_type='deposit', amount=Decimal('5.00'))
+        mock_operation_repository.enqueue.return_value = operation
+        service = OperationService(mock_operation_repository, Mock())
+
+        # Act
+        result = await service.enqueue(wallet_id, Operation.DEPOSIT, Decimal('5.00'))
+
+        # Assert
+        assert result == operation
+        mock_operation_repository.enqueue.assert_called_once_with(wallet_id, Operation.DEPOSIT, Decimal('5.00'))
+
+    @pytest.mark.asyncio
+    async def test_enqueue_unexpected_error_wrapped(self, mock_operation_repository):
+        """Test that unexpected errors are wrapped into DatabaseError."""
+        # Arrange
+        mock_operation_repository.enqueue.side_effect = RuntimeError('boom')
+        service = OperationService(mock_operation_repository, Mock())
+
+        # Act & Assert
+        with pytest.raises(DatabaseError):
+            await service.enqueue(str(uuid4()), Operation.WITHDRAW, Decimal('5.00'))
+
+    @pytest.mark.asyncio
+    async def test_get_operation_not_found(self, mock_operation_repository):
+        """Test operation retrieval when operation not found."""
+        # Arrange
+        mock_operation_repository.get_operation.side_effect = OperationNotFoundError('Operation not found')
+        service = OperationService(mock_operation_repository, Mock())
+
+        # Act & Assert
+        with pytest.raises(OperationNotFoundError):
+            await service.get_operation(str(uuid4()))
+
+
+class TestUnavailableOperationRepository:
+    """Test cases for UnavailableOperationRepository."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('storage', ['memory', 'sharded'])
+    async def test_enqueue_is_refused(self, storage):
+        """Test that no operation is queued, since the worker cannot reach the wallets."""
+        # Arrange
+        session_maker = MagicMock()
+        repository = UnavailableOperationRepository(session_maker, Mock(), storage=storage)
+
+        # Act & Assert
+        with pytest.raises(OperationQueueUnavailableError, match=storage):
+            await repository.enqueue(str(uuid4()), Operation.DEPOSIT, Decimal('10'))
+        session_maker.assert_not_called()
+
+    def test_async_operation_answered_with_501(self):
+        """Test that the refusal reaches the client as 501 rather than a 202 or a 500."""
+        # Arrange
+        repository = UnavailableOperationRepository(MagicMock(), Mock(), storage='memory')
+        app.dependency_overrides[get_operation_service] = lambda: OperationService(repository, Mock())
+        try:
+            client = TestClient(app)
+
+            # Act
+            response = client.post(f'/api/v1/wallets/{uuid4()}/operation?amount=10&operation_type=deposit&async=true')
+        finally:
+            app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 501
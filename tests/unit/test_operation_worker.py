@@ -0,0 +1,139 @@
+"""
+Unit tests for the operation worker.
+
+Tests per-wallet application of queued operations, which must match the
+sequential semantics of WalletRepository.deposit/withdraw, and the
+isolation of wallets within a batch.
+"""
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, UTC
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+from src.application.domain.operation_status import OperationStatus
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.infrastructure.workers import OperationWorker, apply_operations
+from src.settings import settings
+
+
+def make_operation(operation_type: str, amount: str) -> WalletOperation:
+    return WalletOperation(
+        id=uuid4(),
+        wallet_id=uuid4(),
+        operation_type=operation_type,
+        amount=Decimal(amount),
+        status=OperationStatus.PENDING.value
+    )
+
+
+class TestApplyOperations:
+    """Test cases for apply_operations."""
+
+    def test_operations_applied_in_order(self):
+        """Test that deposits and withdrawals are applied sequentially."""
+        # Arrange
+        operations = [
+            make_operation('deposit', '50.00'),
+            make_operation('withdraw', '120.00'),
+            make_operation('deposit', '10.50')
+        ]
+
+        # Act
+        balance = apply_operations(Decimal('100.00'), operations, datetime.now(UTC))
+
+        # Assert
+        assert balance == Decimal('40.50')
+        assert [operation.balance_after for operation in operations] == [
+            Decimal('150.00'), Decimal('30.00'), Decimal('40.50')
+        ]
+        assert all(operation.status == OperationStatus.APPLIED.value for operation in operations)
+
+    def test_overdraft_fails_without_changing_balance(self):
+        """Test that an overdrawing withdrawal fails and later operations still apply."""
+        # Arrange
+        operations = [
+            make_operation('withdraw', '150.00'),
+            make_operation('withdraw', '60.00')
+        ]
+
+        # Act
+        balance = apply_operations(Decimal('100.00'), operations, datetime.now(UTC))
+
+        # Assert
+        assert balance == Decimal('40.00')
+        assert operations[0].status == OperationStatus.FAILED.value
+        assert operations[0].error_code == 'INSUFFICIENT_FUNDS'
+        assert operations[0].balance_after is None
+        assert operations[1].status == OperationStatus.APPLIED.value
+
+    def test_processed_at_recorded(self):
+        """Test that every operation gets the processing timestamp."""
+        # Arrange
+        processed_at = datetime.now(UTC)
+        operations = [make_operation('deposit', '1.00'), make_operation('withdraw', '5.00')]
+
+        # Act
+        apply_operations(Decimal('0.00'), operations, processed_at)
+
+        # Assert
+        assert all(operation.processed_at == processed_at for operation in operations)
+
+
+def _session(operations, wallets):
+    """Session whose first flush fails, as the database would reject an overflowing balance."""
+    session = MagicMock()
+    operations_result, wallets_result = MagicMock(), MagicMock()
+    operations_result.scalars.return_value.all.return_value = operations
+    wallets_result.scalars.return_value = wallets
+    session.execute = AsyncMock(side_effect=[operations_result, wallets_result])
+    session.commit = AsyncMock()
+    session.rolled_back = []
+
+    session.flush = AsyncMock(side_effect=[RuntimeError('numeric field overflow'), None])
+
+    @asynccontextmanager
+    async def begin_nested():
+        try:
+            yield
+        except Exception:
+            session.rolled_back.append(True)
+            raise
+
+    session.begin_nested = begin_nested
+    return session
+
+
+class TestOperationWorker:
+    """Test cases for OperationWorker.process_batch."""
+
+    @pytest.mark.asyncio
+    async def test_failing_wallet_does_not_block_batch(self, monkeypatch):
+        """Test that a wallet the database rejects fails alone and the rest of the batch commits."""
+        # Arrange
+        monkeypatch.setattr(settings, 'BALANCE_STREAM_ENABLED', False)
+        monkeypatch.setattr('src.infrastructure.workers.operation_worker.apply_stats_delta', AsyncMock())
+        poisoned = Wallet(id=uuid4(), balance=Decimal('100.00'), balance_minor=10000)
+        healthy = Wallet(id=uuid4(), balance=Decimal('100.00'), balance_minor=10000)
+        poison = make_operation('deposit', '50.00')
+        poison.wallet_id = poisoned.id
+        good = make_operation('deposit', '25.00')
+        good.wallet_id = healthy.id
+        session = _session([poison, good], [poisoned, healthy])
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__.return_value = session
+        worker = OperationWorker(session_maker, Mock(), batch_size=10, poll_interval=0.1)
+
+        # Act
+        processed = await worker.process_batch()
+
+        # Assert
+        assert processed == 2
+        assert session.rolled_back == [True]
+        assert poison.status == OperationStatus.FAILED.value
+        assert poison.error_code == 'PROCESSING_FAILED'
+        assert poison.balance_after is None
+        assert good.status == OperationStatus.APPLIED.value
+        assert healthy.balance == Decimal('125.00')
+        session.commit.assert_awaited_once()
@@ -0,0 +1,226 @@
+"""
+Unit tests for the sampling profiler.
+
+Tests stack sampling of another thread, collapsed-stack output, artifact
+storage, per-request profiling through ProfilingMiddleware and the admin
+profile endpoint.
+"""
+import asyncio
+import base64
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.infrastructure.profiling import (
+    ProfileArtifactStore, StackSampler, format_collapsed, get_profile_store, profile_marker_var, task_marker_filter
+)
+from src.main import app
+from src.presentation.middleware.profiling import ProfilingMiddleware
+from src.settings import settings
+
+
+def busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def read_in_thread(predicate) -> bool:
+    result = []
+    reader = threading.Thread(target=lambda: result.append(predicate()))
+    reader.start()
+    reader.join()
+    return result[0]
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    monkeypatch.setattr(settings, 'DOCS_USERNAME', 'admin')
+    monkeypatch.setattr(settings, 'DOCS_PASSWORD', 'secret')
+    return 'Basic ' + base64.b64encode(b'admin:secret').decode()
+
+
+def make_app(store: ProfileArtifactStore) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, store=store, logger=Mock(), interval=0.001)
+
+    @app.get('/work')
+    async def work():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        return {'ok': True}
+
+    return app
+
+
+class TestStackSampler:
+    """Test cases for StackSampler."""
+
+    def test_samples_target_thread(self):
+        """Test that the sampled thread's hot function appears in the collapsed stacks."""
+        # Arrange
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop,))
+        worker.start()
+        sampler = StackSampler(thread_id=worker.ident, interval=0.001)
+
+        # Act
+        sampler.start()
+        time.sleep(0.1)
+        counts = sampler.stop()
+        stop.set()
+        worker.join()
+
+        # Assert
+        assert sampler.samples > 0
+        assert 'busy_loop' in format_collapsed(counts)
+
+    def test_predicate_suppresses_samples(self):
+        """Test that no samples are recorded while the predicate is false."""
+        # Arrange
+        sampler = StackSampler(thread_id=threading.get_ident(), interval=0.001, should_sample=lambda: False)
+
+        # Act
+        sampler.start()
+        time.sleep(0.02)
+        counts = sampler.stop()
+
+        # Assert
+        assert not counts
+
+
+class TestTaskMarkerFilter:
+    """Test cases for task_marker_filter."""
+
+    @pytest.mark.asyncio
+    async def test_matches_only_marked_task_from_another_thread(self):
+        """Test that the filter, read from another thread, matches only the marked request's task."""
+        # Arrange
+        marker = object()
+        is_marked = task_marker_filter(asyncio.get_running_loop(), marker)
+
+        async def check(mark: bool) -> bool:
+            if mark:
+                profile_marker_var.set(marker)
+            # The loop thread stays in this task while the sampler thread reads it
+            return read_in_thread(is_marked)
+
+        # Act
+        marked = await asyncio.create_task(check(True))
+        unmarked = await asyncio.create_task(check(False))
+
+        # Assert
+        assert marked is True
+        # Without Task.get_context every task matches
+        assert unmarked is not hasattr(asyncio.Task, 'get_context')
+
+    def test_degrades_when_current_task_is_unreadable(self, monkeypatch):
+        """Test that every sample matches when the loop's current task cannot be read."""
+        # Arrange
+        monkeypatch.setattr(asyncio, 'current_task', Mock(side_effect=RuntimeError('unsupported')))
+        is_marked = task_marker_filter(Mock(), object())
+
+        # Act & Assert
+        assert is_marked() is True
+
+
+class TestProfileArtifactStore:
+    """Test cases for ProfileArtifactStore."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_newest_artifacts(self, tmp_path):
+        """Test that artifacts beyond the limit are deleted oldest first."""
+        # Arrange
+        store = ProfileArtifactStore(directory=str(tmp_path), max_artifacts=2)
+
+        # Act
+        names = []
+        for i in range(3):
+            names.append(await store.save(f'profile-{i}', f'stack {i}\n'))
+            time.sleep(0.01)
+
+        # Assert
+        assert store.read(names[0]) is None
+        assert store.read(names[2]) == 'stack 2\n'
+
+    @pytest.mark.asyncio
+    async def test_zero_keeps_no_artifacts(self, tmp_path):
+        """Test that a limit of 0 deletes every artifact instead of keeping all."""
+        # Arrange
+        store = ProfileArtifactStore(directory=str(tmp_path), max_artifacts=0)
+
+        # Act
+        name = await store.save('profile', 'stack\n')
+
+        # Assert
+        assert store.read(name) is None
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_path_traversal(self, tmp_path):
+        """Test that names with path separators are rejected."""
+        # Arrange
+        store = ProfileArtifactStore(directory=str(tmp_path))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await store.save('../escape', '')
+        assert store.read('../escape.collapsed') is None
+
+
+class TestProfilingMiddleware:
+    """Test cases for ProfilingMiddleware."""
+
+    def test_authorized_request_gets_artifact(self, tmp_path, credentials):
+        """Test that a request with X-Profile and admin credentials is profiled."""
+        # Arrange
+        store = ProfileArtifactStore(directory=str(tmp_path))
+        client = TestClient(make_app(store))
+
+        # Act
+        response = client.get('/work', headers={'X-Profile': '1', 'Authorization': credentials, 'X-Trace-ID': 'abc/1'})
+
+        # Assert
+        assert response.status_code == 200
+        artifact = response.headers['X-Profile-Artifact']
+        assert artifact.endswith('-abc_1.collapsed')
+        assert 'work' in store.read(artifact)
+
+    def test_unauthorized_request_is_not_profiled(self, tmp_path, credentials):
+        """Test that X-Profile without valid credentials is ignored."""
+        # Arrange
+        store = ProfileArtifactStore(directory=str(tmp_path))
+        client = TestClient(make_app(store))
+        wrong = 'Basic ' + base64.b64encode(b'admin:wrong').decode()
+
+        # Act
+        response = client.get('/work', headers={'X-Profile': '1', 'Authorization': wrong})
+
+        # Assert
+        assert response.status_code == 200
+        assert 'X-Profile-Artifact' not in response.headers
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestRunProfile:
+    """Test cases for the admin profile endpoint."""
+
+    def test_failed_save_still_returns_profile(self, credentials):
+        """Test that the stacks are returned without an artifact header when saving fails."""
+        # Arrange
+        store = Mock(save=AsyncMock(side_effect=OSError('disk full')))
+        app.dependency_overrides[get_profile_store] = lambda: store
+        try:
+            client = TestClient(app)
+
+            # Act
+            response = client.post('/admin/profile?seconds=0.01', headers={'Authorization': credentials})
+        finally:
+            app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 200
+        assert 'X-Profile-Artifact' not in response.headers
+        store.save.assert_awaited_once()
@@ -0,0 +1,134 @@
+"""
+Unit tests for wallet reconciliation.
+
+Tests key space splitting, row classification, range queries and checkpoints.
+"""
+import pytest
+from decimal import Decimal
+from uuid import UUID, uuid4
+from src.infrastructure.reconciliation import (
+    DiscrepancyKind,
+    ReconciliationCheckpoint,
+    classify,
+    split_keyspace
+)
+from src.infrastructure.reconciliation.keyspace import UUID_SPACE
+from src.infrastructure.reconciliation.scanner import build_range_query
+
+
+class TestSplitKeyspace:
+    """Test cases for split_keyspace."""
+
+    def test_ranges_cover_space_without_gaps(self):
+        """Test that consecutive ranges share bounds and the ends are open."""
+        # Arrange
+        low, high = UUID('01900000-0000-7000-8000-000000000000').int, UUID('019a0000-0000-7000-8000-000000000000').int
+
+        # Act
+        ranges = split_keyspace(16, low, high)
+
+        # Assert
+        assert len(ranges) == 16
+        assert ranges[0].start == 0
+        assert ranges[-1].end is None
+        for previous, current in zip(ranges, ranges[1:]):
+            assert previous.end == current.start
+        assert [key_range.index for key_range in ranges] == list(range(16))
+
+    def test_ranges_have_similar_width(self):
+        """Test that interior ranges split the bounds evenly."""
+        ranges = split_keyspace(4, 0, 400)
+        assert [(key_range.start, key_range.end) for key_range in ranges] == [(0, 100), (100, 200), (200, 300), (300, None)]
+
+    def test_whole_space(self):
+        """Test that the default bounds span the full UUID space."""
+        ranges = split_keyspace(2)
+        assert ranges[1].start == UUID_SPACE // 2
+
+    def test_invalid_count(self):
+        """Test that a non-positive count is rejected."""
+        with pytest.raises(ValueError):
+            split_keyspace(0)
+
+
+class TestClassify:
+    """Test cases for wallet row classification."""
+
+    def test_consistent_wallet(self):
+        """Test that a consistent wallet yields no discrepancies."""
+        assert classify(uuid4(), Decimal('10.50'), 1050) == []
+
+    def test_minor_units_not_backfilled(self):
+        """Test that a missing minor-unit balance is not a discrepancy."""
+        assert classify(uuid4(), Decimal('10.50'), None) == []
+
+    @pytest.mark.parametrize('balance, minor, kind', [
+        (Decimal('-0.01'), -1, DiscrepancyKind.NEGATIVE_BALANCE),
+        (Decimal('10000000000.00'), 1000000000000, DiscrepancyKind.OUT_OF_RANGE),
+        (Decimal('1.005'), None, DiscrepancyKind.SCALE_EXCEEDED),
+        (Decimal('10.50'), 1049, DiscrepancyKind.MINOR_UNITS_MISMATCH),
+    ])
+    def test_discrepancies(self, balance, minor, kind):
+        """Test that each inconsistency is reported with its kind."""
+        found = classify(uuid4(), balance, minor)
+        assert [discrepancy.kind for discrepancy in found] == [kind]
+
+    def test_null_balance(self):
+        """Test that a NULL balance is reported."""
+        assert classify(uuid4(), None, None)[0].kind == DiscrepancyKind.NULL_BALANCE
+
+    def test_operations_mismatch(self):
+        """Test that a balance differing from the operations sum is reported with the expected value."""
+        # Act
+        found = classify(uuid4(), Decimal('10.00'), 1000, Decimal('7.50'))
+
+        # Assert
+        assert found[0].kind == DiscrepancyKind.OPERATIONS_MISMATCH
+        assert found[0].to_dict()['expected'] == '7.50'
+
+
+class TestRangeQuery:
+    """Test cases for range scan queries."""
+
+    def test_bounded_range(self):
+        """Test that an interior range filters on both bounds."""
+        ranges = split_keyspace(4)
+        sql, args = build_range_query(ranges[1], check_operations=False)
+        assert 'w.id >= $1 AND w.id < $2' in sql
+        assert args == [ranges[1].start_uuid, ranges[1].end_uuid]
+        assert 'wallet_operations' not in sql
+
+    def test_last_range_is_open(self):
+        """Test that the last range has no upper bound."""
+        ranges = split_keyspace(4)
+        sql, args = build_range_query(ranges[-1], check_operations=True)
+        assert '$2' not in sql
+        assert len(args) == 1
+        assert 'wallet_operations' in sql
+
+
+class TestReconciliationCheckpoint:
+    """Test cases for ReconciliationCheckpoint."""
+
+    def test_resume_from_saved_state(self, tmp_path):
+        """Test that finished ranges and parameters survive a restart."""
+        # Arrange
+        path = str(tmp_path / 'nested' / 'checkpoint.json')
+        checkpoint = ReconciliationCheckpoint(path)
+        checkpoint.start({'ranges': 8, 'low': 1, 'high': 2, 'check_operations': False})
+        checkpoint.mark_done([3, 1])
+
+        # Act
+        restored = ReconciliationCheckpoint(path)
+        loaded = restored.load()
+
+        # Assert
+        assert loaded
+        assert restored.done == {1, 3}
+        assert restored.params['ranges'] == 8
+
+    def test_missing_checkpoint(self, tmp_path):
+        """Test that a missing file means a fresh pass."""
+        checkpoint = ReconciliationCheckpoint(str(tmp_path / 'checkpoint.json'))
+        assert not checkpoint.load()
+        checkpoint.clear()
@@ -0,0 +1,147 @@
+"""
+Unit tests for the offline operation replay.
+
+Results are compared with OperationWorker's apply_operations, which mirrors
+WalletRepository.deposit/withdraw.
+"""
+import json
+import random
+import pytest
+from datetime import datetime, UTC
+from decimal import Decimal
+from uuid import uuid4
+from src.application.domain.money import to_minor_units
+from src.application.domain.operation_status import OperationStatus
+from src.infrastructure.database.models.wallet_operation import WalletOperation
+from src.infrastructure.workers.operation_worker import apply_operations
+
+np = pytest.importorskip('numpy')
+
+from src.infrastructure.replay import OperationColumns, replay  # noqa: E402
+
+
+def _sequential(records, initial):
+    """Replay records wallet by wallet with the worker's sequential semantics."""
+    balances = dict(initial)
+    operations = []
+    for record in records:
+        operation = WalletOperation(
+            wallet_id=record['wallet_id'],
+            operation_type=record['operation_type'],
+            amount=Decimal(record['amount'])
+        )
+        balances[record['wallet_id']] = apply_operations(
+            balances.get(record['wallet_id'], Decimal('0.00')),
+            [operation],
+            datetime.now(UTC)
+        )
+        operations.append(operation)
+    return balances, operations
+
+
+class TestReplay:
+    """Test cases for replay."""
+
+    def test_overdraft_rejected_without_changing_balance(self):
+        """Test that a withdrawal beyond the balance is rejected and later operations still apply."""
+        # Arrange
+        wallet_id = str(uuid4())
+        columns = OperationColumns.from_records([
+            {'wallet_id': wallet_id, 'operation_type': 'deposit', 'amount': '10.00'},
+            {'wallet_id': wallet_id, 'operation_type': 'withdraw', 'amount': '15.00'},
+            {'wallet_id': wallet_id, 'operation_type': 'WITHDRAW', 'amount': '4.50'},
+        ])
+
+        # Act
+        result = replay(columns, with_balances=True)
+
+        # Assert
+        assert result.balance(wallet_id) == Decimal('5.50')
+        assert result.first_overdraft[columns.code(wallet_id)] == 1
+        assert result.rejected.tolist() == [False, True, False]
+        assert result.balance_after.tolist() == [1000, 1000, 550]
+
+    def test_initial_balance_and_invalid_amount(self):
+        """Test starting balances and that non-positive amounts are rejected as invalid."""
+        # Arrange
+        columns = OperationColumns.from_records([
+            {'wallet_id': 'a', 'operation_type': 'withdraw', 'amount': '3'},
+            {'wallet_id': 'b', 'operation_type': 'deposit', 'amount': '0'},
+        ])
+
+        # Act
+        result = replay(columns, columns.initial_balances({'a': Decimal('5.00')}))
+
+        # Assert
+        assert result.balance('a') == Decimal('2.00')
+        assert result.balance('b') == Decimal('0.00')
+        assert result.invalid.tolist() == [False, True]
+        assert result.first_overdraft.tolist() == [-1, -1]
+
+    @pytest.mark.parametrize('max_vector_rounds', [0, 1, 32])
+    def test_matches_sequential_semantics(self, max_vector_rounds):
+        """Test that vectorised and sequential resolution agree with the worker on random logs."""
+        for seed in range(50):
+            # Arrange
+            rnd = random.Random(seed)
+            records = [
+                {
+                    'wallet_id': f'w{rnd.randrange(4)}',
+                    'operation_type': rnd.choice(['deposit', 'withdraw', 'withdraw']),
+                    'amount': rnd.choice(['0.01', '1.50', '5.00', '20.00'])
+                }
+                for _ in range(rnd.randrange(1, 40))
+            ]
+            columns = OperationColumns.from_records(records)
+            initial = {wallet_id: Decimal(rnd.randrange(10)) for wallet_id in columns.wallet_ids}
+            expected_balances, operations = _sequential(records, initial)
+
+            # Act
+            result = replay(columns, columns.initial_balances(initial), max_vector_rounds=max_vector_rounds)
+
+            # Assert
+            failed = [operation.status == OperationStatus.FAILED.value for operation in operations]
+            assert result.rejected.tolist() == failed
+            for wallet_id, balance in expected_balances.items():
+                assert result.final_balance[columns.code(wallet_id)] == to_minor_units(balance)
+                expected_first = next(
+                    (index for index, record in enumerate(records)
+                     if record['wallet_id'] == wallet_id and failed[index]),
+                    -1
+                )
+                assert result.first_overdraft[columns.code(wallet_id)] == expected_first
+
+    def test_empty_log(self):
+        """Test that an empty log replays to nothing."""
+        result = replay(OperationColumns.from_records([]))
+        assert len(result.rejected) == 0
+        assert len(result.final_balance) == 0
+
+
+class TestOperationColumns:
+    """Test cases for OperationColumns."""
+
+    def test_jsonl_and_npz_round_trip(self, tmp_path):
+        """Test loading a JSON lines log and reloading it from .npz."""
+        # Arrange
+        path = tmp_path / 'operations.jsonl'
+        path.write_text(
+            json.dumps({'wallet_id': 'a', 'operation_type': 'deposit', 'amount': '1.25'}) + '\n\n'
+            + json.dumps({'wallet_id': 'b', 'operation_type': 'withdraw', 'amount': 2}) + '\n'
+        )
+
+        # Act
+        columns = OperationColumns.read_jsonl(str(path))
+        columns.save(str(tmp_path / 'operations.npz'))
+        restored = OperationColumns.load(str(tmp_path / 'operations.npz'))
+
+        # Assert
+        assert restored.wallet_ids == ['a', 'b']
+        assert restored.amount.tolist() == [125, 200]
+        assert restored.deposit.tolist() == [True, False]
+        assert restored.code('b') == 1
+
+    def test_invalid_record(self):
+        """Test that a malformed record is reported with its position."""
+        with pytest.raises(ValueError, match='record 1'):
+            OperationColumns.from_records([{'wallet_id': 'a', 'operation_type': 'transfer', 'amount': '1'}])
@@ -0,0 +1,107 @@
+"""
+Unit tests for the per-request wide log event.
+
+Tests field collection across layers and that the trace middleware emits
+exactly one record per request.
+"""
+from unittest.mock import Mock
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from src.infrastructure.logger.log_levels import LogLevel
+from src.infrastructure.logger.request_event import (
+    start_request_event,
+    finish_request_event,
+    add_event_fields,
+    add_event_timing,
+    request_event_var
+)
+from src.presentation.middleware.trace_id import TraceIDMiddleware
+
+
+def make_app(logger: Mock) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TraceIDMiddleware, logger=logger)
+
+    @app.get('/ok')
+    async def ok():
+        add_event_fields(wallet_id='w1')
+        add_event_timing('db_time_ms', 0.002)
+        return {'ok': True}
+
+    @app.get('/fail')
+    async def fail():
+        add_event_fields(error_code='DATABASE_ERROR')
+        raise HTTPException(status_code=500, detail='Database operation failed')
+
+    return app
+
+
+class TestRequestEvent:
+    """Test cases for request event collection."""
+
+    def test_fields_are_collected_until_finished(self):
+        """Test that fields and timings accumulate on the current event."""
+        # Arrange
+        token = start_request_event(method='GET')
+
+        # Act
+        add_event_fields(wallet_id='w1')
+        add_event_timing('db_time_ms', 0.001)
+        add_event_timing('db_time_ms', 0.002)
+        event = finish_request_event(token)
+
+        # Assert
+        assert event == {'method': 'GET', 'wallet_id': 'w1', 'db_time_ms': 3.0}
+        assert request_event_var.get() is None
+
+    def test_add_fields_outside_request_is_noop(self):
+        """Test that attaching fields without an active event does nothing."""
+        # Act
+        add_event_fields(wallet_id='w1')
+        add_event_timing('db_time_ms', 0.001)
+
+        # Assert
+        assert request_event_var.get() is None
+
+
+class TestTraceIDMiddlewareEvent:
+    """Test cases for the wide event emitted by TraceIDMiddleware."""
+
+    def test_emits_single_event_per_request(self):
+        """Test that a successful request produces one INFO event with handler fields."""
+        # Arrange
+        logger = Mock()
+        client = TestClient(make_app(logger))
+
+        # Act
+        response = client.get('/ok')
+
+        # Assert
+        assert response.status_code == 200
+        logger.event.assert_called_once()
+        message, fields = logger.event.call_args.args
+        assert message == 'request'
+        assert fields['method'] == 'GET'
+        assert fields['path'] == '/ok'
+        assert fields['status'] == 200
+        assert fields['wallet_id'] == 'w1'
+        assert fields['db_time_ms'] == 2.0
+        assert 'duration_ms' in fields
+        assert logger.event.call_args.kwargs['level'] == LogLevel.INFO
+
+    def test_server_error_is_logged_at_error_level(self):
+        """Test that a 5xx response emits the event at ERROR level with its error code."""
+        # Arrange
+        logger = Mock()
+        client = TestClient(make_app(logger))
+
+        # Act
+        response = client.get('/fail')
+
+        # Assert
+        assert response.status_code == 500
+        logger.event.assert_called_once()
+        fields = logger.event.call_args.args[1]
+        assert fields['status'] == 500
+        assert fields['error_code'] == 'DATABASE_ERROR'
+        assert logger.event.call_args.kwargs['level'] == LogLevel.ERROR
@@ -0,0 +1,236 @@
+"""
+Unit tests for the wallet seeder.
+
+Covers balance distributions, the generated wallets and histories, the
+hot-wallet workload and the COPY pipeline with deferred indexes.
+"""
+import csv
+import random
+import pytest
+from collections import Counter
+from datetime import datetime, UTC
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+from src.infrastructure.seeding import (
+    WalletReservoir, WalletSeedGenerator, WalletSeedLoader, ZipfSampler, batches, make_distribution, write_workload
+)
+from src.infrastructure.seeding.distributions import MAX_BALANCE_MINOR
+
+
+NOW = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def _generator(count=500, operations_mean=0.0, seed=7):
+    distribution = make_distribution('lognormal', Decimal('100'), 1.5, zero_fraction=0.3)
+    return WalletSeedGenerator(count, distribution, seed=seed, days=30, operations_mean=operations_mean, now=NOW)
+
+
+class TestDistributions:
+    """Test cases for balance distributions."""
+
+    @pytest.mark.parametrize('name, shape', [('uniform', 0.0), ('lognormal', 3.0), ('pareto', 0.5)])
+    def test_samples_fit_numeric_column(self, name, shape):
+        """Test that samples are non-negative and fit numeric(12, 2)."""
+        # Arrange
+        distribution = make_distribution(name, Decimal('1000'), shape)
+        rng = random.Random(1)
+
+        # Act
+        samples = [distribution.sample(rng) for _ in range(5000)]
+
+        # Assert
+        assert all(0 <= sample <= MAX_BALANCE_MINOR for sample in samples)
+
+    def test_zero_fraction(self):
+        """Test that the requested share of wallets is empty."""
+        # Arrange
+        distribution = make_distribution('uniform', Decimal('10'), 0.0, zero_fraction=0.4)
+        rng = random.Random(1)
+
+        # Act
+        zeros = sum(distribution.sample(rng) == 0 for _ in range(10_000))
+
+        # Assert
+        assert 3700 < zeros < 4300
+
+    def test_unknown_distribution(self):
+        """Test that unknown names are rejected."""
+        with pytest.raises(ValueError):
+            make_distribution('normal', Decimal('1'), 1.0)
+
+    def test_zipf_is_skewed(self):
+        """Test that low ranks receive most draws."""
+        # Arrange
+        zipf = ZipfSampler(1000, 1.1)
+        rng = random.Random(1)
+
+        # Act
+        counts = Counter(zipf.sample(rng) for _ in range(20_000))
+
+        # Assert
+        assert counts.most_common(1)[0][0] == 0
+        assert sum(counts[rank] for rank in range(10)) / 20_000 == pytest.approx(zipf.share(10), abs=0.02)
+
+
+class TestWalletSeedGenerator:
+    """Test cases for WalletSeedGenerator."""
+
+    def test_ids_and_creation_times_ascend(self):
+        """Test that wallets come in ID and creation order, like UUIDv7 inserts."""
+        # Act
+        wallets = list(_generator().wallets())
+
+        # Assert
+        ids = [wallet.id for wallet in wallets]
+        assert ids == sorted(ids) and len(set(ids)) == len(ids)
+        assert all(wallet.id.version == 7 for wallet in wallets)
+        created = [wallet.created_at for wallet in wallets]
+        assert created == sorted(created) and created[-1] <= NOW
+
+    def test_reproducible(self):
+        """Test that the same seed yields the same wallets."""
+        assert list(_generator().wallets()) == list(_generator().wallets())
+
+    def test_history_ends_at_balance(self):
+        """Test that histories never go negative and their net sum is the balance."""
+        # Act
+        wallets = list(_generator(operations_mean=4).wallets())
+
+        # Assert
+        assert any(wallet.operations for wallet in wallets)
+        for wallet in wallets:
+            balance = 0
+            for operation in wallet.operations:
+                balance += operation.amount_minor if operation.operation_type == 'deposit' else -operation.amount_minor
+                assert operation.amount_minor > 0
+                assert balance == operation.balance_after_minor >= 0
+                assert wallet.created_at <= operation.created_at <= NOW
+            assert balance == wallet.balance_minor
+
+    def test_batches(self):
+        """Test that batches cover all wallets and their rows match the columns."""
+        # Act
+        loaded = list(batches(_generator(count=250, operations_mean=1).wallets(), 100))
+
+        # Assert
+        assert [len(rows) for _, rows, _ in loaded] == [100, 100, 50]
+        _, wallet_rows, operation_rows = loaded[0]
+        wallet_id, balance, balance_minor, _ = wallet_rows[0]
+        assert balance == Decimal(balance_minor).scaleb(-2)
+        assert all(row[4] == 'applied' for row in operation_rows)
+
+
+class TestWorkload:
+    """Test cases for the hot-wallet workload."""
+
+    def test_reservoir_keeps_sample_size(self):
+        """Test that the reservoir holds a bounded sample of the stream."""
+        # Arrange
+        reservoir = WalletReservoir(10, random.Random(1))
+
+        # Act
+        for wallet in _generator(count=200).wallets():
+            reservoir.offer(wallet.id)
+
+        # Assert
+        assert len(reservoir.wallet_ids) == len(set(reservoir.wallet_ids)) == 10
+
+    def test_write_workload(self, tmp_path):
+        """Test that the workload file is skewed towards a few wallets."""
+        # Arrange
+        wallet_ids = [wallet.id for wallet in _generator(count=200).wallets()]
+        path = str(tmp_path / 'workload.csv')
+
+        # Act
+        share = write_workload(path, wallet_ids, operations=5000, skew=1.2, seed=3)
+
+        # Assert
+        with open(path, encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 5000
+        assert {row['operation_type'] for row in rows} == {'deposit', 'withdraw'}
+        top = Counter(row['wallet_id'] for row in rows).most_common(2)
+        assert sum(count for _, count in top) / 5000 == pytest.approx(share, abs=0.05)
+
+
+def _connection(indexes=()):
+    connection = MagicMock()
+    connection.fetch = AsyncMock(side_effect=lambda sql, table: [
+        {'name': name, 'definition': f'CREATE INDEX {name} ON {table} (created_at)'}
+        for index_table, name in indexes if index_table == table
+    ])
+    connection.execute = AsyncMock()
+    connection.copy_records_to_table = AsyncMock()
+    return connection
+
+
+class TestWalletSeedLoader:
+    """Test cases for WalletSeedLoader."""
+
+    @pytest.mark.asyncio
+    async def test_load_defers_indexes(self):
+        """Test that indexes are dropped before the COPY and rebuilt after it."""
+        # Arrange
+        connection = _connection(indexes=[('wallets', 'ix_wallets_created_at_id')])
+        loader = WalletSeedLoader(connection, Mock())
+        on_batch = Mock()
+
+        # Act
+        summary = await loader.load(batches(_generator(count=250, operations_mean=1).wallets(), 100), on_batch=on_batch)
+
+        # Assert
+        assert summary.wallets == 250
+        assert connection.copy_records_to_table.call_args_list[0].args == ('wallets',)
+        statements = [call.args[0] for call in connection.execute.call_args_list]
+        assert statements == [
+            'DROP INDEX IF EXISTS ix_wallets_created_at_id',
+            'CREATE INDEX ix_wallets_created_at_id ON wallets (created_at)',
+            'ANALYZE wallets',
+        ]
+        assert on_batch.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_indexes_rebuilt_after_failure(self):
+        """Test that a failed load still restores the dropped indexes."""
+        # Arrange
+        connection = _connection(indexes=[('wallets', 'ix_wallets_created_at_id')])
+        connection.copy_records_to_table.side_effect = RuntimeError('connection lost')
+        loader = WalletSeedLoader(connection, Mock())
+
+        # Act
+        with pytest.raises(RuntimeError):
+            await loader.load(batches(_generator(count=10).wallets(), 5))
+
+        # Assert
+        statements = [call.args[0] for call in connection.execute.call_args_list]
+        assert 'CREATE INDEX ix_wallets_created_at_id ON wallets (created_at)' in statements
+
+    @pytest.mark.asyncio
+    async def test_rebuild_failure_does_not_mask_load_error(self):
+        """Test that the load error propagates when the rebuild after it fails too, and generation is settled."""
+        # Arrange
+        connection = _connection(indexes=[('wallets', 'ix_wallets_created_at_id')])
+        connection.copy_records_to_table.side_effect = RuntimeError('connection lost')
+        logger = Mock()
+
+        async def execute(sql):
+            if sql.startswith('CREATE'):
+                raise OSError('connection closed')
+
+        connection.execute.side_effect = execute
+        loader = WalletSeedLoader(connection, logger)
+        generated = []
+
+        def wallets():
+            for wallet in _generator(count=10).wallets():
+                generated.append(wallet)
+                yield wallet
+
+        # Act
+        with pytest.raises(RuntimeError, match='connection lost'):
+            await loader.load(batches(wallets(), 5))
+
+        # Assert
+        logger.error.assert_called_once()
+        # The batch generated in the background was waited for, not abandoned mid-generation
+        assert len(generated) == 10
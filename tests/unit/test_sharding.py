@@ -0,0 +1,522 @@
+"""
+Unit tests for wallet sharding.
+
+Covers bucket placement of IDs, the shard map, routing and listing of the
+sharded repository, and the map transitions and row transfers of the
+resharding tool.
+"""
+import random
+import uuid
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+from src.application.domain.uuid7 import uuid7
+from src.application.domain.wallet_page import SortOrder, WalletCursor, WalletListQuery, WalletPage
+from src.application.domain.wallet_totals import WalletTotals
+from src.application.exceptions import WalletNotFoundError
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.sharding import (
+    ACTIVE, BUCKET_COUNT, DRAINING, MOVING, BucketRange, ShardMap, ShardMapStore, bucket_of, with_bucket
+)
+from src.infrastructure.sharding.repository import ShardedStatsRepository, ShardedWalletRepository
+from src.infrastructure.sharding.resharder import (
+    RangeMover, _ADD_STATS, _DELETE_IDS, _DELETE_RANGE, _INSERT_ROWS, _SELECT_RANGE
+)
+
+
+HALF = BUCKET_COUNT // 2
+TWO_SHARDS = ShardMap([BucketRange(0, HALF, 'main'), BucketRange(HALF, BUCKET_COUNT, 'shard1')])
+
+
+def _store(shard_map: ShardMap) -> Mock:
+    store = Mock(loaded=True, map=shard_map)
+    store.refresh = AsyncMock(return_value=shard_map)
+    return store
+
+
+def _wallet_in(bucket: int, created_at: datetime = None) -> Wallet:
+    return Wallet(
+        id=with_bucket(uuid7(), bucket),
+        balance=Decimal('0.00'),
+        balance_minor=0,
+        created_at=created_at or datetime.now(UTC)
+    )
+
+
+class FakeShard:
+    """Shard repository listing a fixed set of wallets with keyset semantics."""
+
+    def __init__(self, wallets):
+        self.wallets = list(wallets)
+
+    async def list_wallets(self, query: WalletListQuery) -> WalletPage:
+        descending = query.order == SortOrder.DESC
+        rows = sorted(self.wallets, key=lambda wallet: (wallet.created_at, wallet.id), reverse=descending)
+        if query.cursor is not None:
+            position = (query.cursor.created_at, query.cursor.wallet_id)
+            rows = [row for row in rows if ((row.created_at, row.id) < position if descending
+                                            else (row.created_at, row.id) > position)]
+        return WalletPage.from_rows(rows[:query.limit + 1], query.limit)
+
+
+class TestBuckets:
+    """Test cases for bucket placement of wallet IDs."""
+
+    def test_with_bucket_keeps_uuid7_order(self):
+        """Test that placed IDs keep their version, variant and creation order."""
+        # Arrange
+        rng = random.Random(1)
+        original = [uuid7() for _ in range(1000)]
+
+        # Act
+        placed = [with_bucket(wallet_id, rng.randrange(BUCKET_COUNT)) for wallet_id in original]
+
+        # Assert
+        assert placed == sorted(placed)
+        assert all(wallet_id.version == 7 and wallet_id.variant == uuid.RFC_4122 for wallet_id in placed)
+
+    def test_bucket_round_trip(self):
+        """Test that an ID placed in a bucket is routed by that bucket."""
+        assert bucket_of(with_bucket(uuid.uuid4(), 12345)) == 12345
+
+
+class TestShardMap:
+    """Test cases for ShardMap."""
+
+    def test_rejects_gaps(self):
+        """Test that a map must cover every bucket exactly once."""
+        with pytest.raises(ValueError):
+            ShardMap([BucketRange(0, HALF, 'main'), BucketRange(HALF + 1, BUCKET_COUNT, 'shard1')])
+
+    def test_rejects_move_without_peer(self):
+        """Test that a moving range must name its target."""
+        with pytest.raises(ValueError):
+            ShardMap([BucketRange(0, BUCKET_COUNT, 'main', MOVING)])
+
+    def test_routes_by_bucket(self):
+        """Test that wallets are routed to the owner of their bucket."""
+        assert TWO_SHARDS.shard_for(with_bucket(uuid7(), HALF - 1)) == 'main'
+        assert TWO_SHARDS.shard_for(with_bucket(uuid7(), HALF)) == 'shard1'
+
+    def test_place_skips_moving_ranges(self):
+        """Test that new wallets are never placed in a range being moved."""
+        # Arrange
+        shard_map = TWO_SHARDS.assign(0, HALF, 'main', MOVING, 'shard1')
+        rng = random.Random(1)
+
+        # Act
+        buckets = [shard_map.place(rng) for _ in range(1000)]
+
+        # Assert
+        assert all(bucket >= HALF for bucket in buckets)
+
+    def test_assign_merges_neighbours(self):
+        """Test that moving a range back restores the original map."""
+        # Act
+        moved = ShardMap.single().assign(100, 200, 'shard1')
+        restored = moved.assign(100, 200, 'main')
+
+        # Assert
+        assert len(moved.ranges) == 3
+        assert restored == ShardMap.single()
+
+
+class TestShardMapStore:
+    """Test cases for ShardMapStore."""
+
+    def _store(self, rows, clock):
+        session = AsyncMock()
+        session.__aenter__.return_value = session
+        session.execute.return_value = Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=rows))))
+        return ShardMapStore(session_maker=Mock(return_value=session), logger=Mock(), clock=clock), session
+
+    @pytest.mark.asyncio
+    async def test_empty_table_means_single_shard(self):
+        """Test that the main database owns every bucket before the first move."""
+        # Arrange
+        store, _ = self._store([], clock=lambda: 0.0)
+
+        # Act
+        shard_map = await store.refresh()
+
+        # Assert
+        assert shard_map == ShardMap.single()
+        assert store.loaded is True
+
+    @pytest.mark.asyncio
+    async def test_on_demand_refresh_is_rate_limited(self):
+        """Test that lookups of unknown IDs do not reload the map on every request."""
+        # Arrange
+        rows = [
+            Mock(start_bucket=0, end_bucket=HALF, shard='main', state=ACTIVE, peer=None),
+            Mock(start_bucket=HALF, end_bucket=BUCKET_COUNT, shard='shard1', state=ACTIVE, peer=None),
+        ]
+        store, session = self._store(rows, clock=lambda: 10.0)
+        await store.refresh()
+
+        # Act
+        shard_map = await store.refresh(force=False)
+
+        # Assert
+        assert shard_map == TWO_SHARDS
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_since_reloads_map_older_than_call(self):
+        """Test that a lookup started after the last load reloads the map despite the rate limit."""
+        # Arrange
+        now = [10.0]
+        store, session = self._store([], clock=lambda: now[0])
+        await store.refresh()
+        now[0] = 10.01
+        started = store.now()
+
+        # Act
+        await store.refresh(force=False, since=9.0)
+        await store.refresh(force=False, since=started)
+
+        # Assert
+        assert session.execute.await_count == 2
+        assert store.loaded_at == started
+
+
+class TestShardedWalletRepository:
+    """Test cases for ShardedWalletRepository."""
+
+    @pytest.mark.asyncio
+    async def test_create_places_wallet_on_owner(self):
+        """Test that a new wallet is created on the shard owning its bucket."""
+        # Arrange
+        shards = {'main': AsyncMock(), 'shard1': AsyncMock()}
+        repository = ShardedWalletRepository(shards, _store(TWO_SHARDS), Mock())
+
+        # Act
+        for _ in range(20):
+            await repository.create()
+
+        # Assert
+        for name, shard in shards.items():
+            for call in shard.create.await_args_list:
+                assert TWO_SHARDS.shard_for(call.args[0]) == name
+        assert shards['main'].create.await_count and shards['shard1'].create.await_count
+
+    @pytest.mark.asyncio
+    async def test_retries_on_new_owner_after_move(self):
+        """Test that a wallet missing on a stale owner is found after reloading the map."""
+        # Arrange
+        wallet_id = str(with_bucket(uuid7(), 10))
+        moved = TWO_SHARDS.assign(0, HALF, 'shard1')
+        store = _store(TWO_SHARDS)
+        store.refresh.return_value = moved
+        shards = {'main': AsyncMock(), 'shard1': AsyncMock()}
+        shards['main'].deposit.side_effect = WalletNotFoundError('not found')
+
+        # Act
+        await ShardedWalletRepository(shards, store, Mock()).deposit(wallet_id, Decimal('5'))
+
+        # Assert
+        shards['shard1'].deposit.assert_awaited_once_with(wallet_id, Decimal('5'))
+        store.refresh.assert_awaited_once_with(force=False, since=store.now.return_value)
+
+    @pytest.mark.asyncio
+    async def test_not_found_when_owner_unchanged(self):
+        """Test that a wallet missing on its current owner is not found."""
+        # Arrange
+        shards = {'main': AsyncMock(), 'shard1': AsyncMock()}
+        shards['main'].get_wallet.side_effect = WalletNotFoundError('not found')
+        repository = ShardedWalletRepository(shards, _store(TWO_SHARDS), Mock())
+
+        # Act & Assert
+        with pytest.raises(WalletNotFoundError):
+            await repository.get_wallet(str(with_bucket(uuid7(), 10)))
+        shards['shard1'].get_wallet.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('order', [SortOrder.ASC, SortOrder.DESC])
+    async def test_listing_merges_shards(self, order):
+        """Test that paging through all shards returns every owned wallet once, in order."""
+        # Arrange
+        rng = random.Random(3)
+        started = datetime(2026, 1, 1, tzinfo=UTC)
+        wallets = [_wallet_in(rng.randrange(BUCKET_COUNT), started + timedelta(seconds=rng.randrange(50)))
+                   for _ in range(120)]
+        wallets.append(_wallet_in(5, started))
+        shard_map = TWO_SHARDS.assign(0, 1000, 'main', MOVING, 'shard1')
+        shards = {name: FakeShard(wallet for wallet in wallets if shard_map.shard_for(wallet.id) == name)
+                  for name in ('main', 'shard1')}
+        # A copy left on the move target must not be listed twice
+        shards['shard1'].wallets.append(wallets[-1])
+        repository = ShardedWalletRepository(shards, _store(shard_map), Mock())
+
+        # Act
+        listed, cursor = [], None
+        for _ in range(100):
+            query = WalletListQuery(limit=7, order=order, cursor=cursor)
+            page = await repository.list_wallets(query)
+            listed.extend(page.items)
+            if page.next_cursor is None:
+                break
+            cursor = WalletCursor.decode(page.next_cursor)
+
+        # Assert
+        expected = sorted(wallets, key=lambda wallet: (wallet.created_at, wallet.id), reverse=order == SortOrder.DESC)
+        assert [wallet.id for wallet in listed] == [wallet.id for wallet in expected]
+
+
+class TestShardedStatsRepository:
+    """Test cases for ShardedStatsRepository."""
+
+    @pytest.mark.asyncio
+    async def test_totals_sum_over_shards(self):
+        """Test that totals add up the aggregates of every shard."""
+        # Arrange
+        shards = {'main': AsyncMock(), 'shard1': AsyncMock()}
+        shards['main'].get_totals.return_value = WalletTotals(wallet_count=2, total_balance=Decimal('3.50'))
+        shards['shard1'].get_totals.return_value = WalletTotals(wallet_count=1, total_balance=Decimal('1.25'))
+
+        # Act
+        totals = await ShardedStatsRepository(shards, Mock()).get_totals()
+
+        # Assert
+        assert totals == WalletTotals(wallet_count=3, total_balance=Decimal('4.75'))
+
+
+def _catalog(shard_map: ShardMap) -> MagicMock:
+    catalog = MagicMock()
+    catalog.fetch = AsyncMock(return_value=[
+        (item.start, item.end, item.shard, item.state, item.peer) for item in shard_map.ranges
+    ])
+    catalog.fetchval = AsyncMock(return_value=True)
+    catalog.execute = AsyncMock()
+    catalog.executemany = AsyncMock()
+    return catalog
+
+
+def _saved_maps(catalog: MagicMock):
+    return [ShardMap([BucketRange(*row) for row in call.args[1]]) for call in catalog.executemany.await_args_list]
+
+
+class FakeConnection:
+    """asyncpg connection to one shard, interpreting the resharding statements over in-memory rows."""
+
+    def __init__(self, wallets=()):
+        self.wallets = {wallet.id: wallet for wallet in wallets}
+        self.stats = [len(self.wallets), sum((wallet.balance for wallet in self.wallets.values()), Decimal('0.00'))]
+
+    @asynccontextmanager
+    async def transaction(self):
+        wallets, stats = dict(self.wallets), list(self.stats)
+        try:
+            yield
+        except BaseException:
+            self.wallets, self.stats = wallets, stats
+            raise
+
+    def _in_range(self, start: int, end: int):
+        return sorted((wallet for wallet in self.wallets.values() if start <= bucket_of(wallet.id) < end),
+                      key=lambda wallet: wallet.id)
+
+    async def fetch(self, query: str, *args):
+        if query == _SELECT_RANGE:
+            return [{'id': wallet.id, 'balance': wallet.balance, 'balance_minor': wallet.balance_minor,
+                     'created_at': wallet.created_at} for wallet in self._in_range(*args)]
+        if query == _DELETE_RANGE:
+            deleted = self._in_range(*args)
+            for wallet in deleted:
+                del self.wallets[wallet.id]
+            return [{'balance': wallet.balance} for wallet in deleted]
+        if query == _INSERT_ROWS:
+            inserted = []
+            for wallet_id, balance, balance_minor, created_at in zip(*args):
+                if wallet_id not in self.wallets:
+                    self.wallets[wallet_id] = Wallet(
+                        id=wallet_id, balance=balance, balance_minor=balance_minor, created_at=created_at
+                    )
+                    inserted.append({'balance': balance})
+            return inserted
+        raise AssertionError(f'Unexpected query: {query}')
+
+    async def execute(self, query: str, *args):
+        if query == _DELETE_IDS:
+            for wallet_id in args[0]:
+                self.wallets.pop(wallet_id, None)
+        elif query == _ADD_STATS:
+            self.stats = [self.stats[0] + args[0], self.stats[1] + args[1]]
+        else:
+            raise AssertionError(f'Unexpected query: {query}')
+
+    def balances(self) -> dict:
+        return {wallet.id: wallet.balance for wallet in self.wallets.values()}
+
+
+def _funded_wallet(bucket: int, balance: str) -> Wallet:
+    wallet = _wallet_in(bucket)
+    wallet.balance = Decimal(balance)
+    wallet.balance_minor = int(wallet.balance * 100)
+    return wallet
+
+
+def _copy(wallet: Wallet, balance: str) -> Wallet:
+    return Wallet(id=wallet.id, balance=Decimal(balance), balance_minor=int(Decimal(balance) * 100),
+                  created_at=wallet.created_at)
+
+
+def _assert_stats_match_rows(*connections: FakeConnection):
+    for connection in connections:
+        assert connection.stats == [len(connection.wallets), sum(connection.balances().values(), Decimal('0.00'))]
+
+
+class TestRangeMover:
+    """Test cases for RangeMover."""
+
+    def _mover(self, catalog):
+        mover = RangeMover(catalog, {'main': MagicMock(), 'shard1': MagicMock()}, Mock(), step_buckets=100,
+                           grace_seconds=15, sleep=AsyncMock())
+        mover._cutover = AsyncMock(return_value=10)
+        mover._drain = AsyncMock(return_value=1)
+        return mover
+
+    @pytest.mark.asyncio
+    async def test_move_walks_range_through_states(self):
+        """Test that a move marks the range, hands it over in steps and releases it."""
+        # Arrange
+        catalog = _catalog(ShardMap.single())
+        mover = self._mover(catalog)
+
+        # Act
+        summary = await mover.move(0, 250, 'shard1')
+
+        # Assert
+        steps = [(call.args[2], call.args[3]) for call in mover._cutover.await_args_list]
+        assert steps == [(0, 100), (100, 200), (200, 250)]
+        handed_over = mover._cutover.await_args_list[-1].args[4]
+        assert handed_over.slice(0, 250) == [BucketRange(0, 250, 'shard1', DRAINING, 'main')]
+        mover._drain.assert_awaited_once_with('main', 'shard1', 0, 250)
+        marked, released = _saved_maps(catalog)
+        assert marked.slice(0, 250) == [BucketRange(0, 250, 'main', MOVING, 'shard1')]
+        assert released == ShardMap.single().assign(0, 250, 'shard1')
+        assert (summary.steps, summary.wallets, summary.leftovers) == (3, 30, 1)
+        assert mover._sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_after_handover(self):
+        """Test that rerunning an interrupted move only cleans up the handed-over range."""
+        # Arrange
+        catalog = _catalog(ShardMap.single().assign(0, 250, 'shard1', DRAINING, 'main'))
+        mover = self._mover(catalog)
+
+        # Act
+        await mover.move(0, 250, 'shard1')
+
+        # Assert
+        mover._cutover.assert_not_awaited()
+        mover._drain.assert_awaited_once_with('main', 'shard1', 0, 250)
+
+    @pytest.mark.asyncio
+    async def test_rejects_conflicting_move(self):
+        """Test that a range moving to another shard is not redirected."""
+        # Arrange
+        catalog = _catalog(ShardMap.single().assign(0, 250, 'main', MOVING, 'shard2'))
+        mover = self._mover(catalog)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await mover.move(0, 250, 'shard1')
+        catalog.execute.assert_awaited_with('SELECT pg_advisory_unlock($1)', 0x52534844)
+
+
+class TestRangeMoverTransfers:
+    """Test cases for the cutover and drain transactions of RangeMover."""
+
+    def _mover(self, catalog, main: FakeConnection, shard1: FakeConnection) -> RangeMover:
+        return RangeMover(catalog, {'main': main, 'shard1': shard1}, Mock(), sleep=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_cutover_conserves_wallets_and_totals(self):
+        """Test that a cutover moves exactly the range's wallets and keeps every balance and total."""
+        # Arrange
+        rng = random.Random(5)
+        main = FakeConnection(_funded_wallet(rng.randrange(400), f'{rng.randrange(1, 10000)}.25') for _ in range(60))
+        shard1 = FakeConnection([_funded_wallet(300, '7.00')])
+        before = {**main.balances(), **shard1.balances()}
+        catalog = _catalog(ShardMap.single())
+        shard_map = ShardMap.single().assign(0, 200, 'shard1', DRAINING, 'main')
+
+        # Act
+        moved = await self._mover(catalog, main, shard1)._cutover('main', 'shard1', 0, 200, shard_map)
+
+        # Assert
+        assert moved == sum(1 for wallet_id in before if bucket_of(wallet_id) < 200)
+        assert {**main.balances(), **shard1.balances()} == before
+        assert not main.balances().keys() & shard1.balances().keys()
+        assert all(bucket_of(wallet_id) >= 200 for wallet_id in main.wallets)
+        assert main.stats[0] + shard1.stats[0] == len(before)
+        assert main.stats[1] + shard1.stats[1] == sum(before.values(), Decimal('0.00'))
+        _assert_stats_match_rows(main, shard1)
+        assert _saved_maps(catalog) == [shard_map]
+
+    @pytest.mark.asyncio
+    async def test_cutover_replaces_stale_target_copies(self):
+        """Test that copies left on the target by a failed attempt are replaced, not counted twice."""
+        # Arrange
+        moving = [_funded_wallet(10, '100.00'), _funded_wallet(20, '250.50')]
+        main = FakeConnection(moving)
+        shard1 = FakeConnection()
+        catalog = _catalog(ShardMap.single())
+        shard_map = ShardMap.single().assign(0, 100, 'shard1', DRAINING, 'main')
+        mover = self._mover(catalog, main, shard1)
+        catalog.executemany.side_effect = [RuntimeError('catalog unavailable'), None]
+        with pytest.raises(RuntimeError):
+            await mover._cutover('main', 'shard1', 0, 100, shard_map)
+        # The source rolled back and changed afterwards, while the target kept the first copies
+        assert shard1.stats == [2, Decimal('350.50')]
+        main.wallets[moving[0].id] = _copy(moving[0], '40.00')
+        main.stats[1] -= Decimal('60.00')
+
+        # Act
+        moved = await mover._cutover('main', 'shard1', 0, 100, shard_map)
+
+        # Assert
+        assert moved == 2
+        assert main.wallets == {}
+        assert shard1.balances() == {moving[0].id: Decimal('40.00'), moving[1].id: Decimal('250.50')}
+        assert shard1.stats == [2, Decimal('290.50')]
+        _assert_stats_match_rows(main, shard1)
+
+    @pytest.mark.asyncio
+    async def test_drain_merges_leftovers_keeping_target_rows(self):
+        """Test that leftovers are inserted with ON CONFLICT and wallets already on the target keep their balance."""
+        # Arrange
+        handed_over = _funded_wallet(10, '80.00')
+        leftover = _funded_wallet(30, '15.00')
+        outside = _funded_wallet(500, '5.00')
+        # The target row was changed after the handover; the old owner still has the handed over copy
+        main = FakeConnection([_copy(handed_over, '50.00'), leftover, outside])
+        shard1 = FakeConnection([handed_over])
+
+        # Act
+        moved = await self._mover(_catalog(ShardMap.single()), main, shard1)._drain('main', 'shard1', 0, 100)
+
+        # Assert
+        assert moved == 1
+        assert main.balances() == {outside.id: Decimal('5.00')}
+        assert shard1.balances() == {handed_over.id: Decimal('80.00'), leftover.id: Decimal('15.00')}
+        assert shard1.stats == [2, Decimal('95.00')]
+        _assert_stats_match_rows(main, shard1)
+
+    @pytest.mark.asyncio
+    async def test_drain_without_leftovers_changes_nothing(self):
+        """Test that draining an empty range writes nothing."""
+        # Arrange
+        main = FakeConnection([_funded_wallet(500, '5.00')])
+        shard1 = FakeConnection([_funded_wallet(10, '80.00')])
+        before = (main.balances(), shard1.balances(), list(main.stats), list(shard1.stats))
+
+        # Act
+        moved = await self._mover(_catalog(ShardMap.single()), main, shard1)._drain('main', 'shard1', 0, 100)
+
+        # Assert
+        assert moved == 0
+        assert (main.balances(), shard1.balances(), main.stats, shard1.stats) == before
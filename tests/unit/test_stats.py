@@ -0,0 +1,152 @@
+"""
+Unit tests for wallet aggregates.
+
+Tests stripe selection, stats deltas, the recomputation and the stats service.
+"""
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import UUID, uuid4
+from sqlalchemy.dialects import postgresql
+from src.application.domain.wallet_totals import WalletTotals
+from src.application.exceptions import DatabaseError
+from src.application.services.stats_service import StatsService
+from src.infrastructure.database.repositories.stats_repository import StatsRepository
+from src.infrastructure.database.stats import apply_stats_delta, recompute_totals, stats_stripe
+from src.settings import settings
+
+
+class TestStatsDelta:
+    """Test cases for striped stats updates."""
+
+    def test_stripe_in_range(self, monkeypatch):
+        """Test that stripes spread wallets over the configured number of rows."""
+        # Arrange
+        monkeypatch.setattr(settings, 'WALLET_STATS_STRIPES', 8)
+
+        # Act
+        stripes = {stats_stripe(uuid4()) for _ in range(500)}
+
+        # Assert
+        assert stripes == set(range(8))
+
+    def test_stripe_is_stable(self):
+        """Test that a wallet always maps to the same stripe."""
+        wallet_id = UUID('0190f7a2-3c4d-7e5f-8a9b-0c1d2e3f4a5b')
+        assert stats_stripe(wallet_id) == stats_stripe(UUID(str(wallet_id)))
+
+    @pytest.mark.asyncio
+    async def test_delta_upserts_stripe(self):
+        """Test that a delta is added to the wallet's stripe with an upsert."""
+        # Arrange
+        session = AsyncMock()
+        wallet_id = uuid4()
+
+        # Act
+        await apply_stats_delta(session, wallet_id, 1, Decimal('5.00'))
+
+        # Assert
+        statement = session.execute.call_args.args[0]
+        compiled = statement.compile(dialect=postgresql.dialect())
+        assert 'ON CONFLICT (stripe) DO UPDATE' in str(compiled)
+        assert compiled.params['stripe'] == stats_stripe(wallet_id)
+        assert compiled.params['wallet_count'] == 1
+        assert compiled.params['total_balance'] == Decimal('5.00')
+
+    @pytest.mark.asyncio
+    async def test_empty_delta_skipped(self):
+        """Test that a zero delta does not touch the stripe."""
+        session = AsyncMock()
+        await apply_stats_delta(session, uuid4(), 0, Decimal('0.00'))
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, monkeypatch):
+        """Test that no update is issued when stats are disabled."""
+        monkeypatch.setattr(settings, 'WALLET_STATS_ENABLED', False)
+        session = AsyncMock()
+        await apply_stats_delta(session, uuid4(), 1, Decimal('1.00'))
+        session.execute.assert_not_called()
+
+
+def _totals_result(count: int, total: str) -> Mock:
+    result = Mock()
+    result.one.return_value = (count, Decimal(total))
+    return result
+
+
+def _session_maker(*sessions) -> MagicMock:
+    session_maker = MagicMock()
+    session_maker.return_value.__aenter__.side_effect = list(sessions)
+    return session_maker
+
+
+class TestRecomputeTotals:
+    """Test cases for recompute_totals."""
+
+    @pytest.mark.asyncio
+    async def test_drift_added_to_stripe(self):
+        """Test that the drift seen in one snapshot is added in a separate short transaction."""
+        # Arrange
+        snapshot = AsyncMock()
+        snapshot.execute.side_effect = [None, _totals_result(10, '100.00'), _totals_result(12, '130.50')]
+        correction = AsyncMock()
+        session_maker = _session_maker(snapshot, correction)
+
+        # Act
+        before, after = await recompute_totals(session_maker)
+
+        # Assert
+        assert before == WalletTotals(wallet_count=10, total_balance=Decimal('100.00'))
+        assert after == WalletTotals(wallet_count=12, total_balance=Decimal('130.50'))
+        snapshot.connection.assert_awaited_once_with(execution_options={'isolation_level': 'REPEATABLE READ'})
+        statements = [str(call.args[0]) for call in snapshot.execute.call_args_list]
+        assert not any('LOCK' in statement for statement in statements)
+        compiled = correction.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+        assert 'ON CONFLICT (stripe) DO UPDATE' in str(compiled)
+        assert (compiled.params['stripe'], compiled.params['wallet_count'], compiled.params['total_balance']) == (
+            0, 2, Decimal('30.50')
+        )
+        correction.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_drift_writes_nothing(self):
+        """Test that consistent stripes are left alone."""
+        # Arrange
+        snapshot = AsyncMock()
+        snapshot.execute.side_effect = [None, _totals_result(3, '9.00'), _totals_result(3, '9.00')]
+        session_maker = _session_maker(snapshot)
+
+        # Act
+        await recompute_totals(session_maker)
+
+        # Assert
+        assert session_maker.call_count == 1
+
+
+class TestStatsService:
+    """Test cases for StatsService."""
+
+    @pytest.mark.asyncio
+    async def test_get_totals(self):
+        """Test that totals are returned from the repository."""
+        # Arrange
+        repository = AsyncMock(spec=StatsRepository)
+        repository.get_totals.return_value = WalletTotals(wallet_count=3, total_balance=Decimal('12.50'))
+        service = StatsService(repository, Mock())
+
+        # Act
+        totals = await service.get_totals()
+
+        # Assert
+        assert totals == WalletTotals(wallet_count=3, total_balance=Decimal('12.50'))
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_wrapped(self):
+        """Test that unexpected errors surface as DatabaseError."""
+        repository = AsyncMock(spec=StatsRepository)
+        repository.get_totals.side_effect = RuntimeError('boom')
+        service = StatsService(repository, Mock())
+
+        with pytest.raises(DatabaseError):
+            await service.get_totals()
@@ -0,0 +1,157 @@
+"""
+Unit tests for the tracer.
+
+Tests trace sampling, span nesting across async calls, the bounded span
+buffer, OTLP export and SQL statement spans.
+"""
+import json
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import create_engine, text
+from src.infrastructure.logger.logger import trace_id_var
+from src.infrastructure.tracing.exporter import FileSpanExporter, to_otlp
+from src.infrastructure.tracing.sql import instrument_engine
+from src.infrastructure.tracing.tracer import Tracer
+
+
+TRACE_ID = '0b6f9a8e-3c1d-4c6e-9a7b-2f4e5d6c7b8a'
+
+
+@pytest.fixture
+def trace_id():
+    token = trace_id_var.set(TRACE_ID)
+    yield TRACE_ID
+    trace_id_var.reset(token)
+
+
+class TestTracer:
+    """Test cases for Tracer."""
+
+    def test_unsampled_trace_records_nothing(self, trace_id):
+        """Test that spans outside a sampled trace are no-ops."""
+        # Arrange
+        tracer = Tracer(sample_ratio=0.5, random_fn=lambda: 0.9)
+
+        # Act
+        with tracer.trace('root') as root:
+            with tracer.span('child') as child:
+                pass
+
+        # Assert
+        assert root is None and child is None
+        assert tracer.get_trace(trace_id) == []
+
+    @pytest.mark.asyncio
+    async def test_spans_nest_across_async_calls(self, trace_id):
+        """Test that traced coroutines become children of the current span."""
+        # Arrange
+        tracer = Tracer(sample_ratio=1.0)
+
+        @tracer.traced('repository')
+        async def repository():
+            with tracer.span('lock'):
+                pass
+
+        @tracer.traced('service')
+        async def service():
+            await repository()
+
+        # Act
+        with tracer.trace('root'):
+            await service()
+
+        # Assert
+        spans = {span.name: span for span in tracer.get_trace(trace_id)}
+        assert set(spans) == {'root', 'service', 'repository', 'lock'}
+        assert spans['root'].parent_id is None
+        assert spans['service'].parent_id == spans['root'].span_id
+        assert spans['repository'].parent_id == spans['service'].span_id
+        assert spans['lock'].parent_id == spans['repository'].span_id
+        assert all(span.end_ns >= span.start_ns for span in spans.values())
+
+    def test_span_records_error(self, trace_id):
+        """Test that an exception leaving a span is recorded on it."""
+        # Arrange
+        tracer = Tracer(sample_ratio=1.0)
+
+        # Act
+        with pytest.raises(ValueError):
+            with tracer.trace('root'):
+                raise ValueError('boom')
+
+        # Assert
+        assert tracer.get_trace(trace_id)[0].error == 'ValueError: boom'
+
+    def test_buffer_is_bounded(self, trace_id):
+        """Test that only the newest spans are kept."""
+        # Arrange
+        tracer = Tracer(sample_ratio=1.0, buffer_size=3)
+
+        # Act
+        with tracer.trace('root'):
+            for i in range(5):
+                with tracer.span(f'child {i}'):
+                    pass
+
+        # Assert
+        assert [span.name for span in tracer.get_trace(trace_id)] == ['child 3', 'child 4', 'root']
+
+
+class TestOtlpExport:
+    """Test cases for OTLP conversion and file export."""
+
+    def test_to_otlp_shape(self, trace_id):
+        """Test that spans are converted to OTLP/JSON with hex IDs and parent links."""
+        # Arrange
+        tracer = Tracer(sample_ratio=1.0)
+        with tracer.trace('root', **{'http.method': 'GET'}):
+            with tracer.span('child'):
+                pass
+
+        # Act
+        document = to_otlp(tracer.get_trace(trace_id), 'wallet-api')
+
+        # Assert
+        spans = document['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert {span['traceId'] for span in spans} == {TRACE_ID.replace('-', '')}
+        child, root = spans
+        assert child['parentSpanId'] == root['spanId']
+        assert {'key': 'http.method', 'value': {'stringValue': 'GET'}} in root['attributes']
+
+    def test_file_exporter_writes_batches(self, trace_id, tmp_path):
+        """Test that queued spans are written as one OTLP/JSON line per flush."""
+        # Arrange
+        exporter = FileSpanExporter(path=str(tmp_path / 'spans.jsonl'), service_name='wallet-api', interval=60)
+        tracer = Tracer(sample_ratio=1.0, exporter=exporter)
+        with tracer.trace('root'):
+            pass
+
+        # Act
+        exporter.shutdown()
+
+        # Assert
+        lines = (tmp_path / 'spans.jsonl').read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])['resourceSpans'][0]['scopeSpans'][0]['spans'][0]['name'] == 'root'
+
+
+class TestSqlInstrumentation:
+    """Test cases for SQL statement spans."""
+
+    def test_statements_become_child_spans(self, trace_id):
+        """Test that executed statements are recorded under the current span."""
+        # Arrange
+        tracer = Tracer(sample_ratio=1.0)
+        engine = create_engine('sqlite://')
+        instrument_engine(SimpleNamespace(sync_engine=engine), tracer)
+
+        # Act
+        with tracer.trace('root'):
+            with engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+
+        # Assert
+        sql, root = tracer.get_trace(trace_id)
+        assert sql.name == 'sql'
+        assert sql.attributes['db.statement'] == 'SELECT 1'
+        assert sql.parent_id == root.span_id
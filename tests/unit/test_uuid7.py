@@ -0,0 +1,42 @@
+"""
+Unit tests for UUIDv7 generation.
+
+Tests RFC 9562 layout and time ordering of generated wallet IDs.
+"""
+import time
+import uuid
+from src.application.domain.uuid7 import uuid7
+
+
+class TestUuid7:
+    """Test cases for uuid7."""
+
+    def test_version_and_variant(self):
+        """Test that generated IDs are RFC 9562 version 7 UUIDs."""
+        # Act
+        value = uuid7()
+
+        # Assert
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_timestamp_prefix(self):
+        """Test that the 48-bit prefix is the current Unix time in milliseconds."""
+        # Arrange
+        before = time.time_ns() // 1_000_000
+
+        # Act
+        value = uuid7()
+
+        # Assert
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after + 1
+
+    def test_monotonic_within_process(self):
+        """Test that consecutive IDs are strictly increasing."""
+        # Act
+        values = [uuid7() for _ in range(10_000)]
+
+        # Assert
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
@@ -0,0 +1,214 @@
+"""
+Unit tests for the wallet ID membership filter.
+
+Tests the Bloom filter's false-positive rate, fail-open behaviour before
+the first build and for freshly created IDs, rebuilds from a streaming
+scan, updates from notifications and the LISTEN connection state.
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+import pytest
+from src.application.domain.uuid7 import uuid7
+from src.infrastructure.membership import BloomFilter, WalletIdFilter
+from src.infrastructure.membership.wallet_id_filter import REBUILD_NOTIFICATION
+from src.infrastructure.notifications.listener import PgNotificationListener
+
+
+class FakeStream:
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def make_filter(wallet_ids, clock=time.time, subscribed=True, **overrides):
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    session.scalar.return_value = len(wallet_ids)
+    session.stream_scalars.return_value = FakeStream(wallet_ids)
+    options = {'session_maker': Mock(return_value=session), 'logger': Mock(), 'min_capacity': 1000, 'clock': clock}
+    options.update(overrides)
+    wallet_filter = WalletIdFilter(**options)
+    if subscribed:
+        wallet_filter.handle_subscribed()
+    return wallet_filter
+
+
+class TestBloomFilter:
+    """Test cases for BloomFilter."""
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        """Test that added items are always found and the FPR stays near the target."""
+        # Arrange
+        bloom = BloomFilter(capacity=10_000, false_positive_rate=0.01)
+        members = [uuid4().bytes for _ in range(10_000)]
+        for item in members:
+            bloom.add(item)
+
+        # Act
+        false_positives = sum(uuid4().bytes in bloom for _ in range(20_000))
+
+        # Assert
+        assert all(item in bloom for item in members)
+        assert false_positives / 20_000 < 0.02
+        assert bloom.estimated_false_positive_rate == pytest.approx(0.01, rel=0.2)
+        assert bloom.memory_bytes < 10_000 * 10 // 8 + 8
+
+
+class TestWalletIdFilter:
+    """Test cases for WalletIdFilter."""
+
+    def test_fails_open_before_first_build(self):
+        """Test that every ID may exist until the filter is built."""
+        # Arrange
+        wallet_filter = make_filter([])
+
+        # Act & Assert
+        assert wallet_filter.might_contain(uuid4()) is True
+        assert wallet_filter.ready is False
+
+    @pytest.mark.asyncio
+    async def test_rebuild_answers_definite_misses(self):
+        """Test that a built filter finds scanned IDs and rejects unknown ones."""
+        # Arrange
+        existing = [uuid4() for _ in range(100)]
+        wallet_filter = make_filter(existing)
+
+        # Act
+        await wallet_filter.rebuild()
+
+        # Assert
+        assert all(wallet_filter.might_contain(wallet_id) for wallet_id in existing)
+        misses = sum(not wallet_filter.might_contain(uuid4()) for _ in range(100))
+        assert misses > 90
+        assert wallet_filter.stats()['definite_misses'] == misses
+
+    @pytest.mark.asyncio
+    async def test_recent_uuid7_bypasses_filter(self):
+        """Test that just-created IDs are not rejected before their notification arrives."""
+        # Arrange
+        wallet_filter = make_filter([], grace_seconds=30)
+        await wallet_filter.rebuild()
+
+        # Act & Assert
+        assert wallet_filter.might_contain(uuid7()) is True
+
+    @pytest.mark.asyncio
+    async def test_old_uuid7_is_filtered(self):
+        """Test that UUIDv7 IDs older than the grace window go through the filter."""
+        # Arrange
+        wallet_filter = make_filter([], clock=lambda: time.time() + 3600, grace_seconds=30)
+        await wallet_filter.rebuild()
+
+        # Act & Assert
+        assert wallet_filter.might_contain(uuid7()) is False
+
+    @pytest.mark.asyncio
+    async def test_notification_adds_wallet(self):
+        """Test that a wallet created on another worker is added from its notification."""
+        # Arrange
+        wallet_filter = make_filter([])
+        await wallet_filter.rebuild()
+        wallet_id = uuid4()
+
+        # Act
+        wallet_filter.handle_notification(str(wallet_id))
+
+        # Assert
+        assert wallet_filter.might_contain(wallet_id) is True
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_notification_fails_open(self):
+        """Test that a bulk load announcement disables misses until the next rebuild."""
+        # Arrange
+        wallet_filter = make_filter([])
+        await wallet_filter.rebuild()
+
+        # Act
+        wallet_filter.handle_notification(REBUILD_NOTIFICATION)
+
+        # Assert
+        assert wallet_filter.might_contain(uuid4()) is True
+        assert wallet_filter.needs_rebuild(rebuild_seconds=3600) is True
+
+    @pytest.mark.asyncio
+    async def test_invalidate_fails_open_until_rebuild(self):
+        """Test that a lost LISTEN connection disables misses until the next rebuild."""
+        # Arrange
+        wallet_filter = make_filter([])
+        await wallet_filter.rebuild()
+
+        # Act
+        wallet_filter.invalidate()
+
+        # Assert
+        assert wallet_filter.might_contain(uuid4()) is True
+        assert wallet_filter.needs_rebuild(rebuild_seconds=3600) is True
+
+    @pytest.mark.asyncio
+    async def test_no_misses_before_subscription(self):
+        """Test that a filter built before LISTEN is subscribed does not answer misses."""
+        # Arrange
+        wallet_filter = make_filter([], subscribed=False)
+        await wallet_filter.rebuild()
+
+        # Act
+        wallet_filter.handle_subscribed()
+
+        # Assert
+        assert wallet_filter.might_contain(uuid4()) is True
+        assert wallet_filter.needs_rebuild(rebuild_seconds=3600) is True
+
+    @pytest.mark.asyncio
+    async def test_disconnect_fails_open_until_rebuilt_under_new_subscription(self):
+        """Test that misses stop when LISTEN is lost and resume only after a rebuild on the new subscription."""
+        # Arrange
+        wallet_filter = make_filter([])
+        await wallet_filter.rebuild()
+
+        # Act
+        wallet_filter.handle_disconnected()
+        await wallet_filter.rebuild()
+        while_down = wallet_filter.might_contain(uuid4())
+        wallet_filter.handle_subscribed()
+        stale = wallet_filter.might_contain(uuid4())
+        wallet_filter._session_maker.return_value.stream_scalars.return_value = FakeStream([])
+        await wallet_filter.rebuild()
+
+        # Assert
+        assert while_down is True
+        assert stale is True
+        assert wallet_filter.might_contain(uuid4()) is False
+
+
+class TestPgNotificationListener:
+    """Test cases for the connection state callbacks of PgNotificationListener."""
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_reports_disconnect(self, monkeypatch):
+        """Test that a connection that cannot be established is reported, also on the first attempt."""
+        # Arrange
+        monkeypatch.setattr('asyncpg.connect', AsyncMock(side_effect=OSError('refused')))
+        listener = PgNotificationListener(dsn='postgresql://localhost/test', logger=Mock(), reconnect_delay=0.01)
+        listener.add_handler('wallet_created', Mock())
+        disconnected, subscribed = Mock(), Mock()
+        listener.add_disconnect_handler(disconnected)
+        listener.add_subscribe_handler(subscribed)
+
+        # Act
+        await listener.start()
+        await asyncio.sleep(0.05)
+        await listener.stop()
+
+        # Assert
+        assert disconnected.call_count >= 2
+        subscribed.assert_not_called()
@@ -0,0 +1,254 @@
+"""
+Unit tests for the keyset-paginated wallet listing.
+
+Covers cursor encoding, the SQL of a listing page, and paging through the
+in-memory repository against a brute-force ordering of the same wallets.
+"""
+import uuid
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from unittest.mock import Mock
+from sqlalchemy.dialects import postgresql
+from src.application.domain.wallet_page import SortOrder, WalletCursor, WalletListQuery, WalletPage
+from src.application.exceptions import DatabaseError, InvalidCursorError
+from src.application.services.wallet_service import WalletService
+from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.repositories.wallet_repostiory import WalletRepository
+from src.infrastructure.memory import InMemoryWalletRepository
+
+
+def _sql(query: WalletListQuery) -> str:
+    statement = WalletRepository._list_query(query)
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestWalletCursor:
+    """Test cases for WalletCursor."""
+
+    def test_round_trip(self):
+        """Test that a decoded cursor equals the encoded one."""
+        # Arrange
+        cursor = WalletCursor(datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC), uuid.uuid4())
+
+        # Act
+        decoded = WalletCursor.decode(cursor.encode())
+
+        # Assert
+        assert decoded == cursor
+
+    @pytest.mark.parametrize('token', ['', 'not-base64!', 'Zm9v', 'MjAyNi0wMS0wMnxub3QtYS11dWlk'])
+    def test_invalid_token(self, token):
+        """Test that malformed tokens raise InvalidCursorError."""
+        # Act & Assert
+        with pytest.raises(InvalidCursorError):
+            WalletCursor.decode(token)
+
+    def test_naive_timestamp_rejected(self):
+        """Test that a cursor without a time zone is rejected."""
+        # Arrange
+        token = WalletCursor(datetime(2026, 1, 2), uuid.uuid4()).encode()
+
+        # Act & Assert
+        with pytest.raises(InvalidCursorError):
+            WalletCursor.decode(token)
+
+
+class TestWalletPage:
+    """Test cases for WalletPage.from_rows."""
+
+    def test_last_page_has_no_cursor(self):
+        """Test that a page with no extra row ends the listing."""
+        # Arrange
+        rows = [Wallet(id=uuid.uuid4(), created_at=datetime.now(UTC)) for _ in range(2)]
+
+        # Act
+        page = WalletPage.from_rows(rows, limit=2)
+
+        # Assert
+        assert page.items == rows
+        assert page.next_cursor is None
+
+    def test_extra_row_yields_cursor_of_last_item(self):
+        """Test that the cursor points at the last returned wallet, not the extra row."""
+        # Arrange
+        rows = [Wallet(id=uuid.uuid4(), created_at=datetime.now(UTC)) for _ in range(3)]
+
+        # Act
+        page = WalletPage.from_rows(rows, limit=2)
+
+        # Assert
+        assert page.items == rows[:2]
+        assert WalletCursor.decode(page.next_cursor) == WalletCursor(rows[1].created_at, rows[1].id)
+
+
+class TestListQuery:
+    """Test cases for the SQL of a listing page."""
+
+    def test_first_page_ascending(self):
+        """Test the first page: index order, no cursor predicate, limit + 1 rows."""
+        # Act
+        sql = _sql(WalletListQuery(limit=10))
+
+        # Assert
+        assert 'ORDER BY wallets.created_at ASC, wallets.id ASC' in sql
+        assert '(wallets.created_at, wallets.id) >' not in sql
+        assert 'LIMIT' in sql
+
+    def test_cursor_descending(self):
+        """Test that a descending page continues below the cursor."""
+        # Arrange
+        cursor = WalletCursor(datetime.now(UTC), uuid.uuid4())
+
+        # Act
+        sql = _sql(WalletListQuery(cursor=cursor, order=SortOrder.DESC))
+
+        # Assert
+        assert '(wallets.created_at, wallets.id) <' in sql
+        assert 'ORDER BY wallets.created_at DESC, wallets.id DESC' in sql
+
+    @pytest.mark.parametrize('query', [
+        WalletListQuery(nonzero=True),
+        WalletListQuery(min_balance=Decimal('0.01')),
+        WalletListQuery(max_balance=Decimal('-1')),
+    ])
+    def test_zero_excluded_as_literal(self, query):
+        """Test that filters excluding zero render the partial index predicate literally."""
+        # Act & Assert
+        assert 'wallets.balance != 0' in _sql(query)
+
+    def test_zero_allowed(self):
+        """Test that a range including zero does not restrict to the partial index."""
+        # Act
+        sql = _sql(WalletListQuery(min_balance=Decimal('0'), max_balance=Decimal('10')))
+
+        # Assert
+        assert 'wallets.balance != 0' not in sql
+        assert 'wallets.balance >=' in sql
+        assert 'wallets.balance <=' in sql
+
+
+class TestWalletRepositoryListing:
+    """Test cases for WalletRepository.list_wallets."""
+
+    @pytest.mark.asyncio
+    async def test_list_wallets(self, repository, mock_session):
+        """Test that rows are turned into a page."""
+        # Arrange
+        rows = [Wallet(id=uuid.uuid4(), created_at=datetime.now(UTC)) for _ in range(3)]
+        mock_result = Mock()
+        mock_result.scalars.return_value.all.return_value = rows
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        page = await repository.list_wallets(WalletListQuery(limit=2))
+
+        # Assert
+        assert page.items == rows[:2]
+        assert page.next_cursor is not None
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_list_wallets_database_error(self, repository, mock_session):
+        """Test that query failures raise DatabaseError."""
+        # Arrange
+        mock_session.execute.side_effect = Exception('connection lost')
+
+        # Act & Assert
+        with pytest.raises(DatabaseError):
+            await repository.list_wallets(WalletListQuery())
+
+
+class TestWalletServiceListing:
+    """Test cases for WalletService.list_wallets."""
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_wrapped(self):
+        """Test that unexpected repository errors become DatabaseError."""
+        # Arrange
+        wallet_repository = Mock()
+        wallet_repository.list_wallets.side_effect = RuntimeError('boom')
+        service = WalletService(wallet_repository, Mock())
+
+        # Act & Assert
+        with pytest.raises(DatabaseError):
+            await service.list_wallets(WalletListQuery())
+
+
+@pytest_asyncio.fixture
+async def memory_repository(tmp_path):
+    """Open in-memory repository with wallets of varied balances and shared creation times."""
+    repository = InMemoryWalletRepository(str(tmp_path / 'store'), Mock(), lock_stripes=16, fsync=False)
+    await repository.start()
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    for index in range(40):
+        wallet = await repository.create()
+        # Pairs of wallets share a creation time so the ID breaks ties
+        repository._state._created[index] = (
+            (base + timedelta(seconds=index // 2)) - datetime(1970, 1, 1, tzinfo=UTC)
+        ) // timedelta(microseconds=1)
+        if index % 3:
+            await repository.deposit(str(wallet.id), Decimal(index))
+    yield repository
+    await repository.close()
+
+
+async def _walk(repository, query: WalletListQuery) -> list:
+    wallets, cursor = [], None
+    while True:
+        page = await repository.list_wallets(
+            WalletListQuery(**{**query.__dict__, 'cursor': cursor})
+        )
+        wallets.extend(page.items)
+        if page.next_cursor is None:
+            return wallets
+        cursor = WalletCursor.decode(page.next_cursor)
+
+
+class TestInMemoryListing:
+    """Test cases for InMemoryWalletRepository.list_wallets."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('order', [SortOrder.ASC, SortOrder.DESC])
+    async def test_pages_cover_all_wallets_in_order(self, memory_repository, order):
+        """Test that walking all pages returns every wallet once in (created_at, id) order."""
+        # Act
+        wallets = await _walk(memory_repository, WalletListQuery(limit=7, order=order))
+
+        # Assert
+        keys = [(wallet.created_at, wallet.id) for wallet in wallets]
+        assert len(keys) == 40
+        assert keys == sorted(keys, reverse=order == SortOrder.DESC)
+
+    @pytest.mark.asyncio
+    async def test_filters(self, memory_repository):
+        """Test balance and creation window filters together."""
+        # Arrange
+        created_from = datetime(2026, 1, 1, 0, 0, 5, tzinfo=UTC)
+        created_to = datetime(2026, 1, 1, 0, 0, 15, tzinfo=UTC)
+        query = WalletListQuery(
+            limit=3,
+            min_balance=Decimal('10.001'),
+            max_balance=Decimal('25'),
+            created_from=created_from,
+            created_to=created_to
+        )
+
+        # Act
+        wallets = await _walk(memory_repository, query)
+
+        # Assert
+        balances = [wallet.balance for wallet in wallets]
+        assert balances == [Decimal(value) for value in (11, 13, 14, 16, 17, 19, 20, 22, 23, 25)]
+        assert all(created_from <= wallet.created_at < created_to for wallet in wallets)
+
+    @pytest.mark.asyncio
+    async def test_nonzero(self, memory_repository):
+        """Test that nonzero skips empty wallets."""
+        # Act
+        wallets = await _walk(memory_repository, WalletListQuery(limit=50, nonzero=True))
+
+        # Assert
+        assert len(wallets) == 26
+        assert all(wallet.balance != 0 for wallet in wallets)
@@ -6,12 +6,19 @@ concurrent access handling, and error scenarios.
 """
 import pytest
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 from uuid import uuid4
+from src.settings import settings
+from src.infrastructure.database.balance import with_wallet_lock
 from src.infrastructure.database.models.wallet import Wallet
+from src.infrastructure.database.repositories.wallet_repostiory import WalletRepository
 from src.application.exceptions import (
     WalletNotFoundError,
-    InsufficientFundsError
+    InsufficientFundsError,
+    InvalidAmountError,
+    InvalidWalletIdError
 )
 
 
@@ -27,7 +34,6 @@ class TestWalletRepository:
             id=wallet_id,
             balance=Decimal("100.00")
         )
-        repository._session = mock_session
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_wallet
         mock_session.execute.return_value = mock_result
@@ -47,7 +53,6 @@ class TestWalletRepository:
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
         mock_session.execute.return_value = mock_result
-        repository._session = mock_session
 
         # Act & Assert
         with pytest.raises(WalletNotFoundError):
@@ -63,7 +68,6 @@ class TestWalletRepository:
             id=wallet_id,
             balance=Decimal("100.00")
         )
-        repository._session = mock_session
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_wallet
         mock_session.execute.return_value = mock_result
@@ -75,6 +79,48 @@ class TestWalletRepository:
         assert result.balance == Decimal("150.00")
         mock_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_deposit_emits_balance_notification(self, repository, mock_session):
+        """Test that deposit queues a NOTIFY with the new balance before commit."""
+        # Arrange
+        wallet_id = str(uuid4())
+        mock_wallet = Wallet(
+            id=wallet_id,
+            balance=Decimal("100.00")
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_wallet
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await repository.deposit(wallet_id, Decimal("50.00"))
+
+        # Assert
+        notify_query = mock_session.execute.call_args_list[-1].args[0]
+        assert 'pg_notify' in str(notify_query)
+        assert mock_session.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_deposit_updates_wallet_stats(self, repository, mock_session):
+        """Test that deposit adds the amount to the wallet's stats stripe in the same transaction."""
+        # Arrange
+        wallet_id = str(uuid4())
+        mock_wallet = Wallet(
+            id=wallet_id,
+            balance=Decimal("100.00")
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_wallet
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await repository.deposit(wallet_id, Decimal("50.00"))
+
+        # Assert
+        stats_query = mock_session.execute.call_args_list[1].args[0]
+        assert 'wallet_stats' in str(stats_query)
+        assert 'ON CONFLICT' in str(stats_query.compile(dialect=postgresql.dialect()))
+
     @pytest.mark.asyncio
     async def test_withdraw_success(self, repository, mock_session):
         """Test successful withdrawal operation."""
@@ -85,7 +131,6 @@ class TestWalletRepository:
             id=wallet_id,
             balance=Decimal("100.00")
         )
-        repository._session = mock_session
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_wallet
         mock_session.execute.return_value = mock_result
@@ -107,7 +152,6 @@ class TestWalletRepository:
             id=wallet_id,
             balance=Decimal("100.00")
         )
-        repository._session = mock_session
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = mock_wallet
         mock_session.execute.return_value = mock_result
@@ -115,3 +159,153 @@ class TestWalletRepository:
         # Act & Assert
         with pytest.raises(InsufficientFundsError):
             await repository.withdraw(wallet_id, amount)
+
+    @pytest.mark.asyncio
+    async def test_deposit_writes_minor_units(self, repository, mock_session):
+        """Test that deposit keeps the minor-unit column in sync with the balance."""
+        # Arrange
+        wallet_id = str(uuid4())
+        mock_wallet = Wallet(
+            id=wallet_id,
+            balance=Decimal("100.00")
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_wallet
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        result = await repository.deposit(wallet_id, Decimal("50.25"))
+
+        # Assert
+        assert result.balance == Decimal("150.25")
+        assert result.balance_minor == 15025
+
+    @pytest.mark.asyncio
+    async def test_withdraw_in_minor_units_mode(self, repository, mock_session, monkeypatch):
+        """Test withdrawal arithmetic on integer minor units."""
+        # Arrange
+        monkeypatch.setattr(settings, "BALANCE_MINOR_UNITS", True)
+        wallet_id = str(uuid4())
+        mock_wallet = Wallet(
+            id=wallet_id,
+            balance=Decimal("100.00"),
+            balance_minor=10000
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_wallet
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        result = await repository.withdraw(wallet_id, Decimal("25.10"))
+
+        # Assert
+        assert result.balance_minor == 7490
+        assert str(result.balance) == "74.90"
+
+    @pytest.mark.asyncio
+    async def test_withdraw_insufficient_funds_in_minor_units_mode(self, repository, mock_session, monkeypatch):
+        """Test funds check on integer minor units for rows not yet backfilled."""
+        # Arrange
+        monkeypatch.setattr(settings, "BALANCE_MINOR_UNITS", True)
+        wallet_id = str(uuid4())
+        mock_wallet = Wallet(
+            id=wallet_id,
+            balance=Decimal("100.00"),
+            balance_minor=None
+        )
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_wallet
+        mock_session.execute.return_value = mock_result
+
+        # Act & Assert
+        with pytest.raises(InsufficientFundsError):
+            await repository.withdraw(wallet_id, Decimal("100.01"))
+
+    @pytest.mark.asyncio
+    async def test_invalid_wallet_id_does_not_open_session(self, repository, mock_session_maker):
+        """Test that a malformed wallet ID is rejected before a session is opened."""
+        # Act & Assert
+        with pytest.raises(InvalidWalletIdError):
+            await repository.deposit("not-a-uuid", Decimal("10.00"))
+        with pytest.raises(InvalidWalletIdError):
+            await repository.get_wallet("not-a-uuid")
+        mock_session_maker.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_amount_does_not_open_session(self, repository, mock_session_maker):
+        """Test that a non-positive amount is rejected before a session is opened."""
+        # Act & Assert
+        with pytest.raises(InvalidAmountError):
+            await repository.withdraw(str(uuid4()), Decimal("0"))
+        mock_session_maker.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_session_closed_after_transaction(self, repository, mock_session):
+        """Test that the session is released as soon as the operation completes."""
+        # Arrange
+        wallet_id = str(uuid4())
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = Wallet(id=wallet_id, balance=Decimal("1.00"))
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await repository.deposit(wallet_id, Decimal("1.00"))
+
+        # Assert
+        mock_session.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_wallet_filter_miss_does_not_open_session(self, mock_session_maker):
+        """Test that an ID the wallet filter has never seen is rejected without a session."""
+        # Arrange
+        wallet_filter = Mock()
+        wallet_filter.might_contain.return_value = False
+        repository = WalletRepository(mock_session_maker, Mock(), wallet_filter=wallet_filter)
+
+        # Act & Assert
+        with pytest.raises(WalletNotFoundError):
+            await repository.get_wallet(str(uuid4()))
+        mock_session_maker.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wallet_filter_false_positive_is_recorded(self, mock_session_maker, mock_session):
+        """Test that a filter hit without a wallet in the database counts as a false positive."""
+        # Arrange
+        wallet_filter = Mock()
+        wallet_filter.might_contain.return_value = True
+        wallet_filter.ready = True
+        repository = WalletRepository(mock_session_maker, Mock(), wallet_filter=wallet_filter)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        # Act & Assert
+        with pytest.raises(WalletNotFoundError):
+            await repository.get_wallet(str(uuid4()))
+        wallet_filter.record_false_positive.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('lock_mode, clause', [
+        ('for_update', 'FOR UPDATE'),
+        ('for_no_key_update', 'FOR NO KEY UPDATE'),
+    ])
+    async def test_lock_mode(self, mock_session_maker, mock_session, lock_mode, clause):
+        """Test that the balance change locks the wallet row with the configured lock mode."""
+        # Arrange
+        repository = WalletRepository(mock_session_maker, Mock(), lock_mode=lock_mode)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = Wallet(id=uuid4(), balance=Decimal("10.00"))
+        mock_session.execute.return_value = mock_result
+
+        # Act
+        await repository.deposit(str(uuid4()), Decimal("1.00"))
+
+        # Assert
+        lock_query = mock_session.execute.call_args_list[0].args[0]
+        assert str(lock_query.compile(dialect=postgresql.dialect())).endswith(clause)
+
+    def test_unknown_lock_mode(self):
+        """Test that an unknown lock mode is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            with_wallet_lock(select(Wallet), 'for_share')
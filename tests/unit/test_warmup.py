@@ -0,0 +1,83 @@
+"""
+Unit tests for startup warm-up.
+
+Tests that /ready reports 503 until warm-up has finished and that a failed
+connection pool warm-up is logged without keeping the worker unready.
+"""
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+from fastapi.testclient import TestClient
+import src.main
+from src.infrastructure.database.health import DatabaseHealthProbe
+from src.main import app, warm_up
+
+
+def _application() -> Mock:
+    return Mock(state=SimpleNamespace(ready=False))
+
+
+class TestWarmUp:
+    """Test cases for warm_up and the /ready endpoint."""
+
+    def test_ready_returns_503_until_warm_up_finishes(self, monkeypatch):
+        """Test that /ready answers 503 before warm-up and 200 after it."""
+        # Arrange
+        monkeypatch.setattr(DatabaseHealthProbe, 'healthy', property(lambda _self: True))
+        monkeypatch.setattr(src.main, 'logger', Mock())
+        monkeypatch.setattr(src.main, 'warm_up_pool', AsyncMock(return_value=2))
+        monkeypatch.setattr(app.state, 'ready', False)
+        client = TestClient(app)
+
+        # Act
+        before = client.get('/ready')
+        asyncio.run(warm_up(app))
+        after = client.get('/ready')
+
+        # Assert
+        assert before.status_code == 503
+        assert before.json() == {'status': 'warming_up'}
+        assert after.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_not_ready_while_pool_warms_up(self, monkeypatch):
+        """Test that the worker is marked ready only once the pool warm-up returns."""
+        # Arrange
+        release = asyncio.Event()
+
+        async def slow_warm_up(_engine, _connections):
+            await release.wait()
+            return 1
+
+        monkeypatch.setattr(src.main, 'logger', Mock())
+        monkeypatch.setattr(src.main, 'warm_up_pool', slow_warm_up)
+        application = _application()
+
+        # Act
+        task = asyncio.create_task(warm_up(application))
+        await asyncio.sleep(0)
+        during = application.state.ready
+        release.set()
+        await task
+
+        # Assert
+        assert during is False
+        assert application.state.ready is True
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_up_is_logged_and_marks_ready(self, monkeypatch):
+        """Test that a failed pool warm-up is logged and the worker still becomes ready."""
+        # Arrange
+        logger = Mock()
+        monkeypatch.setattr(src.main, 'logger', logger)
+        monkeypatch.setattr(src.main, 'warm_up_pool', AsyncMock(side_effect=OSError('connection refused')))
+        application = _application()
+
+        # Act
+        await warm_up(application)
+
+        # Assert
+        logger.error.assert_called_once()
+        assert 'connection refused' in repr(logger.error.call_args.args)
+        assert application.state.ready is True